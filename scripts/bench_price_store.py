@@ -0,0 +1,118 @@
+"""
+Universe load benchmark for the stock_data_manager price stores.
+
+Usage:
+    PYTHONPATH=src uv run python scripts/bench_price_store.py
+    PYTHONPATH=src uv run python scripts/bench_price_store.py --symbols 500 --bars 2520
+
+Writes a synthetic yfinance-style universe to a temporary directory as CSV,
+imports it into SQLite and Parquet, then prints the best-of-N time to load
+every symbol from each backend. The last row loads only Close/Volume for the
+last year from Parquet (column projection + date-range pushdown).
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from stock_data_manager.repositories.csv_repository import (  # noqa: E402
+    CsvPriceDataRepository,
+)
+from stock_data_manager.repositories.parquet_repository import (  # noqa: E402
+    ParquetPriceDataRepository,
+)
+from stock_data_manager.repositories.sqlite_repository import (  # noqa: E402
+    SqlitePriceDataRepository,
+)
+
+
+def make_symbol_frame(bars: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2015-01-02", periods=bars, tz="America/New_York")
+    index.name = "Date"
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, bars)))
+    spread = close * rng.uniform(0.002, 0.02, bars)
+    return pd.DataFrame(
+        {
+            "Open": close * (1 + rng.normal(0, 0.003, bars)),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+            "Volume": rng.integers(100_000, 10_000_000, bars),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=index,
+    )
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--bars", type=int, default=2520, help="~10y of daily bars")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        csv_dir = root / "csv"
+        csv_dir.mkdir()
+        csv_repo = CsvPriceDataRepository(str(csv_dir))
+        sqlite_repo = SqlitePriceDataRepository(str(root / "prices.db"))
+        parquet_repo = ParquetPriceDataRepository(str(root / "parquet"))
+
+        symbols = [f"SYM{i:04d}" for i in range(args.symbols)]
+        for i, symbol in enumerate(symbols):
+            df = make_symbol_frame(args.bars, seed=i)
+            csv_repo.save_symbol(symbol, df)
+            loaded = csv_repo.load_symbol(symbol)
+            sqlite_repo.save_symbol(symbol, loaded)
+            parquet_repo.save_symbol(symbol, loaded)
+
+        last_year = pd.Timestamp("2015-01-02", tz="UTC") + pd.offsets.BDay(
+            args.bars - 252
+        )
+        cases = {
+            "csv": lambda: [csv_repo.load_symbol(s) for s in symbols],
+            "sqlite": lambda: [sqlite_repo.load_symbol(s) for s in symbols],
+            "parquet": lambda: [parquet_repo.load_symbol(s) for s in symbols],
+            "parquet (2 cols, 1y)": lambda: [
+                parquet_repo.load_symbol(
+                    s, columns=["Close", "Volume"], start=last_year
+                )
+                for s in symbols
+            ],
+        }
+
+        print(f"\n=== Universe load ({args.symbols} symbols x {args.bars} bars) ===")
+        print(f"  {'backend':<22} {'total':>10} {'per symbol':>12} {'vs csv':>8}")
+        baseline = None
+        for name, fn in cases.items():
+            elapsed = _best_of(fn, args.repeat)
+            baseline = baseline or elapsed
+            print(
+                f"  {name:<22} {elapsed:>9.3f}s "
+                f"{elapsed / args.symbols * 1000:>10.2f}ms {baseline / elapsed:>7.1f}x"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+Micro-benchmark for trading_indicators.utils.ta_primitives kernels.
+
+Usage:
+    PYTHONPATH=src uv run python scripts/bench_ta_primitives.py
+    PYTHONPATH=src uv run python scripts/bench_ta_primitives.py --bars 5000 --repeat 3
+
+Compares each array-backed primitive against the original per-bar
+`Series.iloc` implementation on a synthetic ~10-year daily history and
+prints the best-of-N timings plus the speedup. The last case compares
+Lux + SMC computed independently against the same pair sharing one
+FeatureGraph via `shared_features()`.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from trading_indicators import (  # noqa: E402
+    LuxSignalsOverlays,
+    SmartMoneyConfluence,
+    shared_features,
+)
+from trading_indicators.utils import ta_primitives as ta  # noqa: E402
+
+# ─── Reference implementations (pre-vectorization) ─────────────────────────────
+
+
+def supertrend_reference(high, low, close, multiplier=3.0, length=10):
+    hl2 = (high + low) / 2
+    tr = ta._true_range(high, low, close)
+    atr = tr.ewm(span=length, adjust=False).mean()
+
+    upper_band = hl2 + multiplier * atr
+    lower_band = hl2 - multiplier * atr
+
+    st = pd.Series(np.nan, index=close.index)
+    direction = pd.Series(1, index=close.index)
+
+    for i in range(1, len(close)):
+        prev_dir = direction.iloc[i - 1]
+        prev_close = close.iloc[i - 1]
+        curr_close = close.iloc[i]
+        curr_upper = upper_band.iloc[i]
+        curr_lower = lower_band.iloc[i]
+
+        final_upper = (
+            curr_upper
+            if (
+                curr_upper < upper_band.iloc[i - 1]
+                or prev_close > upper_band.iloc[i - 1]
+            )
+            else upper_band.iloc[i - 1]
+        )
+        final_lower = (
+            curr_lower
+            if (
+                curr_lower > lower_band.iloc[i - 1]
+                or prev_close < lower_band.iloc[i - 1]
+            )
+            else lower_band.iloc[i - 1]
+        )
+
+        upper_band.iloc[i] = final_upper
+        lower_band.iloc[i] = final_lower
+
+        if prev_dir == 1 and curr_close > final_upper:
+            direction.iloc[i] = -1
+        elif prev_dir == -1 and curr_close < final_lower:
+            direction.iloc[i] = 1
+        else:
+            direction.iloc[i] = prev_dir
+
+        st.iloc[i] = final_lower if direction.iloc[i] == -1 else final_upper
+
+    return st, direction
+
+
+def pivot_high_reference(high, left_bars, right_bars):
+    result = pd.Series(np.nan, index=high.index)
+    for i in range(left_bars, len(high) - right_bars):
+        window = high.iloc[i - left_bars : i + right_bars + 1]
+        if high.iloc[i] == window.max():
+            result.iloc[i] = high.iloc[i]
+    return result
+
+
+def pivot_low_reference(low, left_bars, right_bars):
+    result = pd.Series(np.nan, index=low.index)
+    for i in range(left_bars, len(low) - right_bars):
+        window = low.iloc[i - left_bars : i + right_bars + 1]
+        if low.iloc[i] == window.min():
+            result.iloc[i] = low.iloc[i]
+    return result
+
+
+# ─── Harness ───────────────────────────────────────────────────────────────────
+
+
+def make_ohlc(n: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("2015-01-01", periods=n)
+    close = 100 + np.cumsum(rng.normal(0, 1.0, n))
+    spread = rng.uniform(0.2, 2.0, n)
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.3, n),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+        },
+        index=dates,
+    )
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def lux_and_smc(df: pd.DataFrame) -> None:
+    LuxSignalsOverlays().compute(df)
+    SmartMoneyConfluence().compute(df)
+
+
+def lux_and_smc_shared(df: pd.DataFrame) -> None:
+    with shared_features():
+        lux_and_smc(df)
+
+
+def build_cases(df: pd.DataFrame) -> dict[str, tuple]:
+    high, low, close = df["high"], df["low"], df["close"]
+    return {
+        "supertrend": (
+            lambda: supertrend_reference(high, low, close, 1.5, 14),
+            lambda: ta.supertrend(high, low, close, 1.5, 14),
+        ),
+        "pivot_high": (
+            lambda: pivot_high_reference(high, 10, 10),
+            lambda: ta.pivot_high(high, 10, 10),
+        ),
+        "pivot_low": (
+            lambda: pivot_low_reference(low, 10, 10),
+            lambda: ta.pivot_low(low, 10, 10),
+        ),
+        "lux+smc (shared)": (
+            lambda: lux_and_smc(df),
+            lambda: lux_and_smc_shared(df),
+        ),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bars", type=int, default=2520, help="~10y of daily bars")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    df = make_ohlc(args.bars)
+    print(f"\n=== ta_primitives micro-benchmark ({args.bars} bars) ===")
+    print(f"  {'primitive':<20} {'reference':>12} {'current':>12} {'speedup':>9}")
+    for name, (reference, current) in build_cases(df).items():
+        t_ref = _best_of(reference, args.repeat)
+        t_cur = _best_of(current, args.repeat)
+        print(
+            f"  {name:<20} {t_ref * 1000:>10.2f}ms {t_cur * 1000:>10.2f}ms "
+            f"{t_ref / t_cur:>8.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,28 +1,40 @@
 import argparse
 import time
-from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TypeVar
 
-from market_scanner.cache import get_or_compute_historical
-
+import numpy as np
 import pandas as pd
 
-from market_scanner.eligibility import MIN_HISTORY_ROWS
+from market_scanner.cache import (
+    DEFAULT_CACHE_BUDGET_MB,
+    enforce_cache_budget,
+    get_or_compute_historical,
+)
+from market_scanner.eligibility import MIN_HISTORY_ROWS, compact_price_frame
+from market_scanner.event_state import (
+    LUX_ACTIVE_PRIORITY_CONTEXTS,
+    SMC_ACTIVE_PRIORITY_CONTEXTS,
+    build_event_state_history,
+)
 from market_scanner.pipeline import (
+    PENDING_TASKS_PER_WORKER,
     create_analyzers,
     iter_symbol_data,
     load_selected_universe,
+    load_shared_frame,
+    map_in_order,
+    process_pool,
+    shared_price_store,
 )
 from market_scanner.report_writer import write_csv_report
+from market_scanner.scanner_columns import ScannerColumns, build_scanner_columns
 from market_scanner.scanner_row import build_scanner_row_from_history
-from market_scanner.event_state import (
-    LUX_ACTIVE_PRIORITY_CONTEXTS,
-    SMC_ACTIVE_PRIORITY_CONTEXTS,
-    build_event_state_history,
-)
 from stock_analyzer.analyzer import StockDataAnalyzer
+from trading_indicators import FeatureScope, shared_features
 
 DEFAULT_HORIZONS = (3, 5, 10, 20)
 DEFAULT_MIN_BARS = 120
@@ -32,7 +44,8 @@ DEFAULT_WIN_THRESHOLD = 0.01
 @dataclass
 class _BacktestSymbolArgs:
     symbol: str
-    df: pd.DataFrame
+    # Directory of the shared_price_store holding the symbol's prepared frame
+    store_dir: str
     ranking_modes: list[str]
     min_bars: int
     horizons: list[int]
@@ -47,7 +60,7 @@ class _BacktestSymbolArgs:
 def _backtest_symbol_worker(args: _BacktestSymbolArgs) -> list[dict]:
     return generate_symbol_events(
         symbol=args.symbol,
-        df=args.df,
+        df=load_shared_frame(args.store_dir, args.symbol),
         ranking_modes=args.ranking_modes,
         min_bars=args.min_bars,
         horizons=args.horizons,
@@ -62,7 +75,7 @@ def _backtest_symbol_worker(args: _BacktestSymbolArgs) -> list[dict]:
 
 SCANNER_ROW_MIN_BARS = MIN_HISTORY_ROWS
 DEFAULT_REPORTS_DIR = "reports/market_scanner"
-EVENT_STATE_PRECOMPUTE_MIN_ROWS = 50
+T = TypeVar("T")
 DETAILED_SUMMARY_GROUP_COLUMNS = [
     "signal_side",
     "action_bucket",
@@ -101,9 +114,33 @@ DECISION_SUMMARY_GROUP_COLUMNS = [
 ]
 
 
+@dataclass
+class FeatureGraphSavings:
+    """Primitives reused through the shared feature graph, summed over symbols."""
+
+    symbols: int = 0
+    hits: int = 0
+    saved_seconds: float = 0.0
+
+    def add(self, scope: FeatureScope) -> None:
+        self.symbols += 1
+        self.hits += scope.hits
+        self.saved_seconds += scope.saved_seconds
+
+    def render(self) -> str:
+        per_symbol_ms = (
+            1000 * self.saved_seconds / self.symbols if self.symbols else 0.0
+        )
+        return (
+            f"- feature_graph: {self.hits} reused primitives, "
+            f"{self.saved_seconds:.3f}s saved ({per_symbol_ms:.1f}ms/symbol)"
+        )
+
+
 class BacktestProfiler:
     def __init__(self) -> None:
         self.timings: dict[str, float] = {}
+        self.feature_graph = FeatureGraphSavings()
 
     @contextmanager
     def track(self, name: str):
@@ -115,6 +152,17 @@ class BacktestProfiler:
                 time.perf_counter() - started_at
             )
 
+    def track_iter(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield from `iterable`, charging the time spent waiting on it to `name`."""
+        iterator = iter(iterable)
+        while True:
+            with self.track(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
     def snapshot(self) -> dict[str, float]:
         return dict(self.timings)
 
@@ -159,6 +207,63 @@ def infer_smc_signal_side(row: dict) -> str:
     )
 
 
+@dataclass
+class ForwardMetricsTable:
+    """Forward closes and high/low extremes of one symbol, for every bar.
+
+    Built once per symbol with array operations; `metrics` then only gathers
+    the values for one bar and direction. For horizon `h`, position `i` holds
+    the close `h` bars ahead and the max high / min low over bars `i..i+h`
+    (NaN-skipping, like `Series.max`/`min`); positions without `h` bars ahead
+    are NaN. Values are kept as Python float lists so the per-event gather is
+    plain list indexing and returns the same floats the scalar path produced.
+    """
+
+    entry_close: list[float]
+    future_close: dict[int, list[float]]
+    max_high: dict[int, list[float]]
+    min_low: dict[int, list[float]]
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame, horizons: list[int]) -> "ForwardMetricsTable":
+        close = df[_require_column(df, "close")].to_numpy(dtype=float)
+        high = df[_require_column(df, "high")].to_numpy(dtype=float)
+        low = df[_require_column(df, "low")].to_numpy(dtype=float)
+        future_close, max_high, min_low = {}, {}, {}
+        for horizon in set(horizons):
+            future_close[horizon] = _ahead(close[horizon:], len(close))
+            max_high[horizon] = _ahead(
+                _window_reduce(np.fmax, high, horizon), len(close)
+            )
+            min_low[horizon] = _ahead(_window_reduce(np.fmin, low, horizon), len(close))
+        return cls(close.tolist(), future_close, max_high, min_low)
+
+    def metrics(
+        self,
+        index: int,
+        horizons: list[int],
+        direction: str,
+        win_threshold: float,
+    ) -> dict:
+        entry_close = self.entry_close[index]
+        metrics: dict[str, float | bool | None] = {"entry_close": entry_close}
+        for horizon in horizons:
+            raw_return = (self.future_close[horizon][index] / entry_close) - 1.0
+            directional_return = _directional_return(raw_return, direction)
+            mfe, mae = _excursions(
+                max_high=self.max_high[horizon][index],
+                min_low=self.min_low[horizon][index],
+                entry_close=entry_close,
+                direction=direction,
+            )
+            metrics[f"return_{horizon}"] = raw_return
+            metrics[f"directional_return_{horizon}"] = directional_return
+            metrics[f"mfe_{horizon}"] = mfe
+            metrics[f"mae_{horizon}"] = mae
+            metrics[f"win_{horizon}"] = _classify_win(directional_return, win_threshold)
+        return metrics
+
+
 def compute_forward_metrics(
     df: pd.DataFrame,
     index: int,
@@ -166,33 +271,9 @@ def compute_forward_metrics(
     direction: str,
     win_threshold: float,
 ) -> dict:
-    close_column = _require_column(df, "close")
-    high_column = _require_column(df, "high")
-    low_column = _require_column(df, "low")
-    entry_close = float(df.iloc[index][close_column])
-    metrics: dict[str, float | bool | None] = {"entry_close": entry_close}
-
-    for horizon in horizons:
-        future_close = float(df.iloc[index + horizon][close_column])
-        raw_return = (future_close / entry_close) - 1.0
-        directional_return = _directional_return(raw_return, direction)
-        window = df.iloc[index : index + horizon + 1]
-        mfe, mae = _compute_excursions(
-            window=window,
-            entry_close=entry_close,
-            direction=direction,
-            high_column=high_column,
-            low_column=low_column,
-        )
-        win = _classify_win(directional_return, win_threshold)
-
-        metrics[f"return_{horizon}"] = raw_return
-        metrics[f"directional_return_{horizon}"] = directional_return
-        metrics[f"mfe_{horizon}"] = mfe
-        metrics[f"mae_{horizon}"] = mae
-        metrics[f"win_{horizon}"] = win
-
-    return metrics
+    return ForwardMetricsTable.from_df(df, horizons).metrics(
+        index, horizons, direction, win_threshold
+    )
 
 
 def build_backtest_event(
@@ -204,6 +285,7 @@ def build_backtest_event(
     index: int,
     horizons: list[int],
     win_threshold: float,
+    forward_metrics: ForwardMetricsTable | None = None,
 ) -> dict:
     signal_side = infer_signal_side(row.get("adjusted_alignment"))
     event = {
@@ -235,15 +317,9 @@ def build_backtest_event(
         "signal_side": signal_side,
         "direction": signal_side,
     }
-    event.update(
-        compute_forward_metrics(
-            df=df,
-            index=index,
-            horizons=horizons,
-            direction=signal_side,
-            win_threshold=win_threshold,
-        )
-    )
+    if forward_metrics is None:
+        forward_metrics = ForwardMetricsTable.from_df(df, horizons)
+    event.update(forward_metrics.metrics(index, horizons, signal_side, win_threshold))
     return event
 
 
@@ -273,25 +349,8 @@ def generate_symbol_events(
     start_index = max(effective_min_bars - 1, 0)
     lux_analyzer = lux_analyzer or StockDataAnalyzer(signal_model="lux")
     smc_analyzer = smc_analyzer or StockDataAnalyzer(signal_model="smc")
-    if profiler is None:
-        lux_historical = get_or_compute_historical(
-            analyzer=lux_analyzer,
-            symbol=symbol,
-            df=df,
-            csv_path=csv_path if use_cache else None,
-            cache_dir=cache_dir if use_cache else None,
-            model_name="lux",
-        )
-        smc_historical = get_or_compute_historical(
-            analyzer=smc_analyzer,
-            symbol=symbol,
-            df=df,
-            csv_path=csv_path if use_cache else None,
-            cache_dir=cache_dir if use_cache else None,
-            model_name="smc",
-        )
-    else:
-        with profiler.track("lux_historical_generation"):
+    with shared_features() as features:
+        if profiler is None:
             lux_historical = get_or_compute_historical(
                 analyzer=lux_analyzer,
                 symbol=symbol,
@@ -300,7 +359,6 @@ def generate_symbol_events(
                 cache_dir=cache_dir if use_cache else None,
                 model_name="lux",
             )
-        with profiler.track("smc_historical_generation"):
             smc_historical = get_or_compute_historical(
                 analyzer=smc_analyzer,
                 symbol=symbol,
@@ -309,7 +367,31 @@ def generate_symbol_events(
                 cache_dir=cache_dir if use_cache else None,
                 model_name="smc",
             )
-    close_column = _require_column(df, "close")
+        else:
+            with profiler.track("lux_historical_generation"):
+                lux_historical = get_or_compute_historical(
+                    analyzer=lux_analyzer,
+                    symbol=symbol,
+                    df=df,
+                    csv_path=csv_path if use_cache else None,
+                    cache_dir=cache_dir if use_cache else None,
+                    model_name="lux",
+                )
+            with profiler.track("smc_historical_generation"):
+                smc_historical = get_or_compute_historical(
+                    analyzer=smc_analyzer,
+                    symbol=symbol,
+                    df=df,
+                    csv_path=csv_path if use_cache else None,
+                    cache_dir=cache_dir if use_cache else None,
+                    model_name="smc",
+                )
+    if profiler is None:
+        forward_metrics = ForwardMetricsTable.from_df(df, horizons)
+    else:
+        profiler.feature_graph.add(features)
+        with profiler.track("forward_metrics"):
+            forward_metrics = ForwardMetricsTable.from_df(df, horizons)
     evaluation_indexes = _resolve_evaluation_indexes(
         df=df,
         start_index=start_index,
@@ -317,35 +399,19 @@ def generate_symbol_events(
         start_date=start_date,
         max_bars=max_bars,
     )
-    use_event_state_precompute = (
-        len(evaluation_indexes) * len(ranking_modes) >= EVENT_STATE_PRECOMPUTE_MIN_ROWS
-    )
-    lux_event_states = None
-    smc_event_states = None
-    if use_event_state_precompute:
-        if profiler is None:
-            lux_event_states = build_event_state_history(
-                lux_historical,
-                active_priority_contexts=LUX_ACTIVE_PRIORITY_CONTEXTS,
-            )
-            smc_event_states = build_event_state_history(
-                smc_historical,
-                active_priority_contexts=SMC_ACTIVE_PRIORITY_CONTEXTS,
+    if profiler is None:
+        scanner_columns = _build_scanner_columns(
+            symbol, lux_historical, smc_historical, ranking_modes
+        )
+    else:
+        with profiler.track("scanner_columns"):
+            scanner_columns = _build_scanner_columns(
+                symbol, lux_historical, smc_historical, ranking_modes
             )
-        else:
-            with profiler.track("event_state_precompute"):
-                lux_event_states = build_event_state_history(
-                    lux_historical,
-                    active_priority_contexts=LUX_ACTIVE_PRIORITY_CONTEXTS,
-                )
-                smc_event_states = build_event_state_history(
-                    smc_historical,
-                    active_priority_contexts=SMC_ACTIVE_PRIORITY_CONTEXTS,
-                )
 
     for i in evaluation_indexes:
         if profiler is None:
-            entry_close = float(df.iloc[i][close_column])
+            entry_close = forward_metrics.entry_close[i]
             for ranking_mode in ranking_modes:
                 row = build_scanner_row_from_history(
                     symbol=symbol,
@@ -354,12 +420,7 @@ def generate_symbol_events(
                     smc_historical=smc_historical,
                     index=i,
                     ranking_mode=ranking_mode,
-                    lux_event_state=(
-                        lux_event_states[i] if lux_event_states is not None else None
-                    ),
-                    smc_event_state=(
-                        smc_event_states[i] if smc_event_states is not None else None
-                    ),
+                    scanner_columns=scanner_columns[ranking_mode],
                 )
                 events.append(
                     build_backtest_event(
@@ -370,12 +431,13 @@ def generate_symbol_events(
                         index=i,
                         horizons=horizons,
                         win_threshold=win_threshold,
+                        forward_metrics=forward_metrics,
                     )
                 )
             continue
 
         with profiler.track("per_bar_loop"):
-            entry_close = float(df.iloc[i][close_column])
+            entry_close = forward_metrics.entry_close[i]
             for ranking_mode in ranking_modes:
                 with profiler.track("build_scanner_row"):
                     row = build_scanner_row_from_history(
@@ -385,16 +447,7 @@ def generate_symbol_events(
                         smc_historical=smc_historical,
                         index=i,
                         ranking_mode=ranking_mode,
-                        lux_event_state=(
-                            lux_event_states[i]
-                            if lux_event_states is not None
-                            else None
-                        ),
-                        smc_event_state=(
-                            smc_event_states[i]
-                            if smc_event_states is not None
-                            else None
-                        ),
+                        scanner_columns=scanner_columns[ranking_mode],
                     )
                 with profiler.track("forward_metrics"):
                     event = build_backtest_event(
@@ -405,12 +458,40 @@ def generate_symbol_events(
                         index=i,
                         horizons=horizons,
                         win_threshold=win_threshold,
+                        forward_metrics=forward_metrics,
                     )
                 events.append(event)
 
     return events
 
 
+def _build_scanner_columns(
+    symbol: str,
+    lux_historical: pd.DataFrame,
+    smc_historical: pd.DataFrame,
+    ranking_modes: list[str],
+) -> dict[str, ScannerColumns]:
+    lux_event_states = build_event_state_history(
+        lux_historical,
+        active_priority_contexts=LUX_ACTIVE_PRIORITY_CONTEXTS,
+    )
+    smc_event_states = build_event_state_history(
+        smc_historical,
+        active_priority_contexts=SMC_ACTIVE_PRIORITY_CONTEXTS,
+    )
+    return {
+        ranking_mode: build_scanner_columns(
+            symbol,
+            lux_historical=lux_historical,
+            smc_historical=smc_historical,
+            ranking_mode=ranking_mode,
+            lux_event_states=lux_event_states,
+            smc_event_states=smc_event_states,
+        )
+        for ranking_mode in ranking_modes
+    }
+
+
 def summarize_events(events: list[dict], horizons: list[int]) -> list[dict]:
     return summarize_detailed_events(events, horizons)
 
@@ -472,51 +553,53 @@ def backtest_universe(
     workers: int = 1,
     use_cache: bool = False,
     cache_dir: Path | None = None,
+    compact_dtypes: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
     horizons = horizons or list(DEFAULT_HORIZONS)
     ranking_modes = _resolve_ranking_modes(ranking_mode)
     profiler = BacktestProfiler() if (profile and workers == 1) else None
 
     def _transform_df(df: pd.DataFrame) -> pd.DataFrame:
+        if compact_dtypes:
+            df = compact_price_frame(df)
         return prepare_backtest_df(df=df.sort_index(), end_date=end_date)
 
+    universe = load_selected_universe(universe_file, symbols=symbols)
+    symbol_data_rows = iter_symbol_data(universe, data_dir, transform_df=_transform_df)
     if profiler is not None:
-        with profiler.track("data_loading"):
-            universe = load_selected_universe(universe_file, symbols=symbols)
-            symbol_data_rows = iter_symbol_data(
-                universe, data_dir, transform_df=_transform_df
-            )
-    else:
-        universe = load_selected_universe(universe_file, symbols=symbols)
-        symbol_data_rows = iter_symbol_data(
-            universe, data_dir, transform_df=_transform_df
-        )
+        symbol_data_rows = profiler.track_iter("data_loading", symbol_data_rows)
 
     events: list[dict] = []
 
     if workers > 1:
-        eligible = [
+        eligible = (
             sd for sd in symbol_data_rows if sd.load_error is None and sd.df is not None
-        ]
-        worker_args_list = [
-            _BacktestSymbolArgs(
-                symbol=sd.symbol,
-                df=sd.df,  # type: ignore[arg-type]
-                ranking_modes=ranking_modes,
-                min_bars=min_bars,
-                horizons=horizons,
-                win_threshold=win_threshold,
-                start_date=start_date,
-                max_bars=max_bars,
-                csv_path=Path(data_dir) / f"{sd.symbol}.csv",
-                cache_dir=cache_dir,
-                use_cache=use_cache,
+        )
+        with shared_price_store(eligible) as shared_rows:
+            worker_args = (
+                _BacktestSymbolArgs(
+                    symbol=sd.symbol,
+                    store_dir=store_dir,
+                    ranking_modes=ranking_modes,
+                    min_bars=min_bars,
+                    horizons=horizons,
+                    win_threshold=win_threshold,
+                    start_date=start_date,
+                    max_bars=max_bars,
+                    csv_path=Path(data_dir) / f"{sd.symbol}.csv",
+                    cache_dir=cache_dir,
+                    use_cache=use_cache,
+                )
+                for store_dir, sd in shared_rows
             )
-            for sd in eligible
-        ]
-        with ProcessPoolExecutor(max_workers=workers) as pool:
-            for symbol_events in pool.map(_backtest_symbol_worker, worker_args_list):
-                events.extend(symbol_events)
+            with process_pool(workers) as pool:
+                for symbol_events in map_in_order(
+                    pool,
+                    _backtest_symbol_worker,
+                    worker_args,
+                    max_pending=workers * PENDING_TASKS_PER_WORKER,
+                ):
+                    events.extend(symbol_events)
     else:
         analyzers = create_analyzers(StockDataAnalyzer)
         for symbol_data in symbol_data_rows:
@@ -601,7 +684,7 @@ def backtest_universe(
         print(terminal_summary)
     if profiler is not None:
         print()
-        print(render_profile_report(profiler.snapshot()))
+        print(render_profile_report(profiler.snapshot(), profiler.feature_graph))
     print(f"\nExported events: {Path(output_events)}")
     print(f"Exported detailed summary: {Path(output_detailed_summary)}")
     print(f"Exported decision summary: {Path(output_decision_summary)}")
@@ -730,6 +813,24 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override cache directory (default: data/cache).",
     )
+    parser.add_argument(
+        "--cache-budget-mb",
+        type=float,
+        default=DEFAULT_CACHE_BUDGET_MB,
+        help=(
+            "Evict least recently used cache entries beyond this size after the "
+            f"run; 0 disables (default: {DEFAULT_CACHE_BUDGET_MB:.0f})."
+        ),
+    )
+    parser.add_argument(
+        "--compact-dtypes",
+        action="store_true",
+        help=(
+            "Load prices as float32 and drop unused Dividends/Stock Splits "
+            "columns to roughly halve memory (indicator values differ in the "
+            "last digits)."
+        ),
+    )
     return parser
 
 
@@ -759,7 +860,10 @@ def main(argv: list[str] | None = None) -> int:
         workers=args.workers,
         use_cache=use_cache,
         cache_dir=cache_dir,
+        compact_dtypes=args.compact_dtypes,
     )
+    if use_cache:
+        enforce_cache_budget(cache_dir, args.cache_budget_mb)
     return 0
 
 
@@ -774,7 +878,9 @@ def prepare_backtest_df(
     return filtered.copy()
 
 
-def render_profile_report(timings: dict[str, float]) -> str:
+def render_profile_report(
+    timings: dict[str, float], feature_graph: FeatureGraphSavings | None = None
+) -> str:
     if not timings:
         return "Performance Report\n- no timings collected"
 
@@ -783,6 +889,9 @@ def render_profile_report(timings: dict[str, float]) -> str:
     lines = ["Performance Report", f"- total measured time: {total:.3f}s"]
     for name, duration in ordered:
         lines.append(f"- {name}: {duration:.3f}s")
+    if feature_graph is not None and feature_graph.symbols:
+        # Time not spent, so it stays out of the measured total
+        lines.append(feature_graph.render())
     return "\n".join(lines)
 
 
@@ -897,25 +1006,35 @@ def _ordered_summary(summary_df: pd.DataFrame) -> pd.DataFrame:
     )
 
 
-def _compute_excursions(
+def _excursions(
     *,
-    window: pd.DataFrame,
+    max_high: float,
+    min_low: float,
     entry_close: float,
     direction: str,
-    high_column: str,
-    low_column: str,
 ) -> tuple[float | None, float | None]:
     if direction == "bullish":
-        mfe = (float(window[high_column].max()) / entry_close) - 1.0
-        mae = (float(window[low_column].min()) / entry_close) - 1.0
-        return mfe, mae
+        return (max_high / entry_close) - 1.0, (min_low / entry_close) - 1.0
     if direction == "bearish":
-        mfe = 1.0 - (float(window[low_column].min()) / entry_close)
-        mae = 1.0 - (float(window[high_column].max()) / entry_close)
-        return mfe, mae
+        return 1.0 - (min_low / entry_close), 1.0 - (max_high / entry_close)
     return None, None
 
 
+def _window_reduce(ufunc: np.ufunc, values: np.ndarray, horizon: int) -> np.ndarray:
+    """`ufunc` over every window `values[i : i + horizon + 1]` (one per start)."""
+    if len(values) <= horizon:
+        return np.empty(0)
+    windows = np.lib.stride_tricks.sliding_window_view(values, horizon + 1)
+    return ufunc.reduce(windows, axis=1)
+
+
+def _ahead(values: np.ndarray, length: int) -> list[float]:
+    """`values` padded with NaN at the end up to `length`, as a float list."""
+    padded = np.full(length, np.nan)
+    padded[: len(values)] = values
+    return padded.tolist()
+
+
 def _classify_win(
     directional_return: float | None, win_threshold: float
 ) -> bool | None:
@@ -1,6 +1,5 @@
 import argparse
 from collections import Counter
-from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, replace
 from pathlib import Path
 from time import perf_counter
@@ -8,8 +7,12 @@ from time import perf_counter
 import pandas as pd
 
 from market_scanner.backtest import prepare_backtest_df
-from market_scanner.cache import get_or_compute_historical
-from market_scanner.eligibility import MIN_HISTORY_ROWS
+from market_scanner.cache import (
+    DEFAULT_CACHE_BUDGET_MB,
+    enforce_cache_budget,
+    get_or_compute_historical,
+)
+from market_scanner.eligibility import MIN_HISTORY_ROWS, compact_price_frame
 from market_scanner.exits import (
     exit_after_n_bars,
     exit_on_alignment_break,
@@ -18,11 +21,17 @@ from market_scanner.exits import (
     exit_on_opposite_signal,
 )
 from market_scanner.pipeline import (
+    PENDING_TASKS_PER_WORKER,
     create_analyzers,
     iter_symbol_data,
     load_selected_universe,
+    load_shared_frame,
+    map_in_order,
+    process_pool,
+    shared_price_store,
 )
 from market_scanner.report_writer import write_csv_report
+from market_scanner.scanner_columns import build_scanner_columns
 from market_scanner.scanner_row import build_scanner_row_from_history
 from market_scanner.trades import (
     Trade,
@@ -34,6 +43,7 @@ from market_scanner.trades import (
     trade_to_record,
 )
 from stock_analyzer.analyzer import StockDataAnalyzer
+from trading_indicators import shared_features
 
 DEFAULT_MIN_BARS = 120
 SCANNER_ROW_MIN_BARS = MIN_HISTORY_ROWS
@@ -174,7 +184,8 @@ class PreparedSymbolExecutionData:
 @dataclass
 class _ExecutionSymbolArgs:
     symbol: str
-    df: pd.DataFrame
+    # Directory of the shared_price_store holding the symbol's prepared frame
+    store_dir: str
     ranking_mode: str
     exit_rules: list[str]
     min_bars: int
@@ -189,7 +200,7 @@ class _ExecutionSymbolArgs:
 def _execution_symbol_worker(args: _ExecutionSymbolArgs) -> list[dict]:
     prepared_data = prepare_symbol_execution_data(
         symbol=args.symbol,
-        df=args.df,
+        df=load_shared_frame(args.store_dir, args.symbol),
         ranking_mode=args.ranking_mode,
         min_bars=args.min_bars,
         csv_path=args.csv_path,
@@ -253,6 +264,7 @@ def backtest_execution_universe(
     use_cache: bool = False,
     cache_dir: Path | None = None,
     strategy_filter: str = "all",
+    compact_dtypes: bool = False,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
     universe = load_selected_universe(universe_file, symbols=symbols)
     universe = _limit_universe(universe, max_symbols=max_symbols)
@@ -261,42 +273,54 @@ def backtest_execution_universe(
     start_time = perf_counter()
 
     def _transform_df(df: pd.DataFrame) -> pd.DataFrame:
+        if compact_dtypes:
+            df = compact_price_frame(df)
         return prepare_backtest_df(df=df.sort_index())
 
     all_symbol_data = iter_symbol_data(universe, data_dir, transform_df=_transform_df)
 
     if workers > 1:
-        eligible = []
-        for sd in all_symbol_data:
-            if sd.load_error is not None or sd.df is None:
-                continue
-            if min_price is not None:
-                median_close = _median_close(sd.df)
-                if median_close is None or median_close < min_price:
+
+        def eligible():
+            for sd in all_symbol_data:
+                if sd.load_error is not None or sd.df is None:
                     continue
-            eligible.append(sd)
-        worker_args_list = [
-            _ExecutionSymbolArgs(
-                symbol=sd.symbol,
-                df=sd.df,  # type: ignore[arg-type]
-                ranking_mode=ranking_mode,
-                exit_rules=exit_rules,
-                min_bars=min_bars,
-                min_entry_price=min_entry_price,
-                min_dollar_volume=min_dollar_volume,
-                max_gap=max_gap,
-                csv_path=Path(data_dir) / f"{sd.symbol}.csv",
-                cache_dir=cache_dir,
-                use_cache=use_cache,
+                if min_price is not None:
+                    median_close = _median_close(sd.df)
+                    if median_close is None or median_close < min_price:
+                        continue
+                yield sd
+
+        processed_symbols = 0
+        with shared_price_store(eligible()) as shared_rows:
+            worker_args = (
+                _ExecutionSymbolArgs(
+                    symbol=sd.symbol,
+                    store_dir=store_dir,
+                    ranking_mode=ranking_mode,
+                    exit_rules=exit_rules,
+                    min_bars=min_bars,
+                    min_entry_price=min_entry_price,
+                    min_dollar_volume=min_dollar_volume,
+                    max_gap=max_gap,
+                    csv_path=Path(data_dir) / f"{sd.symbol}.csv",
+                    cache_dir=cache_dir,
+                    use_cache=use_cache,
+                )
+                for store_dir, sd in shared_rows
             )
-            for sd in eligible
-        ]
-        with ProcessPoolExecutor(max_workers=workers) as pool:
-            for symbol_records in pool.map(_execution_symbol_worker, worker_args_list):
-                trade_records.extend(symbol_records)
+            with process_pool(workers) as pool:
+                for symbol_records in map_in_order(
+                    pool,
+                    _execution_symbol_worker,
+                    worker_args,
+                    max_pending=workers * PENDING_TASKS_PER_WORKER,
+                ):
+                    processed_symbols += 1
+                    trade_records.extend(symbol_records)
         if progress:
             print(
-                f"Processed {len(eligible)} symbols with {workers} workers "
+                f"Processed {processed_symbols} symbols with {workers} workers "
                 f"in {perf_counter() - start_time:.1f}s"
             )
     else:
@@ -668,32 +692,41 @@ def prepare_symbol_execution_data(
 
     lux_analyzer = lux_analyzer or StockDataAnalyzer(signal_model="lux")
     smc_analyzer = smc_analyzer or StockDataAnalyzer(signal_model="smc")
-    lux_historical = get_or_compute_historical(
-        analyzer=lux_analyzer,
-        symbol=symbol,
-        df=df,
-        csv_path=csv_path if use_cache else None,
-        cache_dir=cache_dir if use_cache else None,
-        model_name="lux",
-    )
-    smc_historical = get_or_compute_historical(
-        analyzer=smc_analyzer,
-        symbol=symbol,
-        df=df,
-        csv_path=csv_path if use_cache else None,
-        cache_dir=cache_dir if use_cache else None,
-        model_name="smc",
-    )
+    with shared_features():
+        lux_historical = get_or_compute_historical(
+            analyzer=lux_analyzer,
+            symbol=symbol,
+            df=df,
+            csv_path=csv_path if use_cache else None,
+            cache_dir=cache_dir if use_cache else None,
+            model_name="lux",
+        )
+        smc_historical = get_or_compute_historical(
+            analyzer=smc_analyzer,
+            symbol=symbol,
+            df=df,
+            csv_path=csv_path if use_cache else None,
+            cache_dir=cache_dir if use_cache else None,
+            model_name="smc",
+        )
     close_column = _require_column(df, "close")
     high_column = _require_column(df, "high")
     low_column = _require_column(df, "low")
     open_column = _require_column(df, "open")
     volume_column = _require_column(df, "volume")
 
+    scanner_columns = build_scanner_columns(
+        symbol,
+        lux_historical=lux_historical,
+        smc_historical=smc_historical,
+        ranking_mode=ranking_mode,
+    )
+    closes = df[close_column].to_numpy(dtype=float).tolist()
+
     bars: list[ExecutionBar] = []
     start_index = max(effective_min_bars - 1, 0)
     for index in range(start_index, len(df)):
-        close_price = float(df.iloc[index][close_column])
+        close_price = closes[index]
         row = build_scanner_row_from_history(
             symbol=symbol,
             close=close_price,
@@ -701,6 +734,7 @@ def prepare_symbol_execution_data(
             smc_historical=smc_historical,
             index=index,
             ranking_mode=ranking_mode,
+            scanner_columns=scanner_columns,
         )
         bar_date = pd.Timestamp(df.index[index]).isoformat()
         bars.append(
@@ -1100,6 +1134,24 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override cache directory (default: data/cache).",
     )
+    parser.add_argument(
+        "--cache-budget-mb",
+        type=float,
+        default=DEFAULT_CACHE_BUDGET_MB,
+        help=(
+            "Evict least recently used cache entries beyond this size after the "
+            f"run; 0 disables (default: {DEFAULT_CACHE_BUDGET_MB:.0f})."
+        ),
+    )
+    parser.add_argument(
+        "--compact-dtypes",
+        action="store_true",
+        help=(
+            "Load prices as float32 and drop unused Dividends/Stock Splits "
+            "columns to roughly halve memory (indicator values differ in the "
+            "last digits)."
+        ),
+    )
     # --- Strategy filter ---
     parser.add_argument(
         "--strategy",
@@ -1148,7 +1200,10 @@ def main(argv: list[str] | None = None) -> int:
         use_cache=use_cache,
         cache_dir=cache_dir,
         strategy_filter=args.strategy,
+        compact_dtypes=args.compact_dtypes,
     )
+    if use_cache:
+        enforce_cache_budget(cache_dir, args.cache_budget_mb)
     return 0
 
 
@@ -1,11 +1,50 @@
+import argparse
+import dataclasses
+import hashlib
+import importlib.util
 import logging
+import os
 import pickle
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from market_scanner.eligibility import EligibilityInputs
+from stock_data_manager.repositories.manifest import PriceStoreManifest
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_CACHE_DIR = Path("data/cache")
+# Size the scan/backtest CLIs prune the cache down to after a run
+DEFAULT_CACHE_BUDGET_MB = 2048.0
+# Bump when cached entries change in ways the hashed sources below do not show
+CACHE_FORMAT_VERSION = 2
+# Packages whose source is hashed into every key: editing indicator or
+# signal code invalidates the histories computed by the old code
+CODE_PACKAGES = ("trading_indicators", "stock_analyzer.signals")
+# Per-symbol pointer to the newest entry, the base for extending histories
+LATEST_SUFFIX = ".latest"
+# Append-only "<model> <outcome> <count>" lines, one per lookup
+STATS_FILENAME = "stats.log"
+OUTCOMES = ("hit", "reused", "extended", "computed")
+# Directory of the per-file CachedInputs entries, next to the model directories
+INPUTS_DIRNAME = "inputs"
+_BYTES_PER_MB = 1024 * 1024
+
+
+@dataclass
+class CachedHistory:
+    """A cached analyzer history and the price rows it was computed from."""
+
+    history: pd.DataFrame
+    input_rows: int
+    # _input_digest of those rows
+    input_digest: str
+
 
 def get_or_compute_historical(
     *,
@@ -15,35 +54,256 @@ def get_or_compute_historical(
     csv_path: Path | None,
     cache_dir: Path | None,
     model_name: str,
+    fingerprint: str | None = None,
 ) -> pd.DataFrame:
+    if _is_compact(df):
+        # float32 inputs (compact_price_frame) give slightly different values
+        model_name = f"{model_name}_float32"
+    model_key = _model_key(analyzer)
     cache_path = _resolve_cache_path(
-        cache_dir=cache_dir, model_name=model_name, symbol=symbol, csv_path=csv_path
+        cache_dir=cache_dir,
+        model_name=model_name,
+        symbol=symbol,
+        csv_path=csv_path,
+        fingerprint=fingerprint,
+        model_key=model_key,
+        span=_span(df),
     )
-    if cache_path is not None:
-        result = _try_load(cache_path)
-        if result is not None:
-            return result
+    if cache_path is None or cache_dir is None:
+        return analyzer.generate_historical_signals(symbol, df)
 
-    computed = analyzer.generate_historical_signals(symbol, df)
+    row_hashes = _row_hashes(df)
+    digest = _input_digest(df, row_hashes)
+    entry = _try_load(cache_path)
+    if entry is not None and entry.input_digest == digest:
+        _touch(cache_path)
+        _record(cache_dir, model_name, "hit")
+        return entry.history
 
-    if cache_path is not None:
-        _try_save(cache_path, computed)
+    # Histories starting at the same bar extend each other
+    pointer = (
+        cache_path.parent / f"{symbol}_{model_key}_{_first_bar(df)}{LATEST_SUFFIX}"
+    )
+    base_path = _latest_entry_path(pointer, cache_path)
+    base = _try_load(base_path) if base_path is not None else None
+    if base is not None and base.input_digest == digest:
+        # Same prices under a new key (e.g. the CSV was rewritten unchanged)
+        computed, outcome = base.history, "reused"
+    elif base is not None and _is_extension(df, row_hashes, base):
+        computed, outcome = _extend(analyzer, symbol, df, base.history), "extended"
+        logger.debug(
+            "%s: extended cached %s history by %d bar(s)",
+            symbol,
+            model_name,
+            len(df) - base.input_rows,
+        )
+    else:
+        computed, outcome = analyzer.generate_historical_signals(symbol, df), "computed"
 
+    if _try_save(cache_path, CachedHistory(computed, len(df), digest)):
+        _set_latest(pointer, cache_path)
+    _record(cache_dir, model_name, outcome)
     return computed
 
 
+@dataclass
+class CachedInputs:
+    """What a scan reads from a symbol's prices besides its signal histories."""
+
+    eligibility: EligibilityInputs
+    # Row count and first bar of the analysed frame (the histories' span)
+    span: str
+    compact: bool
+
+
+def cached_inputs(
+    cache_dir: Path, symbol: str, fingerprint: str, window: int | None
+) -> CachedInputs | None:
+    """Inputs saved by `save_inputs` for this exact file content and window."""
+    path = _inputs_path(cache_dir, symbol, fingerprint, window)
+    entry = _try_load_object(path)
+    if not isinstance(entry, CachedInputs):
+        return None
+    _touch(path)
+    return entry
+
+
+def save_inputs(
+    cache_dir: Path,
+    symbol: str,
+    fingerprint: str,
+    window: int | None,
+    df: pd.DataFrame,
+    eligibility: EligibilityInputs,
+) -> None:
+    """Keep what a scan of `df` needs so `cached_inputs` can skip the file."""
+    entry = CachedInputs(eligibility, _span(df), _is_compact(df))
+    path = _inputs_path(cache_dir, symbol, fingerprint, window)
+    if not path.exists():
+        _try_save(path, entry)
+
+
+def cached_historical(
+    *,
+    analyzer,
+    symbol: str,
+    inputs: CachedInputs,
+    cache_dir: Path,
+    model_name: str,
+    fingerprint: str,
+) -> pd.DataFrame | None:
+    """The history get_or_compute_historical cached for the frame behind `inputs`.
+
+    `fingerprint` is the file's content hash, so the key alone identifies
+    the prices and no frame is needed; None on a miss.
+    """
+    if inputs.compact:
+        model_name = f"{model_name}_float32"
+    key = f"{symbol}_{fingerprint}_{_model_key(analyzer)}_{inputs.span}"
+    cache_path = cache_dir / model_name / f"{key}.pkl"
+    entry = _try_load(cache_path)
+    if entry is None:
+        return None
+    _touch(cache_path)
+    _record(cache_dir, model_name, "hit")
+    return entry.history
+
+
+@dataclass
+class CacheStats:
+    """Entries on disk and recorded lookup outcomes of a cache directory."""
+
+    entries: dict[str, int] = field(default_factory=dict)
+    bytes: dict[str, int] = field(default_factory=dict)
+    # model -> outcome -> lookups, from the stats log
+    lookups: dict[str, Counter] = field(default_factory=dict)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.bytes.values())
+
+    def hit_rate(self, model: str | None = None) -> float | None:
+        """Share of lookups answered without recomputing (hit or reused)."""
+        counts = self._counts(model)
+        total = sum(counts.values())
+        if not total:
+            return None
+        return (counts["hit"] + counts["reused"]) / total
+
+    def render(self) -> str:
+        lines = []
+        for model in sorted(set(self.entries) | set(self.lookups)):
+            lines.append(
+                f"{model}: {self.entries.get(model, 0)} entries, "
+                f"{self.bytes.get(model, 0) / _BYTES_PER_MB:.1f} MB; "
+                + self._render_lookups(model)
+            )
+        total_entries = sum(self.entries.values())
+        lines.append(
+            f"total: {total_entries} entries, {self.total_bytes / _BYTES_PER_MB:.1f} MB; "
+            + self._render_lookups(None)
+        )
+        return "\n".join(lines)
+
+    def _counts(self, model: str | None) -> Counter:
+        if model is not None:
+            return self.lookups.get(model, Counter())
+        return sum(self.lookups.values(), Counter())
+
+    def _render_lookups(self, model: str | None) -> str:
+        counts = self._counts(model)
+        total = sum(counts.values())
+        if not total:
+            return "no lookups recorded"
+        detail = ", ".join(f"{counts[outcome]} {outcome}" for outcome in OUTCOMES)
+        return f"{total} lookups ({detail}), hit rate {self.hit_rate(model):.1%}"
+
+
+@dataclass
+class PruneResult:
+    removed: int = 0
+    freed_bytes: int = 0
+    remaining_bytes: int = 0
+
+    def render(self) -> str:
+        return (
+            f"removed {self.removed} entries ({self.freed_bytes / _BYTES_PER_MB:.1f} MB); "
+            f"{self.remaining_bytes / _BYTES_PER_MB:.1f} MB left"
+        )
+
+
+def cache_stats(cache_dir: Path) -> CacheStats:
+    stats = CacheStats()
+    for path, size, _ in _entries(cache_dir):
+        model = path.parent.name
+        stats.entries[model] = stats.entries.get(model, 0) + 1
+        stats.bytes[model] = stats.bytes.get(model, 0) + size
+    stats.lookups = _read_lookups(cache_dir)
+    return stats
+
+
+def prune_cache(cache_dir: Path, *, max_mb: float) -> PruneResult:
+    """Delete least recently used entries until the cache fits in `max_mb`.
+
+    Hits refresh an entry's mtime, so mtime order is LRU order. The stats
+    log is compacted to one line per model and outcome.
+    """
+    entries = sorted(_entries(cache_dir), key=lambda entry: entry[2])
+    result = PruneResult(remaining_bytes=sum(size for _, size, _ in entries))
+    max_bytes = int(max_mb * _BYTES_PER_MB)
+    for path, size, _ in entries:
+        if result.remaining_bytes <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError as exc:
+            logger.debug("Cache eviction failed for %s: %s", path, exc)
+            continue
+        result.removed += 1
+        result.freed_bytes += size
+        result.remaining_bytes -= size
+    _compact_lookups(cache_dir)
+    return result
+
+
+def enforce_cache_budget(cache_dir: Path, budget_mb: float) -> None:
+    """prune_cache after a scan or backtest run; a budget of 0 disables it."""
+    if budget_mb <= 0:
+        return
+    result = prune_cache(cache_dir, max_mb=budget_mb)
+    if result.removed:
+        logger.info("Signal cache pruned: %s", result.render())
+
+
 class CachedAnalyzer:
-    """Wraps a StockDataAnalyzer, caching generate_historical_signals only."""
+    """Wraps a StockDataAnalyzer, caching generate_historical_signals only.
+
+    Callers that need both the current signal and the history should fetch
+    the (possibly cached) history and derive the signal from it with
+    generate_signal_from_history instead of calling generate_signal.
+    """
 
-    def __init__(self, analyzer, *, csv_path: Path, cache_dir: Path, model_name: str):
+    def __init__(
+        self,
+        analyzer,
+        *,
+        csv_path: Path,
+        cache_dir: Path,
+        model_name: str,
+        fingerprint: str | None = None,
+    ):
         self._analyzer = analyzer
         self._csv_path = csv_path
         self._cache_dir = cache_dir
         self._model_name = model_name
+        self._fingerprint = fingerprint
 
     def generate_signal(self, symbol, df):
         return self._analyzer.generate_signal(symbol, df)
 
+    def generate_signal_from_history(self, symbol, historical):
+        return self._analyzer.generate_signal_from_history(symbol, historical)
+
     def generate_historical_signals(self, symbol, df):
         return get_or_compute_historical(
             analyzer=self._analyzer,
@@ -52,31 +312,166 @@ class CachedAnalyzer:
             csv_path=self._csv_path,
             cache_dir=self._cache_dir,
             model_name=self._model_name,
+            fingerprint=self._fingerprint,
         )
 
 
+def _is_compact(df: pd.DataFrame) -> bool:
+    return "Close" in df.columns and df["Close"].dtype == "float32"
+
+
 def _resolve_cache_path(
     *,
     cache_dir: Path | None,
     model_name: str,
     symbol: str,
     csv_path: Path | None,
+    fingerprint: str | None = None,
+    model_key: str,
+    span: str,
 ) -> Path | None:
     if cache_dir is None or csv_path is None:
         return None
     try:
-        key = _cache_key(symbol, csv_path)
+        key = _cache_key(symbol, csv_path, fingerprint, model_key=model_key, span=span)
         return cache_dir / model_name / f"{key}.pkl"
     except Exception:
         return None
 
 
-def _cache_key(symbol: str, csv_path: Path) -> str:
-    mtime_ns = csv_path.stat().st_mtime_ns
-    return f"{symbol}_{mtime_ns:016x}"
+def _cache_key(
+    symbol: str,
+    csv_path: Path,
+    fingerprint: str | None = None,
+    *,
+    model_key: str,
+    span: str,
+) -> str:
+    """Key on the prices, the model config and the code computing the history.
+
+    The prices are identified by the CSV content hash when known, else by
+    its mtime. `fingerprint` is the manifest hash already resolved by
+    iter_symbol_data; without it the price-store manifest is consulted (one
+    stat, no read). `model_key` comes from `_model_key`. `span` (row count
+    and first bar) keeps the scan's analysis-window tail and the backtest's
+    full history of one file in separate entries.
+    """
+    if fingerprint is None:
+        entry = PriceStoreManifest(csv_path.parent).fresh_entry(csv_path.stem)
+        if entry is not None and entry.filename == csv_path.name:
+            fingerprint = entry.content_hash
+    if fingerprint is None:
+        fingerprint = f"{csv_path.stat().st_mtime_ns:016x}"
+    return f"{symbol}_{fingerprint}_{model_key}_{span}"
+
+
+def _span(df: pd.DataFrame) -> str:
+    return f"{len(df)}r{_first_bar(df)}"
+
+
+def _inputs_path(
+    cache_dir: Path, symbol: str, fingerprint: str, window: int | None
+) -> Path:
+    window_key = "all" if window is None else str(window)
+    name = f"{symbol}_{fingerprint}_{window_key}_v{CACHE_FORMAT_VERSION}.pkl"
+    return Path(cache_dir) / INPUTS_DIRNAME / name
+
+
+def _first_bar(df: pd.DataFrame) -> str:
+    if df.empty:
+        return "none"
+    first = df.index[0]
+    if isinstance(first, pd.Timestamp):
+        return first.strftime("%Y%m%d")
+    return str(first)
+
+
+def _model_key(analyzer) -> str:
+    """Hash of what, besides the prices, determines the analyzer's history."""
+    generator = getattr(analyzer, "signal_generator", analyzer)
+    config = getattr(generator, "config", None)
+    if dataclasses.is_dataclass(config) and not isinstance(config, type):
+        config = dataclasses.asdict(config)
+    parts = (
+        type(generator).__qualname__,
+        config,
+        getattr(generator, "tail_tolerance", None),
+        CACHE_FORMAT_VERSION,
+        _code_version(),
+    )
+    return hashlib.blake2b(repr(parts).encode(), digest_size=6).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _code_version() -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    for package in CODE_PACKAGES:
+        spec = importlib.util.find_spec(package)
+        for location in (spec.submodule_search_locations or []) if spec else []:
+            root = Path(location)
+            for path in sorted(root.rglob("*.py")):
+                digest.update(path.relative_to(root).as_posix().encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    return pd.util.hash_pandas_object(df, index=True).to_numpy()
+
+
+def _input_digest(df: pd.DataFrame, row_hashes: np.ndarray) -> str:
+    """Digest of the rows behind `row_hashes`, tied to `df`'s columns and dtypes."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()]).encode()
+    )
+    digest.update(np.ascontiguousarray(row_hashes).tobytes())
+    return digest.hexdigest()
+
+
+def _is_extension(
+    df: pd.DataFrame, row_hashes: np.ndarray, base: CachedHistory
+) -> bool:
+    """True when `df` is the base entry's input with bars appended."""
+    return 0 < base.input_rows < len(df) and base.input_digest == _input_digest(
+        df, row_hashes[: base.input_rows]
+    )
+
+
+def _extend(
+    analyzer, symbol: str, df: pd.DataFrame, history: pd.DataFrame
+) -> pd.DataFrame:
+    extend = getattr(analyzer, "extend_historical_signals", None)
+    if extend is None:
+        return analyzer.generate_historical_signals(symbol, df)
+    return extend(symbol, df, history)
+
+
+def _latest_entry_path(pointer: Path, cache_path: Path) -> Path | None:
+    try:
+        name = pointer.read_text().strip()
+    except OSError:
+        return None
+    return cache_path.parent / name if name and name != cache_path.name else None
+
+
+def _set_latest(pointer: Path, cache_path: Path) -> None:
+    # Superseded entries stay on disk: another price source for the same
+    # symbol (e.g. a different interval directory) may still hit them
+    try:
+        tmp = pointer.with_suffix(".tmp")
+        tmp.write_text(cache_path.name)
+        tmp.rename(pointer)
+    except OSError as exc:
+        logger.debug("Cache pointer update failed for %s: %s", pointer, exc)
+
+
+def _try_load(cache_path: Path) -> CachedHistory | None:
+    entry = _try_load_object(cache_path)
+    return entry if isinstance(entry, CachedHistory) else None
 
 
-def _try_load(cache_path: Path) -> pd.DataFrame | None:
+def _try_load_object(cache_path: Path) -> object | None:
     try:
         with open(cache_path, "rb") as f:
             return pickle.load(f)
@@ -84,12 +479,123 @@ def _try_load(cache_path: Path) -> pd.DataFrame | None:
         return None
 
 
-def _try_save(cache_path: Path, df: pd.DataFrame) -> None:
+def _touch(cache_path: Path) -> None:
+    # mtime doubles as last use for prune_cache's LRU order
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+
+
+def _try_save(cache_path: Path, entry: CachedHistory | CachedInputs) -> bool:
     try:
         cache_path.parent.mkdir(parents=True, exist_ok=True)
         tmp = cache_path.with_suffix(".tmp")
         with open(tmp, "wb") as f:
-            pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
         tmp.rename(cache_path)  # atomic on Linux
+        return True
     except Exception as exc:
         logger.debug("Cache write failed for %s: %s", cache_path, exc)
+        return False
+
+
+def _entries(cache_dir: Path) -> list[tuple[Path, int, int]]:
+    """(path, size, mtime_ns) of every entry under the model directories."""
+    entries = []
+    for path in Path(cache_dir).glob("*/*.pkl"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((path, stat.st_size, stat.st_mtime_ns))
+    return entries
+
+
+def _record(cache_dir: Path, model_name: str, outcome: str) -> None:
+    # One small O_APPEND write, so worker processes can share the log
+    try:
+        fd = os.open(
+            Path(cache_dir) / STATS_FILENAME,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644,
+        )
+        try:
+            os.write(fd, f"{model_name} {outcome} 1\n".encode())
+        finally:
+            os.close(fd)
+    except OSError as exc:
+        logger.debug("Cache stats write failed for %s: %s", cache_dir, exc)
+
+
+def _read_lookups(cache_dir: Path) -> dict[str, Counter]:
+    lookups: dict[str, Counter] = {}
+    try:
+        with open(Path(cache_dir) / STATS_FILENAME) as f:
+            for line in f:
+                try:
+                    model, outcome, count = line.split()
+                    lookups.setdefault(model, Counter())[outcome] += int(count)
+                except ValueError:
+                    continue
+    except OSError:
+        pass
+    return lookups
+
+
+def _compact_lookups(cache_dir: Path) -> None:
+    # Lookups recorded while this runs can be lost; the counts are advisory
+    lookups = _read_lookups(cache_dir)
+    if not lookups:
+        return
+    path = Path(cache_dir) / STATS_FILENAME
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(
+            "".join(
+                f"{model} {outcome} {count}\n"
+                for model, counts in sorted(lookups.items())
+                for outcome, count in sorted(counts.items())
+            )
+        )
+        tmp.rename(path)
+    except OSError as exc:
+        logger.debug("Cache stats compaction failed for %s: %s", path, exc)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Inspect or prune the Lux/SMC signal cache"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_stats = sub.add_parser("stats", help="Entries, size and hit rate per model")
+    p_stats.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR))
+
+    p_prune = sub.add_parser("prune", help="Evict least recently used entries")
+    p_prune.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR))
+    p_prune.add_argument(
+        "--max-mb",
+        type=float,
+        default=DEFAULT_CACHE_BUDGET_MB,
+        help=f"Size to prune down to (default: {DEFAULT_CACHE_BUDGET_MB:.0f}).",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    cache_dir = Path(args.cache_dir)
+
+    if args.command == "stats":
+        print(cache_stats(cache_dir).render())
+        return 0
+    if args.command == "prune":
+        print(prune_cache(cache_dir, max_mb=args.max_mb).render())
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,10 +1,18 @@
+import io
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from stock_data_manager.implementations.append_support import read_csv_tail
+
 
 MIN_HISTORY_ROWS = 200
+# Columns narrowed to float32 by compact_price_frame
+COMPACT_FLOAT_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close")
+# Dropped by compact_price_frame when they carry no events
+CORPORATE_ACTION_COLUMNS = ("Dividends", "Stock Splits")
 
 
 @dataclass
@@ -16,16 +24,86 @@ class EligibilityResult:
     close: float | None
 
 
+@dataclass
+class EligibilityInputs:
+    """Everything evaluate_symbol_eligibility reads from a price frame."""
+
+    rows: int
+    close: float | None
+    avg_volume_20: float | None
+    avg_dollar_volume_20: float | None
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "EligibilityInputs":
+        return cls(
+            rows=len(df),
+            close=_latest_close(df),
+            avg_volume_20=calculate_avg_volume_20(df),
+            avg_dollar_volume_20=calculate_avg_dollar_volume_20(df),
+        )
+
+
 def load_symbol_csv(data_dir: str | Path, symbol: str) -> pd.DataFrame:
     csv_path = Path(data_dir) / f"{symbol}.csv"
     if not csv_path.exists():
         raise FileNotFoundError(f"Missing CSV for {symbol}: {csv_path}")
 
-    df = pd.read_csv(csv_path)
+    return _index_by_date(pd.read_csv(csv_path)).sort_index()
+
+
+def load_symbol_csv_tail(data_dir: str | Path, symbol: str, rows: int) -> pd.DataFrame:
+    """Same as `load_symbol_csv(...).tail(rows)`, parsing only the end of the file.
+
+    Falls back to a full load when the tail cannot be trusted to be the last
+    `rows` bars (unparseable dates or rows out of order).
+    """
+    if rows <= 0:
+        raise ValueError("rows must be greater than zero")
+    csv_path = Path(data_dir) / f"{symbol}.csv"
+    if not csv_path.exists():
+        raise FileNotFoundError(f"Missing CSV for {symbol}: {csv_path}")
+
+    header, lines = read_csv_tail(csv_path, rows)
+    if lines:
+        df = _index_by_date(pd.read_csv(io.StringIO("\n".join([header, *lines]))))
+        if len(df) == len(lines) and df.index.is_monotonic_increasing:
+            return df
+    return load_symbol_csv(data_dir, symbol).tail(rows)
+
+
+def compact_price_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Narrow a loaded price frame to roughly half its memory.
+
+    Prices become float32, Volume becomes int64 when every value is a whole
+    number, and Dividends / Stock Splits are dropped when they are all zero
+    (kept as float32 otherwise). Other columns are left untouched.
+
+    float32 carries ~7 significant digits, so indicator outputs computed from
+    a compact frame differ from the float64 ones in the last digits (relative
+    error around 1e-5 for RSI/ADX); discrete signals are expected to match.
+    """
+    columns = {}
+    for name in df.columns:
+        values = df[name]
+        if name in CORPORATE_ACTION_COLUMNS:
+            if values.fillna(0).eq(0).all():
+                continue
+            columns[name] = values.astype(np.float32)
+        elif name in COMPACT_FLOAT_COLUMNS and values.dtype.kind == "f":
+            columns[name] = values.astype(np.float32)
+        elif name == "Volume" and values.dtype.kind == "f":
+            array = values.to_numpy()
+            whole = np.isfinite(array).all() and (array == np.round(array)).all()
+            columns[name] = values.astype(np.int64) if whole else values
+        else:
+            columns[name] = values
+    return pd.DataFrame(columns, index=df.index)
+
+
+def _index_by_date(df: pd.DataFrame) -> pd.DataFrame:
     date_column = _detect_date_column(df)
     df[date_column] = pd.to_datetime(df[date_column], utc=True, errors="coerce")
-    df = df.dropna(subset=[date_column]).set_index(date_column).sort_index()
-    return df
+    return df.dropna(subset=[date_column]).set_index(date_column)
 
 
 def evaluate_symbol_eligibility(
@@ -36,16 +114,36 @@ def evaluate_symbol_eligibility(
     min_avg_dollar_volume_20: float = 0,
     min_history_rows: int = MIN_HISTORY_ROWS,
 ) -> EligibilityResult:
+    return evaluate_eligibility_inputs(
+        market_cap,
+        None if df is None else EligibilityInputs.from_frame(df),
+        min_market_cap=min_market_cap,
+        min_avg_volume_20=min_avg_volume_20,
+        min_avg_dollar_volume_20=min_avg_dollar_volume_20,
+        min_history_rows=min_history_rows,
+    )
+
+
+def evaluate_eligibility_inputs(
+    market_cap: float | None,
+    inputs: EligibilityInputs | None,
+    min_market_cap: float,
+    min_avg_volume_20: float,
+    min_avg_dollar_volume_20: float = 0,
+    min_history_rows: int = MIN_HISTORY_ROWS,
+) -> EligibilityResult:
+    """`evaluate_symbol_eligibility` from inputs already taken from the frame."""
+    close = inputs.close if inputs is not None else None
     if market_cap is None or pd.isna(market_cap) or market_cap < min_market_cap:
         return EligibilityResult(
             eligible=False,
             excluded_reason="market_cap_below_threshold",
             avg_volume_20=None,
             avg_dollar_volume_20=None,
-            close=_latest_close(df),
+            close=close,
         )
 
-    if df is None:
+    if inputs is None:
         return EligibilityResult(
             eligible=False,
             excluded_reason="missing_csv",
@@ -54,24 +152,24 @@ def evaluate_symbol_eligibility(
             close=None,
         )
 
-    if len(df) < min_history_rows:
+    if inputs.rows < min_history_rows:
         return EligibilityResult(
             eligible=False,
             excluded_reason="insufficient_history",
             avg_volume_20=None,
             avg_dollar_volume_20=None,
-            close=_latest_close(df),
+            close=close,
         )
 
-    avg_volume_20 = calculate_avg_volume_20(df)
-    avg_dollar_volume_20 = calculate_avg_dollar_volume_20(df)
+    avg_volume_20 = inputs.avg_volume_20
+    avg_dollar_volume_20 = inputs.avg_dollar_volume_20
     if avg_volume_20 is None or avg_volume_20 < min_avg_volume_20:
         return EligibilityResult(
             eligible=False,
             excluded_reason="avg_volume_20_below_threshold",
             avg_volume_20=avg_volume_20,
             avg_dollar_volume_20=avg_dollar_volume_20,
-            close=_latest_close(df),
+            close=close,
         )
 
     if min_avg_dollar_volume_20 > 0 and (
@@ -82,7 +180,7 @@ def evaluate_symbol_eligibility(
             excluded_reason="avg_dollar_volume_20_below_threshold",
             avg_volume_20=avg_volume_20,
             avg_dollar_volume_20=avg_dollar_volume_20,
-            close=_latest_close(df),
+            close=close,
         )
 
     return EligibilityResult(
@@ -90,7 +188,7 @@ def evaluate_symbol_eligibility(
         excluded_reason=None,
         avg_volume_20=avg_volume_20,
         avg_dollar_volume_20=avg_dollar_volume_20,
-        close=_latest_close(df),
+        close=close,
     )
 
 
@@ -1,5 +1,7 @@
+from dataclasses import dataclass
 from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
 
 from market_scanner.ranking import signal_to_label
@@ -12,6 +14,8 @@ SMC_ACTIVE_PRIORITY_CONTEXTS = (
     ("short_term_bullish_reversal", "short_term_bearish_reversal"),
     ("bullish_confluence", "bearish_confluence"),
 )
+EVENT_FIELDS = ("signal", "options_hint", "context", "date", "days_since")
+_DAY_NS = 86_400_000_000_000
 
 
 def optional_float(value) -> float | None:
@@ -117,51 +121,150 @@ def active_smc_event(historical: pd.DataFrame) -> dict[str, str | int | None]:
     return latest_event_by_priority(historical, SMC_ACTIVE_PRIORITY_CONTEXTS)
 
 
+@dataclass
+class EventStateHistory:
+    """Latest and active-priority event of a history as of each of its bars.
+
+    `latest_index[i]` / `active_index[i]` are the positions of the events in
+    effect at bar `i` (-1 before the first one); the remaining arrays hold
+    each bar's event fields, so the state of bar `i` is a couple of lookups
+    instead of a pair of dicts per bar. `state[i]` returns the
+    `{"latest": ..., "active": ...}` dicts `build_scanner_row_from_history`
+    accepts as `lux_event_state` / `smc_event_state`.
+    """
+
+    latest_index: np.ndarray
+    active_index: np.ndarray
+    signal: np.ndarray
+    options_hint: np.ndarray
+    context: np.ndarray
+    date: np.ndarray
+    # Bar dates normalized to midnight, as nanoseconds
+    day: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.latest_index)
+
+    def __getitem__(self, position: int) -> dict[str, dict[str, str | int | None]]:
+        return {
+            "latest": self._event(int(self.latest_index[position]), position),
+            "active": self._event(int(self.active_index[position]), position),
+        }
+
+    def events(self, key: str) -> dict[str, np.ndarray]:
+        """`EVENT_FIELDS` of the "latest" or "active" event of every bar.
+
+        Object arrays holding the same values as `self[i][key]`, with None
+        for bars before the first event.
+        """
+        indexes = self.latest_index if key == "latest" else self.active_index
+        found = indexes >= 0
+        source = np.where(found, indexes, 0)
+        days = (self.day - self.day[source]) // _DAY_NS
+        columns = {
+            "signal": self.signal[source],
+            "options_hint": self.options_hint[source],
+            "context": self.context[source],
+            "date": self.date[source],
+            "days_since": _objects(days.tolist()),
+        }
+        for values in columns.values():
+            values[~found] = None
+        return columns
+
+    def _event(self, source: int, position: int) -> dict[str, str | int | None]:
+        if source < 0:
+            return empty_event()
+        return {
+            "signal": self.signal[source],
+            "options_hint": self.options_hint[source],
+            "context": self.context[source],
+            "date": self.date[source],
+            "days_since": int((self.day[position] - self.day[source]) // _DAY_NS),
+        }
+
+
 def build_event_state_history(
     historical: pd.DataFrame,
     *,
     active_priority_contexts: tuple[tuple[str, str], ...],
-) -> list[dict[str, dict[str, str | int | None]]]:
-    latest_row = None
-    active_row = None
-    active_rank = None
-    priority_rank = _priority_rank(active_priority_contexts)
-    event_mask_values = event_mask(historical) if not historical.empty else []
-    states = []
-
-    for position, (_, row) in enumerate(historical.iterrows()):
-        if bool(event_mask_values.iloc[position]):
-            latest_row = row
-        if (
-            "signal_context" in historical.columns
-            and row.get("signal_context") in priority_rank
-        ):
-            candidate_rank = priority_rank[str(row.get("signal_context"))]
-            if active_row is None or _is_better_active_event(
-                row,
-                candidate_rank=candidate_rank,
-                active_row=active_row,
-                active_rank=active_rank,
-            ):
-                active_row = row
-                active_rank = candidate_rank
-
-        states.append(
-            {
-                "latest": (
-                    _event_from_current_row(latest_row, current_row=row)
-                    if latest_row is not None
-                    else empty_event()
-                ),
-                "active": (
-                    _event_from_current_row(active_row, current_row=row)
-                    if active_row is not None
-                    else empty_event()
-                ),
-            }
+) -> EventStateHistory:
+    """Event state of every bar, as of the history cut at that bar.
+
+    Bar `i` matches `latest_model_event` / `latest_event_by_priority` over
+    `historical.iloc[: i + 1]`. The latest event is a forward-filled index
+    of event bars; the active event is a running best over the priority
+    contexts, where a later date wins and, on the same date, the
+    higher-priority (lower rank) context wins.
+    """
+    if historical.empty:
+        nothing = np.empty(0, dtype=np.intp)
+        return EventStateHistory(
+            latest_index=nothing,
+            active_index=nothing,
+            signal=_objects([]),
+            options_hint=_objects([]),
+            context=_objects([]),
+            date=_objects([]),
+            day=np.empty(0, dtype=np.int64),
+        )
+
+    rows = len(historical)
+    positions = np.arange(rows, dtype=np.intp)
+    latest_index = np.maximum.accumulate(
+        np.where(event_mask(historical).to_numpy(dtype=bool), positions, -1)
+    )
+
+    dates = pd.DatetimeIndex(pd.to_datetime(historical["date"]))
+    active_index = np.full(rows, -1, dtype=np.intp)
+    if "signal_context" in historical.columns:
+        ranks = historical["signal_context"].map(
+            _priority_rank(active_priority_contexts)
         )
+        candidates = positions[ranks.notna().to_numpy()]
+        if len(candidates):
+            active_index = _running_best(
+                candidates,
+                dates.asi8[candidates],
+                ranks.to_numpy(dtype=float)[candidates],
+                rows,
+            )
+
+    return EventStateHistory(
+        latest_index=latest_index,
+        active_index=active_index,
+        signal=_objects(
+            [signal_to_label(value) for value in historical["combined_signal"].tolist()]
+        ),
+        options_hint=_text(historical, "options_hint", "NO_TRADE"),
+        context=_text(historical, "signal_context", "no_trade"),
+        date=_objects([stamp.isoformat() for stamp in dates]),
+        day=dates.normalize().asi8,
+    )
+
+
+def _running_best(
+    candidates: np.ndarray, dates: np.ndarray, ranks: np.ndarray, rows: int
+) -> np.ndarray:
+    """Position of the best candidate seen so far at every bar (-1 before any).
 
-    return states
+    Candidates get a dense score ordering them by (date, -rank); the running
+    maximum of the score picks the best one, and equal scores resolve to the
+    earliest bar, as the strict "better than" comparison of the bar loop did.
+    """
+    order = np.lexsort((-ranks, dates))
+    new_key = np.ones(len(order), dtype=bool)
+    new_key[1:] = (np.diff(dates[order]) != 0) | (np.diff(ranks[order]) != 0)
+    dense = np.empty(len(order), dtype=np.int64)
+    dense[order] = np.cumsum(new_key) - 1
+
+    score = np.full(rows, -1, dtype=np.int64)
+    score[candidates] = dense
+    best = np.maximum.accumulate(score)
+    first = np.empty(dense.max() + 1, dtype=candidates.dtype)
+    unique_scores, first_positions = np.unique(dense, return_index=True)
+    first[unique_scores] = candidates[first_positions]
+    return np.where(best >= 0, first[np.maximum(best, 0)], -1)
 
 
 def rank_inputs(
@@ -241,18 +344,6 @@ def _event_from_dates(
     }
 
 
-def _event_from_current_row(
-    event_row: pd.Series,
-    *,
-    current_row: pd.Series,
-) -> dict[str, str | int | None]:
-    return _event_from_dates(
-        event_row,
-        last_date=pd.Timestamp(event_row["date"]),
-        final_date=pd.Timestamp(current_row["date"]),
-    )
-
-
 def _priority_rank(
     priority_contexts: tuple[tuple[str, str], ...],
 ) -> dict[str, int]:
@@ -263,17 +354,13 @@ def _priority_rank(
     return priority_rank
 
 
-def _is_better_active_event(
-    row: pd.Series,
-    *,
-    candidate_rank: int,
-    active_row: pd.Series,
-    active_rank: int | None,
-) -> bool:
-    row_date = pd.Timestamp(row["date"])
-    active_date = pd.Timestamp(active_row["date"])
-    if row_date > active_date:
-        return True
-    if row_date == active_date and active_rank is not None:
-        return candidate_rank < active_rank
-    return False
+def _objects(values: list) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _text(historical: pd.DataFrame, column: str, default: str) -> np.ndarray:
+    if column not in historical.columns:
+        return _objects([default] * len(historical))
+    return _objects([str(value) for value in historical[column].tolist()])
@@ -51,6 +51,7 @@ def _consistency_allows_candidate(value: Any) -> bool:
     return consistency_score is not None and consistency_score >= 1
 
 
+# Vectorized copy in scanner_columns.py: change the rules in both places
 def classify_market_state(row: Mapping[str, Any]) -> str:
     lux_trend = str(row.get("lux_trend") or "")
     lux_strength = str(row.get("lux_strength") or "")
@@ -104,6 +105,7 @@ def classify_market_state(row: Mapping[str, Any]) -> str:
     return UNKNOWN
 
 
+# Vectorized copy in scanner_columns.py: change the rules in both places
 def adjust_alignment_for_market_state(
     alignment: str,
     row: Mapping[str, Any],
@@ -164,6 +166,7 @@ def adjust_alignment_for_market_state(
     return "no_trade"
 
 
+# Vectorized copy in scanner_columns.py: change the rules in both places
 def classify_action_bucket(
     adjusted_alignment: str,
     market_state: str,
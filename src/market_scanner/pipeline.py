@@ -1,12 +1,31 @@
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
+from itertools import count, islice
 from pathlib import Path
-from typing import Callable
+from typing import Callable, TypeVar
 
 import pandas as pd
 
-from market_scanner.eligibility import load_symbol_csv
+from market_scanner.cache import CachedInputs
+from market_scanner.eligibility import load_symbol_csv, load_symbol_csv_tail
 from market_scanner.universe_loader import load_universe
 from stock_analyzer.analyzer import StockDataAnalyzer
+from stock_data_manager.repositories.manifest import PriceStoreManifest
+from stock_data_manager.repositories.mmap_store import MmapPriceStore, open_mmap_store
+
+# Symbols parsed ahead of the consumer by iter_symbol_data
+DEFAULT_PREFETCH = 4
+# Symbols per memory-mapped store written by shared_price_store
+SHARED_STORE_BATCH_SYMBOLS = 32
+# Pool tasks submitted ahead of the consumer, per worker
+PENDING_TASKS_PER_WORKER = 4
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 @dataclass
@@ -21,6 +40,10 @@ class SymbolData:
     market_cap: float | None
     df: pd.DataFrame | None
     load_error: str | None
+    # Content hash from the price-store manifest, when it still matches the CSV
+    fingerprint: str | None = None
+    # Set instead of df when the file was skipped (see iter_symbol_data)
+    inputs: CachedInputs | None = None
 
 
 def create_analyzers(
@@ -49,21 +72,166 @@ def iter_symbol_data(
     data_dir: str | Path,
     *,
     transform_df: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
-) -> list[SymbolData]:
-    rows: list[SymbolData] = []
-    for entry in universe.itertuples(index=False):
+    tail_rows: int | None = None,
+    prefetch: int = DEFAULT_PREFETCH,
+    cached: Callable[[str, str], CachedInputs | None] | None = None,
+) -> Iterator[SymbolData]:
+    """Stream every universe symbol's CSV from `data_dir`, in universe order.
+
+    A background thread parses up to `prefetch` symbols ahead of the consumer,
+    so reading the next files overlaps with analysing the current one and at
+    most `prefetch + 1` frames are alive at a time (`prefetch=0` loads inline).
+
+    With `tail_rows`, only the last `tail_rows` bars of each file are parsed
+    (the CSV is read from the end), for callers that never look further back.
+
+    The price-store manifest supplies each symbol's `fingerprint` (its
+    content hash, while the entry still matches the file), which keys the
+    signal cache without hashing the CSV. With `cached`, a symbol whose
+    `cached(symbol, fingerprint)` returns inputs is not opened at all: it is
+    yielded with those `inputs` and no `df`. Callers that need the prices
+    themselves (e.g. forward returns in backtests) leave `cached` unset.
+    """
+    manifest = PriceStoreManifest(data_dir).entries()
+
+    def fingerprint_of(symbol: str) -> str | None:
+        manifest_entry = manifest.get(symbol)
+        if manifest_entry is not None and manifest_entry.matches(
+            Path(data_dir) / f"{symbol}.csv"
+        ):
+            return manifest_entry.content_hash
+        return None
+
+    def load(entry) -> SymbolData:
         symbol = str(entry.symbol).upper()
         market_cap = float(entry.market_cap) if pd.notna(entry.market_cap) else None
+        fingerprint = fingerprint_of(symbol)
+        if cached is not None and fingerprint is not None:
+            inputs = cached(symbol, fingerprint)
+            if inputs is not None:
+                return SymbolData(
+                    symbol, market_cap, None, None, fingerprint, inputs=inputs
+                )
         try:
-            df = load_symbol_csv(data_dir, symbol)
+            if tail_rows is None:
+                df = load_symbol_csv(data_dir, symbol)
+            else:
+                df = load_symbol_csv_tail(data_dir, symbol, tail_rows)
             if transform_df is not None:
                 df = transform_df(df)
         except FileNotFoundError:
-            rows.append(SymbolData(symbol, market_cap, None, "missing_csv"))
-            continue
+            return SymbolData(symbol, market_cap, None, "missing_csv")
         except Exception:
-            rows.append(SymbolData(symbol, market_cap, None, "load_failed"))
-            continue
+            return SymbolData(symbol, market_cap, None, "load_failed")
+        return SymbolData(symbol, market_cap, df, None, fingerprint)
+
+    entries = universe.itertuples(index=False)
+    if prefetch <= 0:
+        for entry in entries:
+            yield load(entry)
+        return
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch") as reader:
+        pending = deque(
+            reader.submit(load, entry) for entry in islice(entries, prefetch)
+        )
+        try:
+            while pending:
+                symbol_data = pending.popleft().result()
+                entry = next(entries, None)
+                if entry is not None:
+                    pending.append(reader.submit(load, entry))
+                yield symbol_data
+        finally:
+            # Consumer stopped early: drop the read-ahead instead of finishing it
+            for future in pending:
+                future.cancel()
+
+
+@contextmanager
+def shared_price_store(
+    rows: Iterable[SymbolData],
+    batch_symbols: int = SHARED_STORE_BATCH_SYMBOLS,
+) -> Iterator[Iterator[tuple[str, SymbolData]]]:
+    """Stream loaded frames into temporary memory-mapped stores for workers.
+
+    Yields an iterator of `(store_dir, symbol_data)` pairs, in `rows` order.
+    Rows are consumed lazily in batches of `batch_symbols`: each batch is
+    written to its own store, and its pairs are handed out once the store is
+    complete, so workers can start on the first batch while later ones are
+    still being read. `store_dir` plus the symbol is all a worker needs to
+    get its frame via `load_shared_frame`. Each `SymbolData.df` is released
+    once written, so the parent holds at most the frames in flight. The
+    stores are deleted on exit; shut the process pool down inside the block.
+    """
+    rows = iter(rows)
+
+    def frames(batch: list[SymbolData]) -> Iterator[tuple[str, pd.DataFrame]]:
+        # Fills `batch` with the rows it consumes, frames or not
+        for symbol_data in islice(rows, batch_symbols):
+            batch.append(symbol_data)
+            if symbol_data.df is not None:
+                yield symbol_data.symbol, symbol_data.df
+                symbol_data.df = None
+
+    def batches(root: str) -> Iterator[tuple[str, SymbolData]]:
+        for number in count():
+            batch: list[SymbolData] = []
+            store_dir = str(Path(root) / f"batch_{number:05d}")
+            MmapPriceStore.build(store_dir, frames(batch))
+            if not batch:
+                return
+            for symbol_data in batch:
+                yield store_dir, symbol_data
+
+    with tempfile.TemporaryDirectory(prefix="price_store_") as root:
+        yield batches(root)
+
+
+def map_in_order(
+    pool: Executor,
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_pending: int,
+) -> Iterator[R]:
+    """Like `pool.map(fn, items)`, but pulls `items` lazily.
+
+    At most `max_pending` tasks are submitted ahead of the consumer, whereas
+    `Executor.map` drains the whole iterable up front.
+    """
+    items = iter(items)
+    pending = deque(
+        pool.submit(fn, item) for item in islice(items, max(1, max_pending))
+    )
+    try:
+        while pending:
+            result = pending.popleft().result()
+            try:
+                item = next(items)
+            except StopIteration:
+                pass
+            else:
+                pending.append(pool.submit(fn, item))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool whose workers are already running when it is returned.
+
+    With the fork start method, a worker forked later would copy a process
+    in which `iter_symbol_data`'s reader thread is running, which can leave
+    the child deadlocked on a lock held by that thread. Create the pool
+    before iterating the symbol stream.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers)
+    # Under fork, the first submit starts every worker at once
+    pool.submit(int).result()
+    return pool
+
 
-        rows.append(SymbolData(symbol, market_cap, df, None))
-    return rows
+def load_shared_frame(store_dir: str, symbol: str) -> pd.DataFrame:
+    """Read-only, zero-copy frame of `symbol` from a `shared_price_store`."""
+    return open_mmap_store(store_dir).load_symbol(symbol)
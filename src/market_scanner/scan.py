@@ -1,32 +1,51 @@
 import argparse
 import sys
-from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
 
-from market_scanner.cache import CachedAnalyzer
-
 import pandas as pd
-from market_scanner.event_state import smc_context
 
+from market_scanner.cache import (
+    DEFAULT_CACHE_BUDGET_MB,
+    CachedAnalyzer,
+    CachedInputs,
+    cached_historical,
+    cached_inputs,
+    enforce_cache_budget,
+    save_inputs,
+)
 from market_scanner.eligibility import (
     MIN_HISTORY_ROWS,
+    EligibilityInputs,
     EligibilityResult,
+    evaluate_eligibility_inputs,
     evaluate_symbol_eligibility,
+    load_symbol_csv,
+    load_symbol_csv_tail,
 )
+from market_scanner.event_state import smc_context
 from market_scanner.market_state import AVOID, UNKNOWN
 from market_scanner.models import ScannerRow
 from market_scanner.pipeline import (
+    PENDING_TASKS_PER_WORKER,
     create_analyzers,
     iter_symbol_data,
     load_selected_universe,
+    load_shared_frame,
+    map_in_order,
+    process_pool,
+    shared_price_store,
 )
 from market_scanner.report_writer import (
     render_top_n_summary,
     sort_scanner_results,
     write_csv_report,
 )
-from market_scanner.scanner_row import build_scanner_row
+from market_scanner.scanner_row import (
+    build_scanner_row,
+    build_scanner_row_from_histories,
+)
 from stock_analyzer.analyzer import StockDataAnalyzer
 
 _smc_context = smc_context
@@ -36,7 +55,8 @@ _smc_context = smc_context
 class _ScanWorkerArgs:
     symbol: str
     market_cap: float | None
-    df: pd.DataFrame | None
+    # Directory of the shared_price_store; the frame is there unless load_error
+    store_dir: str
     load_error: str | None
     analysis_bars: int | None
     ranking_mode: str
@@ -47,6 +67,9 @@ class _ScanWorkerArgs:
     csv_path: Path | None = None
     cache_dir: Path | None = None
     use_cache: bool = False
+    fingerprint: str | None = None
+    # Set when iter_symbol_data skipped the file; the store has no frame then
+    inputs: CachedInputs | None = None
 
 
 def _scan_symbol_worker(args: _ScanWorkerArgs) -> dict:
@@ -66,13 +89,28 @@ def _scan_symbol_worker(args: _ScanWorkerArgs) -> dict:
             symbol, market_cap, eligibility, ranking_mode=args.ranking_mode
         )
 
-    if args.load_error is not None or args.df is None:
+    if args.load_error is not None:
         return _build_analysis_failed_row(symbol, market_cap, args.ranking_mode)
 
-    analysis_df = _analysis_window(args.df, args.analysis_bars)
-    eligibility = evaluate_symbol_eligibility(
-        market_cap=market_cap,
-        df=analysis_df,
+    use_cache = (
+        args.use_cache and args.cache_dir is not None and args.csv_path is not None
+    )
+    analysis_df = None
+    if args.inputs is not None:
+        inputs = args.inputs.eligibility
+    else:
+        df = load_shared_frame(args.store_dir, symbol)
+        analysis_df = _analysis_window(df, args.analysis_bars)
+        inputs = _frame_inputs(
+            symbol,
+            analysis_df,
+            fingerprint=args.fingerprint,
+            cache_dir=args.cache_dir if use_cache else None,
+            analysis_bars=args.analysis_bars,
+        )
+    eligibility = evaluate_eligibility_inputs(
+        market_cap,
+        inputs,
         min_market_cap=args.min_market_cap,
         min_avg_volume_20=args.min_avg_volume_20,
         min_avg_dollar_volume_20=args.min_avg_dollar_volume_20,
@@ -86,21 +124,42 @@ def _scan_symbol_worker(args: _ScanWorkerArgs) -> dict:
     try:
         effective_lux = None
         effective_smc = None
-        if args.use_cache and args.cache_dir is not None and args.csv_path is not None:
+        if use_cache:
             from stock_analyzer.analyzer import StockDataAnalyzer
 
+            lux_analyzer = StockDataAnalyzer(signal_model="lux")
+            smc_analyzer = StockDataAnalyzer(signal_model="smc")
+            if args.inputs is not None:
+                cached_row = _row_from_cached_histories(
+                    symbol,
+                    args.inputs,
+                    fingerprint=args.fingerprint,
+                    cache_dir=args.cache_dir,
+                    lux_analyzer=lux_analyzer,
+                    smc_analyzer=smc_analyzer,
+                    ranking_mode=args.ranking_mode,
+                    eligibility=eligibility,
+                    market_cap=market_cap,
+                )
+                if cached_row is not None:
+                    return cached_row
             effective_lux = CachedAnalyzer(
-                StockDataAnalyzer(signal_model="lux"),
+                lux_analyzer,
                 csv_path=args.csv_path,
                 cache_dir=args.cache_dir,
                 model_name="lux",
+                fingerprint=args.fingerprint,
             )
             effective_smc = CachedAnalyzer(
-                StockDataAnalyzer(signal_model="smc"),
+                smc_analyzer,
                 csv_path=args.csv_path,
                 cache_dir=args.cache_dir,
                 model_name="smc",
+                fingerprint=args.fingerprint,
             )
+        if analysis_df is None:
+            # A cached history is gone: read the file iter_symbol_data skipped
+            analysis_df = _load_analysis_frame(args.csv_path, args.analysis_bars)
         return build_scanner_row(
             symbol=symbol,
             df_slice=analysis_df,
@@ -136,30 +195,49 @@ def scan_universe(
     use_cache: bool = False,
     cache_dir: Path | None = None,
 ) -> tuple[pd.DataFrame, Path]:
+    if analysis_bars is not None and analysis_bars <= 0:
+        raise ValueError("analysis_bars must be greater than zero")
     universe = load_selected_universe(universe_file)
     rows: list[dict] = []
 
+    cached = None
+    if use_cache and cache_dir is not None:
+        cached = partial(cached_inputs, cache_dir, window=analysis_bars)
+
     if workers > 1:
-        worker_args_list = [
-            _ScanWorkerArgs(
-                symbol=sd.symbol,
-                market_cap=sd.market_cap,
-                df=sd.df,
-                load_error=sd.load_error,
-                analysis_bars=analysis_bars,
-                ranking_mode=ranking_mode,
-                min_market_cap=min_market_cap,
-                min_avg_volume_20=min_avg_volume_20,
-                min_avg_dollar_volume_20=min_avg_dollar_volume_20,
-                min_history_rows=min_history_rows,
-                csv_path=Path(data_dir) / f"{sd.symbol}.csv",
-                cache_dir=cache_dir,
-                use_cache=use_cache,
+        symbol_rows = iter_symbol_data(
+            universe, data_dir, tail_rows=analysis_bars, cached=cached
+        )
+        with shared_price_store(symbol_rows) as shared_rows:
+            worker_args = (
+                _ScanWorkerArgs(
+                    symbol=sd.symbol,
+                    market_cap=sd.market_cap,
+                    store_dir=store_dir,
+                    load_error=sd.load_error,
+                    analysis_bars=analysis_bars,
+                    ranking_mode=ranking_mode,
+                    min_market_cap=min_market_cap,
+                    min_avg_volume_20=min_avg_volume_20,
+                    min_avg_dollar_volume_20=min_avg_dollar_volume_20,
+                    min_history_rows=min_history_rows,
+                    csv_path=Path(data_dir) / f"{sd.symbol}.csv",
+                    cache_dir=cache_dir,
+                    use_cache=use_cache,
+                    fingerprint=sd.fingerprint,
+                    inputs=sd.inputs,
+                )
+                for store_dir, sd in shared_rows
             )
-            for sd in iter_symbol_data(universe, data_dir)
-        ]
-        with ProcessPoolExecutor(max_workers=workers) as pool:
-            raw_rows: list[dict] = list(pool.map(_scan_symbol_worker, worker_args_list))
+            with process_pool(workers) as pool:
+                raw_rows: list[dict] = list(
+                    map_in_order(
+                        pool,
+                        _scan_symbol_worker,
+                        worker_args,
+                        max_pending=workers * PENDING_TASKS_PER_WORKER,
+                    )
+                )
         for row in raw_rows:
             error_detail = row.pop("_error_detail", None)
             if error_detail is not None:
@@ -171,7 +249,9 @@ def scan_universe(
     else:
         analyzers = create_analyzers(StockDataAnalyzer)
 
-        for symbol_data in iter_symbol_data(universe, data_dir):
+        for symbol_data in iter_symbol_data(
+            universe, data_dir, tail_rows=analysis_bars, cached=cached
+        ):
             symbol = symbol_data.symbol
             market_cap = symbol_data.market_cap
             df = symbol_data.df
@@ -195,16 +275,30 @@ def scan_universe(
                 )
                 continue
 
-            if symbol_data.load_error is not None or df is None:
+            if symbol_data.load_error is not None or (
+                df is None and symbol_data.inputs is None
+            ):
                 rows.append(
                     _build_analysis_failed_row(symbol, market_cap, ranking_mode)
                 )
                 continue
 
-            analysis_df = _analysis_window(df, analysis_bars)
-            eligibility = evaluate_symbol_eligibility(
-                market_cap=market_cap,
-                df=analysis_df,
+            csv_path = Path(data_dir) / f"{symbol}.csv"
+            analysis_df = None
+            if symbol_data.inputs is not None:
+                inputs = symbol_data.inputs.eligibility
+            else:
+                analysis_df = _analysis_window(df, analysis_bars)
+                inputs = _frame_inputs(
+                    symbol,
+                    analysis_df,
+                    fingerprint=symbol_data.fingerprint,
+                    cache_dir=cache_dir if use_cache else None,
+                    analysis_bars=analysis_bars,
+                )
+            eligibility = evaluate_eligibility_inputs(
+                market_cap,
+                inputs,
                 min_market_cap=min_market_cap,
                 min_avg_volume_20=min_avg_volume_20,
                 min_avg_dollar_volume_20=min_avg_dollar_volume_20,
@@ -222,19 +316,37 @@ def scan_universe(
                 continue
 
             try:
-                csv_path = Path(data_dir) / f"{symbol}.csv"
+                if symbol_data.inputs is not None:
+                    cached_row = _row_from_cached_histories(
+                        symbol,
+                        symbol_data.inputs,
+                        fingerprint=symbol_data.fingerprint,
+                        cache_dir=cache_dir,
+                        lux_analyzer=analyzers.lux_analyzer,
+                        smc_analyzer=analyzers.smc_analyzer,
+                        ranking_mode=ranking_mode,
+                        eligibility=eligibility,
+                        market_cap=market_cap,
+                    )
+                    if cached_row is not None:
+                        rows.append(cached_row)
+                        continue
+                    # A cached history is gone: read the file after all
+                    analysis_df = _load_analysis_frame(csv_path, analysis_bars)
                 if use_cache and cache_dir is not None:
                     effective_lux = CachedAnalyzer(
                         analyzers.lux_analyzer,
                         csv_path=csv_path,
                         cache_dir=cache_dir,
                         model_name="lux",
+                        fingerprint=symbol_data.fingerprint,
                     )
                     effective_smc = CachedAnalyzer(
                         analyzers.smc_analyzer,
                         csv_path=csv_path,
                         cache_dir=cache_dir,
                         model_name="smc",
+                        fingerprint=symbol_data.fingerprint,
                     )
                 else:
                     effective_lux = analyzers.lux_analyzer
@@ -286,6 +398,75 @@ def _analysis_window(df: pd.DataFrame, analysis_bars: int | None) -> pd.DataFram
     return df.tail(analysis_bars)
 
 
+def _frame_inputs(
+    symbol: str,
+    analysis_df: pd.DataFrame,
+    *,
+    fingerprint: str | None,
+    cache_dir: Path | None,
+    analysis_bars: int | None,
+) -> EligibilityInputs:
+    """Eligibility inputs of a loaded frame, saved so later scans can skip it."""
+    inputs = EligibilityInputs.from_frame(analysis_df)
+    if cache_dir is not None and fingerprint is not None:
+        save_inputs(cache_dir, symbol, fingerprint, analysis_bars, analysis_df, inputs)
+    return inputs
+
+
+def _row_from_cached_histories(
+    symbol: str,
+    inputs: CachedInputs,
+    *,
+    fingerprint: str | None,
+    cache_dir: Path | None,
+    lux_analyzer: StockDataAnalyzer,
+    smc_analyzer: StockDataAnalyzer,
+    ranking_mode: str,
+    eligibility: EligibilityResult,
+    market_cap: float | None,
+) -> dict | None:
+    """Scan row of a skipped file, or None when a history is no longer cached."""
+    if cache_dir is None or fingerprint is None:
+        return None
+    histories = []
+    for model_name, analyzer in (("lux", lux_analyzer), ("smc", smc_analyzer)):
+        history = cached_historical(
+            analyzer=analyzer,
+            symbol=symbol,
+            inputs=inputs,
+            cache_dir=cache_dir,
+            model_name=model_name,
+            fingerprint=fingerprint,
+        )
+        if history is None:
+            return None
+        histories.append(history)
+    lux_historical, smc_historical = histories
+    return build_scanner_row_from_histories(
+        symbol,
+        lux_historical=lux_historical,
+        smc_historical=smc_historical,
+        ranking_mode=ranking_mode,
+        lux_analyzer=lux_analyzer,
+        smc_analyzer=smc_analyzer,
+        close=eligibility.close,
+        avg_volume_20=eligibility.avg_volume_20,
+        avg_dollar_volume_20=eligibility.avg_dollar_volume_20,
+        market_cap=market_cap,
+    )
+
+
+def _load_analysis_frame(
+    csv_path: Path | None, analysis_bars: int | None
+) -> pd.DataFrame:
+    """The frame iter_symbol_data would have loaded for `csv_path`."""
+    if csv_path is None:
+        raise ValueError("No CSV path to load the prices from")
+    if analysis_bars is None:
+        return load_symbol_csv(csv_path.parent, csv_path.stem)
+    return load_symbol_csv_tail(csv_path.parent, csv_path.stem, analysis_bars)
+
+
 def _build_excluded_row(
     symbol: str,
     market_cap: float | None,
@@ -477,6 +658,15 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override cache directory (default: data/cache).",
     )
+    parser.add_argument(
+        "--cache-budget-mb",
+        type=float,
+        default=DEFAULT_CACHE_BUDGET_MB,
+        help=(
+            "Evict least recently used cache entries beyond this size after the "
+            f"run; 0 disables (default: {DEFAULT_CACHE_BUDGET_MB:.0f})."
+        ),
+    )
     return parser
 
 
@@ -501,6 +691,8 @@ def main(argv: list[str] | None = None) -> int:
         use_cache=use_cache,
         cache_dir=cache_dir,
     )
+    if use_cache:
+        enforce_cache_budget(cache_dir, args.cache_budget_mb)
     return 0
 
 
@@ -0,0 +1,606 @@
+import math
+from dataclasses import dataclass, fields
+
+import numpy as np
+import pandas as pd
+
+from market_scanner.event_state import (
+    EVENT_FIELDS,
+    LUX_ACTIVE_PRIORITY_CONTEXTS,
+    SMC_ACTIVE_PRIORITY_CONTEXTS,
+    EventStateHistory,
+    build_event_state_history,
+)
+from market_scanner.market_state import (
+    AVOID,
+    BEARISH_WATCHLIST,
+    BULLISH_WATCHLIST,
+    CANDIDATE,
+    EARLY_TREND,
+    EXHAUSTION,
+    EXTENDED,
+    NEEDS_REVIEW,
+    PULLBACK,
+    RANGE,
+    RANGE_WATCHLIST,
+    UNKNOWN,
+    WATCHLIST,
+)
+from market_scanner.models import ScannerRow
+from market_scanner.ranking import (
+    BEARISH_HINTS,
+    BEARISH_TREND,
+    BEARISH_TRIGGER,
+    BEARISH_TRIGGER_CONTEXTS,
+    BEARISH_WATCH,
+    BEARISH_WATCH_CONTEXTS,
+    BULLISH_HINTS,
+    BULLISH_TREND,
+    BULLISH_TRIGGER,
+    BULLISH_TRIGGER_CONTEXTS,
+    BULLISH_WATCH,
+    BULLISH_WATCH_CONTEXTS,
+    NEUTRAL_ROLE,
+    ROLE_BEARISH,
+    ROLE_BULLISH,
+    TREND_ROLES,
+    TRIGGER_ROLES,
+    WATCH_ROLES,
+)
+
+SCANNER_ROW_FIELDS = tuple(field.name for field in fields(ScannerRow))
+_SIGNAL_LABELS = {1: "BUY", -1: "SELL", 0: "HOLD"}
+
+
+@dataclass
+class ScannerColumns:
+    """Scanner-row fields of one symbol and ranking mode for every bar.
+
+    `columns` holds one list per `ScannerRow` field, in field order, with
+    the same Python values the scalar path puts in its row dicts.
+    """
+
+    columns: dict[str, list]
+
+    def __len__(self) -> int:
+        return len(self.columns["symbol"])
+
+    def row(
+        self,
+        index: int,
+        *,
+        close: float | None = None,
+        avg_volume_20: float | None = None,
+        avg_dollar_volume_20: float | None = None,
+        market_cap: float | None = None,
+    ) -> dict:
+        row = {name: values[index] for name, values in self.columns.items()}
+        if close is not None:
+            row["close"] = close
+        row["avg_volume_20"] = avg_volume_20
+        row["avg_dollar_volume_20"] = avg_dollar_volume_20
+        row["market_cap"] = market_cap
+        return row
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns)
+
+
+def build_scanner_columns(
+    symbol: str,
+    *,
+    lux_historical: pd.DataFrame,
+    smc_historical: pd.DataFrame,
+    ranking_mode: str,
+    lux_event_states: EventStateHistory | None = None,
+    smc_event_states: EventStateHistory | None = None,
+) -> ScannerColumns:
+    """Every scanner-row field for every bar of the Lux/SMC histories at once.
+
+    Bar `i` of the result equals `build_scanner_row_from_history(index=i)`:
+    the ranking, alignment, market-state and action-bucket rules of
+    `ranking` and `market_state` are applied as array predicates, in the
+    same first-match order as the scalar functions. The scalar path stays
+    the reference (and the one the daily scan uses); the parity is pinned
+    by `tests/market_scanner/test_scanner_columns.py`.
+    """
+    if lux_event_states is None:
+        lux_event_states = build_event_state_history(
+            lux_historical, active_priority_contexts=LUX_ACTIVE_PRIORITY_CONTEXTS
+        )
+    if smc_event_states is None:
+        smc_event_states = build_event_state_history(
+            smc_historical, active_priority_contexts=SMC_ACTIVE_PRIORITY_CONTEXTS
+        )
+    lux_latest = lux_event_states.events("latest")
+    lux_active = lux_event_states.events("active")
+    smc_latest = smc_event_states.events("latest")
+    smc_active = smc_event_states.events("active")
+
+    # Current signal of each bar (lux/smc_signal_from_history)
+    lux_close = lux_historical["close"].to_numpy(dtype=float)
+    lux_trend = _text(lux_historical, "trend")
+    lux_strength = _text(lux_historical, "strength")
+    lux_hint = _text(lux_historical, "options_hint")
+    lux_adx = _optional_float(lux_historical, "adx")
+    lux_combined = _integer(lux_historical, "combined_signal")
+    lux_confirmation = _integer(lux_historical, "confirmation_signal", default=0)
+    lux_contrarian = _integer(lux_historical, "contrarian_signal", default=0)
+
+    smc_combined = _integer(smc_historical, "combined_signal")
+    smc_bias = _text(smc_historical, "signal_bias", default="NEUTRAL")
+    smc_range_position = _optional_float(smc_historical, "range_position_pct")
+    smc_rsi = _optional_float(smc_historical, "rsi")
+    smc_hint = _text(smc_historical, "options_hint", default="NO_TRADE")
+
+    lux_context = _lux_context(lux_hint, lux_combined, lux_confirmation, lux_contrarian)
+    smc_context = _smc_context(smc_historical)
+    lux_label = _signal_labels(lux_combined)
+    smc_label = _signal_labels(smc_combined)
+
+    # rank_inputs / _selected_rank_context / _selected_state_event
+    if ranking_mode == "recent-event":
+        ranked_lux_hint = _or_default(lux_active["options_hint"], "NO_TRADE")
+        ranked_lux_signal = _or_default(lux_active["signal"], "HOLD")
+        ranked_smc_hint = _or_default(smc_active["options_hint"], "NO_TRADE")
+        ranked_smc_signal = _or_default(smc_active["signal"], "HOLD")
+        has_smc_context = _is_set(smc_active["context"])
+        ranked_smc_context = np.where(
+            has_smc_context, smc_active["context"].astype(str), smc_context
+        ).astype(object)
+        selected_lux = _select_events(
+            _is_set(lux_active["signal"]), lux_active, lux_latest
+        )
+    else:
+        ranked_lux_hint, ranked_lux_signal = lux_hint, lux_label
+        ranked_smc_hint, ranked_smc_signal = smc_hint, smc_label
+        ranked_smc_context = smc_context
+        selected_lux = lux_latest
+
+    lux_role = _lux_role(ranked_lux_signal, ranked_lux_hint, lux_trend)
+    smc_role = _smc_role(
+        ranked_smc_signal, ranked_smc_hint, ranked_smc_context, smc_bias
+    )
+    alignment = _alignment(lux_role, smc_role)
+    consistency_score = _consistency_score(
+        lux_role, smc_role, ranked_lux_signal, ranked_smc_signal
+    )
+    market_state = _market_state(
+        lux_trend=lux_trend,
+        lux_strength=lux_strength,
+        lux_last_event=selected_lux["signal"],
+        lux_days_since_last_event=selected_lux["days_since"],
+        smc_bias=smc_bias,
+        range_position_pct=smc_range_position,
+        smc_rsi=smc_rsi,
+    )
+    adjusted_alignment = _adjusted_alignment(
+        alignment, market_state, lux_role=lux_role, smc_role=smc_role
+    )
+    action_bucket = _action_bucket(
+        adjusted_alignment, market_state, alignment, smc_role, consistency_score
+    )
+
+    n = len(lux_historical)
+    values = {
+        "symbol": [symbol] * n,
+        "close": lux_close.tolist(),
+        "avg_volume_20": [None] * n,
+        "avg_dollar_volume_20": [None] * n,
+        "market_cap": [None] * n,
+        "ranking_mode": [ranking_mode] * n,
+        "lux_role": lux_role,
+        "lux_signal": lux_label,
+        "lux_options_hint": lux_hint,
+        "lux_context": lux_context,
+        "lux_trend": lux_trend,
+        "lux_strength": lux_strength,
+        "lux_adx": _none_for_nan(lux_adx),
+        "smc_role": smc_role,
+        "smc_signal": smc_label,
+        "smc_options_hint": smc_hint,
+        "smc_context": smc_context,
+        "smc_bias": smc_bias,
+        "smc_range_position_pct": _none_for_nan(smc_range_position),
+        "smc_rsi": _none_for_nan(smc_rsi),
+        "alignment": alignment,
+        "consistency_score": consistency_score,
+        "market_state": market_state,
+        "adjusted_alignment": adjusted_alignment,
+        "action_bucket": action_bucket,
+        "eligible": [True] * n,
+        "excluded_reason": [None] * n,
+    }
+    for prefix, events in (
+        ("lux_last_event", lux_latest),
+        ("lux_active_event", lux_active),
+        ("smc_last_event", smc_latest),
+        ("smc_active_event", smc_active),
+    ):
+        model, kind = prefix.split("_", 1)
+        values[prefix] = events["signal"]
+        values[f"{prefix}_options_hint"] = events["options_hint"]
+        values[f"{prefix}_context"] = events["context"]
+        values[f"{prefix}_date"] = events["date"]
+        values[f"{model}_days_since_{kind}"] = events["days_since"]
+
+    columns = {}
+    for name in SCANNER_ROW_FIELDS:
+        column = values[name]
+        columns[name] = column.tolist() if isinstance(column, np.ndarray) else column
+    return ScannerColumns(columns)
+
+
+# ----------------------------------------------------------------------
+# History columns, converted the way the scalar *_signal_from_history does
+# ----------------------------------------------------------------------
+
+
+def _text(frame: pd.DataFrame, name: str, default: str | None = None) -> np.ndarray:
+    if name not in frame.columns:
+        if default is None:
+            raise KeyError(name)
+        return np.full(len(frame), default, dtype=object)
+    return np.array([str(value) for value in frame[name].tolist()], dtype=object)
+
+
+def _integer(frame: pd.DataFrame, name: str, default: int | None = None) -> np.ndarray:
+    if name not in frame.columns:
+        if default is None:
+            raise KeyError(name)
+        return np.full(len(frame), default, dtype=np.int64)
+    return np.array([int(value) for value in frame[name].tolist()], dtype=np.int64)
+
+
+def _optional_float(frame: pd.DataFrame, name: str) -> np.ndarray:
+    """Floats with NaN where the scalar path would yield None."""
+    if name not in frame.columns:
+        return np.full(len(frame), np.nan)
+    return frame[name].to_numpy(dtype=float, na_value=np.nan)
+
+
+def _flag(frame: pd.DataFrame, name: str) -> np.ndarray:
+    if name not in frame.columns:
+        return np.zeros(len(frame), dtype=bool)
+    values = frame[name]
+    if values.dtype == bool:
+        return values.to_numpy()
+    return np.array([bool(value) for value in values.tolist()], dtype=bool)
+
+
+def _none_for_nan(values: np.ndarray) -> list[float | None]:
+    return [None if math.isnan(value) else value for value in values.tolist()]
+
+
+def _objects(values: list) -> np.ndarray:
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _is_set(values: np.ndarray) -> np.ndarray:
+    return np.array([value is not None for value in values.tolist()], dtype=bool)
+
+
+def _or_default(values: np.ndarray, default: str) -> np.ndarray:
+    return _objects([str(value or default) for value in values.tolist()])
+
+
+def _select_events(
+    use_first: np.ndarray, first: dict[str, np.ndarray], second: dict[str, np.ndarray]
+) -> dict[str, np.ndarray]:
+    return {
+        field: np.where(use_first, first[field], second[field])
+        for field in EVENT_FIELDS
+    }
+
+
+def _isin(values: np.ndarray, options) -> np.ndarray:
+    return pd.Series(values, dtype=object).isin(list(options)).to_numpy()
+
+
+def _startswith(values: np.ndarray, prefix: str) -> np.ndarray:
+    return np.char.startswith(values.astype(str), prefix)
+
+
+def _signal_labels(values: np.ndarray) -> np.ndarray:
+    return _objects(
+        [_SIGNAL_LABELS.get(value, str(value)) for value in values.tolist()]
+    )
+
+
+# ----------------------------------------------------------------------
+# Rules (event_state, ranking and market_state, as array predicates)
+# ----------------------------------------------------------------------
+
+
+def _lux_context(
+    hint: np.ndarray,
+    combined: np.ndarray,
+    confirmation: np.ndarray,
+    contrarian: np.ndarray,
+) -> np.ndarray:
+    call = hint == "CALL"
+    return np.select(
+        [
+            (confirmation == combined) & (combined != 0),
+            (contrarian == combined) & (combined != 0),
+        ],
+        [
+            np.where(call, "trend_confirmation_buy", "trend_confirmation_sell"),
+            np.where(call, "contrarian_reversal_buy", "contrarian_reversal_sell"),
+        ],
+        default="no_trade",
+    ).astype(object)
+
+
+def _smc_context(smc_historical: pd.DataFrame) -> np.ndarray:
+    swing_high = _flag(smc_historical, "swing_high_marker")
+    swing_low = _flag(smc_historical, "swing_low_marker")
+    in_premium = _flag(smc_historical, "in_premium")
+    in_discount = _flag(smc_historical, "in_discount")
+    return np.select(
+        [
+            _flag(smc_historical, "long_signal"),
+            _flag(smc_historical, "short_signal"),
+            swing_low & in_discount,
+            swing_high & in_premium,
+            in_discount & _flag(smc_historical, "bullish_rejection"),
+            in_premium & _flag(smc_historical, "bearish_rejection"),
+            swing_low,
+            swing_high,
+        ],
+        [
+            "bullish_confluence",
+            "bearish_confluence",
+            "short_term_bullish_reversal",
+            "short_term_bearish_reversal",
+            "discount_watch",
+            "premium_watch",
+            "swing_low_watch",
+            "swing_high_watch",
+        ],
+        default="no_trade",
+    ).astype(object)
+
+
+def _lux_role(signal: np.ndarray, hint: np.ndarray, trend: np.ndarray) -> np.ndarray:
+    return np.select(
+        [
+            _isin(hint, BULLISH_HINTS) & (signal == "BUY"),
+            _isin(hint, BEARISH_HINTS) & (signal == "SELL"),
+            trend == "BULLISH",
+            trend == "BEARISH",
+        ],
+        [BULLISH_TRIGGER, BEARISH_TRIGGER, BULLISH_TREND, BEARISH_TREND],
+        default=NEUTRAL_ROLE,
+    ).astype(object)
+
+
+def _smc_role(
+    signal: np.ndarray, hint: np.ndarray, context: np.ndarray, bias: np.ndarray
+) -> np.ndarray:
+    bullish = _isin(hint, BULLISH_HINTS)
+    bearish = _isin(hint, BEARISH_HINTS)
+    return np.select(
+        [
+            bullish & _isin(context, BULLISH_TRIGGER_CONTEXTS),
+            bearish & _isin(context, BEARISH_TRIGGER_CONTEXTS),
+            bullish & ((hint == "CALL_WATCH") | _isin(context, BULLISH_WATCH_CONTEXTS)),
+            bearish & ((hint == "PUT_WATCH") | _isin(context, BEARISH_WATCH_CONTEXTS)),
+            (signal == "BUY") & (bias == "BULLISH"),
+            (signal == "SELL") & (bias == "BEARISH"),
+        ],
+        [
+            BULLISH_TRIGGER,
+            BEARISH_TRIGGER,
+            BULLISH_WATCH,
+            BEARISH_WATCH,
+            BULLISH_WATCH,
+            BEARISH_WATCH,
+        ],
+        default=NEUTRAL_ROLE,
+    ).astype(object)
+
+
+def _alignment(lux_role: np.ndarray, smc_role: np.ndarray) -> np.ndarray:
+    lux_bullish = _isin(lux_role, ROLE_BULLISH)
+    lux_bearish = _isin(lux_role, ROLE_BEARISH)
+    conditions, choices = [], []
+    for smc_value, opposed, same, same_label, neutral_label in (
+        (BULLISH_TRIGGER, lux_bearish, lux_bullish, "bullish_aligned", "early_bullish"),
+        (BEARISH_TRIGGER, lux_bullish, lux_bearish, "bearish_aligned", "early_bearish"),
+        (BULLISH_WATCH, lux_bearish, lux_bullish, "bullish_watch", "early_bullish"),
+        (BEARISH_WATCH, lux_bullish, lux_bearish, "bearish_watch", "early_bearish"),
+    ):
+        is_role = smc_role == smc_value
+        conditions += [is_role & opposed, is_role & same, is_role]
+        choices += ["conflicted", same_label, neutral_label]
+    conditions += [
+        _isin(lux_role, (BULLISH_TRIGGER, BULLISH_TREND)),
+        _isin(lux_role, (BEARISH_TRIGGER, BEARISH_TREND)),
+    ]
+    choices += ["bullish_trend", "bearish_trend"]
+    return np.select(conditions, choices, default="no_trade").astype(object)
+
+
+def _consistency_score(
+    lux_role: np.ndarray,
+    smc_role: np.ndarray,
+    lux_signal: np.ndarray,
+    smc_signal: np.ndarray,
+) -> np.ndarray:
+    lux_bullish = _isin(lux_role, ROLE_BULLISH)
+    lux_bearish = _isin(lux_role, ROLE_BEARISH)
+    smc_bullish = _isin(smc_role, ROLE_BULLISH)
+    smc_bearish = _isin(smc_role, ROLE_BEARISH)
+
+    score = np.select(
+        [_isin(smc_role, TRIGGER_ROLES), _isin(smc_role, WATCH_ROLES)],
+        [2, 1],
+        default=0,
+    )
+    score += np.select(
+        [_isin(lux_role, TRIGGER_ROLES), _isin(lux_role, TREND_ROLES)],
+        [2, 1],
+        default=0,
+    )
+    score += (lux_bullish & smc_bullish) | (lux_bearish & smc_bearish)
+    score += (lux_signal == smc_signal) & (lux_signal != "HOLD")
+    opposed = (lux_bullish & smc_bearish) | (lux_bearish & smc_bullish)
+    return np.where(opposed, -2, score).astype(np.int64)
+
+
+def _market_state(
+    *,
+    lux_trend: np.ndarray,
+    lux_strength: np.ndarray,
+    lux_last_event: np.ndarray,
+    lux_days_since_last_event: np.ndarray,
+    smc_bias: np.ndarray,
+    range_position_pct: np.ndarray,
+    smc_rsi: np.ndarray,
+) -> np.ndarray:
+    trend = _or_default(lux_trend, "")
+    strength = _or_default(lux_strength, "")
+    last_event = _or_default(lux_last_event, "")
+    bias = _or_default(smc_bias, "")
+    position, rsi = range_position_pct, smc_rsi
+    days = np.array(
+        [
+            np.nan if value is None else value
+            for value in lux_days_since_last_event.tolist()
+        ],
+        dtype=float,
+    )
+    bullish, bearish = trend == "BULLISH", trend == "BEARISH"
+    buy, sell = last_event == "BUY", last_event == "SELL"
+
+    with np.errstate(invalid="ignore"):
+        return np.select(
+            [
+                np.isnan(position) | np.isnan(rsi),
+                bullish & (position >= 80) & (rsi >= 65) & sell,
+                bearish & (position <= 15) & (rsi <= 35),
+                bullish & (position >= 75) & ((rsi >= 60) | sell),
+                bearish & (position <= 20) & (rsi <= 40),
+                np.isnan(days),
+                bearish & sell & (position >= 35) & (position <= 70) & (rsi >= 40),
+                bullish & buy & (position >= 30) & (position <= 65) & (rsi <= 60),
+                (buy | sell)
+                & (days <= 3)
+                & (strength == "STRONG")
+                & (position >= 30)
+                & (position <= 65)
+                & (rsi >= 45)
+                & (rsi <= 65),
+                (strength == "NORMAL")
+                & (bias == "NEUTRAL")
+                & (position >= 20)
+                & (position <= 80),
+            ],
+            [
+                UNKNOWN,
+                EXHAUSTION,
+                EXHAUSTION,
+                EXTENDED,
+                EXTENDED,
+                UNKNOWN,
+                PULLBACK,
+                PULLBACK,
+                EARLY_TREND,
+                RANGE,
+            ],
+            default=UNKNOWN,
+        ).astype(object)
+
+
+def _adjusted_alignment(
+    alignment: np.ndarray,
+    market_state: np.ndarray,
+    *,
+    lux_role: np.ndarray,
+    smc_role: np.ndarray,
+) -> np.ndarray:
+    # adjust_alignment_for_market_state without its "mixed" branch:
+    # classify_alignment never returns "mixed"
+    stretched = _isin(market_state, (EXTENDED, EXHAUSTION))
+    in_range = market_state == RANGE
+    lux_bullish = _startswith(lux_role, "bullish")
+    lux_bearish = _startswith(lux_role, "bearish")
+    smc_bullish = _startswith(smc_role, "bullish")
+    smc_bearish = _startswith(smc_role, "bearish")
+    early_bullish = _isin(alignment, ("early_bullish", "bullish_watch"))
+    early_bearish = _isin(alignment, ("early_bearish", "bearish_watch"))
+
+    return np.select(
+        [
+            alignment == "conflicted",
+            (alignment == "bullish_aligned") & stretched,
+            alignment == "bullish_aligned",
+            (alignment == "bearish_aligned") & stretched,
+            alignment == "bearish_aligned",
+            early_bullish & lux_bearish,
+            early_bullish,
+            early_bearish & lux_bullish,
+            early_bearish,
+            _isin(alignment, ("bullish_trend", "bearish_trend")),
+            in_range & (smc_bullish | lux_bullish),
+            in_range & (smc_bearish | lux_bearish),
+            in_range,
+        ],
+        [
+            "conflicted",
+            BULLISH_WATCHLIST,
+            "bullish_aligned",
+            BEARISH_WATCHLIST,
+            "bearish_aligned",
+            "conflicted",
+            BULLISH_WATCHLIST,
+            "conflicted",
+            BEARISH_WATCHLIST,
+            "trend_only",
+            BULLISH_WATCHLIST,
+            BEARISH_WATCHLIST,
+            RANGE_WATCHLIST,
+        ],
+        default="no_trade",
+    ).astype(object)
+
+
+def _action_bucket(
+    adjusted_alignment: np.ndarray,
+    market_state: np.ndarray,
+    alignment: np.ndarray,
+    smc_role: np.ndarray,
+    consistency_score: np.ndarray,
+) -> np.ndarray:
+    aligned_entry = _isin(
+        adjusted_alignment, ("bullish_aligned", "bearish_aligned")
+    ) & _isin(market_state, (EARLY_TREND, PULLBACK))
+    return np.select(
+        [
+            aligned_entry & _isin(smc_role, TRIGGER_ROLES) & (consistency_score >= 1),
+            aligned_entry,
+            _isin(
+                adjusted_alignment,
+                (BULLISH_WATCHLIST, BEARISH_WATCHLIST, RANGE_WATCHLIST),
+            ),
+            adjusted_alignment == "conflicted",
+            adjusted_alignment == "trend_only",
+            _isin(market_state, (EXTENDED, EXHAUSTION, RANGE)),
+            adjusted_alignment == "no_trade",
+            _isin(alignment, ("early_bullish", "early_bearish")),
+        ],
+        [
+            CANDIDATE,
+            WATCHLIST,
+            WATCHLIST,
+            NEEDS_REVIEW,
+            AVOID,
+            WATCHLIST,
+            AVOID,
+            WATCHLIST,
+        ],
+        default=NEEDS_REVIEW,
+    ).astype(object)
@@ -25,7 +25,9 @@ from market_scanner.ranking import (
     infer_smc_role,
     signal_to_label,
 )
+from market_scanner.scanner_columns import ScannerColumns
 from stock_analyzer.analyzer import StockDataAnalyzer
+from trading_indicators import shared_features
 
 
 def build_scanner_row(
@@ -43,10 +45,9 @@ def build_scanner_row(
     lux_analyzer = lux_analyzer or StockDataAnalyzer(signal_model="lux")
     smc_analyzer = smc_analyzer or StockDataAnalyzer(signal_model="smc")
 
-    lux_signal = lux_analyzer.generate_signal(symbol, df_slice)
-    smc_signal = smc_analyzer.generate_signal(symbol, df_slice)
-    lux_historical = lux_analyzer.generate_historical_signals(symbol, df_slice)
-    smc_historical = smc_analyzer.generate_historical_signals(symbol, df_slice)
+    with shared_features():
+        lux_signal, lux_historical = _signal_and_history(lux_analyzer, symbol, df_slice)
+        smc_signal, smc_historical = _signal_and_history(smc_analyzer, symbol, df_slice)
 
     if lux_signal is None or smc_signal is None:
         raise ValueError(f"Signal generation failed for {symbol}")
@@ -65,6 +66,39 @@ def build_scanner_row(
     )
 
 
+def build_scanner_row_from_histories(
+    symbol: str,
+    *,
+    lux_historical: pd.DataFrame,
+    smc_historical: pd.DataFrame,
+    ranking_mode: str,
+    lux_analyzer: StockDataAnalyzer,
+    smc_analyzer: StockDataAnalyzer,
+    close: float | None = None,
+    avg_volume_20: float | None = None,
+    avg_dollar_volume_20: float | None = None,
+    market_cap: float | None = None,
+) -> dict:
+    """`build_scanner_row` for histories already computed, e.g. cached ones."""
+    lux_signal = lux_analyzer.generate_signal_from_history(symbol, lux_historical)
+    smc_signal = smc_analyzer.generate_signal_from_history(symbol, smc_historical)
+    if lux_signal is None or smc_signal is None:
+        raise ValueError(f"Signal generation failed for {symbol}")
+
+    return _assemble_scanner_row(
+        symbol=symbol,
+        lux_signal=lux_signal,
+        smc_signal=smc_signal,
+        lux_historical=lux_historical,
+        smc_historical=smc_historical,
+        ranking_mode=ranking_mode,
+        close=close,
+        avg_volume_20=avg_volume_20,
+        avg_dollar_volume_20=avg_dollar_volume_20,
+        market_cap=market_cap,
+    )
+
+
 def build_scanner_row_from_history(
     symbol: str,
     *,
@@ -78,7 +112,18 @@ def build_scanner_row_from_history(
     market_cap: float | None = None,
     lux_event_state: dict[str, dict[str, str | int | None]] | None = None,
     smc_event_state: dict[str, dict[str, str | int | None]] | None = None,
+    scanner_columns: ScannerColumns | None = None,
 ) -> dict:
+    if scanner_columns is not None:
+        # Precomputed by build_scanner_columns for the same histories and mode
+        return scanner_columns.row(
+            index,
+            close=close,
+            avg_volume_20=avg_volume_20,
+            avg_dollar_volume_20=avg_dollar_volume_20,
+            market_cap=market_cap,
+        )
+
     lux_signal = lux_signal_from_history(symbol, lux_historical.iloc[index])
     smc_signal = smc_signal_from_history(symbol, smc_historical.iloc[index])
 
@@ -102,6 +147,15 @@ def build_scanner_row_from_history(
     )
 
 
+def _signal_and_history(analyzer, symbol: str, df: pd.DataFrame):
+    """Computes the history once and derives the current signal from it."""
+    historical = analyzer.generate_historical_signals(symbol, df)
+    signal_from_history = getattr(analyzer, "generate_signal_from_history", None)
+    if signal_from_history is None:
+        return analyzer.generate_signal(symbol, df), historical
+    return signal_from_history(symbol, historical), historical
+
+
 def _assemble_scanner_row(
     *,
     symbol: str,
@@ -29,10 +29,21 @@ class StockDataAnalyzer:
     """
 
     def __init__(
-        self, config: IndicatorConfig = None, signal_model: SignalModel = "rsi-sma"
+        self,
+        config: IndicatorConfig = None,
+        signal_model: SignalModel = "rsi-sma",
+        tail_only_current: bool = False,
     ):
+        """
+        Args:
+            config: Parâmetros do modelo RSI/SMA
+            signal_model: Modelo de sinais
+            tail_only_current: `generate_signal` dos modelos lux/smc calcula só
+                a cauda necessária para convergir (ver `BaseIndicator.tail_bars`)
+        """
         self.config = config or IndicatorConfig()
         self.signal_model = signal_model
+        self.tail_only_current = tail_only_current
         self.signal_generator = self._create_signal_generator(signal_model)
         logger.info(f"StockDataAnalyzer inicializado com config: {self.config}")
 
@@ -42,9 +53,9 @@ class StockDataAnalyzer:
         if signal_model == "rsi-sma":
             return SignalGenerator(self.config)
         if signal_model == "lux":
-            return LuxSignalGenerator()
+            return LuxSignalGenerator(tail_only=self.tail_only_current)
         if signal_model == "smc":
-            return SMCSignalGenerator()
+            return SMCSignalGenerator(tail_only=self.tail_only_current)
         raise ValueError(f"Unsupported signal model: {signal_model}")
 
     def generate_signal(self, symbol: str, df: pd.DataFrame) -> Any:
@@ -60,6 +71,50 @@ class StockDataAnalyzer:
         """
         return self.signal_generator.generate_current_signal(symbol, df)
 
+    def extend_historical_signals(
+        self, symbol: str, df: pd.DataFrame, historical: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Estende um histórico de sinais para barras novas acrescentadas a `df`.
+
+        Args:
+            symbol: Ticker
+            df: DataFrame com dados OHLC (o anterior mais barras no fim)
+            historical: Saída de `generate_historical_signals` para
+                `df.iloc[:len(historical)]`
+
+        Returns:
+            DataFrame com sinais históricos de todo `df`. Os modelos lux/smc
+            recalculam só a cauda (ver `extend_history`); os demais, tudo.
+        """
+        extend = getattr(self.signal_generator, "extend_historical_signals", None)
+        if extend is None:
+            return self.generate_historical_signals(symbol, df)
+        return extend(symbol, df, historical)
+
+    def generate_signal_from_history(
+        self, symbol: str, historical: pd.DataFrame
+    ) -> Any:
+        """
+        Deriva o sinal atual de um histórico já calculado, sem recalcular
+        os indicadores.
+
+        Args:
+            symbol: Ticker
+            historical: Saída de `generate_historical_signals`
+
+        Returns:
+            SignalResult ou None se o histórico estiver vazio
+        """
+        signal_from_history = getattr(
+            self.signal_generator, "signal_from_history", None
+        )
+        if signal_from_history is None:
+            raise NotImplementedError(
+                f"Modelo {self.signal_model} não deriva o sinal atual do histórico"
+            )
+        return signal_from_history(symbol, historical)
+
     def generate_historical_signals(
         self, symbol: str, df: pd.DataFrame
     ) -> pd.DataFrame:
@@ -1,5 +1,4 @@
 from pathlib import Path
-from time import sleep
 from typing import List
 
 import pandas as pd
@@ -9,12 +8,14 @@ from stock_analyzer.analyzer import StockDataAnalyzer
 from stock_analyzer.config import IndicatorConfig
 from stock_analyzer.enums import Signal
 from stock_analyzer.signals import AnalyzerSignalAdapter
+from stock_data_manager.factories import StockDataManagerFactory
 from stock_data_manager.implementations.trading_view_tickers_download import (
     TradingViewDownloader,
 )
 from stock_data_manager.implementations.trading_view_tickers_reader import (
     TradingViewTickerExtractor,
 )
+from stock_data_manager.managers.bulk_downloader import BulkDownloader, TokenBucket
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "data" / "stocks"
@@ -34,15 +35,33 @@ def update_tickers_list(tickers_file: str):
 
 
 def update_tickers_data(
-    tickers_file: str, symbols: List[str] = None, sleep_time: float = 0.05
+    tickers_file: str,
+    symbols: List[str] = None,
+    sleep_time: float = 0.05,
+    max_workers: int = 4,
+    max_retries: int = 2,
 ):
+    """
+    Atualiza os dados diários dos tickers.
+
+    `sleep_time` é o intervalo mínimo médio entre requisições: vira um limite
+    de 1/sleep_time req/s compartilhado pelos `max_workers` downloads
+    simultâneos.
+    """
     tv_ticker_extrator = TradingViewTickerExtractor(tickers_file)
     tickers = tv_ticker_extrator.extract_tickers()
 
     symbols_to_update = symbols or tickers["symbol"].tolist()
-    for symbol in symbols_to_update:
-        sleep(sleep_time)
-        StockDataAnalyzer.retrieve_data(symbol, data_dir=DATA_DIR, interval="1d")
+    sdm = StockDataManagerFactory.create_with_update_strategy(
+        data_dir=str(DATA_DIR / "1D")
+    )
+    sdm.bulk_downloader = BulkDownloader(
+        max_workers=max_workers,
+        rate_limiter=TokenBucket(1 / sleep_time) if sleep_time > 0 else None,
+        max_retries=max_retries,
+    )
+    sdm.download_multiple(symbols_to_update, interval="1d", skip_current=True)
+    return sdm.last_download_summary
 
 
 def _signal_label(value) -> str:
@@ -282,7 +301,9 @@ def main(argv=None) -> int:
     args = parser.parse_args(argv)
 
     config = IndicatorConfig(rsi_period=14, sma_period=50)
-    analyzer = StockDataAnalyzer(config=config, signal_model=args.model)
+    analyzer = StockDataAnalyzer(
+        config=config, signal_model=args.model, tail_only_current=True
+    )
 
     symbol = args.symbol.upper()
     try:
@@ -1,10 +1,15 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
+import numpy as np
 import pandas as pd
 
 from stock_analyzer.enums import Signal
 
+# Linhas mantidas do histórico anterior conferidas contra a cauda recalculada
+EXTENSION_CHECK_BARS = 10
+
 
 @dataclass
 class AnalyzerSignalResult:
@@ -34,3 +39,62 @@ class AnalyzerSignalAdapter(Protocol):
 
     def event_columns(self) -> list[str]:
         ...
+
+
+def select_labels(
+    conditions: Sequence[Any],
+    labels: Sequence[str],
+    default: str,
+    index: pd.Index,
+) -> pd.Series:
+    """
+    Classificação vetorizada por prioridade: cada linha recebe o rótulo da
+    primeira condição verdadeira (ou `default`), como uma cadeia de `if`s
+    por linha. Retorna uma Series categórica com todos os rótulos possíveis.
+    """
+    codes = np.select(
+        [np.asarray(condition, dtype=bool) for condition in conditions],
+        list(range(len(labels))),
+        default=len(labels),
+    )
+    categorical = pd.Categorical.from_codes(codes, categories=[*labels, default])
+    return pd.Series(categorical, index=index)
+
+
+def extend_history(
+    generator: Any, symbol: str, df: pd.DataFrame, historical: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Estende `historical`, saída de `generator.generate_historical_signals`
+    para `df.iloc[:len(historical)]`, até o fim de `df` recalculando só a cauda.
+
+    As últimas `indicator.lookahead_bars()` linhas de `historical` são
+    substituídas, e a cauda recalculada começa `tail_bars(tail_tolerance)`
+    barras antes delas: valores contínuos ficam dentro da tolerância de um
+    recálculo completo. Se as colunas discretas das últimas
+    `EXTENSION_CHECK_BARS` linhas mantidas não batem com a cauda (ex.: o
+    Supertrend ainda não convergiu), recalcula o histórico inteiro.
+    """
+    if len(df) < len(historical):
+        raise ValueError(
+            f"{symbol}: histórico tem {len(historical)} linhas, mas df tem {len(df)}"
+        )
+    indicator = generator.indicator
+    keep = len(historical) - indicator.lookahead_bars()
+    check = keep - EXTENSION_CHECK_BARS
+    start = check - indicator.tail_bars(generator.tail_tolerance)
+    if start <= 0:
+        return generator.generate_historical_signals(symbol, df)
+
+    tail = generator.generate_historical_signals(symbol, df.iloc[start:])
+    discrete = [
+        column for column in historical.columns if historical[column].dtype.kind != "f"
+    ]
+    kept = historical.iloc[check:keep][discrete].reset_index(drop=True)
+    recomputed = tail.iloc[check - start : keep - start][discrete]
+    recomputed = recomputed.reset_index(drop=True)
+    if not recomputed.equals(kept):
+        return generator.generate_historical_signals(symbol, df)
+    return pd.concat(
+        [historical.iloc[:keep], tail.iloc[keep - start :]], ignore_index=True
+    )
@@ -4,8 +4,16 @@ from typing import Optional
 import pandas as pd
 
 from stock_analyzer.enums import Signal
-from stock_analyzer.signals.base import AnalyzerSignalResult
-from trading_indicators import LuxConfig, LuxSignalsOverlays
+from stock_analyzer.signals.base import (
+    AnalyzerSignalResult,
+    extend_history,
+    select_labels,
+)
+from trading_indicators import (
+    DEFAULT_TAIL_TOLERANCE,
+    LuxConfig,
+    LuxSignalsOverlays,
+)
 from trading_indicators.utils.types import Trend
 
 
@@ -29,14 +37,27 @@ class LuxSignalGenerator:
 
     REQUIRED_COLUMNS = {"Open", "High", "Low", "Close"}
 
-    def __init__(self, config: LuxConfig = None):
+    def __init__(
+        self,
+        config: LuxConfig = None,
+        tail_only: bool = False,
+        tail_tolerance: float = DEFAULT_TAIL_TOLERANCE,
+    ):
         self.config = config or LuxConfig()
+        self.tail_only = tail_only
+        self.tail_tolerance = tail_tolerance
         self.indicator = LuxSignalsOverlays(self.config)
 
     def generate_current_signal(
         self, symbol: str, df: pd.DataFrame
     ) -> Optional[LuxSignalResult]:
-        historical = self.generate_historical_signals(symbol, df)
+        historical = self.generate_historical_signals(symbol, self._current_frame(df))
+        return self.signal_from_history(symbol, historical)
+
+    def signal_from_history(
+        self, symbol: str, historical: pd.DataFrame
+    ) -> Optional[LuxSignalResult]:
+        """Sinal atual a partir de um histórico de `generate_historical_signals`."""
         if historical.empty:
             return None
 
@@ -149,13 +170,15 @@ class LuxSignalGenerator:
         history.loc[no_confirmation, "combined_signal"] = history.loc[
             no_confirmation, "contrarian_signal"
         ]
-        history["signal_context"] = history.apply(self._signal_context, axis=1)
-        history["options_hint"] = history["combined_signal"].map(
-            {
-                int(Signal.BUY): "CALL",
-                int(Signal.SELL): "PUT",
-                int(Signal.HOLD): "NO_TRADE",
-            }
+        history["signal_context"] = self._signal_contexts(history)
+        history["options_hint"] = select_labels(
+            [
+                history["combined_signal"] == int(Signal.BUY),
+                history["combined_signal"] == int(Signal.SELL),
+            ],
+            ["CALL", "PUT"],
+            "NO_TRADE",
+            history.index,
         )
 
         return history.astype(
@@ -166,6 +189,18 @@ class LuxSignalGenerator:
             }
         ).reset_index(drop=True)
 
+    def extend_historical_signals(
+        self, symbol: str, df: pd.DataFrame, historical: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Histórico de `df` a partir do já calculado para suas barras iniciais."""
+        return extend_history(self, symbol, df, historical)
+
+    def _current_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Histórico usado pelo sinal atual: só a cauda em modo `tail_only`."""
+        if not self.tail_only:
+            return df
+        return df.iloc[-self.indicator.tail_bars(self.tail_tolerance) :]
+
     @staticmethod
     def _prepare_frame(df: pd.DataFrame) -> pd.DataFrame:
         return df.rename(
@@ -185,16 +220,26 @@ class LuxSignalGenerator:
         return float(value)
 
     @staticmethod
-    def _signal_context(row: pd.Series) -> str:
-        if row["confirmation_signal"] == int(Signal.BUY):
-            return "trend_confirmation_buy"
-        if row["confirmation_signal"] == int(Signal.SELL):
-            return "trend_confirmation_sell"
-        if row["contrarian_signal"] == int(Signal.BUY):
-            return "contrarian_reversal_buy"
-        if row["contrarian_signal"] == int(Signal.SELL):
-            return "contrarian_reversal_sell"
-        return "no_trade"
+    def _signal_contexts(history: pd.DataFrame) -> pd.Series:
+        """Contexto de cada barra; o primeiro sinal na ordem abaixo vence."""
+        confirmation = history["confirmation_signal"]
+        contrarian = history["contrarian_signal"]
+        return select_labels(
+            [
+                confirmation == int(Signal.BUY),
+                confirmation == int(Signal.SELL),
+                contrarian == int(Signal.BUY),
+                contrarian == int(Signal.SELL),
+            ],
+            [
+                "trend_confirmation_buy",
+                "trend_confirmation_sell",
+                "contrarian_reversal_buy",
+                "contrarian_reversal_sell",
+            ],
+            "no_trade",
+            history.index,
+        )
 
     @staticmethod
     def _signal_label(value) -> str:
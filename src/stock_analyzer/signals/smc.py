@@ -4,8 +4,16 @@ from typing import Optional
 import pandas as pd
 
 from stock_analyzer.enums import Signal
-from stock_analyzer.signals.base import AnalyzerSignalResult
-from trading_indicators import SMCConfig, SmartMoneyConfluence
+from stock_analyzer.signals.base import (
+    AnalyzerSignalResult,
+    extend_history,
+    select_labels,
+)
+from trading_indicators import (
+    DEFAULT_TAIL_TOLERANCE,
+    SMCConfig,
+    SmartMoneyConfluence,
+)
 
 
 @dataclass
@@ -32,14 +40,27 @@ class SMCSignalGenerator:
 
     REQUIRED_COLUMNS = {"Open", "High", "Low", "Close"}
 
-    def __init__(self, config: SMCConfig = None):
+    def __init__(
+        self,
+        config: SMCConfig = None,
+        tail_only: bool = False,
+        tail_tolerance: float = DEFAULT_TAIL_TOLERANCE,
+    ):
         self.config = config or SMCConfig()
+        self.tail_only = tail_only
+        self.tail_tolerance = tail_tolerance
         self.indicator = SmartMoneyConfluence(self.config)
 
     def generate_current_signal(
         self, symbol: str, df: pd.DataFrame
     ) -> Optional[SMCSignalResult]:
-        historical = self.generate_historical_signals(symbol, df)
+        historical = self.generate_historical_signals(symbol, self._current_frame(df))
+        return self.signal_from_history(symbol, historical)
+
+    def signal_from_history(
+        self, symbol: str, historical: pd.DataFrame
+    ) -> Optional[SMCSignalResult]:
+        """Sinal atual a partir de um histórico de `generate_historical_signals`."""
         if historical.empty:
             return None
 
@@ -103,8 +124,8 @@ class SMCSignalGenerator:
         history.loc[history["long_signal"], "signal_bias"] = "BULLISH"
         history.loc[history["short_signal"], "signal_bias"] = "BEARISH"
 
-        history["signal_context"] = history.apply(self._signal_context, axis=1)
-        history["options_hint"] = history.apply(self._options_hint, axis=1)
+        history["signal_context"] = self._signal_contexts(history)
+        history["options_hint"] = self._options_hints(history)
 
         return history.astype({"combined_signal": int}).reset_index(drop=True)
 
@@ -146,6 +167,18 @@ class SMCSignalGenerator:
             "combined_signal",
         ]
 
+    def extend_historical_signals(
+        self, symbol: str, df: pd.DataFrame, historical: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Histórico de `df` a partir do já calculado para suas barras iniciais."""
+        return extend_history(self, symbol, df, historical)
+
+    def _current_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Histórico usado pelo sinal atual: só a cauda em modo `tail_only`."""
+        if not self.tail_only:
+            return df
+        return df.iloc[-self.indicator.tail_bars(self.tail_tolerance) :]
+
     @staticmethod
     def _prepare_frame(df: pd.DataFrame) -> pd.DataFrame:
         return df.rename(
@@ -167,36 +200,49 @@ class SMCSignalGenerator:
         return pct.where(span != 0, 50.0)
 
     @staticmethod
-    def _signal_context(row: pd.Series) -> str:
-        if row["long_signal"]:
-            return "bullish_confluence"
-        if row["short_signal"]:
-            return "bearish_confluence"
-        if row["swing_low_marker"] and row["in_discount"]:
-            return "short_term_bullish_reversal"
-        if row["swing_high_marker"] and row["in_premium"]:
-            return "short_term_bearish_reversal"
-        if row["in_discount"] and row["bullish_rejection"]:
-            return "discount_watch"
-        if row["in_premium"] and row["bearish_rejection"]:
-            return "premium_watch"
-        if row["swing_low_marker"]:
-            return "swing_low_watch"
-        if row["swing_high_marker"]:
-            return "swing_high_watch"
-        return "no_trade"
+    def _signal_contexts(history: pd.DataFrame) -> pd.Series:
+        """Contexto de cada barra; a primeira condição na ordem abaixo vence."""
+        h = history
+        return select_labels(
+            [
+                h["long_signal"],
+                h["short_signal"],
+                h["swing_low_marker"] & h["in_discount"],
+                h["swing_high_marker"] & h["in_premium"],
+                h["in_discount"] & h["bullish_rejection"],
+                h["in_premium"] & h["bearish_rejection"],
+                h["swing_low_marker"],
+                h["swing_high_marker"],
+            ],
+            [
+                "bullish_confluence",
+                "bearish_confluence",
+                "short_term_bullish_reversal",
+                "short_term_bearish_reversal",
+                "discount_watch",
+                "premium_watch",
+                "swing_low_watch",
+                "swing_high_watch",
+            ],
+            "no_trade",
+            history.index,
+        )
 
     @staticmethod
-    def _options_hint(row: pd.Series) -> str:
-        if row["long_signal"]:
-            return "CALL"
-        if row["short_signal"]:
-            return "PUT"
-        if row["swing_low_marker"] or (row["in_discount"] and row["bullish_rejection"]):
-            return "CALL_WATCH"
-        if row["swing_high_marker"] or (row["in_premium"] and row["bearish_rejection"]):
-            return "PUT_WATCH"
-        return "NO_TRADE"
+    def _options_hints(history: pd.DataFrame) -> pd.Series:
+        """Hint de opções de cada barra; a primeira condição na ordem abaixo vence."""
+        h = history
+        return select_labels(
+            [
+                h["long_signal"],
+                h["short_signal"],
+                h["swing_low_marker"] | (h["in_discount"] & h["bullish_rejection"]),
+                h["swing_high_marker"] | (h["in_premium"] & h["bearish_rejection"]),
+            ],
+            ["CALL", "PUT", "CALL_WATCH", "PUT_WATCH"],
+            "NO_TRADE",
+            history.index,
+        )
 
     @staticmethod
     def _optional_float(value) -> Optional[float]:
@@ -8,6 +8,7 @@ import pandas as pd
 
 from stock_data_manager.factories.manager_factory import StockDataManagerFactory
 from stock_data_manager.implementations.yfinance_downloader import YFinanceDownloader
+from stock_data_manager.managers.bulk_downloader import BulkDownloader, TokenBucket
 
 BASE_PATH = Path(__file__).parent.parent.resolve()
 PROJECT_ROOT = BASE_PATH.parent
@@ -182,9 +183,12 @@ Formato do arquivo de símbolos:
 
         parser.add_argument(
             "--storage",
-            choices=["csv", "sqlite"],
+            choices=["csv", "sqlite", "parquet"],
             default="csv",
-            help="Backend de persistência local (padrão: csv; sqlite é opt-in)",
+            help=(
+                "Backend de persistência local "
+                "(padrão: csv; sqlite e parquet são opt-in)"
+            ),
         )
 
         parser.add_argument(
@@ -194,6 +198,28 @@ Formato do arquivo de símbolos:
             help="Arquivo SQLite quando --storage sqlite é usado",
         )
 
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Downloads simultâneos (padrão: 1, sequencial)",
+        )
+
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=None,
+            metavar="REQ_PER_SEC",
+            help="Limite de requisições por segundo ao provedor (padrão: sem limite)",
+        )
+
+        parser.add_argument(
+            "--retries",
+            type=int,
+            default=0,
+            help="Retentativas por símbolo, com backoff exponencial (padrão: 0)",
+        )
+
         parser.add_argument(
             "-v",
             "--verbose",
@@ -265,6 +291,12 @@ Formato do arquivo de símbolos:
                     db_path=args.db_path,
                 )
 
+            manager.bulk_downloader = BulkDownloader(
+                max_workers=args.workers,
+                rate_limiter=TokenBucket(args.rate) if args.rate else None,
+                max_retries=args.retries,
+            )
+
             # Baixa os dados
             print(
                 f"\n{'🔄 Modo: Download completo' if args.full else '⚡ Modo: Incremental'}"
@@ -272,6 +304,9 @@ Formato do arquivo de símbolos:
             print(f"💾 Persistência: {args.storage}")
             if args.storage == "sqlite":
                 print(f"🗄️  SQLite DB: {args.db_path}")
+            if args.workers > 1 or args.rate:
+                rate = f"{args.rate:g} req/s" if args.rate else "sem limite"
+                print(f"🧵 Workers: {args.workers} | Taxa: {rate}")
             print(f"📈 Processando {len(symbols)} ativo(s)...\n")
 
             results = manager.download_multiple(
@@ -287,10 +322,9 @@ Formato do arquivo de símbolos:
             for symbol, data in results.items():
                 if data is not None and not data.empty:
                     success_count += 1
+                    # Atualizações incrementais trazem só a cauda do histórico
                     print(
-                        f"✅ {symbol:12} | {len(data):6} registros | "
-                        f"{data.index.min().strftime('%Y-%m-%d')} a "
-                        f"{data.index.max().strftime('%Y-%m-%d')}"
+                        f"✅ {symbol:12} | até {data.index.max().strftime('%Y-%m-%d')}"
                     )
                 else:
                     print(f"❌ {symbol:12} | Falha no download")
@@ -298,6 +332,9 @@ Formato do arquivo de símbolos:
             print("=" * 60)
             print(f"✅ Sucesso: {success_count}/{len(symbols)}")
             print(f"❌ Falhas: {len(symbols) - success_count}/{len(symbols)}")
+            summary = getattr(manager, "last_download_summary", None)
+            if summary is not None:
+                print(f"⏱️  {summary.render()}")
             print("=" * 60)
 
             return 0 if success_count > 0 else 1
@@ -1,5 +1,7 @@
 from stock_data_manager.implementations.csv_reader import CSVReader
 from stock_data_manager.implementations.csv_writer import CSVWriter
+from stock_data_manager.implementations.parquet_reader import ParquetReader
+from stock_data_manager.implementations.parquet_writer import ParquetWriter
 from stock_data_manager.implementations.sqlite_reader import SQLiteReader
 from stock_data_manager.implementations.sqlite_writer import SQLiteWriter
 from stock_data_manager.implementations.yfinance_downloader import YFinanceDownloader
@@ -41,8 +43,12 @@ class StockDataManagerFactory:
 
     @staticmethod
     def _create_storage(storage: str, db_path: str):
+        # Atualizações diárias só acrescentam barras: writers em modo append.
+        # Stores em arquivo mantêm o manifest usado nas checagens de frescor.
         if storage == "csv":
-            return CSVReader(), CSVWriter()
+            return CSVReader(), CSVWriter(append=True, manifest=True)
         if storage == "sqlite":
-            return SQLiteReader(db_path), SQLiteWriter(db_path)
+            return SQLiteReader(db_path), SQLiteWriter(db_path, append=True)
+        if storage == "parquet":
+            return ParquetReader(), ParquetWriter(append=True, manifest=True)
         raise ValueError(f"Unsupported storage backend: {storage}")
@@ -0,0 +1,116 @@
+"""
+Apoio à escrita incremental (append) dos writers.
+
+Antes de anexar, o writer compara as últimas linhas já gravadas (`tail`) com
+as mesmas datas em `data`. Se batem, só as linhas posteriores precisam ser
+gravadas; se não (histórico revisado, datas fora de ordem, colunas
+diferentes), o writer reescreve tudo.
+"""
+
+import io
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+# Linhas do fim do armazenamento comparadas antes de anexar
+TAIL_OVERLAP_ROWS = 5
+
+# Bytes lidos do fim do CSV para encontrar as últimas linhas
+_CSV_TAIL_BYTES = 8192
+
+
+def _normalized_index(index: pd.Index) -> Optional[pd.DatetimeIndex]:
+    try:
+        return pd.DatetimeIndex(pd.to_datetime(index, utc=True))
+    except (ValueError, TypeError):
+        return None
+
+
+def _values_equal(left: pd.DataFrame, right: pd.DataFrame) -> bool:
+    for column in right.columns:
+        a, b = left[column], right[column]
+        if is_numeric_dtype(a) and is_numeric_dtype(b):
+            if not np.allclose(
+                a.to_numpy(dtype=float),
+                b.to_numpy(dtype=float),
+                rtol=1e-9,
+                atol=0.0,
+                equal_nan=True,
+            ):
+                return False
+        elif not (a.astype(str).to_numpy() == b.astype(str).to_numpy()).all():
+            return False
+    return True
+
+
+def appendable_rows(data: pd.DataFrame, tail: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    Linhas de `data` posteriores à última linha gravada.
+
+    Args:
+        data: Frame completo que o writer recebeu.
+        tail: Últimas linhas já gravadas no armazenamento.
+
+    Returns:
+        As linhas a anexar (possivelmente vazio), ou None se `tail` não
+        coincide com `data` e é preciso reescrever tudo.
+    """
+    if tail.empty or any(column not in data.columns for column in tail.columns):
+        return None
+
+    data_index = _normalized_index(data.index)
+    tail_index = _normalized_index(tail.index)
+    if data_index is None or tail_index is None:
+        return None
+    if not (data_index.is_unique and data_index.is_monotonic_increasing):
+        return None
+
+    positions = data_index.get_indexer(tail_index)
+    expected = np.arange(positions[0], positions[0] + len(positions))
+    if (positions < 0).any() or not np.array_equal(positions, expected):
+        return None
+
+    if not _values_equal(data.iloc[positions][tail.columns], tail):
+        return None
+    return data.iloc[positions[-1] + 1 :]
+
+
+def read_csv_tail(
+    filepath: Path, rows: int = TAIL_OVERLAP_ROWS
+) -> Tuple[str, List[str]]:
+    """
+    Cabeçalho e últimas `rows` linhas de um CSV, sem ler o arquivo inteiro.
+
+    Lê blocos do fim do arquivo, dobrando o tamanho até cobrir `rows` linhas
+    completas (ou o arquivo todo).
+    """
+    with open(filepath, "rb") as f:
+        header = f.readline()
+        f.seek(0, io.SEEK_END)
+        size = f.tell()
+        body = size - len(header)
+        block = min(body, _CSV_TAIL_BYTES)
+        while True:
+            f.seek(size - block)
+            chunk = f.read()
+            # +1: a primeira linha do bloco pode estar cortada
+            if block == body or chunk.count(b"\n") > rows + 1:
+                break
+            block = min(body, block * 2)
+
+    header_line = header.decode("utf-8").rstrip("\r\n")
+    # Sem quebra de linha final não dá para anexar com segurança
+    if not chunk.endswith(b"\n"):
+        return header_line, []
+    lines = chunk.decode("utf-8").splitlines()
+    if block < body:
+        # A primeira linha do bloco pode estar cortada
+        lines = lines[1:]
+    return header_line, lines[-rows:]
+
+
+def parse_csv_tail(header: str, lines: List[str]) -> pd.DataFrame:
+    return pd.read_csv(io.StringIO("\n".join([header, *lines])), index_col=0)
@@ -1,8 +1,10 @@
+import io
 from pathlib import Path
 from typing import Optional
 import pandas as pd
 import logging
 
+from stock_data_manager.implementations.append_support import read_csv_tail
 from stock_data_manager.interfaces.data_reader import IDataReader
 
 
@@ -25,3 +27,14 @@ class CSVReader(IDataReader):
         except Exception as e:
             self.logger.error(f"Erro ao ler {filepath}: {e}")
             return None
+
+    def read_tail(self, filepath: Path, rows: int) -> Optional[pd.DataFrame]:
+        """Últimas `rows` linhas, lidas do fim do arquivo."""
+        if not filepath.exists():
+            return None
+        header, lines = read_csv_tail(filepath, rows)
+        if not lines:
+            return super().read_tail(filepath, rows)
+        return pd.read_csv(
+            io.StringIO("\n".join([header, *lines])), index_col=0, parse_dates=True
+        )
@@ -1,21 +1,119 @@
 from pathlib import Path
+from typing import Optional
 import pandas as pd
 import logging
 
+from stock_data_manager.implementations.append_support import (
+    appendable_rows,
+    parse_csv_tail,
+    read_csv_tail,
+)
 from stock_data_manager.interfaces.data_writer import IDataWriter
+from stock_data_manager.models.write_stats import WriteStats
+from stock_data_manager.repositories.manifest import (
+    ManifestEntry,
+    PriceStoreManifest,
+)
 
 
 class CSVWriter(IDataWriter):
     """Responsável apenas por escrever arquivos CSV"""
 
-    def __init__(self):
+    def __init__(self, append: bool = False, manifest: bool = False):
+        """
+        Args:
+            append: Anexa só as linhas novas quando o fim do arquivo coincide
+                com `data`; reescreve o arquivo se o histórico foi revisado.
+            manifest: Mantém o PriceStoreManifest do diretório atualizado.
+        """
+        self.append = append
+        self.manifest = manifest
+        self.stats = WriteStats()
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    @property
+    def appends_in_place(self) -> bool:
+        return self.append
+
     def write(self, data: pd.DataFrame, filepath: Path) -> None:
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
-            data.to_csv(filepath)
-            self.logger.info(f"Dados salvos: {len(data)} registros em {filepath}")
+            new_rows = self._appendable_rows(data, filepath) if self.append else None
+
+            if new_rows is None:
+                data.to_csv(filepath)
+                self.stats.record(filepath.stat().st_size, len(data), appended=False)
+                self.logger.info(f"Dados salvos: {len(data)} registros em {filepath}")
+                self._update_manifest(data, filepath, changed=True)
+            elif new_rows.empty:
+                self.stats.record_skip()
+                self.logger.info(f"Nenhum registro novo para {filepath}")
+                self._update_manifest(data, filepath, changed=False)
+            else:
+                previous = self._manifest_entry(filepath)
+                appended = new_rows.to_csv(header=False).encode("utf-8")
+                with open(filepath, "ab") as f:
+                    f.write(appended)
+                self.stats.record(len(appended), len(new_rows), appended=True)
+                self.logger.info(
+                    f"Dados anexados: {len(new_rows)} registros em {filepath}"
+                )
+                self._update_manifest(
+                    data, filepath, changed=True, previous=previous, appended=appended
+                )
         except Exception as e:
             self.logger.error(f"Erro ao salvar {filepath}: {e}")
             raise
+
+    def _appendable_rows(
+        self, data: pd.DataFrame, filepath: Path
+    ) -> Optional[pd.DataFrame]:
+        if not filepath.exists():
+            return None
+        header, lines = read_csv_tail(filepath)
+        if not lines or header != data.iloc[:0].to_csv().rstrip("\r\n"):
+            return None
+        tail = parse_csv_tail(header, lines)
+        rows = appendable_rows(data, tail)
+        if rows is None or rows.empty:
+            return rows
+
+        # As linhas novas são gravadas no próprio timezone, com o offset de cada
+        # data (horário de verão incluído). Um índice em UTC não diz qual é o
+        # fuso da bolsa: se o arquivo usa outro offset, reescreve tudo em vez
+        # de gravar um offset fixo copiado da cauda.
+        file_offset = pd.Timestamp(tail.index[-1]).utcoffset()
+        if _is_utc(rows.index) and file_offset != pd.Timedelta(0):
+            return None
+        return rows
+
+    def _manifest_entry(self, filepath: Path) -> Optional[ManifestEntry]:
+        if not self.manifest:
+            return None
+        return PriceStoreManifest(filepath.parent).fresh_entry(filepath.stem)
+
+    def _update_manifest(
+        self,
+        data: pd.DataFrame,
+        filepath: Path,
+        changed: bool,
+        previous: Optional[ManifestEntry] = None,
+        appended: Optional[bytes] = None,
+    ) -> None:
+        """
+        Atualiza a entrada do arquivo no manifest. Após um append, o hash do
+        conteúdo é encadeado a partir de `previous` e dos bytes anexados, sem
+        reler o arquivo.
+        """
+        if not self.manifest:
+            return
+        manifest = PriceStoreManifest(filepath.parent)
+        if changed or manifest.fresh_entry(filepath.stem) is None:
+            manifest.record(
+                filepath.stem, filepath, data, previous=previous, appended=appended
+            )
+
+
+def _is_utc(index: pd.Index) -> bool:
+    tz = getattr(index, "tz", None)
+    return tz is not None and str(tz) == "UTC"
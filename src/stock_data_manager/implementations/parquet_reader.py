@@ -0,0 +1,29 @@
+import logging
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from stock_data_manager.interfaces.data_reader import IDataReader
+from stock_data_manager.repositories.parquet_repository import (
+    ParquetPriceDataRepository,
+)
+
+
+class ParquetReader(IDataReader):
+    """Read symbol OHLCV data from `<SYMBOL>.parquet` next to the CSV path."""
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def read(self, filepath: Path) -> Optional[pd.DataFrame]:
+        repository = ParquetPriceDataRepository(str(filepath.parent))
+        symbol = filepath.stem
+        try:
+            df = repository.load_symbol(symbol)
+        except FileNotFoundError:
+            self.logger.info("Parquet data not found for %s", symbol)
+            return None
+
+        self.logger.info("Parquet data read: %d rows for %s", len(df), symbol)
+        return df
@@ -0,0 +1,54 @@
+import logging
+from pathlib import Path
+
+import pandas as pd
+
+from stock_data_manager.implementations.append_support import (
+    TAIL_OVERLAP_ROWS,
+    appendable_rows,
+)
+from stock_data_manager.interfaces.data_writer import IDataWriter
+from stock_data_manager.models.write_stats import WriteStats
+from stock_data_manager.repositories.manifest import PriceStoreManifest
+from stock_data_manager.repositories.parquet_repository import (
+    ParquetPriceDataRepository,
+)
+
+
+class ParquetWriter(IDataWriter):
+    """Write symbol OHLCV data to `<SYMBOL>.parquet` next to the CSV path."""
+
+    def __init__(self, append: bool = False, manifest: bool = False):
+        """
+        Args:
+            append: Skip the write when the stored tail already matches
+                `data` and there are no new rows. Parquet files cannot be
+                appended in place, so any new row still rewrites the file.
+            manifest: Keep the directory's PriceStoreManifest up to date.
+        """
+        self.append = append
+        self.manifest = manifest
+        self.stats = WriteStats()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def write(self, data: pd.DataFrame, filepath: Path) -> None:
+        repository = ParquetPriceDataRepository(str(filepath.parent))
+        symbol = filepath.stem
+        path = repository.path_for(symbol)
+        manifest = PriceStoreManifest(filepath.parent) if self.manifest else None
+
+        if self.append and path.exists():
+            tail = repository.load_tail(symbol, TAIL_OVERLAP_ROWS)
+            new_rows = appendable_rows(data, tail)
+            if new_rows is not None and new_rows.empty:
+                self.stats.record_skip()
+                self.logger.info("Parquet data unchanged for %s", symbol)
+                if manifest is not None and manifest.fresh_entry(symbol) is None:
+                    manifest.record(symbol, path, data)
+                return
+
+        repository.save_symbol(symbol, data)
+        self.stats.record(path.stat().st_size, len(data), appended=False)
+        if manifest is not None:
+            manifest.record(symbol, path, data)
+        self.logger.info("Parquet data saved: %d rows for %s", len(data), symbol)
@@ -1,20 +1,52 @@
 import logging
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
+from stock_data_manager.implementations.append_support import (
+    TAIL_OVERLAP_ROWS,
+    appendable_rows,
+)
 from stock_data_manager.interfaces.data_writer import IDataWriter
+from stock_data_manager.models.write_stats import WriteStats
 from stock_data_manager.repositories.sqlite_repository import SqlitePriceDataRepository
 
 
 class SQLiteWriter(IDataWriter):
     """Write symbol OHLCV data to a local SQLite database."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, append: bool = False):
+        """
+        Args:
+            append: Insert only rows after the stored tail when it matches
+                `data`; upsert every row if history was revised.
+        """
         self.repository = SqlitePriceDataRepository(db_path)
+        self.append = append
+        self.stats = WriteStats()
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def write(self, data: pd.DataFrame, filepath: Path) -> None:
         symbol = filepath.stem
-        self.repository.save_symbol(symbol, data)
-        self.logger.info("SQLite data saved: %d rows for %s", len(data), symbol)
+        new_rows = self._appendable_rows(symbol, data) if self.append else None
+
+        if new_rows is None:
+            nbytes = self.repository.write_rows(symbol, data)
+            self.stats.record(nbytes, len(data), appended=False)
+            self.logger.info("SQLite data saved: %d rows for %s", len(data), symbol)
+        elif new_rows.empty:
+            self.stats.record_skip()
+            self.logger.info("SQLite data unchanged for %s", symbol)
+        else:
+            nbytes = self.repository.write_rows(symbol, new_rows)
+            self.stats.record(nbytes, len(new_rows), appended=True)
+            self.logger.info(
+                "SQLite data appended: %d rows for %s", len(new_rows), symbol
+            )
+
+    def _appendable_rows(
+        self, symbol: str, data: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        tail = self.repository.load_tail(symbol, TAIL_OVERLAP_ROWS)
+        return appendable_rows(data, tail)
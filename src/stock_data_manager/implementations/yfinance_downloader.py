@@ -1,15 +1,36 @@
 import logging
+from collections import defaultdict
+
 import pandas as pd
 import yfinance as yf
+from yfinance.exceptions import YFException
 
 from stock_data_manager.interfaces.data_downloader import IDataDownloader
 from stock_data_manager.models.stock_config import StockConfig
 
+# Falhas de um download: erros do yfinance, de rede (as exceções de requests e
+# curl_cffi derivam de OSError) e de dados inválidos na resposta ou no arquivo
+DOWNLOAD_ERRORS: tuple[type[Exception], ...] = (YFException, OSError, ValueError)
+# Falhas da consulta do timezone: as de download ou um campo ausente no fast_info
+TIMEZONE_ERRORS: tuple[type[Exception], ...] = (*DOWNLOAD_ERRORS, KeyError)
+
 
 class YFinanceDownloader(IDataDownloader):
     """Responsável apenas por baixar dados do Yahoo Finance"""
 
     INTERVAL_MAP = {"1d": "1D", "1w": "1wk", "1m": "1mo"}
+    # Símbolos por requisição multi-ticker em download_batch
+    BATCH_SIZE = 100
+    # Ordem das colunas retornada por Ticker.history
+    HISTORY_COLUMNS = [
+        "Open",
+        "High",
+        "Low",
+        "Close",
+        "Volume",
+        "Dividends",
+        "Stock Splits",
+    ]
 
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -37,3 +58,107 @@ class YFinanceDownloader(IDataDownloader):
         except Exception as e:
             self.logger.error(f"Erro ao baixar {config.symbol}: {e}")
             raise
+
+    def download_batch(self, configs: list[StockConfig]) -> dict[str, pd.DataFrame]:
+        """
+        Baixa vários símbolos agrupando-os por (início, fim, intervalo) em
+        requisições multi-ticker de até BATCH_SIZE símbolos.
+
+        Returns:
+            Dict símbolo -> DataFrame no formato de `download`, com o índice no
+            timezone da bolsa de cada símbolo (o mesmo de `Ticker.history`);
+            símbolos ausentes na resposta ficam fora do dict para que o
+            chamador possa recorrer a `download`.
+        """
+        groups: dict[tuple, list[str]] = defaultdict(list)
+        for config in configs:
+            groups[(config.start_date, config.end_date, config.interval)].append(
+                config.symbol
+            )
+
+        results: dict[str, pd.DataFrame] = {}
+        for (start, end, interval), symbols in groups.items():
+            for i in range(0, len(symbols), self.BATCH_SIZE):
+                chunk = symbols[i : i + self.BATCH_SIZE]
+                self.logger.info(
+                    f"Baixando lote de {len(chunk)} símbolos de {start} até {end}"
+                )
+                data = yf.download(
+                    chunk,
+                    start=start,
+                    end=end,
+                    interval=self.INTERVAL_MAP[interval],
+                    group_by="ticker",
+                    actions=True,
+                    auto_adjust=True,
+                    # O lote vem convertido para um único timezone; cada símbolo
+                    # volta ao da sua bolsa em split_batch
+                    ignore_tz=False,
+                    progress=False,
+                )
+                timezones = None
+                if isinstance(getattr(data, "index", None), pd.DatetimeIndex) and (
+                    data.index.tz is not None
+                ):
+                    timezones = {
+                        symbol: self.exchange_timezone(symbol) for symbol in chunk
+                    }
+                results.update(self.split_batch(data, chunk, timezones))
+        return results
+
+    def exchange_timezone(self, symbol: str) -> str | None:
+        """
+        Nome do timezone da bolsa do símbolo (ex.: "America/New_York").
+
+        Vem do cache de timezones do yfinance, já preenchido pelo download;
+        só consulta a rede quando o símbolo não está no cache.
+        """
+        try:
+            return yf.Ticker(symbol).fast_info["timezone"]
+        except TIMEZONE_ERRORS as e:
+            self.logger.warning(f"Timezone da bolsa indisponível para {symbol}: {e}")
+            return None
+
+    @classmethod
+    def split_batch(
+        cls,
+        data: pd.DataFrame | None,
+        symbols: list[str],
+        timezones: dict[str, str | None] | None = None,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Separa o frame multi-ticker (colunas (símbolo, campo)) por símbolo.
+
+        Args:
+            timezones: Timezone da bolsa de cada símbolo. Índices com timezone
+                são convertidos para ele, de modo que cada barra fique com o
+                offset da sua data (horário de verão incluído); símbolos sem
+                timezone conhecido são descartados, para que o chamador recorra
+                a `download`.
+        """
+        if data is None:
+            return {}
+        if not isinstance(data.columns, pd.MultiIndex):
+            if len(symbols) != 1:
+                return {}
+            data = pd.concat({symbols[0]: data}, axis=1)
+
+        present = set(data.columns.get_level_values(0))
+        frames = {}
+        for symbol in symbols:
+            if symbol not in present:
+                continue
+            frame = data[symbol].rename_axis(None, axis=1)
+            if timezones is not None and frame.index.tz is not None:
+                if not timezones.get(symbol):
+                    continue
+                frame = frame.tz_convert(timezones[symbol])
+            ordered = [c for c in cls.HISTORY_COLUMNS if c in frame.columns]
+            frame = frame[ordered + [c for c in frame.columns if c not in ordered]]
+            # O índice do lote é a união das datas de todos os símbolos
+            prices = [c for c in ("Open", "High", "Low", "Close") if c in frame.columns]
+            frame = frame.dropna(subset=prices or None, how="all")
+            if "Volume" in frame.columns and not frame["Volume"].isna().any():
+                frame = frame.astype({"Volume": "int64"})
+            frames[symbol] = frame
+        return frames
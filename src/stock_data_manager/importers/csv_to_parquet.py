@@ -0,0 +1,114 @@
+"""
+CLI script: convert all CSV files from a directory into per-symbol Parquet files.
+
+CSVs are parsed by a pool of worker processes; progress is journalled in the
+Parquet directory so an interrupted conversion resumes where it stopped, and
+row counts are verified against the Parquet footers at the end.
+
+Usage:
+    PYTHONPATH=src uv run python -m stock_data_manager.importers.csv_to_parquet \\
+        --data-dir data/stocks/1D \\
+        --parquet-dir data/stocks/1D \\
+        --workers 4
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from stock_data_manager.importers.parallel import (
+    ImportJournal,
+    ImportSummary,
+    run_import,
+)
+from stock_data_manager.repositories.csv_repository import CsvPriceDataRepository
+from stock_data_manager.repositories.parquet_repository import (
+    ParquetPriceDataRepository,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "_import_journal.jsonl"
+
+
+def import_csv_to_parquet(
+    data_dir: str,
+    parquet_dir: str,
+    workers: int = 1,
+    resume: bool = True,
+) -> ImportSummary | None:
+    csv_repo = CsvPriceDataRepository(data_dir)
+    parquet_repo = ParquetPriceDataRepository(parquet_dir)
+
+    symbols = sorted(csv_repo.list_symbols())
+
+    if not symbols:
+        logger.warning("No CSV files found in %s", data_dir)
+        return None
+
+    logger.info("Found %d symbol(s) in %s", len(symbols), data_dir)
+
+    def write_batch(batch):
+        for symbol, df in batch:
+            parquet_repo.save_symbol(symbol, df)
+
+    summary = run_import(
+        data_dir=data_dir,
+        symbols=symbols,
+        journal=ImportJournal(Path(parquet_dir) / JOURNAL_FILENAME),
+        write_batch=write_batch,
+        stored_rows=parquet_repo.row_counts,
+        workers=workers,
+        resume=resume,
+        verb="converted",
+    )
+
+    print(f"\nDone: {summary.render()}. Parquet dir: {parquet_dir}")
+    return summary
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert CSV OHLCV files into per-symbol Parquet files."
+    )
+    parser.add_argument(
+        "--data-dir",
+        required=True,
+        help="Directory containing <SYMBOL>.csv files",
+    )
+    parser.add_argument(
+        "--parquet-dir",
+        default=None,
+        help="Directory for <SYMBOL>.parquet files (default: same as --data-dir)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes parsing CSVs in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the resume journal and convert every symbol again",
+    )
+    args = parser.parse_args(argv)
+
+    data_dir = Path(args.data_dir)
+    if not data_dir.exists():
+        print(f"Error: data-dir does not exist: {data_dir}", file=sys.stderr)
+        return 1
+
+    summary = import_csv_to_parquet(
+        str(data_dir),
+        args.parquet_dir or str(data_dir),
+        workers=args.workers,
+        resume=not args.fresh,
+    )
+    return 1 if summary is not None and summary.mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,16 @@
 """
 CLI script: import all CSV files from a directory into a SQLite database.
 
+CSVs are parsed by a pool of worker processes and written by this process in
+one transaction per batch of symbols. Progress is journalled next to the
+database, so an interrupted import resumes where it stopped; row counts are
+verified at the end.
+
 Usage:
     PYTHONPATH=src uv run python -m stock_data_manager.importers.csv_to_sqlite \\
         --data-dir data/stocks/1D \\
-        --db-path data/financial.db
+        --db-path data/financial.db \\
+        --workers 4
 """
 
 import argparse
@@ -12,38 +18,64 @@ import logging
 import sys
 from pathlib import Path
 
+from stock_data_manager.importers.parallel import (
+    ImportJournal,
+    ImportSummary,
+    run_import,
+    unique_dates,
+)
 from stock_data_manager.repositories.csv_repository import CsvPriceDataRepository
 from stock_data_manager.repositories.sqlite_repository import SqlitePriceDataRepository
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+# Symbols written per SQLite transaction (one commit per batch, not per symbol)
+IMPORT_BATCH_SYMBOLS = 100
+
+
+def journal_path(db_path: str) -> Path:
+    path = Path(db_path)
+    return path.with_name(f"{path.name}.import-journal")
 
-def import_csv_to_sqlite(data_dir: str, db_path: str) -> None:
+
+def import_csv_to_sqlite(
+    data_dir: str,
+    db_path: str,
+    workers: int = 1,
+    resume: bool = True,
+    batch_symbols: int = IMPORT_BATCH_SYMBOLS,
+) -> ImportSummary | None:
     csv_repo = CsvPriceDataRepository(data_dir)
     sqlite_repo = SqlitePriceDataRepository(db_path)
 
-    symbols = csv_repo.list_symbols()
+    symbols = sorted(csv_repo.list_symbols())
 
     if not symbols:
         logger.warning("No CSV files found in %s", data_dir)
-        return
+        return None
 
     logger.info("Found %d symbol(s) in %s", len(symbols), data_dir)
 
-    ok = 0
-    skipped = 0
-    for symbol in symbols:
-        try:
-            df = csv_repo.load_symbol(symbol)
-            sqlite_repo.save_symbol(symbol, df)
-            print(f"  [OK] {symbol}: {len(df)} rows imported")
-            ok += 1
-        except Exception as exc:
-            logger.warning("Skipping %s: %s", symbol, exc)
-            skipped += 1
+    def write_batch(batch):
+        with sqlite_repo.transaction():
+            for symbol, df in batch:
+                sqlite_repo.write_rows(symbol, df)
+
+    summary = run_import(
+        data_dir=data_dir,
+        symbols=symbols,
+        journal=ImportJournal(journal_path(db_path)),
+        write_batch=write_batch,
+        stored_rows=sqlite_repo.row_counts,
+        workers=workers,
+        batch_symbols=batch_symbols,
+        resume=resume,
+        count_rows=unique_dates,
+    )
 
-    print(f"\nDone: {ok} imported, {skipped} skipped. DB: {db_path}")
+    print(f"\nDone: {summary.render()}. DB: {db_path}")
+    return summary
 
 
 def main(argv=None) -> int:
@@ -60,6 +92,23 @@ def main(argv=None) -> int:
         required=True,
         help="Path to the SQLite database file (created if absent)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes parsing CSVs in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--batch-symbols",
+        type=int,
+        default=IMPORT_BATCH_SYMBOLS,
+        help=f"Symbols per transaction (default: {IMPORT_BATCH_SYMBOLS})",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the resume journal and import every symbol again",
+    )
     args = parser.parse_args(argv)
 
     data_dir = Path(args.data_dir)
@@ -67,8 +116,14 @@ def main(argv=None) -> int:
         print(f"Error: data-dir does not exist: {data_dir}", file=sys.stderr)
         return 1
 
-    import_csv_to_sqlite(str(data_dir), args.db_path)
-    return 0
+    summary = import_csv_to_sqlite(
+        str(data_dir),
+        args.db_path,
+        workers=args.workers,
+        resume=not args.fresh,
+        batch_symbols=args.batch_symbols,
+    )
+    return 1 if summary is not None and summary.mismatches else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,242 @@
+"""
+Shared machinery for the CSV importers: parallel parsing, batched writes,
+a resume journal and end-of-run row-count verification.
+
+Worker processes only parse CSVs; the calling process is the single writer,
+so destinations that are not safe for concurrent writers (SQLite) still get
+large, sequential transactions.
+"""
+
+import json
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+import pandas as pd
+
+from market_scanner.eligibility import load_symbol_csv
+
+logger = logging.getLogger(__name__)
+
+# Parsed frames allowed in flight per worker before the writer catches up
+PREFETCH_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    rows: int
+    mtime_ns: int
+    size: int
+
+
+class ImportJournal:
+    """Append-only JSON-lines record of symbols committed to the destination.
+
+    An entry is written only after the batch holding the symbol is committed,
+    and is honoured on resume only while the source CSV's mtime and size still
+    match, so edited files are imported again.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def load(self) -> dict[str, JournalEntry]:
+        entries: dict[str, JournalEntry] = {}
+        if not self.path.exists():
+            return entries
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    entries[record["symbol"]] = JournalEntry(
+                        record["rows"], record["mtime_ns"], record["size"]
+                    )
+                except (ValueError, KeyError):
+                    # A line cut short by an interrupted run
+                    continue
+        return entries
+
+    def record(self, entries: dict[str, JournalEntry]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.writelines(
+                json.dumps(
+                    {
+                        "symbol": symbol,
+                        "rows": entry.rows,
+                        "mtime_ns": entry.mtime_ns,
+                        "size": entry.size,
+                    }
+                )
+                + "\n"
+                for symbol, entry in entries.items()
+            )
+            f.flush()
+            os.fsync(f.fileno())
+
+    def reset(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class ImportSummary:
+    imported: int = 0
+    resumed: int = 0
+    rows: int = 0
+    elapsed_seconds: float = 0.0
+    failed: list[str] = field(default_factory=list)
+    # symbol -> (rows parsed from CSV, rows found in the destination)
+    mismatches: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def render(self) -> str:
+        text = (
+            f"{self.imported} imported, {self.resumed} already in journal, "
+            f"{len(self.failed)} skipped; {self.rows} rows in "
+            f"{self.elapsed_seconds:.1f}s ({self.rows_per_second:,.0f} rows/s)"
+        )
+        if self.mismatches:
+            text += f"; ROW COUNT MISMATCH for {len(self.mismatches)} symbol(s)"
+        else:
+            text += "; row counts verified"
+        return text
+
+
+def _parse_csv(data_dir: str, symbol: str):
+    """Worker task: (symbol, df, error, stat) for one CSV."""
+    try:
+        stat = (Path(data_dir) / f"{symbol}.csv").stat()
+        df = load_symbol_csv(data_dir, symbol)
+        return symbol, df, None, (stat.st_mtime_ns, stat.st_size)
+    except (OSError, ValueError) as exc:
+        # Missing or unreadable file, or text that does not parse as prices
+        return symbol, None, exc, None
+
+
+def _parsed(data_dir: str, symbols: list[str], workers: int) -> Iterator[tuple]:
+    if workers <= 1:
+        for symbol in symbols:
+            yield _parse_csv(data_dir, symbol)
+        return
+
+    remaining = iter(symbols)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque(
+            pool.submit(_parse_csv, data_dir, symbol)
+            for symbol in islice(remaining, workers * PREFETCH_PER_WORKER)
+        )
+        while pending:
+            result = pending.popleft().result()
+            next_symbol = next(remaining, None)
+            if next_symbol is not None:
+                pending.append(pool.submit(_parse_csv, data_dir, next_symbol))
+            yield result
+
+
+def unique_dates(df: pd.DataFrame) -> int:
+    """Rows `df` leaves in a destination keyed on (symbol, date)."""
+    return df.index.nunique()
+
+
+def _source_stat(data_dir: str, symbol: str) -> tuple[int, int] | None:
+    try:
+        stat = (Path(data_dir) / f"{symbol}.csv").stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def run_import(
+    *,
+    data_dir: str,
+    symbols: Iterable[str],
+    journal: ImportJournal,
+    write_batch: Callable[[list[tuple[str, pd.DataFrame]]], None],
+    stored_rows: Callable[[list[str]], dict[str, int]],
+    workers: int = 1,
+    batch_symbols: int = 100,
+    resume: bool = True,
+    verb: str = "imported",
+    count_rows: Callable[[pd.DataFrame], int] = len,
+) -> ImportSummary:
+    """Parse `symbols` from `data_dir` and hand them to `write_batch` in batches.
+
+    Args:
+        write_batch: Persists a batch atomically (or idempotently); the journal
+            is updated only after it returns.
+        stored_rows: Row count per symbol currently in the destination, used
+            for the final verification of every journalled symbol.
+        resume: Skip symbols already in the journal with an unchanged CSV.
+            With False the journal is discarded and everything is imported.
+        count_rows: Rows a parsed frame should occupy in the destination, as
+            journalled and verified; destinations keyed on the date pass
+            `unique_dates`, since duplicate dates collapse into one row.
+    """
+    started = time.perf_counter()
+    summary = ImportSummary()
+    if not resume:
+        journal.reset()
+    done = journal.load()
+
+    pending = []
+    for symbol in symbols:
+        entry = done.get(symbol)
+        if entry is not None and (entry.mtime_ns, entry.size) == _source_stat(
+            data_dir, symbol
+        ):
+            summary.resumed += 1
+        else:
+            pending.append(symbol)
+    if summary.resumed:
+        logger.info("Resuming: %d symbol(s) already imported", summary.resumed)
+
+    batch: list[tuple[str, pd.DataFrame]] = []
+    batch_entries: dict[str, JournalEntry] = {}
+
+    def flush() -> None:
+        if not batch:
+            return
+        write_batch(batch)
+        journal.record(batch_entries)
+        done.update(batch_entries)
+        for symbol, df in batch:
+            print(f"  [OK] {symbol}: {len(df)} rows {verb}")
+        summary.imported += len(batch)
+        summary.rows += sum(len(df) for _, df in batch)
+        batch.clear()
+        batch_entries.clear()
+
+    for symbol, df, error, stat in _parsed(data_dir, pending, workers):
+        if error is not None:
+            logger.warning("Skipping %s: %s", symbol, error)
+            summary.failed.append(symbol)
+            continue
+        batch.append((symbol, df))
+        batch_entries[symbol] = JournalEntry(count_rows(df), *stat)
+        if len(batch) >= batch_symbols:
+            flush()
+    flush()
+
+    stored = stored_rows(list(done))
+    for symbol, entry in done.items():
+        found = stored.get(symbol, 0)
+        if found != entry.rows:
+            summary.mismatches[symbol] = (entry.rows, found)
+            logger.error(
+                "Row count mismatch for %s: %d in CSV, %d stored",
+                symbol,
+                entry.rows,
+                found,
+            )
+
+    summary.elapsed_seconds = time.perf_counter() - started
+    return summary
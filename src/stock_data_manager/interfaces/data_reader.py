@@ -11,3 +11,8 @@ class IDataReader(ABC):
     @abstractmethod
     def read(self, filepath: Path) -> Optional[pd.DataFrame]:
         pass
+
+    def read_tail(self, filepath: Path, rows: int) -> Optional[pd.DataFrame]:
+        """Últimas `rows` linhas; sobrescreva para não ler o histórico inteiro."""
+        data = self.read(filepath)
+        return None if data is None else data.iloc[-rows:]
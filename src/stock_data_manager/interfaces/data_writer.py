@@ -11,3 +11,12 @@ class IDataWriter(ABC):
     @abstractmethod
     def write(self, data: pd.DataFrame, filepath: Path) -> None:
         pass
+
+    @property
+    def appends_in_place(self) -> bool:
+        """
+        True se `write` só acrescenta as linhas posteriores às já gravadas
+        quando o fim do armazenamento coincide com `data`; nesse caso basta
+        passar a cauda gravada mais as linhas novas.
+        """
+        return False
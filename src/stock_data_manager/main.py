@@ -34,6 +34,5 @@ if __name__ == "__main__":
         for symbol, data in results.items():
             if data is not None and not data.empty:
                 print(f"\n{symbol}:")
-                print(f"  Período: {data.index.min()} a {data.index.max()}")
-                print(f"  Registros: {len(data)}")
+                print(f"  Última data: {data.index.max()}")
                 print(f"  Último fechamento: {data['Close'].iloc[-1]:.2f}")
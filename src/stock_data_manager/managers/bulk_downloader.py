@@ -0,0 +1,197 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any
+
+from stock_data_manager.implementations.yfinance_downloader import DOWNLOAD_ERRORS
+from stock_data_manager.models.write_stats import WriteStats
+
+
+class TokenBucket:
+    """Rate limiter thread-safe: até `rate` aquisições/s, com rajadas de `capacity`."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate deve ser positivo; recebeu {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Bloqueia até haver um token disponível; retorna o tempo esperado."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                elapsed = now - self._updated
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+
+@dataclass
+class BulkDownloadSummary:
+    total: int = 0
+    succeeded: int = 0
+    failed: list[str] = field(default_factory=list)
+    retries: int = 0
+    elapsed_seconds: float = 0.0
+    # Preenchido pelo StockDataManager quando o writer expõe `stats`
+    write_stats: WriteStats | None = None
+    # Símbolos pulados pelo StockDataManager por já estarem atualizados
+    up_to_date: list[str] = field(default_factory=list)
+
+    def extend(self, other: "BulkDownloadSummary") -> None:
+        """Acumula o resumo de outra rodada."""
+        self.total += other.total
+        self.succeeded += other.succeeded
+        self.failed.extend(other.failed)
+        self.retries += other.retries
+        self.elapsed_seconds += other.elapsed_seconds
+        self.up_to_date.extend(other.up_to_date)
+
+    def render(self) -> str:
+        rate = self.total / self.elapsed_seconds if self.elapsed_seconds else 0.0
+        text = (
+            f"{self.succeeded}/{self.total} ok, {len(self.failed)} falhas, "
+            f"{self.retries} retentativas em {self.elapsed_seconds:.1f}s "
+            f"({rate:.1f} símbolos/s)"
+        )
+        if self.up_to_date:
+            text += f"; {len(self.up_to_date)} já atualizados"
+        if self.write_stats is not None:
+            text += f"; {self.write_stats.render()}"
+        return text
+
+
+class BulkDownloader:
+    """
+    Executa uma tarefa por símbolo com concorrência limitada.
+
+    Cada tentativa adquire um token do `rate_limiter` (se houver); falhas são
+    re-tentadas até `max_retries` vezes com backoff exponencial
+    (`backoff_seconds * 2**tentativa`). As tarefas rodam em threads, então o
+    merge/escrita de um símbolo se sobrepõe à espera de rede dos outros.
+    Símbolos que esgotam as tentativas retornam None, como no fluxo sequencial.
+    Só exceções de `errors` (por padrão, as de rede/dados do download) contam
+    como falha do símbolo; as demais interrompem a execução.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 1,
+        rate_limiter: TokenBucket | None = None,
+        max_retries: int = 0,
+        backoff_seconds: float = 1.0,
+        progress_every: int = 50,
+        sleep: Callable[[float], None] = time.sleep,
+        errors: tuple[type[Exception], ...] = DOWNLOAD_ERRORS,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.progress_every = progress_every
+        self._sleep = sleep
+        self.errors = errors
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def run(
+        self,
+        symbols: Iterable[str],
+        task: Callable[[str], Any],
+        throttled: Callable[[str], bool] | None = None,
+    ) -> tuple[dict[str, Any], BulkDownloadSummary]:
+        """
+        Executa `task(symbol)` para cada símbolo.
+
+        `throttled(symbol)` diz se a tentativa faz requisição de rede e deve
+        passar pelo rate limiter (padrão: todas). Símbolos repetidos são
+        processados uma vez.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        summary = BulkDownloadSummary(total=len(symbols))
+        lock = threading.Lock()
+        started = time.perf_counter()
+        results: dict[str, Any] = {}
+
+        def attempt(symbol: str) -> Any:
+            for retry in range(self.max_retries + 1):
+                if self.rate_limiter is not None and (
+                    throttled is None or throttled(symbol)
+                ):
+                    self.rate_limiter.acquire()
+                try:
+                    return task(symbol)
+                except self.errors as e:
+                    if retry == self.max_retries:
+                        raise
+                    delay = self.backoff_seconds * 2**retry
+                    self.logger.warning(
+                        "%s: tentativa %d falhou (%s); nova tentativa em %.1fs",
+                        symbol,
+                        retry + 1,
+                        e,
+                        delay,
+                    )
+                    with lock:
+                        summary.retries += 1
+                    self._sleep(delay)
+
+        def record(symbol: str, value: Any, error: Exception | None) -> None:
+            with lock:
+                if error is None:
+                    summary.succeeded += 1
+                    results[symbol] = value
+                else:
+                    self.logger.error("Erro ao processar %s: %s", symbol, error)
+                    summary.failed.append(symbol)
+                    results[symbol] = None
+                done = summary.succeeded + len(summary.failed)
+            if self.progress_every and done % self.progress_every == 0:
+                self.logger.info(
+                    "Progresso: %d/%d (%d falhas)",
+                    done,
+                    summary.total,
+                    len(summary.failed),
+                )
+
+        if self.max_workers == 1:
+            for symbol in symbols:
+                self.logger.info("Processando %s...", symbol)
+                try:
+                    record(symbol, attempt(symbol), None)
+                except self.errors as e:
+                    record(symbol, None, e)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(attempt, s): s for s in symbols}
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    try:
+                        record(symbol, future.result(), None)
+                    except self.errors as e:
+                        record(symbol, None, e)
+
+        summary.elapsed_seconds = time.perf_counter() - started
+        self.logger.info("Download concluído: %s", summary.render())
+        # Preserva a ordem de entrada, como o loop sequencial
+        return {symbol: results[symbol] for symbol in symbols}, summary
@@ -1,19 +1,36 @@
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from stock_data_manager.implementations.append_support import (
+    TAIL_OVERLAP_ROWS,
+    appendable_rows,
+)
+from stock_data_manager.implementations.yfinance_downloader import DOWNLOAD_ERRORS
 from stock_data_manager.interfaces.data_downloader import IDataDownloader
 from stock_data_manager.interfaces.data_reader import IDataReader
 from stock_data_manager.interfaces.data_writer import IDataWriter
 from stock_data_manager.interfaces.merge_strategy import IMergeStrategy
+from stock_data_manager.managers.bulk_downloader import (
+    BulkDownloader,
+    BulkDownloadSummary,
+)
 from stock_data_manager.models.stock_config import StockConfig
+from stock_data_manager.repositories.manifest import (
+    ManifestEntry,
+    PriceStoreManifest,
+)
 
 
 class StockDataManager:
     YEARS_TO_DOWNLOAD = 10
+    # A partir de quantos símbolos download_multiple usa download_batch
+    BATCH_THRESHOLD = 10
+    # Símbolos lidos e baixados por rodada no modo em lote (limita a memória)
+    BATCH_CHUNK_SIZE = 500
 
     def __init__(
         self,
@@ -23,6 +40,7 @@ class StockDataManager:
         merge_strategy: IMergeStrategy,
         data_dir: str = "data/stocks/1D",
         year_to_download: int = YEARS_TO_DOWNLOAD,
+        bulk_downloader: Optional[BulkDownloader] = None,
     ):
         self.reader = reader
         self.writer = writer
@@ -30,71 +48,326 @@ class StockDataManager:
         self.merge_strategy = merge_strategy
         self.data_dir = Path(data_dir)
         self.years_to_download = year_to_download
+        # Padrão: sequencial e sem retentativas, como o loop original
+        self.bulk_downloader = bulk_downloader or BulkDownloader()
+        self.last_download_summary: Optional[BulkDownloadSummary] = None
         self.logger = logging.getLogger(self.__class__.__name__)
         self.logger.info(f"Data directory: {self.data_dir}")
 
     def _get_filepath(self, symbol: str) -> Path:
         return self.data_dir / f"{symbol}.csv"
 
-    def _calculate_start_date(self, existing_data: Optional[pd.DataFrame]) -> str:
+    @staticmethod
+    def _last_date(existing_data: Optional[pd.DataFrame]) -> Optional[pd.Timestamp]:
         if existing_data is None or existing_data.empty:
+            return None
+        return existing_data.index.max()
+
+    def _calculate_start_date(self, last_date: Optional[pd.Timestamp]) -> str:
+        if last_date is None:
             # Se não há dados, baixa dos últimos 10 anos
             start = datetime.now() - timedelta(days=self.years_to_download * 365)
             return start.strftime("%Y-%m-%d")
 
         # Pega o último dia disponível e adiciona 1 dia
-        last_date = existing_data.index.max()
         next_date = last_date + timedelta(days=1)
         return next_date.strftime("%Y-%m-%d")
 
+    def _is_up_to_date(self, last_date: pd.Timestamp) -> bool:
+        return last_date.strftime("%Y-%m-%d") >= datetime.now().strftime("%Y-%m-%d")
+
+    def _stored_tail(
+        self, symbol: str, entries: Optional[Dict[str, ManifestEntry]] = None
+    ) -> Optional[Tuple[pd.DataFrame, pd.Timestamp]]:
+        """
+        Últimas linhas gravadas e última data do símbolo, quando bastam para
+        atualizá-lo: o writer grava por append e o manifest tem uma entrada
+        válida para o arquivo, de onde vem a última data.
+
+        Args:
+            entries: Entradas válidas do manifest já lidas (`fresh_entries`);
+                sem elas, consulta o manifest só para `symbol`.
+        """
+        if not getattr(self.writer, "appends_in_place", False):
+            return None
+        if entries is None:
+            entry = PriceStoreManifest(self.data_dir).fresh_entry(symbol)
+        else:
+            entry = entries.get(symbol)
+        if entry is None:
+            return None
+        tail = self.reader.read_tail(self._get_filepath(symbol), TAIL_OVERLAP_ROWS)
+        if tail is None or tail.empty:
+            return None
+        return tail, pd.Timestamp(entry.last_date)
+
+    def _read_existing(
+        self,
+        symbol: str,
+        full_history: bool,
+        entries: Optional[Dict[str, ManifestEntry]] = None,
+    ) -> Tuple[Optional[pd.DataFrame], Optional[pd.Timestamp], bool]:
+        """
+        Dados locais para atualizar o símbolo: (dados, última data, só cauda).
+
+        Sem `full_history`, usa `_stored_tail` quando possível; senão lê o
+        histórico completo.
+        """
+        stored = None if full_history else self._stored_tail(symbol, entries)
+        if stored is not None:
+            return stored[0], stored[1], True
+        existing_data = self.reader.read(self._get_filepath(symbol))
+        return existing_data, self._last_date(existing_data), False
+
     def download_and_save(
-        self, symbol: str, force_full: bool = False, interval: str = "1d"
+        self,
+        symbol: str,
+        force_full: bool = False,
+        interval: str = "1d",
+        full_history: bool = True,
     ) -> pd.DataFrame:
-        filepath = self._get_filepath(symbol)
+        """
+        Baixa as barras que faltam, mescla e grava.
 
-        existing_data = None if force_full else self.reader.read(filepath)
-
-        start_date = self._calculate_start_date(existing_data)
+        Args:
+            full_history: Com False, se `_stored_tail` se aplica, só a cauda do
+                arquivo é lida e o retorno é essa cauda mais as barras novas;
+                senão o histórico completo é lido e devolvido.
+        """
+        if force_full:
+            existing_data, last_date, tail = None, None, False
+        else:
+            existing_data, last_date, tail = self._read_existing(symbol, full_history)
 
-        if not force_full and existing_data is not None:
-            last_date = existing_data.index.max().strftime("%Y-%m-%d")
-            today = datetime.now().strftime("%Y-%m-%d")
+        start_date = self._calculate_start_date(last_date)
 
-            if last_date >= today:
-                self.logger.info(f"{symbol} já está atualizado até {last_date}")
+        if not force_full and last_date is not None:
+            if self._is_up_to_date(last_date):
+                self.logger.info(
+                    f"{symbol} já está atualizado até {last_date.strftime('%Y-%m-%d')}"
+                )
                 return existing_data
 
         config = StockConfig(symbol=symbol, start_date=start_date, interval=interval)
         new_data = self.downloader.download(config)
 
+        return self._save_new_data(symbol, existing_data, new_data, tail=tail)
+
+    def _save_new_data(
+        self,
+        symbol: str,
+        existing_data: Optional[pd.DataFrame],
+        new_data: pd.DataFrame,
+        tail: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Mescla `new_data` com `existing_data` e grava.
+
+        Com `tail`, `existing_data` é só a cauda gravada: se as barras novas a
+        revisam, o writer reescreveria o arquivo apenas com ela, então o merge
+        é refeito sobre o histórico completo.
+        """
         if new_data.empty:
             self.logger.info(f"Nenhum dado novo para {symbol}")
             return existing_data if existing_data is not None else new_data
 
         if existing_data is not None and not existing_data.empty:
+            # UpdateMergeStrategy altera `existing_data`
+            stored = existing_data.copy() if tail else None
             final_data = self.merge_strategy.merge(existing_data, new_data)
+            if stored is not None and appendable_rows(final_data, stored) is None:
+                self.logger.info(f"{symbol}: barras revisadas, relendo o histórico")
+                history = self.reader.read(self._get_filepath(symbol))
+                return self._save_new_data(symbol, history, new_data)
             self.logger.info(f"Dados mesclados: {len(final_data)} registros totais")
         else:
             final_data = new_data
 
-        self.writer.write(final_data, filepath)
+        self.writer.write(final_data, self._get_filepath(symbol))
 
         return final_data
 
+    def current_symbols(self, symbols: List[str]) -> List[str]:
+        """
+        Símbolos que o manifest do diretório mostra atualizados até hoje.
+
+        Usa apenas o manifest e um stat por arquivo; símbolos sem entrada
+        válida (arquivo alterado por fora, store sem manifest) não entram.
+        """
+        entries = PriceStoreManifest(self.data_dir).fresh_entries()
+        today = datetime.now().strftime("%Y-%m-%d")
+        return [
+            symbol
+            for symbol in symbols
+            if symbol in entries and entries[symbol].last_date[:10] >= today
+        ]
+
     def download_multiple(
-        self, symbols: List[str], force_full: bool = False, interval: str = "1d"
+        self,
+        symbols: List[str],
+        force_full: bool = False,
+        interval: str = "1d",
+        skip_current: bool = False,
+        full_history: bool = False,
     ) -> dict:
+        """
+        Baixa e salva vários símbolos.
+
+        Args:
+            skip_current: Pula, sem abrir os arquivos, os símbolos que o
+                manifest mostra atualizados; eles ficam fora do resultado e
+                são listados em `last_download_summary.up_to_date`.
+            full_history: Lê e devolve o histórico completo de cada símbolo.
+                Por padrão, símbolos com entrada válida no manifest são
+                atualizados a partir da cauda do arquivo, e o resultado traz
+                só essa cauda mais as barras novas (ver `download_and_save`).
+        """
+        up_to_date: List[str] = []
+        if skip_current and not force_full:
+            up_to_date = self.current_symbols(symbols)
+            if up_to_date:
+                skip = set(up_to_date)
+                symbols = [symbol for symbol in symbols if symbol not in skip]
+                self.logger.info(f"{len(up_to_date)} símbolos já atualizados")
+
+        write_stats = getattr(self.writer, "stats", None)
+        before = write_stats.snapshot() if write_stats is not None else None
+
+        if (
+            not force_full
+            and len(symbols) >= self.BATCH_THRESHOLD
+            and hasattr(self.downloader, "download_batch")
+        ):
+            results, summary = self._download_multiple_batched(
+                symbols, interval, full_history
+            )
+        else:
+            results, summary = self.bulk_downloader.run(
+                symbols,
+                lambda symbol: self.download_and_save(
+                    symbol, force_full, interval, full_history=full_history
+                ),
+            )
+
+        if write_stats is not None:
+            summary.write_stats = write_stats.since(before)
+        summary.up_to_date = up_to_date
+        self.last_download_summary = summary
+        return results
+
+    def _download_multiple_batched(
+        self, symbols: List[str], interval: str, full_history: bool = False
+    ) -> Tuple[dict, BulkDownloadSummary]:
+        """
+        Atualização incremental em lote: os símbolos com dados locais são
+        baixados via `downloader.download_batch`; mesclagem e gravação seguem
+        pelo bulk_downloader. Símbolos sem dados locais, ausentes na resposta
+        do lote ou cujo lote falhou recorrem a `download_and_save`.
+        """
         results = {}
+        summary = BulkDownloadSummary()
+
+        for i in range(0, len(symbols), self.BATCH_CHUNK_SIZE):
+            chunk = symbols[i : i + self.BATCH_CHUNK_SIZE]
+            prefetched = self._prefetch_batch(chunk, interval, full_history)
+
+            def task(symbol: str, prefetched=prefetched) -> pd.DataFrame:
+                if symbol not in prefetched:
+                    return self.download_and_save(
+                        symbol, interval=interval, full_history=full_history
+                    )
+                # pop: libera o frame; uma retentativa baixa individualmente
+                existing_data, new_data, tail = prefetched.pop(symbol)
+                if new_data is None:
+                    return existing_data
+                new_data = self._align_timezone(new_data, existing_data)
+                if new_data is None:
+                    return self.download_and_save(
+                        symbol, interval=interval, full_history=full_history
+                    )
+                return self._save_new_data(symbol, existing_data, new_data, tail=tail)
+
+            chunk_results, chunk_summary = self.bulk_downloader.run(
+                chunk,
+                task,
+                throttled=lambda symbol, prefetched=prefetched: (
+                    symbol not in prefetched
+                ),
+            )
+            results.update(chunk_results)
+            summary.extend(chunk_summary)
+
+        return results, summary
+
+    def _prefetch_batch(
+        self, symbols: List[str], interval: str, full_history: bool = False
+    ) -> Dict[str, Tuple[pd.DataFrame, Optional[pd.DataFrame], bool]]:
+        """
+        Lê os dados locais e baixa em lote o que falta para cada símbolo.
+
+        Cada valor é (dados locais, barras novas ou None se já atualizado,
+        se os dados locais são só a cauda — ver `_read_existing`).
+        """
+        prefetched: Dict[str, Tuple[pd.DataFrame, Optional[pd.DataFrame], bool]] = {}
+        pending: Dict[str, Tuple[pd.DataFrame, StockConfig, bool]] = {}
+        entries = (
+            None if full_history else PriceStoreManifest(self.data_dir).fresh_entries()
+        )
 
         for symbol in symbols:
-            try:
-                self.logger.info(f"Processando {symbol}...")
-                results[symbol] = self.download_and_save(symbol, force_full, interval)
-            except Exception as e:
-                self.logger.error(f"Erro ao processar {symbol}: {e}")
-                results[symbol] = None
+            existing_data, last_date, tail = self._read_existing(
+                symbol, full_history, entries
+            )
+            if existing_data is None or last_date is None:
+                continue
+            if self._is_up_to_date(last_date):
+                prefetched[symbol] = (existing_data, None, tail)
+                continue
+            config = StockConfig(
+                symbol=symbol,
+                start_date=self._calculate_start_date(last_date),
+                interval=interval,
+            )
+            pending[symbol] = (existing_data, config, tail)
 
-        return results
+        if not pending:
+            return prefetched
+
+        if self.bulk_downloader.rate_limiter is not None:
+            self.bulk_downloader.rate_limiter.acquire()
+        try:
+            downloaded = self.downloader.download_batch(
+                [config for _, config, _ in pending.values()]
+            )
+        except DOWNLOAD_ERRORS as e:
+            self.logger.warning(
+                f"Falha no download em lote, baixando individualmente: {e}"
+            )
+            return prefetched
+
+        for symbol, (existing_data, _, tail) in pending.items():
+            if symbol in downloaded:
+                prefetched[symbol] = (existing_data, downloaded[symbol], tail)
+        return prefetched
+
+    @staticmethod
+    def _align_timezone(
+        new_data: pd.DataFrame, existing_data: pd.DataFrame
+    ) -> Optional[pd.DataFrame]:
+        """
+        Localiza um índice sem timezone no timezone dos dados existentes.
+
+        Só usa timezones com nome: um offset fixo (lido de CSV) erraria as
+        barras do outro lado de uma mudança de horário de verão. Sem nome
+        disponível devolve None, e o chamador baixa o símbolo individualmente.
+        """
+        if not isinstance(new_data.index, pd.DatetimeIndex) or new_data.index.tz:
+            return new_data
+        tz = getattr(existing_data.index.max(), "tzinfo", None)
+        if tz is None:
+            return new_data
+        name = getattr(tz, "key", None) or getattr(tz, "zone", None)
+        return new_data.tz_localize(name) if name else None
 
     def get_data(self, symbol: str) -> Optional[pd.DataFrame]:
         filepath = self._get_filepath(symbol)
@@ -1,3 +1,5 @@
+from .price_panel import PANEL_FIELDS, PricePanel
 from .stock_config import StockConfig
+from .write_stats import WriteStats
 
-__all__ = ["StockConfig"]
+__all__ = ["PANEL_FIELDS", "PricePanel", "StockConfig", "WriteStats"]
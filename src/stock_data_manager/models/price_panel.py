@@ -0,0 +1,146 @@
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Campos carregados quando `load_panel` não recebe `fields`
+PANEL_FIELDS = ("Open", "High", "Low", "Close", "Volume")
+
+
+def session_dates(index: pd.Index) -> np.ndarray:
+    """
+    Data do pregão de cada barra, como datetime64 à meia-noite sem timezone.
+
+    Com o timezone da bolsa (ou sem timezone) é a data local da barra. Em UTC
+    o offset local se perdeu: a barra diária fica à meia-noite local, a menos
+    de 12 h da meia-noite UTC da mesma data, então arredonda-se para o dia
+    mais próximo.
+    """
+    index = pd.DatetimeIndex(index)
+    if index.tz is None:
+        return index.normalize().to_numpy(dtype="datetime64[ns]")
+    if str(index.tz) == "UTC":
+        return index.tz_localize(None).round("D").to_numpy(dtype="datetime64[ns]")
+    return index.tz_localize(None).normalize().to_numpy(dtype="datetime64[ns]")
+
+
+def _session_bound(value) -> np.datetime64:
+    return session_dates(pd.DatetimeIndex([pd.Timestamp(value)]))[0]
+
+
+@dataclass
+class PricePanel:
+    """
+    Preços diários de vários símbolos alinhados numa grade datas × símbolos.
+
+    `dates` é a união (ordenada, sem timezone) das datas de pregão das barras
+    de todos os símbolos (ver `session_dates`), de modo que bolsas com fusos
+    diferentes caem na mesma linha; cada campo em `values` é um array float64
+    de shape `(len(dates), len(symbols))`. `valid[i, j]` indica se o símbolo
+    `j` tem barra em `dates[i]` — onde é False o valor é NaN. Um campo
+    ausente na fonte também aparece como NaN, com a barra ainda marcada como
+    válida.
+    """
+
+    dates: pd.DatetimeIndex
+    symbols: list[str]
+    values: dict[str, np.ndarray]
+    valid: np.ndarray
+
+    @property
+    def fields(self) -> list[str]:
+        return list(self.values)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.values[field]
+
+    def frame(self, field: str) -> pd.DataFrame:
+        """Um campo como DataFrame datas × símbolos (view dos arrays)."""
+        return pd.DataFrame(
+            self.values[field], index=self.dates, columns=self.symbols, copy=False
+        )
+
+    @classmethod
+    def from_long(
+        cls,
+        symbols: Sequence[str],
+        positions: np.ndarray,
+        stamps: np.ndarray,
+        values: Mapping[str, np.ndarray],
+        start=None,
+        end=None,
+    ) -> "PricePanel":
+        """
+        Monta o painel a partir de linhas em formato longo.
+
+        Args:
+            symbols: Colunas do painel, na ordem desejada.
+            positions: Índice em `symbols` de cada linha.
+            stamps: Data de pregão de cada linha (datetime64 à meia-noite, sem
+                timezone; ver `session_dates`).
+            values: Campo -> valores de cada linha.
+            start: Limite inferior inclusivo de data de pregão.
+            end: Limite superior inclusivo de data de pregão.
+        """
+        positions = np.asarray(positions, dtype=np.intp)
+        stamps = np.asarray(stamps, dtype="datetime64[ns]")
+        keep = np.ones(len(stamps), dtype=bool)
+        if start is not None:
+            keep &= stamps >= _session_bound(start)
+        if end is not None:
+            keep &= stamps <= _session_bound(end)
+
+        unique, rows = np.unique(stamps[keep], return_inverse=True)
+        rows = rows.reshape(-1)
+        columns = positions[keep]
+        shape = (len(unique), len(symbols))
+
+        valid = np.zeros(shape, dtype=bool)
+        valid[rows, columns] = True
+        arrays = {}
+        for field, field_values in values.items():
+            array = np.full(shape, np.nan)
+            array[rows, columns] = np.asarray(field_values, dtype=float)[keep]
+            arrays[field] = array
+
+        dates = pd.DatetimeIndex(unique, name="Date")
+        return cls(dates=dates, symbols=list(symbols), values=arrays, valid=valid)
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Mapping[str, pd.DataFrame | None],
+        fields: Iterable[str] = PANEL_FIELDS,
+        start=None,
+        end=None,
+    ) -> "PricePanel":
+        """Monta o painel a partir de um DataFrame por símbolo (None = sem dados)."""
+        fields = list(fields)
+        symbols = list(frames)
+        positions, stamps = [], []
+        values: dict[str, list[np.ndarray]] = {field: [] for field in fields}
+        for position, symbol in enumerate(symbols):
+            df = frames[symbol]
+            if df is None or df.empty:
+                continue
+            positions.append(np.full(len(df), position, dtype=np.intp))
+            stamps.append(session_dates(df.index))
+            for field in fields:
+                if field in df.columns:
+                    column = df[field].to_numpy(dtype=float, na_value=np.nan)
+                else:
+                    column = np.full(len(df), np.nan)
+                values[field].append(column)
+
+        def concat(parts, dtype):
+            return np.concatenate(parts) if parts else np.empty(0, dtype=dtype)
+
+        return cls.from_long(
+            symbols,
+            concat(positions, np.intp),
+            concat(stamps, "datetime64[ns]"),
+            {field: concat(parts, float) for field, parts in values.items()},
+            start=start,
+            end=end,
+        )
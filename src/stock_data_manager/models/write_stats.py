@@ -0,0 +1,57 @@
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass
+class WriteStats:
+    """Contadores de escrita acumulados por um writer (thread-safe)."""
+
+    bytes_written: int = 0
+    rows_written: int = 0
+    appends: int = 0
+    rewrites: int = 0
+    skipped: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, nbytes: int, rows: int, appended: bool) -> None:
+        with self._lock:
+            self.bytes_written += nbytes
+            self.rows_written += rows
+            if appended:
+                self.appends += 1
+            else:
+                self.rewrites += 1
+
+    def record_skip(self) -> None:
+        with self._lock:
+            self.skipped += 1
+
+    def snapshot(self) -> "WriteStats":
+        with self._lock:
+            return WriteStats(
+                self.bytes_written,
+                self.rows_written,
+                self.appends,
+                self.rewrites,
+                self.skipped,
+            )
+
+    def since(self, before: "WriteStats") -> "WriteStats":
+        """Diferença entre o estado atual e um snapshot anterior."""
+        now = self.snapshot()
+        return WriteStats(
+            now.bytes_written - before.bytes_written,
+            now.rows_written - before.rows_written,
+            now.appends - before.appends,
+            now.rewrites - before.rewrites,
+            now.skipped - before.skipped,
+        )
+
+    def render(self) -> str:
+        return (
+            f"{self.bytes_written / 1024:.1f} KiB gravados "
+            f"({self.appends} appends, {self.rewrites} reescritas, "
+            f"{self.skipped} sem alteração)"
+        )
@@ -1,5 +1,9 @@
+from collections.abc import Iterable
+
 import pandas as pd
 
+from stock_data_manager.models.price_panel import PANEL_FIELDS, PricePanel
+
 
 class PriceDataRepository:
     def load_symbol(self, symbol: str) -> pd.DataFrame:
@@ -10,3 +14,23 @@ class PriceDataRepository:
 
     def list_symbols(self) -> list[str]:
         raise NotImplementedError
+
+    def load_panel(
+        self,
+        symbols: Iterable[str],
+        fields: Iterable[str] = PANEL_FIELDS,
+        start=None,
+        end=None,
+    ) -> PricePanel:
+        """Aligned dates x symbols arrays for `fields` (see PricePanel).
+
+        Symbols without data get an all-invalid column. This default loads one
+        symbol at a time; repositories that can do better override it.
+        """
+        frames = {}
+        for symbol in dict.fromkeys(symbols):
+            try:
+                frames[symbol] = self.load_symbol(symbol)
+            except FileNotFoundError:
+                frames[symbol] = None
+        return PricePanel.from_frames(frames, fields, start=start, end=end)
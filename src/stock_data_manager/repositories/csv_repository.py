@@ -2,7 +2,7 @@ from pathlib import Path
 
 import pandas as pd
 
-from market_scanner.eligibility import load_symbol_csv
+from market_scanner.eligibility import load_symbol_csv, load_symbol_csv_tail
 from stock_data_manager.repositories.base import PriceDataRepository
 
 
@@ -13,6 +13,10 @@ class CsvPriceDataRepository(PriceDataRepository):
     def load_symbol(self, symbol: str) -> pd.DataFrame:
         return load_symbol_csv(self.data_dir, symbol)
 
+    def load_tail(self, symbol: str, rows: int) -> pd.DataFrame:
+        """Last `rows` rows of a symbol, parsing only the end of the CSV."""
+        return load_symbol_csv_tail(self.data_dir, symbol, rows)
+
     def save_symbol(self, symbol: str, df: pd.DataFrame) -> None:
         path = Path(self.data_dir) / f"{symbol}.csv"
         df.to_csv(path)
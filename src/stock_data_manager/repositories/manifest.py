@@ -0,0 +1,169 @@
+import hashlib
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+
+# Manifest file kept inside each price directory (e.g. data/stocks/1D).
+MANIFEST_FILENAME = "_manifest.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS manifest (
+    symbol TEXT PRIMARY KEY,
+    filename TEXT NOT NULL,
+    last_date TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    symbol: str
+    filename: str
+    last_date: str
+    rows: int
+    mtime_ns: int
+    size: int
+    content_hash: str
+
+    def matches(self, path: Path) -> bool:
+        """True if `path` is this entry's file with the recorded mtime and size."""
+        if path.name != self.filename:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return stat.st_mtime_ns == self.mtime_ns and stat.st_size == self.size
+
+
+def file_content_hash(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def appended_content_hash(previous_hash: str, appended: bytes) -> str:
+    """Content hash after appending `appended` to a file hashed as `previous_hash`.
+
+    Chained rather than recomputed, so an append costs only the new bytes.
+    Equal contents reached by different write histories get different
+    hashes, which only costs a cache miss.
+    """
+    digest = hashlib.blake2b(previous_hash.encode("ascii"), digest_size=16)
+    digest.update(appended)
+    return digest.hexdigest()
+
+
+class PriceStoreManifest:
+    """Per-symbol index of a file-based price store (CSV or Parquet).
+
+    Each entry records the last bar date, row count, file mtime/size and a
+    content hash at the time the writer saved the file. An entry is only
+    trusted while `stat()` of the file still matches it, so freshness checks
+    and cache keys cost a stat instead of parsing the file. Files changed by
+    anything other than a manifest-aware writer simply have no valid entry.
+    """
+
+    def __init__(self, data_dir: str | Path):
+        self.data_dir = Path(data_dir)
+        self.path = self.data_dir / MANIFEST_FILENAME
+
+    def _connect(self) -> sqlite3.Connection:
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def record(
+        self,
+        symbol: str,
+        path: Path,
+        data: pd.DataFrame,
+        *,
+        previous: ManifestEntry | None = None,
+        appended: bytes | None = None,
+    ) -> ManifestEntry:
+        """Store the entry for `path`, which was just written from `data`.
+
+        After an append, pass the entry that described the file before it and
+        the appended bytes: the content hash is then chained from them instead
+        of re-reading the file. Full rewrites hash the whole file.
+        """
+        stat = path.stat()
+        if (
+            previous is not None
+            and appended is not None
+            and previous.size + len(appended) == stat.st_size
+        ):
+            content_hash = appended_content_hash(previous.content_hash, appended)
+        else:
+            content_hash = file_content_hash(path)
+        entry = ManifestEntry(
+            symbol=symbol,
+            filename=path.name,
+            last_date=pd.Timestamp(data.index.max()).isoformat(),
+            rows=len(data),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=content_hash,
+        )
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO manifest VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.symbol,
+                    entry.filename,
+                    entry.last_date,
+                    entry.rows,
+                    entry.mtime_ns,
+                    entry.size,
+                    entry.content_hash,
+                ),
+            )
+        return entry
+
+    def get(self, symbol: str) -> ManifestEntry | None:
+        if not self.path.exists():
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM manifest WHERE symbol = ?", (symbol,)
+            ).fetchone()
+        return ManifestEntry(*row) if row else None
+
+    def entries(self) -> dict[str, ManifestEntry]:
+        """All entries, read in one query (not validated against the files)."""
+        if not self.path.exists():
+            return {}
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM manifest").fetchall()
+        return {row[0]: ManifestEntry(*row) for row in rows}
+
+    def fresh_entry(self, symbol: str) -> ManifestEntry | None:
+        """The entry for `symbol` if it still describes the file, else None."""
+        entry = self.get(symbol)
+        if entry is None or not entry.matches(self.data_dir / entry.filename):
+            return None
+        return entry
+
+    def fresh_entries(self) -> dict[str, ManifestEntry]:
+        """All entries that still describe their files (one query + one stat each)."""
+        return {
+            symbol: entry
+            for symbol, entry in self.entries().items()
+            if entry.matches(self.data_dir / entry.filename)
+        }
+
+    def remove(self, symbol: str) -> None:
+        if not self.path.exists():
+            return
+        with self._connect() as conn:
+            conn.execute("DELETE FROM manifest WHERE symbol = ?", (symbol,))
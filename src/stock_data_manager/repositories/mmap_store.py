@@ -0,0 +1,180 @@
+import json
+from collections.abc import Iterable
+from contextlib import ExitStack
+from functools import lru_cache
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+import pandas as pd
+
+from stock_data_manager.repositories.base import PriceDataRepository
+
+# Offsets index written next to the column files
+INDEX_FILENAME = "index.json"
+DATES_FILENAME = "dates.bin"
+_LAYOUT_VERSION = 1
+
+
+def _column_key(name: str, dtype: np.dtype) -> str:
+    return f"{name}|{dtype.str}"
+
+
+class MmapPriceStore(PriceDataRepository):
+    """Read-only price store laid out as flat binary column files.
+
+    Every column of every symbol is concatenated into one raw array per
+    (column, dtype) pair plus a shared `dates.bin` of UTC nanoseconds;
+    `index.json` maps each symbol to its `[start, stop)` row range. Opening
+    the store maps the files with `np.memmap`, and `load_symbol` returns a
+    DataFrame whose columns are views into the mapping, so processes sharing
+    a store read the same page-cache pages instead of receiving pickled
+    copies.
+
+    Frames are stored as given (index name, timezone, column order and
+    dtypes are restored on load). Only numeric and boolean columns are
+    supported. Loaded frames are read-only; copy before mutating in place.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        index = json.loads((self.root / INDEX_FILENAME).read_text())
+        if index.get("version") != _LAYOUT_VERSION:
+            raise ValueError(f"Unsupported mmap store layout in {self.root}")
+        self._rows = index["rows"]
+        self._files = index["files"]
+        self._symbols = index["symbols"]
+        self._arrays: dict[str, np.ndarray] = {}
+
+    @classmethod
+    def build(
+        cls, root: str | Path, frames: Iterable[tuple[str, pd.DataFrame]]
+    ) -> "MmapPriceStore":
+        """Write `(symbol, df)` pairs into a new store at `root` and open it.
+
+        Frames are streamed to disk one at a time, so callers can pass a
+        generator and release each DataFrame after it is written.
+        """
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        files: dict[str, dict] = {}
+        handles: dict[str, BinaryIO] = {}
+        written: dict[str, int] = {}
+        symbols: dict[str, dict] = {}
+        rows = 0
+
+        def pad(key: str, to_rows: int) -> None:
+            # Symbols without this column still occupy its rows (zero-filled)
+            missing = to_rows - written[key]
+            if missing:
+                handles[key].write(
+                    np.zeros(missing, dtype=files[key]["dtype"]).tobytes()
+                )
+                written[key] = to_rows
+
+        # Column files are opened as new columns appear; the stack closes them all
+        with ExitStack() as stack:
+            dates_handle = stack.enter_context(open(root / DATES_FILENAME, "wb"))
+            for symbol, df in frames:
+                index = pd.DatetimeIndex(df.index)
+                tz = None if index.tz is None else str(index.tz)
+                utc = index.tz_convert("UTC").tz_localize(None) if tz else index
+                dates_handle.write(utc.to_numpy(dtype="datetime64[ns]").tobytes())
+
+                columns = []
+                for name in df.columns:
+                    values = df[name].to_numpy()
+                    if values.dtype.kind not in "biuf":
+                        raise ValueError(
+                            f"{symbol}: column {name!r} has unsupported dtype {values.dtype}"
+                        )
+                    key = _column_key(str(name), values.dtype)
+                    if key not in files:
+                        files[key] = {
+                            "file": f"col_{len(files)}.bin",
+                            "dtype": values.dtype.str,
+                        }
+                        handles[key] = stack.enter_context(
+                            open(root / files[key]["file"], "wb")
+                        )
+                        written[key] = 0
+                    pad(key, rows)
+                    handles[key].write(np.ascontiguousarray(values).tobytes())
+                    written[key] += len(values)
+                    columns.append([str(name), key])
+
+                symbols[symbol] = {
+                    "start": rows,
+                    "stop": rows + len(df),
+                    "columns": columns,
+                    "index_name": index.name,
+                    "tz": tz,
+                }
+                rows += len(df)
+            for key in files:
+                pad(key, rows)
+
+        index = {
+            "version": _LAYOUT_VERSION,
+            "rows": rows,
+            "files": files,
+            "symbols": symbols,
+        }
+        # Written last: a store without its index is never opened half-built
+        (root / INDEX_FILENAME).write_text(json.dumps(index))
+        return cls(root)
+
+    def _array(self, key: str) -> np.ndarray:
+        array = self._arrays.get(key)
+        if array is None:
+            if key == DATES_FILENAME:
+                path, dtype = self.root / DATES_FILENAME, np.dtype("datetime64[ns]")
+            else:
+                meta = self._files[key]
+                path, dtype = self.root / meta["file"], np.dtype(meta["dtype"])
+            if self._rows == 0:
+                array = np.empty(0, dtype=dtype)
+            else:
+                array = np.memmap(path, dtype=dtype, mode="r", shape=(self._rows,))
+                # Plain ndarray view over the mapping (slices stay zero-copy)
+                array = array.view(np.ndarray)
+            self._arrays[key] = array
+        return array
+
+    # ------------------------------------------------------------------
+    # PriceDataRepository interface
+    # ------------------------------------------------------------------
+
+    def load_symbol(self, symbol: str) -> pd.DataFrame:
+        meta = self._symbols.get(symbol)
+        if meta is None:
+            raise FileNotFoundError(f"{symbol} is not in the mmap store {self.root}")
+        rows = slice(meta["start"], meta["stop"])
+        index = pd.DatetimeIndex(
+            self._array(DATES_FILENAME)[rows], name=meta["index_name"]
+        )
+        if meta["tz"] is not None:
+            index = index.tz_localize("UTC").tz_convert(meta["tz"])
+        data = {name: self._array(key)[rows] for name, key in meta["columns"]}
+        return pd.DataFrame(data, index=index, copy=False)
+
+    def list_symbols(self) -> list[str]:
+        return list(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._symbols
+
+
+def open_mmap_store(root: str) -> MmapPriceStore:
+    """Process-wide cached store, so each worker maps the files only once.
+
+    The cache is keyed on the index file's mtime, so a store rebuilt at the
+    same path is reopened rather than served stale.
+    """
+    index_mtime = (Path(root) / INDEX_FILENAME).stat().st_mtime_ns
+    return _open_cached(str(root), index_mtime)
+
+
+@lru_cache(maxsize=8)
+def _open_cached(root: str, index_mtime: int) -> MmapPriceStore:
+    return MmapPriceStore(root)
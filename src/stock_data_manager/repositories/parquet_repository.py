@@ -0,0 +1,170 @@
+import importlib.util
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import pandas as pd
+
+from stock_data_manager.models.price_panel import PANEL_FIELDS, PricePanel
+from stock_data_manager.repositories.base import PriceDataRepository
+
+# Name of the timestamp column stored in each file; surfaced as the index,
+# matching what load_symbol_csv returns for yfinance-written CSVs.
+DATE_COLUMN = "Date"
+
+# Rows per Parquet row group. Row-group min/max statistics on DATE_COLUMN are
+# what lets date-range filters skip data, so keep groups to ~2 years of bars.
+ROW_GROUP_SIZE = 512
+
+
+def _require_pyarrow() -> None:
+    if importlib.util.find_spec("pyarrow") is None:
+        raise RuntimeError(
+            "pyarrow package is not installed. Run: uv sync --extra parquet"
+        )
+
+
+def _to_utc(value) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+class ParquetPriceDataRepository(PriceDataRepository):
+    """One `<SYMBOL>.parquet` file per symbol under `data_dir`.
+
+    Files are columnar and store typed timestamps, so loads skip CSV text and
+    date parsing. `load_symbol` supports column projection and date-range
+    pushdown to the Parquet reader.
+    """
+
+    def __init__(self, data_dir: str):
+        _require_pyarrow()
+        self.data_dir = data_dir
+
+    def path_for(self, symbol: str) -> Path:
+        return Path(self.data_dir) / f"{symbol}.parquet"
+
+    # ------------------------------------------------------------------
+    # PriceDataRepository interface
+    # ------------------------------------------------------------------
+
+    def load_symbol(
+        self,
+        symbol: str,
+        *,
+        columns: Sequence[str] | None = None,
+        start=None,
+        end=None,
+    ) -> pd.DataFrame:
+        """Load one symbol indexed by a UTC `Date` index, sorted ascending.
+
+        Args:
+            columns: Only read these price columns (e.g. ["Close", "Volume"]).
+            start: Inclusive lower bound on the date, pushed down to the reader.
+            end: Inclusive upper bound on the date, pushed down to the reader.
+        """
+        path = self.path_for(symbol)
+        if not path.exists():
+            raise FileNotFoundError(f"Missing Parquet for {symbol}: {path}")
+
+        filters = []
+        if start is not None:
+            filters.append((DATE_COLUMN, ">=", _to_utc(start)))
+        if end is not None:
+            filters.append((DATE_COLUMN, "<=", _to_utc(end)))
+
+        read_columns = None
+        if columns is not None:
+            read_columns = [DATE_COLUMN, *[c for c in columns if c != DATE_COLUMN]]
+
+        df = pd.read_parquet(
+            path,
+            engine="pyarrow",
+            columns=read_columns,
+            filters=filters or None,
+        )
+        return df.set_index(DATE_COLUMN).sort_index()
+
+    def load_tail(self, symbol: str, rows: int) -> pd.DataFrame:
+        """Last `rows` rows of a symbol, reading only the trailing row groups."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self.path_for(symbol)
+        if not path.exists():
+            raise FileNotFoundError(f"Missing Parquet for {symbol}: {path}")
+
+        parquet_file = pq.ParquetFile(path)
+        groups = []
+        count = 0
+        for i in reversed(range(parquet_file.num_row_groups)):
+            groups.append(parquet_file.read_row_group(i))
+            count += groups[-1].num_rows
+            if count >= rows:
+                break
+        if not groups:
+            return pd.DataFrame(index=pd.DatetimeIndex([], tz="UTC", name=DATE_COLUMN))
+        df = pa.concat_tables(groups[::-1]).to_pandas()
+        return df.set_index(DATE_COLUMN).sort_index().iloc[-rows:]
+
+    def save_symbol(self, symbol: str, df: pd.DataFrame) -> None:
+        """Replace the symbol's file atomically with `df`."""
+        index = pd.DatetimeIndex(pd.to_datetime(df.index, utc=True))
+        frame = df.set_axis(index, axis=0).sort_index()
+        frame.index.name = DATE_COLUMN
+        frame = frame.reset_index()
+
+        path = self.path_for(symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".parquet.tmp")
+        frame.to_parquet(
+            tmp, engine="pyarrow", index=False, row_group_size=ROW_GROUP_SIZE
+        )
+        os.replace(tmp, path)
+
+    def list_symbols(self) -> list[str]:
+        return sorted(p.stem for p in Path(self.data_dir).glob("*.parquet"))
+
+    def row_counts(self, symbols: Iterable[str]) -> dict[str, int]:
+        """Stored rows per symbol, read from the Parquet footers only."""
+        import pyarrow.parquet as pq
+
+        counts = {}
+        for symbol in symbols:
+            path = self.path_for(symbol)
+            if path.exists():
+                counts[symbol] = pq.read_metadata(path).num_rows
+        return counts
+
+    def load_panel(
+        self,
+        symbols: Iterable[str],
+        fields: Iterable[str] = PANEL_FIELDS,
+        start=None,
+        end=None,
+    ) -> PricePanel:
+        """Aligned dates x symbols arrays, reading only `fields` and the date range.
+
+        Files store UTC instants while the panel filters on session dates, so
+        the range pushed down to the reader is a day wider on each side.
+        """
+        import pyarrow.parquet as pq
+
+        fields = list(fields)
+        day = pd.Timedelta(days=1)
+        read_start = None if start is None else _to_utc(start) - day
+        read_end = None if end is None else _to_utc(end) + day
+        frames: dict[str, pd.DataFrame | None] = {}
+        for symbol in dict.fromkeys(symbols):
+            path = self.path_for(symbol)
+            if not path.exists():
+                frames[symbol] = None
+                continue
+            stored = set(pq.read_schema(path).names)
+            frames[symbol] = self.load_symbol(
+                symbol,
+                columns=[f for f in fields if f in stored],
+                start=read_start,
+                end=read_end,
+            )
+        return PricePanel.from_frames(frames, fields, start=start, end=end)
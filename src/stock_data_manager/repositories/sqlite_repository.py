@@ -1,9 +1,19 @@
 import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from stock_data_manager.models.price_panel import (
+    PANEL_FIELDS,
+    PricePanel,
+    session_dates,
+)
 from stock_data_manager.repositories.base import PriceDataRepository
 
 # Columns stored in ohlcv_daily mapped to their DataFrame names.
@@ -19,8 +29,27 @@ _DB_TO_DF_COLUMNS = {
     "stock_splits": "Stock Splits",
 }
 
+_DF_TO_DB_COLUMNS = {df: db for db, df in _DB_TO_DF_COLUMNS.items()}
+
+# Symbols bound per `IN (...)` list, below SQLite's host-parameter limit
+_PANEL_QUERY_SYMBOLS = 900
+
 _SCHEMA_PATH = Path(__file__).parent.parent / "schema" / "sqlite_schema.sql"
 
+# Applied to every connection. WAL lets readers run alongside the writer and,
+# with synchronous=NORMAL, commits without an fsync per transaction.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Databases whose schema script already ran in this process
+_SCHEMA_READY: set[str] = set()
+_SCHEMA_LOCK = threading.Lock()
+
 
 def _get_col(df: pd.DataFrame, name: str):
     """Case-insensitive column lookup; returns None if column is absent."""
@@ -31,17 +60,139 @@ def _get_col(df: pd.DataFrame, name: str):
     return df[actual]
 
 
-def _series_val(series, idx: int):
-    """Return float value at position idx, or None if series is None or NaN."""
+def _iso_dates(index: pd.Index) -> list[str]:
+    """`Timestamp.isoformat()` of every index entry, vectorized.
+
+    The text is part of the primary key, so it must match what older versions
+    wrote row by row; anything unusual falls back to the per-row call.
+    """
+    if (
+        not isinstance(index, pd.DatetimeIndex)
+        or index.hasnans
+        or index.microsecond.any()
+        or index.nanosecond.any()
+    ):
+        return [pd.Timestamp(value).isoformat() for value in index]
+
+    wall = index.tz_localize(None) if index.tz is not None else index
+    text = np.datetime_as_string(wall.to_numpy(), unit="s")
+    if index.tz is None:
+        return text.tolist()
+
+    utc = index.tz_convert("UTC").tz_localize(None)
+    offsets = (wall.to_numpy() - utc.to_numpy()) // np.timedelta64(1, "s")
+    if (offsets % 60).any():
+        return [pd.Timestamp(value).isoformat() for value in index]
+
+    suffixes = {}
+    for offset in np.unique(offsets):
+        sign = "-" if offset < 0 else "+"
+        hours, minutes = divmod(abs(int(offset)) // 60, 60)
+        suffixes[offset] = f"{sign}{hours:02d}:{minutes:02d}"
+    return [f"{t}{suffixes[o]}" for t, o in zip(text.tolist(), offsets.tolist())]
+
+
+def _column_values(df: pd.DataFrame, *names: str) -> np.ndarray | None:
+    """Column as an object array of floats with None for NaN, or None if absent."""
+    series = None
+    for name in names:
+        series = _get_col(df, name)
+        if series is not None:
+            break
     if series is None:
         return None
-    v = series.iloc[idx]
-    return None if pd.isna(v) else float(v)
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out
+
+
+def _offset_seconds(suffix: str) -> int:
+    """Seconds east of UTC for a `+HH:MM` / `-HH:MM` suffix ("" is UTC)."""
+    if not suffix:
+        return 0
+    seconds = int(suffix[1:3]) * 3600 + int(suffix[4:6]) * 60
+    return -seconds if suffix[0] == "-" else seconds
+
+
+def _parse_iso_dates(dates: tuple[str, ...]) -> pd.DatetimeIndex:
+    """UTC index from the stored `date` strings.
+
+    Rows written by `_iso_dates` are `YYYY-MM-DDTHH:MM:SS` plus an optional
+    `+HH:MM` offset; those are parsed as datetime64 with one offset lookup per
+    distinct suffix. Anything else goes through `pd.to_datetime`.
+    """
+    lengths = {len(d) for d in dates}
+    if lengths <= {19, 25}:
+        try:
+            wall = np.array([d[:19] for d in dates], dtype="datetime64[s]")
+            suffixes, inverse = np.unique([d[19:] for d in dates], return_inverse=True)
+            offsets = np.array(
+                [_offset_seconds(sfx) for sfx in suffixes], dtype="timedelta64[s]"
+            )
+            utc = (wall - offsets[inverse.reshape(-1)]).astype("datetime64[ns]")
+            return pd.DatetimeIndex(utc, name="Date").tz_localize("UTC")
+        except ValueError:
+            pass
+    return pd.DatetimeIndex(
+        pd.to_datetime(list(dates), utc=True, format="ISO8601"), name="Date"
+    )
+
+
+def _session_dates(dates: tuple[str, ...]) -> np.ndarray:
+    """Session date of each stored `date` string, for PricePanel.from_long.
+
+    Text written by `_iso_dates` starts with the exchange's local date, so no
+    parsing is needed; anything else goes through `session_dates`.
+    """
+    if {len(d) for d in dates} <= {19, 25}:
+        try:
+            local = np.array([d[:10] for d in dates], dtype="datetime64[D]")
+            return local.astype("datetime64[ns]")
+        except ValueError:
+            pass
+    return session_dates(_parse_iso_dates(dates))
+
+
+def _date_text_bound(value, days: int) -> str:
+    """Date text `days` away from `value`, as a loose bound on stored local dates.
+
+    Stored dates carry the exchange's local offset, so text comparison is
+    only accurate to within a day; callers re-filter exactly after parsing.
+    """
+    ts = pd.Timestamp(value)
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    return (ts + pd.Timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def _rows_to_frame(rows: list[tuple]) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame(
+            columns=list(_DB_TO_DF_COLUMNS.values()),
+            index=pd.DatetimeIndex([], tz="UTC", name="Date"),
+        )
+
+    dates, *columns = zip(*rows)
+    index = _parse_iso_dates(dates)
+    # None (SQL NULL) becomes NaN in the float arrays
+    data = {
+        name: np.array(values, dtype=float)
+        for name, values in zip(_DB_TO_DF_COLUMNS.values(), columns)
+    }
+    return pd.DataFrame(data, index=index, copy=False)
 
 
 class SqlitePriceDataRepository(PriceDataRepository):
+    """OHLCV rows in the `ohlcv_daily` table of a SQLite database.
+
+    Each thread reuses one connection (WAL journal, tuned pragmas). Writes
+    commit individually unless they run inside `transaction()`, which groups
+    writes for many symbols into a single commit.
+    """
+
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._local = threading.local()
         self._ensure_schema()
 
     # ------------------------------------------------------------------
@@ -49,13 +200,52 @@ class SqlitePriceDataRepository(PriceDataRepository):
     # ------------------------------------------------------------------
 
     def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+        return conn
 
     def _ensure_schema(self) -> None:
-        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
-        sql = _SCHEMA_PATH.read_text()
-        with self._connect() as conn:
-            conn.executescript(sql)
+        path = Path(self.db_path)
+        key = str(path.resolve())
+        with _SCHEMA_LOCK:
+            if key in _SCHEMA_READY and path.exists():
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            conn.executescript(_SCHEMA_PATH.read_text())
+            conn.commit()
+            _SCHEMA_READY.add(key)
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group every write made by this thread inside the block in one commit."""
+        conn = self._connect()
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0 and not conn.in_transaction:
+            conn.execute("BEGIN")
+        self._local.depth = depth + 1
+        try:
+            yield
+        except BaseException:
+            if depth == 0:
+                conn.rollback()
+            raise
+        else:
+            if depth == 0:
+                conn.commit()
+        finally:
+            self._local.depth = depth
 
     # ------------------------------------------------------------------
     # PriceDataRepository interface
@@ -66,73 +256,132 @@ class SqlitePriceDataRepository(PriceDataRepository):
             "SELECT date, open, high, low, close, volume, dividends, stock_splits "
             "FROM ohlcv_daily WHERE symbol = ? ORDER BY date"
         )
-        with self._connect() as conn:
-            rows = conn.execute(query, (symbol,)).fetchall()
+        rows = self._connect().execute(query, (symbol,)).fetchall()
+        return _rows_to_frame(rows)
 
-        if not rows:
-            return pd.DataFrame(
-                columns=list(_DB_TO_DF_COLUMNS.values()),
-                index=pd.DatetimeIndex([], tz="UTC", name="Date"),
-            )
-
-        dates = [row[0] for row in rows]
-        data = {
-            "Open": [row[1] for row in rows],
-            "High": [row[2] for row in rows],
-            "Low": [row[3] for row in rows],
-            "Close": [row[4] for row in rows],
-            "Volume": [row[5] for row in rows],
-            "Dividends": [row[6] for row in rows],
-            "Stock Splits": [row[7] for row in rows],
-        }
-
-        index = pd.to_datetime(dates, utc=True)
-        index.name = "Date"
-        df = pd.DataFrame(data, index=index)
-        return df
+    def load_tail(self, symbol: str, rows: int) -> pd.DataFrame:
+        """Last `rows` rows of a symbol, in ascending date order."""
+        query = (
+            "SELECT date, open, high, low, close, volume, dividends, stock_splits "
+            "FROM ohlcv_daily WHERE symbol = ? ORDER BY date DESC LIMIT ?"
+        )
+        result = self._connect().execute(query, (symbol, rows)).fetchall()
+        return _rows_to_frame(result[::-1])
 
     def save_symbol(self, symbol: str, df: pd.DataFrame) -> None:
-        imported_at = datetime.now(tz=timezone.utc).isoformat()
+        self.write_rows(symbol, df)
 
-        open_col = _get_col(df, "open")
-        high_col = _get_col(df, "high")
-        low_col = _get_col(df, "low")
-        close_col = _get_col(df, "close")
-        volume_col = _get_col(df, "volume")
-        dividends_col = _get_col(df, "dividends")
-        splits_col = _get_col(df, "stock splits")
-        if splits_col is None:
-            splits_col = _get_col(df, "stock_splits")
-
-        rows = []
-        for i, date_val in enumerate(df.index):
-            date_str = pd.Timestamp(date_val).isoformat()
-            rows.append(
-                (
-                    symbol,
-                    date_str,
-                    _series_val(open_col, i),
-                    _series_val(high_col, i),
-                    _series_val(low_col, i),
-                    _series_val(close_col, i),
-                    _series_val(volume_col, i),
-                    _series_val(dividends_col, i),
-                    _series_val(splits_col, i),
-                    None,  # source
-                    imported_at,
-                )
-            )
+    def write_rows(self, symbol: str, df: pd.DataFrame) -> int:
+        """Upsert `df` rows for `symbol`; returns the approximate bytes written."""
+        n = len(df)
+        if n == 0:
+            return 0
+        imported_at = datetime.now(tz=timezone.utc).isoformat()
+        dates = _iso_dates(df.index)
+        columns = [
+            _column_values(df, "open"),
+            _column_values(df, "high"),
+            _column_values(df, "low"),
+            _column_values(df, "close"),
+            _column_values(df, "volume"),
+            _column_values(df, "dividends"),
+            _column_values(df, "stock splits", "stock_splits"),
+        ]
+        rows = zip(
+            repeat(symbol, n),
+            dates,
+            *(repeat(None, n) if col is None else col for col in columns),
+            repeat(None, n),  # source
+            repeat(imported_at, n),
+        )
 
         sql = (
             "INSERT OR REPLACE INTO ohlcv_daily "
-            "(symbol, date, open, high, low, close, volume, dividends, stock_splits, source, imported_at) "
+            "(symbol, date, open, high, low, close, volume, dividends, stock_splits, "
+            "source, imported_at) "
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
         )
-        with self._connect() as conn:
-            conn.executemany(sql, rows)
+        conn = self._connect()
+        if getattr(self._local, "depth", 0) == 0:
+            with conn:
+                conn.executemany(sql, rows)
+        else:
+            # Savepoint: a failed symbol inside transaction() leaves no partial rows
+            conn.execute("SAVEPOINT write_rows")
+            try:
+                conn.executemany(sql, rows)
+            except BaseException:
+                conn.execute("ROLLBACK TO write_rows")
+                raise
+            finally:
+                conn.execute("RELEASE write_rows")
+
+        numbers = sum(int(pd.notna(col).sum()) for col in columns if col is not None)
+        text = (len(symbol) + len(imported_at)) * n + sum(len(d) for d in dates)
+        return text + 8 * numbers
+
+    def load_panel(
+        self,
+        symbols: Iterable[str],
+        fields: Iterable[str] = PANEL_FIELDS,
+        start=None,
+        end=None,
+    ) -> PricePanel:
+        """Aligned dates x symbols arrays for `fields`, read in one query.
+
+        Universes larger than `_PANEL_QUERY_SYMBOLS` take one query per chunk
+        of symbols. No per-symbol DataFrame is built.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        fields = list(fields)
+        unknown = [f for f in fields if f not in _DF_TO_DB_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown panel fields: {unknown}")
+
+        select = ", ".join(["symbol", "date", *(_DF_TO_DB_COLUMNS[f] for f in fields)])
+        conditions, bounds = "", []
+        if start is not None:
+            conditions += " AND date >= ?"
+            bounds.append(_date_text_bound(start, -1))
+        if end is not None:
+            conditions += " AND date < ?"
+            bounds.append(_date_text_bound(end, 2))
+
+        conn = self._connect()
+        rows: list[tuple] = []
+        for i in range(0, len(symbols), _PANEL_QUERY_SYMBOLS):
+            chunk = symbols[i : i + _PANEL_QUERY_SYMBOLS]
+            placeholders = ", ".join("?" * len(chunk))
+            query = (
+                f"SELECT {select} FROM ohlcv_daily "
+                f"WHERE symbol IN ({placeholders}){conditions}"
+            )
+            rows.extend(conn.execute(query, (*chunk, *bounds)).fetchall())
+
+        if rows:
+            row_symbols, dates, *columns = zip(*rows)
+        else:
+            row_symbols, dates, columns = (), (), [()] * len(fields)
+        position = {symbol: i for i, symbol in enumerate(symbols)}
+        positions = np.fromiter(
+            (position[s] for s in row_symbols), dtype=np.intp, count=len(rows)
+        )
+        stamps = _session_dates(dates)
+        values = {
+            field: np.array(column, dtype=float)
+            for field, column in zip(fields, columns)
+        }
+        return PricePanel.from_long(
+            symbols, positions, stamps, values, start=start, end=end
+        )
+
+    def row_counts(self, symbols: Iterable[str]) -> dict[str, int]:
+        """Stored rows per symbol, counted in one pass over the primary key."""
+        query = "SELECT symbol, COUNT(*) FROM ohlcv_daily GROUP BY symbol"
+        counts = dict(self._connect().execute(query).fetchall())
+        return {symbol: counts[symbol] for symbol in symbols if symbol in counts}
 
     def list_symbols(self) -> list[str]:
         query = "SELECT DISTINCT symbol FROM ohlcv_daily ORDER BY symbol"
-        with self._connect() as conn:
-            rows = conn.execute(query).fetchall()
+        rows = self._connect().execute(query).fetchall()
         return [row[0] for row in rows]
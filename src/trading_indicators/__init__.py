@@ -1,10 +1,19 @@
-from trading_indicators.indicators.smc import SmartMoneyConfluence, SMCConfig
-from trading_indicators.indicators.lux import LuxSignalsOverlays, LuxConfig
+from trading_indicators.indicators.base import DEFAULT_TAIL_TOLERANCE
+from trading_indicators.indicators.smc import SmartMoneyConfluence, SMCConfig, SMCState
+from trading_indicators.indicators.lux import LuxSignalsOverlays, LuxConfig, LuxState
 from trading_indicators.signals.aggregator import (
     CompositeSignalAggregator,
     AggregationRule,
     SMCSignalStrategy,
     LuxSignalStrategy,
+    SIGNAL_CODES,
+    encode_signals,
+    decode_signals,
+)
+from trading_indicators.utils.features import (
+    FeatureGraph,
+    FeatureScope,
+    shared_features,
 )
 from trading_indicators.utils.types import (
     SMCResult,
@@ -17,15 +26,24 @@ from trading_indicators.utils.types import (
 __all__ = [
     "SmartMoneyConfluence",
     "SMCConfig",
+    "SMCState",
     "LuxSignalsOverlays",
     "LuxConfig",
+    "LuxState",
     "CompositeSignalAggregator",
+    "FeatureGraph",
+    "FeatureScope",
+    "shared_features",
     "AggregationRule",
     "SMCSignalStrategy",
     "LuxSignalStrategy",
+    "SIGNAL_CODES",
+    "encode_signals",
+    "decode_signals",
     "SMCResult",
     "LuxResult",
     "SignalType",
     "Trend",
     "ZonePosition",
+    "DEFAULT_TAIL_TOLERANCE",
 ]
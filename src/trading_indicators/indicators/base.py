@@ -1,18 +1,29 @@
 """
 Contrato base para todos os indicadores.
 Aplica o padrão Template Method: subclasses implementam `_validate` e `_compute`.
+
+Indicadores que suportam atualização incremental implementam também
+`_create_state` e `_step` (ver `init_state` / `update`).
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Mapping
+from typing import Any, Generic, TypeVar
 
 import pandas as pd
 
+from trading_indicators.utils.features import FeatureGraph, resolve_features
+from trading_indicators.utils.streaming import StreamingState
+
 T = TypeVar("T")
 
 REQUIRED_COLUMNS = {"open", "high", "low", "close"}
+_BAR_COLUMNS = ("open", "high", "low", "close")
+
+# Peso residual máximo do histórico descartado por `tail_bars()` / `compute_tail()`
+DEFAULT_TAIL_TOLERANCE = 1e-6
 
 
 class BaseIndicator(ABC, Generic[T]):
@@ -25,20 +36,88 @@ class BaseIndicator(ABC, Generic[T]):
       - Expor uma interface uniforme via `compute()`
     """
 
-    def compute(self, df: pd.DataFrame) -> T:
+    def compute(self, df: pd.DataFrame, *, features: FeatureGraph | None = None) -> T:
         """
         Ponto de entrada público.
 
         Args:
             df: DataFrame com colunas OHLCV (case-insensitive).
                 O índice deve ser DatetimeIndex ou inteiro crescente.
+            features: Grafo de features do mesmo frame, compartilhado com
+                outros indicadores para não recalcular primitivas comuns.
+                Sem ele, usa o escopo de `shared_features()` se houver.
 
         Returns:
             Objeto de resultado tipado conforme a subclasse.
         """
+        if features is not None and not features.same_frame(df):
+            raise ValueError("FeatureGraph foi construído para outro DataFrame.")
+        df = self._normalize_columns(df)
+        self._validate(df)
+        if features is None:
+            features = resolve_features(df)
+        return self._compute(df, features)
+
+    def tail_bars(self, tolerance: float = DEFAULT_TAIL_TOLERANCE) -> int:
+        """
+        Quantidade de barras finais suficiente para que a última barra de
+        `compute()` sobre elas reproduza a do histórico completo.
+
+        Termos recursivos (EWM) nunca esquecem o histórico por completo:
+        `tolerance` é o peso máximo que o histórico descartado ainda teria
+        neles, então valores contínuos diferem em ~tolerance x amplitude do
+        preço e sinais discretos só divergem quando o valor está a essa
+        distância de um limiar. Sobrescreva em indicadores com memória.
+        """
+        return self._min_bars()
+
+    def lookahead_bars(self) -> int:
+        """
+        Barras futuras que uma linha de `compute()` consulta. As últimas
+        `lookahead_bars()` linhas do resultado mudam quando o histórico ganha
+        barras novas. Sobrescreva em indicadores com janelas centradas.
+        """
+        return 0
+
+    def compute_tail(
+        self, df: pd.DataFrame, tolerance: float = DEFAULT_TAIL_TOLERANCE
+    ) -> T:
+        """`compute()` apenas sobre as últimas `tail_bars(tolerance)` barras."""
+        return self.compute(df.iloc[-self.tail_bars(tolerance) :])
+
+    def init_state(self, df: pd.DataFrame) -> StreamingState:
+        """
+        Constrói o estado incremental a partir de um histórico completo.
+
+        O estado é avançado barra a barra pelo mesmo `_step` usado em
+        `update()`, então um `update()` subsequente equivale (dentro de
+        tolerância de ponto flutuante) à última barra de `compute()` sobre o
+        histórico estendido. O estado é serializável via `to_dict()`.
+        """
         df = self._normalize_columns(df)
         self._validate(df)
-        return self._compute(df)
+        state = self._create_state()
+        columns = [df[col].to_numpy(dtype=float).tolist() for col in _BAR_COLUMNS]
+        for open_, high, low, close in zip(*columns):
+            self._step(state, open_, high, low, close)
+        return state
+
+    def update(
+        self, state: StreamingState, bar: Mapping[str, Any] | pd.Series
+    ) -> dict[str, Any]:
+        """
+        Avança o estado com uma nova barra em O(1) e retorna os valores do
+        resultado (mesmos nomes de campo do objeto de `compute()`) para ela.
+
+        Args:
+            state: Estado retornado por `init_state()` (modificado in-place).
+            bar: Mapeamento com open/high/low/close (case-insensitive).
+        """
+        values = {str(key).lower(): value for key, value in bar.items()}
+        missing = REQUIRED_COLUMNS - set(values)
+        if missing:
+            raise ValueError(f"Barra está faltando colunas: {missing}")
+        return self._step(state, *(float(values[col]) for col in _BAR_COLUMNS))
 
     # ── Template Method ────────────────────────────────────────────────────────
 
@@ -53,13 +132,32 @@ class BaseIndicator(ABC, Generic[T]):
             )
 
     @abstractmethod
-    def _compute(self, df: pd.DataFrame) -> T:
-        """Implementação do cálculo do indicador."""
+    def _compute(self, df: pd.DataFrame, features: FeatureGraph) -> T:
+        """Implementação do cálculo do indicador (primitivas via `features`)."""
 
     def _min_bars(self) -> int:
         """Mínimo de barras necessárias. Sobrescreva se necessário."""
         return 1
 
+    def _create_state(self) -> StreamingState:
+        """Estado incremental vazio. Sobrescreva para suportar `update()`."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} não suporta atualização incremental."
+        )
+
+    def _step(
+        self,
+        state: StreamingState,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+    ) -> dict[str, Any]:
+        """Avança `state` em uma barra e retorna os valores dela."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} não suporta atualização incremental."
+        )
+
     # ── Helpers ────────────────────────────────────────────────────────────────
 
     @staticmethod
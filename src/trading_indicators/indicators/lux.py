@@ -12,11 +12,24 @@ Combina:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 import pandas as pd
 
-from trading_indicators.indicators.base import BaseIndicator
+from trading_indicators.indicators.base import DEFAULT_TAIL_TOLERANCE, BaseIndicator
 from trading_indicators.utils import ta_primitives as ta
+from trading_indicators.utils.features import FeatureGraph
+from trading_indicators.utils.streaming import (
+    NAN,
+    DmiState,
+    RollingWindow,
+    RsiState,
+    StreamingState,
+    SupertrendState,
+    true_range,
+    window_mean,
+    window_std,
+)
 from trading_indicators.utils.types import LuxResult, Trend
 
 
@@ -36,6 +49,21 @@ class LuxConfig:
     rsi_overbought: float = 70.0
 
 
+@dataclass
+class LuxState(StreamingState):
+    """Estado incremental do Lux (ver `LuxSignalsOverlays.update`)."""
+
+    supertrend: SupertrendState
+    dmi: DmiState
+    rsi: RsiState
+    closes: RollingWindow
+    prev_close: float = NAN
+    prev_high: float = NAN
+    prev_low: float = NAN
+    prev_supertrend: float = NAN
+    bars: int = 0
+
+
 class LuxSignalsOverlays(BaseIndicator[LuxResult]):
     """
     Indicador Lux Signals & Overlays.
@@ -50,6 +78,10 @@ class LuxSignalsOverlays(BaseIndicator[LuxResult]):
 
         # Candles com compra forte confirmada
         strong_buys = df[result.valid_buy & result.is_strong]
+
+        # Atualização incremental (O(1) por barra nova)
+        state = lux.init_state(df)
+        latest = lux.update(state, new_bar)  # dict com os campos de LuxResult
     """
 
     def __init__(self, config: LuxConfig | None = None) -> None:
@@ -59,30 +91,37 @@ class LuxSignalsOverlays(BaseIndicator[LuxResult]):
         cfg = self.config
         return max(200, cfg.sensitivity * 2, cfg.bollinger_length * 2)
 
-    def _compute(self, df: pd.DataFrame) -> LuxResult:
+    def tail_bars(self, tolerance: float = DEFAULT_TAIL_TOLERANCE) -> int:
+        cfg = self.config
+        # ADX suaviza o DX, que já vem de médias de Wilder: dois estágios
+        adx_warmup = 2 * ta.ewm_warmup_bars(1 / 14, tolerance)
+        rsi_warmup = ta.ewm_warmup_bars(1 / cfg.rsi_length, tolerance)
+        # Bandas do Supertrend dependem do caminho; margem extra para resetarem
+        st_warmup = ta.ewm_warmup_bars(2 / (cfg.sensitivity + 1), tolerance) * 2
+        return max(self._min_bars(), adx_warmup, rsi_warmup, st_warmup) + 1
+
+    def _compute(self, df: pd.DataFrame, features: FeatureGraph) -> LuxResult:
         cfg = self.config
         close = df["close"]
         high = df["high"]
         low = df["low"]
 
         # ── Supertrend (Smart Trail) ──────────────────────────────────────────
-        st_line, direction = ta.supertrend(
-            high, low, close, cfg.multiplier, cfg.sensitivity
-        )
+        st_line, direction = features.supertrend(cfg.multiplier, cfg.sensitivity)
 
         trend = direction.map({-1: Trend.BULLISH, 1: Trend.BEARISH})  # type: ignore[arg-type]
         # ── Bandas de Reversão ────────────────────────────────────────────────
-        basis = ta.sma(close, cfg.bollinger_length)
-        dev = cfg.bollinger_mult * ta.stdev(close, cfg.bollinger_length)
+        basis = features.sma("close", cfg.bollinger_length)
+        dev = cfg.bollinger_mult * features.stdev("close", cfg.bollinger_length)
         upper_zone = basis + dev
         lower_zone = basis - dev
 
         # ── ADX / Força ───────────────────────────────────────────────────────
-        _, _, adx_val = ta.dmi(high, low, close, di_length=14, adx_length=14)
+        _, _, adx_val = features.dmi(di_length=14, adx_length=14)
         is_strong = adx_val > cfg.adx_strong_threshold
 
         # ── RSI ───────────────────────────────────────────────────────────────
-        rsi_val = ta.rsi(close, cfg.rsi_length)
+        rsi_val = features.rsi("close", cfg.rsi_length)
 
         # ── Sinais de Confirmação ─────────────────────────────────────────────
         signal_buy = _crossover(close, st_line)
@@ -116,6 +155,71 @@ class LuxSignalsOverlays(BaseIndicator[LuxResult]):
             rsi=rsi_val,
         )
 
+    # ── Atualização incremental ───────────────────────────────────────────────
+
+    def _create_state(self) -> LuxState:
+        cfg = self.config
+        return LuxState(
+            supertrend=SupertrendState.create(cfg.multiplier, cfg.sensitivity),
+            dmi=DmiState.create(di_length=14, adx_length=14),
+            rsi=RsiState.create(cfg.rsi_length),
+            closes=RollingWindow(cfg.bollinger_length),
+        )
+
+    def _step(  # type: ignore[override]
+        self, state: LuxState, open_: float, high: float, low: float, close: float
+    ) -> dict[str, Any]:
+        cfg = self.config
+        tr = true_range(high, low, state.prev_close)
+
+        st_line, direction = state.supertrend.update(
+            high, low, close, state.prev_close, tr
+        )
+
+        state.closes.push(close)
+        window = state.closes.tail(cfg.bollinger_length)
+        basis = window_mean(window)
+        dev = cfg.bollinger_mult * window_std(window)
+        upper_zone = basis + dev
+        lower_zone = basis - dev
+
+        adx_val = state.dmi.update(tr, high - state.prev_high, state.prev_low - low)
+        is_strong = adx_val > cfg.adx_strong_threshold
+
+        rsi_val = state.rsi.update(close - state.prev_close)
+
+        signal_buy = close > st_line and state.prev_close <= state.prev_supertrend
+        signal_sell = close < st_line and state.prev_close >= state.prev_supertrend
+        if cfg.use_trend_filter:
+            valid_buy = signal_buy and adx_val > cfg.adx_filter_threshold
+            valid_sell = signal_sell and adx_val > cfg.adx_filter_threshold
+        else:
+            valid_buy = signal_buy
+            valid_sell = signal_sell
+
+        state.prev_close = close
+        state.prev_high = high
+        state.prev_low = low
+        state.prev_supertrend = st_line
+        state.bars += 1
+
+        return {
+            "supertrend": st_line,
+            "trend": Trend.BULLISH if direction == -1 else Trend.BEARISH,
+            "upper_zone": upper_zone,
+            "lower_zone": lower_zone,
+            "basis": basis,
+            "adx": adx_val,
+            "is_strong": is_strong,
+            "signal_buy": signal_buy,
+            "signal_sell": signal_sell,
+            "valid_buy": valid_buy,
+            "valid_sell": valid_sell,
+            "contra_buy": low <= lower_zone and rsi_val < cfg.rsi_oversold,
+            "contra_sell": high >= upper_zone and rsi_val > cfg.rsi_overbought,
+            "rsi": rsi_val,
+        }
+
 
 # ─── Helpers locais ────────────────────────────────────────────────────────────
 
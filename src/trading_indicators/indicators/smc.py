@@ -12,12 +12,25 @@ Detecta confluência entre:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 import numpy as np
 import pandas as pd
 
-from trading_indicators.indicators.base import BaseIndicator
+from trading_indicators.indicators.base import DEFAULT_TAIL_TOLERANCE, BaseIndicator
 from trading_indicators.utils import ta_primitives as ta
+from trading_indicators.utils.features import FeatureGraph
+from trading_indicators.utils.streaming import (
+    NAN,
+    EwmState,
+    RollingWindow,
+    RsiState,
+    StreamingState,
+    nan_max,
+    nan_min,
+    window_max,
+    window_min,
+)
 from trading_indicators.utils.types import SMCResult
 
 
@@ -33,6 +46,19 @@ class SMCConfig:
     use_ema_filter: bool = True
 
 
+@dataclass
+class SMCState(StreamingState):
+    """Estado incremental do SMC (ver `SmartMoneyConfluence.update`)."""
+
+    ema200: EwmState
+    rsi: RsiState
+    highs: RollingWindow
+    lows: RollingWindow
+    rsi_values: RollingWindow
+    prev_close: float = NAN
+    bars: int = 0
+
+
 class SmartMoneyConfluence(BaseIndicator[SMCResult]):
     """
     Indicador Smart Money Confluence.
@@ -47,6 +73,15 @@ class SmartMoneyConfluence(BaseIndicator[SMCResult]):
 
         # Filtrar apenas barras com sinal de compra
         buy_bars = df[result.long_signal]
+
+        # Atualização incremental (O(1) por barra nova)
+        state = smc.init_state(df)
+        latest = smc.update(state, new_bar)  # dict com os campos de SMCResult
+
+    Pivôs só são confirmados `swing_lookback` barras depois do candle central,
+    então `update()` também retorna `confirmed_swing_high` /
+    `confirmed_swing_low`: o valor do pivô (ou NaN) do candle
+    `swing_lookback` barras atrás, que um recompute completo passaria a marcar.
     """
 
     def __init__(self, config: SMCConfig | None = None) -> None:
@@ -58,7 +93,19 @@ class SmartMoneyConfluence(BaseIndicator[SMCResult]):
             200, cfg.range_lookback, cfg.divergence_lookback, cfg.swing_lookback * 2 + 1
         )
 
-    def _compute(self, df: pd.DataFrame) -> SMCResult:
+    def tail_bars(self, tolerance: float = DEFAULT_TAIL_TOLERANCE) -> int:
+        cfg = self.config
+        rsi_warmup = (
+            ta.ewm_warmup_bars(1 / cfg.rsi_length, tolerance) + cfg.divergence_lookback
+        )
+        ema_warmup = ta.ewm_warmup_bars(2 / (200 + 1), tolerance)
+        return max(self._min_bars(), rsi_warmup, ema_warmup) + 1
+
+    def lookahead_bars(self) -> int:
+        # Pivôs são marcados no candle central, `swing_lookback` barras atrás
+        return self.config.swing_lookback
+
+    def _compute(self, df: pd.DataFrame, features: FeatureGraph) -> SMCResult:
         cfg = self.config
         close = df["close"]
         high = df["high"]
@@ -66,11 +113,11 @@ class SmartMoneyConfluence(BaseIndicator[SMCResult]):
         open_ = df["open"]
 
         # ── EMA 200 ──────────────────────────────────────────────────────────
-        ema200 = ta.ema(close, 200)
+        ema200 = features.ema("close", 200)
 
         # ── Pivôs ─────────────────────────────────────────────────────────────
-        swing_highs = ta.pivot_high(high, cfg.swing_lookback, cfg.swing_lookback)
-        swing_lows = ta.pivot_low(low, cfg.swing_lookback, cfg.swing_lookback)
+        swing_highs = features.pivot_high(cfg.swing_lookback, cfg.swing_lookback)
+        swing_lows = features.pivot_low(cfg.swing_lookback, cfg.swing_lookback)
 
         # ── Rejeição de Pavio ─────────────────────────────────────────────────
         total_range = high - low
@@ -82,24 +129,24 @@ class SmartMoneyConfluence(BaseIndicator[SMCResult]):
         bullish_rejection = (lower_wick / safe_range) >= cfg.wick_threshold
 
         # ── Premium / Discount ────────────────────────────────────────────────
-        range_high = high.rolling(cfg.range_lookback).max()
-        range_low = low.rolling(cfg.range_lookback).min()
+        range_high = features.rolling_max("high", cfg.range_lookback)
+        range_low = features.rolling_min("low", cfg.range_lookback)
         range_mid = (range_high + range_low) / 2
 
         in_premium = close > range_mid
         in_discount = close < range_mid
 
         # ── RSI ───────────────────────────────────────────────────────────────
-        rsi_val = ta.rsi(close, cfg.rsi_length)
+        rsi_val = features.rsi("close", cfg.rsi_length)
 
         # ── Divergência RSI ───────────────────────────────────────────────────
         # Bearish: Preço faz topo maior, RSI faz topo menor (zona Premium)
-        prev_high_max = high.rolling(cfg.divergence_lookback).max().shift(1)
+        prev_high_max = features.rolling_max("high", cfg.divergence_lookback).shift(1)
         prev_rsi_max = rsi_val.rolling(cfg.divergence_lookback).max().shift(1)
         bearish_div = (high > prev_high_max) & (rsi_val < prev_rsi_max) & (rsi_val > 50)
 
         # Bullish: Preço faz fundo menor, RSI faz fundo maior (zona Discount)
-        prev_low_min = low.rolling(cfg.divergence_lookback).min().shift(1)
+        prev_low_min = features.rolling_min("low", cfg.divergence_lookback).shift(1)
         prev_rsi_min = rsi_val.rolling(cfg.divergence_lookback).min().shift(1)
         bullish_div = (low < prev_low_min) & (rsi_val > prev_rsi_min) & (rsi_val < 50)
 
@@ -145,3 +192,111 @@ class SmartMoneyConfluence(BaseIndicator[SMCResult]):
             rsi=rsi_val,
             range_position_pct=float(range_position_pct),
         )
+
+    # ── Atualização incremental ───────────────────────────────────────────────
+
+    def _create_state(self) -> SMCState:
+        cfg = self.config
+        window = max(
+            cfg.swing_lookback * 2 + 1, cfg.range_lookback, cfg.divergence_lookback + 1
+        )
+        return SMCState(
+            ema200=EwmState.from_span(200),
+            rsi=RsiState.create(cfg.rsi_length),
+            highs=RollingWindow(window),
+            lows=RollingWindow(window),
+            rsi_values=RollingWindow(cfg.divergence_lookback),
+        )
+
+    def _step(  # type: ignore[override]
+        self, state: SMCState, open_: float, high: float, low: float, close: float
+    ) -> dict[str, Any]:
+        cfg = self.config
+        swing = cfg.swing_lookback
+        state.highs.push(high)
+        state.lows.push(low)
+
+        ema200 = state.ema200.update(close)
+
+        # ── Pivôs (candle central fica `swing` barras atrás) ──────────────────
+        confirmed_high = _confirmed_pivot(
+            state.highs.tail(swing * 2 + 1), swing, use_max=True
+        )
+        confirmed_low = _confirmed_pivot(
+            state.lows.tail(swing * 2 + 1), swing, use_max=False
+        )
+
+        # ── Rejeição de Pavio ─────────────────────────────────────────────────
+        total_range = high - low
+        safe_range = NAN if total_range == 0 else total_range
+        upper_wick = high - nan_max(close, open_)
+        lower_wick = nan_min(close, open_) - low
+        bearish_rejection = (upper_wick / safe_range) >= cfg.wick_threshold
+        bullish_rejection = (lower_wick / safe_range) >= cfg.wick_threshold
+
+        # ── Premium / Discount ────────────────────────────────────────────────
+        range_high = window_max(state.highs.tail(cfg.range_lookback))
+        range_low = window_min(state.lows.tail(cfg.range_lookback))
+        range_mid = (range_high + range_low) / 2
+
+        # ── RSI + Divergência (janela anterior à barra atual) ─────────────────
+        rsi_val = state.rsi.update(close - state.prev_close)
+        lookback = cfg.divergence_lookback
+        prev_rsi_max = window_max(state.rsi_values.tail(lookback))
+        prev_rsi_min = window_min(state.rsi_values.tail(lookback))
+        state.rsi_values.push(rsi_val)
+
+        prev_high_max = window_max(state.highs.tail(lookback, offset=1))
+        prev_low_min = window_min(state.lows.tail(lookback, offset=1))
+        bearish_div = high > prev_high_max and rsi_val < prev_rsi_max and rsi_val > 50
+        bullish_div = low < prev_low_min and rsi_val > prev_rsi_min and rsi_val < 50
+
+        in_premium = close > range_mid
+        in_discount = close < range_mid
+        ema_long_ok = close > ema200 if cfg.use_ema_filter else True
+        ema_short_ok = close < ema200 if cfg.use_ema_filter else True
+
+        span = range_high - range_low
+        range_position_pct = ((close - range_low) / span * 100) if span != 0 else 50.0
+
+        state.prev_close = close
+        state.bars += 1
+
+        return {
+            "ema200": ema200,
+            "range_high": range_high,
+            "range_low": range_low,
+            "range_mid": range_mid,
+            "swing_highs": confirmed_high if swing == 0 else NAN,
+            "swing_lows": confirmed_low if swing == 0 else NAN,
+            "confirmed_swing_high": confirmed_high,
+            "confirmed_swing_low": confirmed_low,
+            "bullish_rejection": bullish_rejection,
+            "bearish_rejection": bearish_rejection,
+            "in_premium": in_premium,
+            "in_discount": in_discount,
+            "bullish_divergence": bullish_div,
+            "bearish_divergence": bearish_div,
+            "long_signal": (
+                bullish_div and bullish_rejection and in_discount and ema_long_ok
+            ),
+            "short_signal": (
+                bearish_div and bearish_rejection and in_premium and ema_short_ok
+            ),
+            "rsi": rsi_val,
+            "range_position_pct": float(range_position_pct),
+        }
+
+
+# ─── Helpers locais ────────────────────────────────────────────────────────────
+
+
+def _confirmed_pivot(
+    window: list[float] | None, right_bars: int, use_max: bool
+) -> float:
+    """Valor do pivô no candle central da janela (NaN se não for pivô)."""
+    if window is None:
+        return NAN
+    center = window[len(window) - 1 - right_bars]
+    extreme = nan_max(*window) if use_max else nan_min(*window)
+    return center if center == extreme else NAN
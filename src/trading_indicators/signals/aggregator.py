@@ -10,16 +10,61 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Protocol
 
+import numpy as np
 import pandas as pd
 
 from trading_indicators.utils.types import LuxResult, SMCResult, SignalType
 
 
+# ─── Codificação inteira de sinais ─────────────────────────────────────────────
+
+# Cada SignalType vira um int8 (o próprio `.value` do enum) para que regras de
+# agregação sejam avaliadas com operações de array em vez de loops por candle.
+SIGNAL_CODES: dict[SignalType, int] = {signal: signal.value for signal in SignalType}
+NONE_CODE = SIGNAL_CODES[SignalType.NONE]
+BUY_CODE = SIGNAL_CODES[SignalType.BUY]
+SELL_CODE = SIGNAL_CODES[SignalType.SELL]
+
+_BUY_CODES = np.array(
+    [
+        SIGNAL_CODES[s]
+        for s in (SignalType.BUY, SignalType.STRONG_BUY, SignalType.CONTRA_BUY)
+    ],
+    dtype=np.int8,
+)
+_SELL_CODES = np.array(
+    [
+        SIGNAL_CODES[s]
+        for s in (SignalType.SELL, SignalType.STRONG_SELL, SignalType.CONTRA_SELL)
+    ],
+    dtype=np.int8,
+)
+_DECODE_TABLE = np.empty(max(SIGNAL_CODES.values()) + 1, dtype=object)
+for _signal, _code in SIGNAL_CODES.items():
+    _DECODE_TABLE[_code] = _signal
+
+
+def encode_signals(signals: pd.Series) -> np.ndarray:
+    """Converte Series de SignalType em array int8 (desconhecidos viram NONE)."""
+    return signals.map(SIGNAL_CODES).fillna(NONE_CODE).to_numpy(dtype=np.int8)
+
+
+def decode_signals(codes: np.ndarray, index: pd.Index) -> pd.Series:
+    """Converte um array de códigos int8 de volta em Series de SignalType."""
+    return pd.Series(_DECODE_TABLE[np.asarray(codes, dtype=np.intp)], index=index)
+
+
 # ─── Protocolo de estratégia de sinal ─────────────────────────────────────────
 
 
 class SignalStrategy(Protocol):
-    """Contrato para qualquer gerador de sinais."""
+    """
+    Contrato para qualquer gerador de sinais.
+
+    Estratégias podem opcionalmente expor `generate_codes(df) -> np.ndarray`
+    (códigos int8 de SIGNAL_CODES); o agregador usa esse caminho quando
+    disponível e evita materializar objetos SignalType.
+    """
 
     def generate(self, df: pd.DataFrame) -> pd.Series:
         """Retorna uma Series de SignalType por candle."""
@@ -36,11 +81,16 @@ class SMCSignalStrategy:
         self._result = result
 
     def generate(self, df: pd.DataFrame) -> pd.Series:
+        return decode_signals(self.generate_codes(df), df.index)
+
+    def generate_codes(self, df: pd.DataFrame) -> np.ndarray:
         r = self._result
-        signals = pd.Series(SignalType.NONE, index=df.index)
-        signals[r.long_signal] = SignalType.BUY
-        signals[r.short_signal] = SignalType.SELL
-        return signals
+        # Ordem importa: short sobrescreve long
+        return np.select(
+            [_mask(r.short_signal), _mask(r.long_signal)],
+            [SELL_CODE, BUY_CODE],
+            default=NONE_CODE,
+        ).astype(np.int8)
 
 
 class LuxSignalStrategy:
@@ -50,18 +100,34 @@ class LuxSignalStrategy:
         self._result = result
 
     def generate(self, df: pd.DataFrame) -> pd.Series:
-        r = self._result
-        signals = pd.Series(SignalType.NONE, index=df.index)
+        return decode_signals(self.generate_codes(df), df.index)
 
-        # Ordem importa: sinais mais específicos sobrescrevem os genéricos
-        signals[r.valid_buy] = SignalType.BUY
-        signals[r.valid_sell] = SignalType.SELL
-        signals[r.valid_buy & r.is_strong] = SignalType.STRONG_BUY
-        signals[r.valid_sell & r.is_strong] = SignalType.STRONG_SELL
-        signals[r.contra_buy] = SignalType.CONTRA_BUY
-        signals[r.contra_sell] = SignalType.CONTRA_SELL
-
-        return signals
+    def generate_codes(self, df: pd.DataFrame) -> np.ndarray:
+        r = self._result
+        valid_buy = _mask(r.valid_buy)
+        valid_sell = _mask(r.valid_sell)
+        is_strong = _mask(r.is_strong)
+
+        # Ordem importa: sinais mais específicos (primeiros) têm prioridade
+        return np.select(
+            [
+                _mask(r.contra_sell),
+                _mask(r.contra_buy),
+                valid_sell & is_strong,
+                valid_buy & is_strong,
+                valid_sell,
+                valid_buy,
+            ],
+            [
+                SIGNAL_CODES[SignalType.CONTRA_SELL],
+                SIGNAL_CODES[SignalType.CONTRA_BUY],
+                SIGNAL_CODES[SignalType.STRONG_SELL],
+                SIGNAL_CODES[SignalType.STRONG_BUY],
+                SELL_CODE,
+                BUY_CODE,
+            ],
+            default=NONE_CODE,
+        ).astype(np.int8)
 
 
 # ─── Agregador Composto ────────────────────────────────────────────────────────
@@ -98,40 +164,51 @@ class CompositeSignalAggregator:
         self._strategies.append(strategy)
         return self
 
-    def aggregate(self, df: pd.DataFrame) -> pd.Series:
+    def aggregate(self, df: pd.DataFrame, as_codes: bool = False) -> pd.Series:
         """
         Combina todos os sinais conforme a regra configurada.
 
+        Args:
+            df: DataFrame usado para gerar os sinais de cada estratégia.
+            as_codes: Se True, retorna códigos int8 (ver SIGNAL_CODES) em vez
+                de objetos SignalType — mais barato para históricos longos.
+
         Returns:
-            Series com SignalType por candle.
+            Series com SignalType (ou código int8) por candle.
         """
         if not self._strategies:
             raise RuntimeError("Nenhuma estratégia adicionada ao agregador.")
 
-        all_signals = pd.DataFrame(
-            {i: s.generate(df) for i, s in enumerate(self._strategies)}
-        )
-
-        buy_types = {SignalType.BUY, SignalType.STRONG_BUY, SignalType.CONTRA_BUY}
-        sell_types = {SignalType.SELL, SignalType.STRONG_SELL, SignalType.CONTRA_SELL}
+        codes = np.column_stack([_strategy_codes(s, df) for s in self._strategies])
+        buy_count = np.isin(codes, _BUY_CODES).sum(axis=1)
+        sell_count = np.isin(codes, _SELL_CODES).sum(axis=1)
 
         n_strategies = len(self._strategies)
-        result = pd.Series(SignalType.NONE, index=df.index)
-
-        for idx in df.index:
-            row = all_signals.loc[idx]
-            buy_count = sum(1 for v in row if v in buy_types)
-            sell_count = sum(1 for v in row if v in sell_types)
-
-            if self.rule.require_agreement:
-                if buy_count == n_strategies:
-                    result[idx] = SignalType.BUY
-                elif sell_count == n_strategies:
-                    result[idx] = SignalType.SELL
-            else:
-                if buy_count >= self.rule.min_strategies:
-                    result[idx] = SignalType.BUY
-                elif sell_count >= self.rule.min_strategies:
-                    result[idx] = SignalType.SELL
-
-        return result
+        if self.rule.require_agreement:
+            is_buy = buy_count == n_strategies
+            is_sell = sell_count == n_strategies
+        else:
+            is_buy = buy_count >= self.rule.min_strategies
+            is_sell = sell_count >= self.rule.min_strategies
+
+        result = np.select(
+            [is_buy, is_sell], [BUY_CODE, SELL_CODE], default=NONE_CODE
+        ).astype(np.int8)
+
+        if as_codes:
+            return pd.Series(result, index=df.index)
+        return decode_signals(result, df.index)
+
+
+# ─── Helpers locais ────────────────────────────────────────────────────────────
+
+
+def _mask(series: pd.Series) -> np.ndarray:
+    return series.to_numpy(dtype=bool, na_value=False)
+
+
+def _strategy_codes(strategy: SignalStrategy, df: pd.DataFrame) -> np.ndarray:
+    generate_codes = getattr(strategy, "generate_codes", None)
+    if generate_codes is not None:
+        return np.asarray(generate_codes(df), dtype=np.int8)
+    return encode_signals(strategy.generate(df))
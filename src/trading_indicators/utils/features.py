@@ -0,0 +1,231 @@
+"""
+Grafo de features compartilhado entre indicadores.
+
+Lux e SMC calculam várias primitivas iguais sobre o mesmo frame OHLC
+(RSI, true range, extremos móveis...). `FeatureGraph` memoiza cada
+primitiva por (nome, coluna, parâmetros) para um único frame, de modo que
+indicadores diferentes que recebam o mesmo grafo calculem cada uma só uma vez.
+
+Uso explícito::
+
+    features = FeatureGraph(df)
+    lux = LuxSignalsOverlays().compute(df, features=features)
+    smc = SmartMoneyConfluence().compute(df, features=features)
+
+Quando os indicadores são chamados através de camadas que não repassam o
+grafo (adapters do stock_analyzer), `shared_features()` abre um escopo em
+que `compute()` reaproveita o grafo de qualquer frame com o mesmo conteúdo
+OHLC::
+
+    with shared_features():
+        lux_analyzer.generate_historical_signals(symbol, df)
+        smc_analyzer.generate_historical_signals(symbol, df)
+
+O escopo devolve um `FeatureScope`, com os acertos do grafo e o tempo de
+cálculo que eles pouparam::
+
+    with shared_features() as scope:
+        ...
+    scope.hits, scope.saved_seconds
+
+As Series retornadas são compartilhadas entre consumidores — trate-as como
+somente leitura.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from trading_indicators.utils import ta_primitives as ta
+
+
+class FeatureGraph:
+    """Memoiza primitivas de `ta_primitives` para um único frame OHLC."""
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.source = df
+        self.df = df.rename(columns=str.lower)
+        self._cache: dict[tuple[Hashable, ...], Any] = {}
+        # Tempo de cálculo de cada feature, creditado a cada reaproveitamento
+        self._seconds: dict[tuple[Hashable, ...], float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def matches(self, df: pd.DataFrame) -> bool:
+        """True se `df` tem o mesmo índice do frame do grafo."""
+        return len(df) == len(self.df) and (
+            df.index is self.df.index or df.index.equals(self.df.index)
+        )
+
+    def same_frame(self, df: pd.DataFrame) -> bool:
+        """True se `df` tem o mesmo índice e os mesmos valores OHLC do grafo."""
+        if df is self.source:
+            return True
+        if not self.matches(df):
+            return False
+        df = df.rename(columns=str.lower)
+        for col in ("open", "high", "low", "close"):
+            if (col in df.columns) != (col in self.df.columns):
+                return False
+            if col in df.columns and not np.array_equal(
+                df[col].to_numpy(), self.df[col].to_numpy(), equal_nan=True
+            ):
+                return False
+        return True
+
+    def get(self, key: tuple[Hashable, ...], factory: Callable[[], Any]) -> Any:
+        """Retorna a feature `key`, calculando-a via `factory` na primeira vez."""
+        if key in self._cache:
+            self.hits += 1
+            self.saved_seconds += self._seconds[key]
+            return self._cache[key]
+        self.misses += 1
+        started = time.perf_counter()
+        value = factory()
+        self._seconds[key] = time.perf_counter() - started
+        self._cache[key] = value
+        return value
+
+    # ── Primitivas ─────────────────────────────────────────────────────────────
+
+    def column(self, name: str) -> pd.Series:
+        return self.df[name]
+
+    def ema(self, column: str, length: int) -> pd.Series:
+        return self.get(
+            ("ema", column, length), lambda: ta.ema(self.column(column), length)
+        )
+
+    def sma(self, column: str, length: int) -> pd.Series:
+        return self.get(
+            ("sma", column, length), lambda: ta.sma(self.column(column), length)
+        )
+
+    def stdev(self, column: str, length: int) -> pd.Series:
+        return self.get(
+            ("stdev", column, length), lambda: ta.stdev(self.column(column), length)
+        )
+
+    def rsi(self, column: str, length: int) -> pd.Series:
+        return self.get(
+            ("rsi", column, length), lambda: ta.rsi(self.column(column), length)
+        )
+
+    def rolling_max(self, column: str, length: int) -> pd.Series:
+        return self.get(
+            ("rolling_max", column, length),
+            lambda: self.column(column).rolling(length).max(),
+        )
+
+    def rolling_min(self, column: str, length: int) -> pd.Series:
+        return self.get(
+            ("rolling_min", column, length),
+            lambda: self.column(column).rolling(length).min(),
+        )
+
+    def true_range(self) -> pd.Series:
+        return self.get(
+            ("true_range",),
+            lambda: ta.true_range(
+                self.column("high"), self.column("low"), self.column("close")
+            ),
+        )
+
+    def dmi(
+        self, di_length: int = 14, adx_length: int = 14
+    ) -> tuple[pd.Series, pd.Series, pd.Series]:
+        return self.get(
+            ("dmi", di_length, adx_length),
+            lambda: ta.dmi(
+                self.column("high"),
+                self.column("low"),
+                self.column("close"),
+                di_length=di_length,
+                adx_length=adx_length,
+                tr=self.true_range(),
+            ),
+        )
+
+    def supertrend(self, multiplier: float, length: int) -> tuple[pd.Series, pd.Series]:
+        return self.get(
+            ("supertrend", multiplier, length),
+            lambda: ta.supertrend(
+                self.column("high"),
+                self.column("low"),
+                self.column("close"),
+                multiplier,
+                length,
+                tr=self.true_range(),
+            ),
+        )
+
+    def pivot_high(self, left_bars: int, right_bars: int) -> pd.Series:
+        return self.get(
+            ("pivot_high", left_bars, right_bars),
+            lambda: ta.pivot_high(self.column("high"), left_bars, right_bars),
+        )
+
+    def pivot_low(self, left_bars: int, right_bars: int) -> pd.Series:
+        return self.get(
+            ("pivot_low", left_bars, right_bars),
+            lambda: ta.pivot_low(self.column("low"), left_bars, right_bars),
+        )
+
+
+# ─── Escopo compartilhado ──────────────────────────────────────────────────────
+
+_ACTIVE_SCOPE: ContextVar[list[FeatureGraph] | None] = ContextVar(
+    "trading_indicators_feature_scope", default=None
+)
+
+
+@dataclass
+class FeatureScope:
+    """Grafos criados num escopo de `shared_features()`."""
+
+    graphs: list[FeatureGraph] = field(default_factory=list)
+
+    @property
+    def hits(self) -> int:
+        return sum(graph.hits for graph in self.graphs)
+
+    @property
+    def misses(self) -> int:
+        return sum(graph.misses for graph in self.graphs)
+
+    @property
+    def saved_seconds(self) -> float:
+        return sum(graph.saved_seconds for graph in self.graphs)
+
+
+@contextmanager
+def shared_features() -> Iterator[FeatureScope]:
+    """Compartilha grafos de features entre `compute()` dentro do bloco."""
+    scope = FeatureScope()
+    token = _ACTIVE_SCOPE.set(scope.graphs)
+    try:
+        yield scope
+    finally:
+        _ACTIVE_SCOPE.reset(token)
+
+
+def resolve_features(df: pd.DataFrame) -> FeatureGraph:
+    """Grafo do escopo ativo para o conteúdo de `df`, ou um grafo novo."""
+    graphs = _ACTIVE_SCOPE.get()
+    if graphs is None:
+        return FeatureGraph(df)
+    for graph in graphs:
+        if graph.same_frame(df):
+            return graph
+    graph = FeatureGraph(df)
+    graphs.append(graph)
+    return graph
@@ -0,0 +1,258 @@
+"""
+Primitivas incrementais (streaming) para atualização barra a barra.
+
+Cada primitiva guarda apenas o estado mínimo para avançar uma barra em O(1)
+em relação ao tamanho do histórico e reproduz a mesma semântica das versões
+vetorizadas em `ta_primitives` (inclusive tratamento de NaN), para que
+`update()` acompanhe um recompute completo dentro de tolerância de ponto
+flutuante.
+
+Todos os estados são dataclasses de floats/ints/listas, serializáveis via
+`to_dict()` / `from_dict()` (compatível com JSON).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+from dataclasses import dataclass, field
+from typing import Any, TypeVar, get_type_hints
+
+NAN = float("nan")
+
+S = TypeVar("S", bound="StreamingState")
+
+
+# ─── Serialização ──────────────────────────────────────────────────────────────
+
+
+class StreamingState:
+    """Mixin de serialização para estados incrementais (dataclasses aninhadas)."""
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)  # type: ignore[call-overload]
+
+    @classmethod
+    def from_dict(cls: type[S], data: dict[str, Any]) -> S:
+        hints = get_type_hints(cls)
+        kwargs: dict[str, Any] = {}
+        for f in dataclasses.fields(cls):  # type: ignore[arg-type]
+            value = data[f.name]
+            hint = hints[f.name]
+            if isinstance(hint, type) and issubclass(hint, StreamingState):
+                value = hint.from_dict(value)
+            elif isinstance(value, list):
+                value = list(value)
+            kwargs[f.name] = value
+        return cls(**kwargs)
+
+
+# ─── Médias exponenciais ───────────────────────────────────────────────────────
+
+
+@dataclass
+class EwmState(StreamingState):
+    """
+    Estado de `Series.ewm(alpha=..., adjust=False).mean()`.
+
+    Replica a recursão do pandas: NaN na entrada não altera a média, mas
+    decai o peso do valor anterior (ignore_na=False).
+    """
+
+    alpha: float
+    mean: float = NAN
+    old_wt: float = 1.0
+
+    @classmethod
+    def from_span(cls, span: int) -> EwmState:
+        return cls(alpha=2 / (span + 1))
+
+    def update(self, value: float) -> float:
+        is_obs = not math.isnan(value)
+        if not math.isnan(self.mean):
+            self.old_wt *= 1 - self.alpha
+            if is_obs:
+                if self.mean != value:
+                    self.mean = (self.old_wt * self.mean + self.alpha * value) / (
+                        self.old_wt + self.alpha
+                    )
+                self.old_wt = 1.0
+        elif is_obs:
+            self.mean = value
+        return self.mean
+
+
+# ─── Janelas deslizantes ───────────────────────────────────────────────────────
+
+
+@dataclass
+class RollingWindow(StreamingState):
+    """Últimos `length` valores observados (mais antigo primeiro)."""
+
+    length: int
+    values: list[float] = field(default_factory=list)
+
+    def push(self, value: float) -> None:
+        self.values.append(value)
+        if len(self.values) > self.length:
+            del self.values[0]
+
+    def tail(self, size: int, offset: int = 0) -> list[float] | None:
+        """
+        `size` valores terminando `offset` posições antes do mais recente.
+        None quando ainda não há barras suficientes.
+        """
+        end = len(self.values) - offset
+        if size <= 0 or end - size < 0:
+            return None
+        return self.values[end - size : end]
+
+
+def window_max(values: list[float] | None) -> float:
+    """Máximo com semântica de `rolling(n).max()`: NaN se incompleta ou com NaN."""
+    if values is None or any(math.isnan(v) for v in values):
+        return NAN
+    return max(values)
+
+
+def window_min(values: list[float] | None) -> float:
+    if values is None or any(math.isnan(v) for v in values):
+        return NAN
+    return min(values)
+
+
+def window_mean(values: list[float] | None) -> float:
+    if values is None or any(math.isnan(v) for v in values):
+        return NAN
+    return math.fsum(values) / len(values)
+
+
+def window_std(values: list[float] | None) -> float:
+    """Desvio padrão populacional (ddof=0), como `ta_primitives.stdev`."""
+    mean = window_mean(values)
+    if math.isnan(mean):
+        return NAN
+    assert values is not None
+    return math.sqrt(math.fsum((v - mean) ** 2 for v in values) / len(values))
+
+
+def nan_max(*values: float) -> float:
+    """Máximo ignorando NaN (como `DataFrame.max(axis=1)`)."""
+    observed = [v for v in values if not math.isnan(v)]
+    return max(observed) if observed else NAN
+
+
+def nan_min(*values: float) -> float:
+    observed = [v for v in values if not math.isnan(v)]
+    return min(observed) if observed else NAN
+
+
+# ─── Indicadores compostos ─────────────────────────────────────────────────────
+
+
+def true_range(high: float, low: float, prev_close: float) -> float:
+    return nan_max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+@dataclass
+class RsiState(StreamingState):
+    """Estado incremental de `ta_primitives.rsi` (Wilder)."""
+
+    gain: EwmState
+    loss: EwmState
+
+    @classmethod
+    def create(cls, length: int) -> RsiState:
+        return cls(gain=EwmState(alpha=1 / length), loss=EwmState(alpha=1 / length))
+
+    def update(self, delta: float) -> float:
+        gain = max(delta, 0.0) if not math.isnan(delta) else NAN
+        loss = -min(delta, 0.0) if not math.isnan(delta) else NAN
+        avg_gain = self.gain.update(gain)
+        avg_loss = self.loss.update(loss)
+        if avg_loss == 0 or math.isnan(avg_loss) or math.isnan(avg_gain):
+            return NAN
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+@dataclass
+class DmiState(StreamingState):
+    """Estado incremental do ADX de `ta_primitives.dmi`."""
+
+    atr: EwmState
+    plus_dm: EwmState
+    minus_dm: EwmState
+    adx: EwmState
+
+    @classmethod
+    def create(cls, di_length: int = 14, adx_length: int = 14) -> DmiState:
+        return cls(
+            atr=EwmState(alpha=1 / di_length),
+            plus_dm=EwmState(alpha=1 / di_length),
+            minus_dm=EwmState(alpha=1 / di_length),
+            adx=EwmState(alpha=1 / adx_length),
+        )
+
+    def update(self, tr: float, up_move: float, down_move: float) -> float:
+        plus_dm = up_move if (up_move > down_move and up_move > 0) else 0.0
+        minus_dm = down_move if (down_move > up_move and down_move > 0) else 0.0
+
+        atr = self.atr.update(tr)
+        smooth_plus = self.plus_dm.update(plus_dm)
+        smooth_minus = self.minus_dm.update(minus_dm)
+
+        safe_atr = NAN if atr == 0 else atr
+        di_plus = 100 * smooth_plus / safe_atr
+        di_minus = 100 * smooth_minus / safe_atr
+        di_sum = di_plus + di_minus
+        if di_sum == 0 or math.isnan(di_sum):
+            dx = NAN
+        else:
+            dx = 100 * abs(di_plus - di_minus) / di_sum
+        return self.adx.update(dx)
+
+
+@dataclass
+class SupertrendState(StreamingState):
+    """Estado incremental de `ta_primitives.supertrend`."""
+
+    multiplier: float
+    atr: EwmState
+    final_upper: float = NAN
+    final_lower: float = NAN
+    direction: int = 1
+    started: bool = False
+
+    @classmethod
+    def create(cls, multiplier: float, length: int) -> SupertrendState:
+        return cls(multiplier=multiplier, atr=EwmState.from_span(length))
+
+    def update(
+        self, high: float, low: float, close: float, prev_close: float, tr: float
+    ) -> tuple[float, int]:
+        """Retorna (supertrend_line, direction) da nova barra."""
+        atr = self.atr.update(tr)
+        hl2 = (high + low) / 2
+        curr_upper = hl2 + self.multiplier * atr
+        curr_lower = hl2 - self.multiplier * atr
+
+        if not self.started:
+            self.started = True
+            self.final_upper = curr_upper
+            self.final_lower = curr_lower
+            return NAN, self.direction
+
+        prev_upper = self.final_upper
+        prev_lower = self.final_lower
+        if curr_upper < prev_upper or prev_close > prev_upper:
+            self.final_upper = curr_upper
+        if curr_lower > prev_lower or prev_close < prev_lower:
+            self.final_lower = curr_lower
+
+        if self.direction == 1 and close > self.final_upper:
+            self.direction = -1
+        elif self.direction == -1 and close < self.final_lower:
+            self.direction = 1
+
+        line = self.final_lower if self.direction == -1 else self.final_upper
+        return line, self.direction
@@ -7,6 +7,8 @@ com índices e facilitar composição.
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import pandas as pd
 
@@ -29,6 +31,16 @@ def stdev(series: pd.Series, length: int) -> pd.Series:
     return series.rolling(window=length).std(ddof=0)
 
 
+def ewm_warmup_bars(alpha: float, tolerance: float) -> int:
+    """
+    Barras até o peso do histórico descartado numa EWM (adjust=False)
+    ficar abaixo de `tolerance`, i.e. menor k com (1 - alpha)^k <= tolerance.
+    """
+    if not 0 < tolerance < 1:
+        raise ValueError(f"tolerance deve estar em (0, 1); recebeu {tolerance}.")
+    return math.ceil(math.log(tolerance) / math.log1p(-alpha))
+
+
 # ─── Osciladores ───────────────────────────────────────────────────────────────
 
 
@@ -54,14 +66,19 @@ def dmi(
     close: pd.Series,
     di_length: int = 14,
     adx_length: int = 14,
+    tr: pd.Series | None = None,
 ) -> tuple[pd.Series, pd.Series, pd.Series]:
     """
     Directional Movement Index.
 
+    Args:
+        tr: True range já calculado (opcional, evita recomputar).
+
     Returns:
         (DI+, DI-, ADX)
     """
-    tr = _true_range(high, low, close)
+    if tr is None:
+        tr = _true_range(high, low, close)
 
     up_move = high.diff()
     down_move = -low.diff()
@@ -93,61 +110,42 @@ def supertrend(
     close: pd.Series,
     multiplier: float = 3.0,
     length: int = 10,
+    tr: pd.Series | None = None,
 ) -> tuple[pd.Series, pd.Series]:
     """
     Supertrend.
 
+    Args:
+        tr: True range já calculado (opcional, evita recomputar).
+
     Returns:
         (supertrend_line, direction)  — direction: -1 bullish, +1 bearish
     """
     hl2 = (high + low) / 2
-    tr = _true_range(high, low, close)
+    if tr is None:
+        tr = _true_range(high, low, close)
     atr = tr.ewm(span=length, adjust=False).mean()
 
     upper_band = hl2 + multiplier * atr
     lower_band = hl2 - multiplier * atr
 
-    st = pd.Series(np.nan, index=close.index)
-    direction = pd.Series(1, index=close.index)
-
-    for i in range(1, len(close)):
-        prev_dir = direction.iloc[i - 1]
-        prev_close = close.iloc[i - 1]
-        curr_close = close.iloc[i]
-        curr_upper = upper_band.iloc[i]
-        curr_lower = lower_band.iloc[i]
+    st, direction = _supertrend_kernel(
+        close.to_numpy(dtype=float),
+        upper_band.to_numpy(dtype=float),
+        lower_band.to_numpy(dtype=float),
+    )
+    return (
+        pd.Series(st, index=close.index),
+        pd.Series(direction, index=close.index),
+    )
 
-        # Ajuste de bandas
-        final_upper = (
-            curr_upper
-            if (
-                curr_upper < upper_band.iloc[i - 1]
-                or prev_close > upper_band.iloc[i - 1]
-            )
-            else upper_band.iloc[i - 1]
-        )
-        final_lower = (
-            curr_lower
-            if (
-                curr_lower > lower_band.iloc[i - 1]
-                or prev_close < lower_band.iloc[i - 1]
-            )
-            else lower_band.iloc[i - 1]
-        )
-
-        upper_band.iloc[i] = final_upper
-        lower_band.iloc[i] = final_lower
 
-        if prev_dir == 1 and curr_close > final_upper:
-            direction.iloc[i] = -1
-        elif prev_dir == -1 and curr_close < final_lower:
-            direction.iloc[i] = 1
-        else:
-            direction.iloc[i] = prev_dir
+# ─── Volatilidade ──────────────────────────────────────────────────────────────
 
-        st.iloc[i] = final_lower if direction.iloc[i] == -1 else final_upper
 
-    return st, direction
+def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+    """True Range (maior entre high-low e gaps contra o fechamento anterior)."""
+    return _true_range(high, low, close)
 
 
 # ─── Pivôs ─────────────────────────────────────────────────────────────────────
@@ -159,30 +157,12 @@ def pivot_high(high: pd.Series, left_bars: int, right_bars: int) -> pd.Series:
     Retorna o valor do topo no índice do candle central; NaN nos demais.
     Semanticamente equivalente a ta.pivothigh() do Pine Script.
     """
-    result = pd.Series(np.nan, index=high.index)
-    n = len(high)
-    for i in range(left_bars, n - right_bars):
-        window = high.iloc[i - left_bars : i + right_bars + 1]
-        pivot_val = high.iloc[i]
-        if pivot_val == window.max():
-            # Emite no índice deslocado (como Pine faz com offset=-swingLen)
-            result.iloc[i] = pivot_val
-
-    return result
+    return _pivot(high, left_bars, right_bars, use_max=True)
 
 
 def pivot_low(low: pd.Series, left_bars: int, right_bars: int) -> pd.Series:
     """Detecta fundos de pivô."""
-    result = pd.Series(np.nan, index=low.index)
-    n = len(low)
-
-    for i in range(left_bars, n - right_bars):
-        window = low.iloc[i - left_bars : i + right_bars + 1]
-        pivot_val = low.iloc[i]
-        if pivot_val == window.min():
-            result.iloc[i] = pivot_val
-
-    return result
+    return _pivot(low, left_bars, right_bars, use_max=False)
 
 
 # ─── Helpers privados ──────────────────────────────────────────────────────────
@@ -199,3 +179,79 @@ def _true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
 def _wilder_smooth(series: pd.Series, length: int) -> pd.Series:
     """Wilder smoothing (EMA com alpha=1/length)."""
     return series.ewm(alpha=1 / length, adjust=False).mean()
+
+
+def _supertrend_kernel(
+    close: np.ndarray, upper: np.ndarray, lower: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Recursão de bandas/direção do Supertrend sobre arrays simples.
+
+    A recursão é inerentemente sequencial (cada banda final depende da
+    anterior), então o loop roda sobre listas Python — evita o custo de
+    `Series.iloc` por barra e mantém a mesma semântica de NaN (comparações
+    com NaN são falsas).
+    """
+    n = len(close)
+    closes = close.tolist()
+    uppers = upper.tolist()
+    lowers = lower.tolist()
+    st = [np.nan] * n
+    direction = [1] * n
+
+    prev_upper = uppers[0] if n else np.nan
+    prev_lower = lowers[0] if n else np.nan
+    prev_dir = 1
+    for i in range(1, n):
+        prev_close = closes[i - 1]
+        curr_close = closes[i]
+        curr_upper = uppers[i]
+        curr_lower = lowers[i]
+
+        # Ajuste de bandas
+        if curr_upper < prev_upper or prev_close > prev_upper:
+            final_upper = curr_upper
+        else:
+            final_upper = prev_upper
+        if curr_lower > prev_lower or prev_close < prev_lower:
+            final_lower = curr_lower
+        else:
+            final_lower = prev_lower
+
+        if prev_dir == 1 and curr_close > final_upper:
+            curr_dir = -1
+        elif prev_dir == -1 and curr_close < final_lower:
+            curr_dir = 1
+        else:
+            curr_dir = prev_dir
+
+        direction[i] = curr_dir
+        st[i] = final_lower if curr_dir == -1 else final_upper
+
+        prev_upper = final_upper
+        prev_lower = final_lower
+        prev_dir = curr_dir
+
+    return np.asarray(st, dtype=float), np.asarray(direction, dtype=np.int64)
+
+
+def _pivot(
+    series: pd.Series, left_bars: int, right_bars: int, use_max: bool
+) -> pd.Series:
+    """
+    Pivô via extremo de janela centrada [i - left_bars, i + right_bars].
+
+    Empates contam como pivô (o candle central só precisa igualar o extremo
+    da janela) e NaN dentro da janela é ignorado, como em `Series.max()`.
+    Barras sem janela completa (bordas) ficam NaN.
+    """
+    values = series.astype(float)
+    window = left_bars + right_bars + 1
+    rolling = values.rolling(window, min_periods=1)
+    extreme = (rolling.max() if use_max else rolling.min()).shift(-right_bars)
+
+    positions = np.arange(len(values))
+    in_range = (positions >= left_bars) & (positions < len(values) - right_bars)
+    is_pivot = in_range & (values == extreme).to_numpy()
+
+    return pd.Series(np.where(is_pivot, values.to_numpy(), np.nan), index=series.index)
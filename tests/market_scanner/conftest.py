@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def fuzz_histories():
+    """Factory of random Lux/SMC history pairs: fuzz_histories(rows, seed).
+
+    Values cluster on the scanner's rule thresholds and include NaNs, so
+    every branch of the event and decision rules gets exercised.
+    """
+
+    def make(rows: int, seed: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+        rng = np.random.default_rng(seed)
+        dates = pd.date_range("2024-01-01", periods=rows, freq="D", tz="UTC")
+
+        def pick(*values):
+            return rng.choice(np.array(values, dtype=object), rows)
+
+        def around(thresholds, low, high):
+            # Mostly uniform values, some exactly on rule thresholds, some NaN
+            values = rng.uniform(low, high, rows)
+            on_threshold = rng.random(rows) < 0.3
+            values[on_threshold] = rng.choice(thresholds, on_threshold.sum())
+            values[rng.random(rows) < 0.05] = np.nan
+            return values
+
+        lux = pd.DataFrame(
+            {
+                "date": dates,
+                "close": rng.uniform(10, 20, rows),
+                "trend": pick("BULLISH", "BEARISH"),
+                "strength": pick("STRONG", "NORMAL"),
+                "adx": np.where(
+                    rng.random(rows) < 0.1, np.nan, rng.uniform(5, 50, rows)
+                ),
+                "confirmation_signal": rng.integers(-1, 2, rows),
+                "contrarian_signal": rng.integers(-1, 2, rows),
+                "combined_signal": rng.integers(-1, 2, rows),
+                "signal_context": pick(
+                    "trend_confirmation_buy",
+                    "trend_confirmation_sell",
+                    "contrarian_reversal_buy",
+                    "contrarian_reversal_sell",
+                    "no_trade",
+                    "no_trade",
+                ),
+                "options_hint": pick("CALL", "PUT", "NO_TRADE", "NO_TRADE"),
+            }
+        )
+        smc = pd.DataFrame(
+            {
+                "date": dates,
+                "close": lux["close"],
+                "rsi": around([35, 40, 45, 60, 65], 20, 80),
+                "range_position_pct": around([15, 20, 30, 35, 65, 70, 75, 80], 0, 100),
+                "combined_signal": rng.integers(-1, 2, rows),
+                "signal_bias": pick("BULLISH", "BEARISH", "NEUTRAL"),
+                "signal_context": pick(
+                    "bullish_confluence",
+                    "bearish_confluence",
+                    "short_term_bullish_reversal",
+                    "short_term_bearish_reversal",
+                    "discount_watch",
+                    "premium_watch",
+                    "swing_low_watch",
+                    "swing_high_watch",
+                    "no_trade",
+                    "no_trade",
+                ),
+                "options_hint": pick(
+                    "CALL", "PUT", "CALL_WATCH", "PUT_WATCH", "NO_TRADE"
+                ),
+            }
+        )
+        for flag in (
+            "swing_high_marker",
+            "swing_low_marker",
+            "in_premium",
+            "in_discount",
+            "bullish_rejection",
+            "bearish_rejection",
+            "long_signal",
+            "short_signal",
+        ):
+            smc[flag] = rng.random(rows) < 0.2
+        return lux, smc
+
+    return make
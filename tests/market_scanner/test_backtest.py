@@ -1,8 +1,11 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from market_scanner.backtest import (
     BacktestProfiler,
+    FeatureGraphSavings,
+    ForwardMetricsTable,
     build_backtest_event,
     compute_forward_metrics,
     generate_symbol_events,
@@ -200,6 +203,67 @@ def test_compute_forward_metrics_calculates_mfe_and_mae_by_direction():
     assert bearish["mae_3"] == pytest.approx(-0.04)
 
 
+def _scalar_forward_metrics(df, index, horizons, direction, win_threshold):
+    # Per-bar reference: the iloc-window computation ForwardMetricsTable replaced
+    entry_close = float(df.iloc[index]["Close"])
+    metrics = {"entry_close": entry_close}
+    for horizon in horizons:
+        raw_return = (float(df.iloc[index + horizon]["Close"]) / entry_close) - 1.0
+        window = df.iloc[index : index + horizon + 1]
+        high = float(window["High"].max())
+        low = float(window["Low"].min())
+        if direction == "bullish":
+            directional, mfe, mae = (
+                raw_return,
+                high / entry_close - 1.0,
+                low / entry_close - 1.0,
+            )
+        elif direction == "bearish":
+            directional, mfe, mae = (
+                -raw_return,
+                1.0 - low / entry_close,
+                1.0 - high / entry_close,
+            )
+        else:
+            directional = mfe = mae = None
+        metrics[f"return_{horizon}"] = raw_return
+        metrics[f"directional_return_{horizon}"] = directional
+        metrics[f"mfe_{horizon}"] = mfe
+        metrics[f"mae_{horizon}"] = mae
+        metrics[f"win_{horizon}"] = (
+            None if directional is None else directional > win_threshold
+        )
+    return metrics
+
+
+def test_forward_metrics_table_matches_per_bar_computation_exactly():
+    rng = np.random.default_rng(3)
+    closes = list(100 * np.exp(np.cumsum(rng.normal(0, 0.02, 80))))
+    df = make_ohlc_df(
+        closes=closes,
+        highs=[close * 1.01 for close in closes],
+        lows=[close * 0.99 for close in closes],
+    )
+    df.iloc[[10, 11, 40], df.columns.get_loc("High")] = np.nan
+    df.iloc[[12], df.columns.get_loc("Low")] = np.nan
+    df.iloc[[30], df.columns.get_loc("Close")] = np.nan
+    horizons = [1, 3, 5, 20]
+    table = ForwardMetricsTable.from_df(df, horizons)
+
+    for index in range(len(df) - max(horizons)):
+        for direction in ("bullish", "bearish", "neutral"):
+            expected = _scalar_forward_metrics(df, index, horizons, direction, 0.01)
+            actual = table.metrics(index, horizons, direction, 0.01)
+            assert actual.keys() == expected.keys()
+            for key, value in expected.items():
+                if isinstance(value, float) and np.isnan(value):
+                    assert np.isnan(actual[key]), key
+                else:
+                    assert actual[key] == value and type(actual[key]) is type(value), (
+                        key
+                    )
+
+
 def test_build_backtest_event_contains_expected_schema():
     df = make_ohlc_df(
         closes=[100, 101, 102, 103],
@@ -770,6 +834,7 @@ def test_generate_symbol_events_profiles_timings(monkeypatch):
     assert "build_scanner_row" in timings
     assert "forward_metrics" in timings
     assert "per_bar_loop" in timings
+    assert profiler.feature_graph.symbols == 1
 
 
 def test_render_profile_report_lists_timings():
@@ -783,6 +848,15 @@ def test_render_profile_report_lists_timings():
     assert "forward_metrics: 0.500s" in report
 
 
+def test_render_profile_report_lists_feature_graph_savings():
+    savings = FeatureGraphSavings(symbols=4, hits=20, saved_seconds=0.2)
+
+    report = render_profile_report({"forward_metrics": 0.5}, savings)
+
+    assert "total measured time: 0.500s" in report
+    assert "feature_graph: 20 reused primitives, 0.200s saved (50.0ms/symbol)" in report
+
+
 def test_render_decision_summary_uses_directional_metrics_not_avg_return():
     summary_df = pd.DataFrame(
         [
@@ -824,3 +898,41 @@ def test_render_decision_summary_uses_directional_metrics_not_avg_return():
     assert "avg_directional_return=+2.1%" in rendered
     assert "avg_return" not in rendered
     assert "neutral" not in rendered.lower()
+
+
+def test_backtest_worker_reads_frame_from_shared_store(monkeypatch):
+    import pickle
+
+    from market_scanner.backtest import _backtest_symbol_worker, _BacktestSymbolArgs
+    from market_scanner.pipeline import SymbolData, shared_price_store
+
+    df = prepare_backtest_df(
+        df=make_ohlc_df(closes=[100] * 30, highs=[101] * 30, lows=[99] * 30)
+    )
+    rows = [SymbolData("AAPL", 1e9, df.copy(), None)]
+    received = {}
+
+    def fake_generate_symbol_events(*, symbol, df, **kwargs):
+        received[symbol] = df
+        return [{"symbol": symbol}]
+
+    monkeypatch.setattr(
+        "market_scanner.backtest.generate_symbol_events", fake_generate_symbol_events
+    )
+    with shared_price_store(rows) as shared_rows:
+        [(store_dir, _)] = list(shared_rows)
+        args = _BacktestSymbolArgs(
+            symbol="AAPL",
+            store_dir=store_dir,
+            ranking_modes=["snapshot"],
+            min_bars=1,
+            horizons=[3],
+            win_threshold=0.01,
+            start_date=None,
+            max_bars=None,
+        )
+        assert len(pickle.dumps(args)) < 1024
+        assert _backtest_symbol_worker(args) == [{"symbol": "AAPL"}]
+        pd.testing.assert_frame_equal(received["AAPL"], df, check_freq=False)
+
+    assert rows[0].df is None
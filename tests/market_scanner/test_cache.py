@@ -2,7 +2,13 @@ import os
 
 import pandas as pd
 
-from market_scanner.cache import CachedAnalyzer, get_or_compute_historical
+from market_scanner.cache import (
+    CachedAnalyzer,
+    cache_stats,
+    get_or_compute_historical,
+    main,
+    prune_cache,
+)
 
 
 def _make_df() -> pd.DataFrame:
@@ -81,7 +87,7 @@ def test_cache_hit_skips_computation(tmp_path):
     pd.testing.assert_frame_equal(result, analyzer._result)
 
 
-def test_cache_invalidated_on_mtime_change(tmp_path):
+def test_cache_reuses_history_when_only_mtime_changes(tmp_path):
     csv_path = tmp_path / "AAPL.csv"
     _write_fake_csv(csv_path)
     cache_dir = tmp_path / "cache"
@@ -103,8 +109,8 @@ def test_cache_invalidated_on_mtime_change(tmp_path):
     new_mtime = csv_path.stat().st_mtime + 2.0
     os.utime(csv_path, (new_mtime, new_mtime))
 
-    # Second call — mtime changed, cache key is different, must recompute
-    get_or_compute_historical(
+    # Second call — new cache key, but the prices are the same
+    result = get_or_compute_historical(
         analyzer=analyzer,
         symbol="AAPL",
         df=df,
@@ -112,7 +118,134 @@ def test_cache_invalidated_on_mtime_change(tmp_path):
         cache_dir=cache_dir,
         model_name="lux",
     )
-    assert analyzer.calls == 2
+    assert analyzer.calls == 1
+    pd.testing.assert_frame_equal(result, analyzer._result)
+    assert len(list((cache_dir / "lux").glob("*.pkl"))) == 2
+
+
+class ExtendingAnalyzer:
+    """History = prices + 1; records how each call was answered."""
+
+    def __init__(self):
+        self.full_rows = []
+        self.extended = []
+
+    def generate_historical_signals(self, symbol, df):
+        self.full_rows.append(len(df))
+        return df + 1
+
+    def extend_historical_signals(self, symbol, df, historical):
+        self.extended.append((len(historical), len(df)))
+        return pd.concat([historical, df.iloc[len(historical) :] + 1])
+
+
+def _update_prices(csv_path, df, analyzer, cache_dir):
+    # A new mtime gives a new cache key, as a daily CSV update does
+    stat = csv_path.stat()
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    return get_or_compute_historical(
+        analyzer=analyzer,
+        symbol="AAPL",
+        df=df,
+        csv_path=csv_path,
+        cache_dir=cache_dir,
+        model_name="lux",
+    )
+
+
+def test_cache_extends_history_when_bars_are_appended(tmp_path):
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    cache_dir = tmp_path / "cache"
+    analyzer = ExtendingAnalyzer()
+    prices = pd.DataFrame(
+        {"Close": [10.0, 11.0, 12.0, 13.0, 14.0]},
+        index=pd.date_range("2024-01-01", periods=5, name="Date"),
+    )
+
+    _update_prices(csv_path, prices.iloc[:3], analyzer, cache_dir)
+    result = _update_prices(csv_path, prices.iloc[:4], analyzer, cache_dir)
+    result = _update_prices(csv_path, prices, analyzer, cache_dir)
+
+    assert analyzer.full_rows == [3]
+    assert analyzer.extended == [(3, 4), (4, 5)]
+    pd.testing.assert_frame_equal(result, prices + 1)
+
+
+def test_cache_recomputes_when_earlier_bars_change(tmp_path):
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    cache_dir = tmp_path / "cache"
+    analyzer = ExtendingAnalyzer()
+    prices = pd.DataFrame(
+        {"Close": [10.0, 11.0, 12.0, 13.0]},
+        index=pd.date_range("2024-01-01", periods=4, name="Date"),
+    )
+    _update_prices(csv_path, prices.iloc[:3], analyzer, cache_dir)
+
+    # Adjusted history: an earlier close changed as well as a bar appended
+    adjusted = prices.copy()
+    adjusted.iloc[0, 0] = 9.5
+    result = _update_prices(csv_path, adjusted, analyzer, cache_dir)
+
+    assert analyzer.full_rows == [3, 4]
+    assert analyzer.extended == []
+    pd.testing.assert_frame_equal(result, adjusted + 1)
+
+
+def test_cache_entry_is_not_reused_for_other_prices_under_the_same_key(tmp_path):
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    analyzer = ExtendingAnalyzer()
+    prices = pd.DataFrame({"Close": [10.0, 11.0, 12.0]})
+    kwargs = {
+        "analyzer": analyzer,
+        "symbol": "AAPL",
+        "csv_path": csv_path,
+        "cache_dir": tmp_path / "cache",
+        "model_name": "lux",
+    }
+
+    # e.g. a scan over an analysis window, then a backtest over the full file
+    get_or_compute_historical(df=prices.tail(2), **kwargs)
+    result = get_or_compute_historical(df=prices, **kwargs)
+
+    assert analyzer.full_rows == [2, 3]
+    pd.testing.assert_frame_equal(result, prices + 1)
+
+
+def test_cache_extension_with_real_analyzers_matches_full_history(tmp_path):
+    import numpy as np
+
+    from stock_analyzer.analyzer import StockDataAnalyzer
+
+    rng = np.random.default_rng(11)
+    rows = 2200
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+    spread = close * rng.uniform(0.002, 0.02, rows)
+    prices = pd.DataFrame(
+        {
+            "Open": close * (1 + rng.normal(0, 0.003, rows)),
+            "High": close + spread,
+            "Low": close - spread,
+            "Close": close,
+        },
+        index=pd.date_range("2015-01-01", periods=rows, freq="B", name="Date"),
+    )
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+
+    for model in ("lux", "smc"):
+        analyzer = StockDataAnalyzer(signal_model=model)
+        _update_prices(csv_path, prices.iloc[:-3], analyzer, tmp_path / "cache")
+        extended = _update_prices(csv_path, prices, analyzer, tmp_path / "cache")
+        full = analyzer.generate_historical_signals("AAPL", prices)
+
+        floats = [column for column in full if full[column].dtype.kind == "f"]
+        pd.testing.assert_frame_equal(
+            extended.drop(columns=floats), full.drop(columns=floats)
+        )
+        pd.testing.assert_frame_equal(extended[floats], full[floats], rtol=1e-5)
 
 
 def test_corrupt_cache_falls_back_silently(tmp_path):
@@ -123,9 +256,11 @@ def test_corrupt_cache_falls_back_silently(tmp_path):
     df = _make_df()
 
     # Pre-populate with garbage bytes at the expected cache path
-    from market_scanner.cache import _cache_key
+    from market_scanner.cache import _cache_key, _model_key
 
-    key = _cache_key("AAPL", csv_path)
+    key = _cache_key(
+        "AAPL", csv_path, model_key=_model_key(analyzer), span=f"{len(df)}r0"
+    )
     pkl_dir = cache_dir / "lux"
     pkl_dir.mkdir(parents=True, exist_ok=True)
     corrupt_path = pkl_dir / f"{key}.pkl"
@@ -212,3 +347,251 @@ def test_cached_analyzer_wraps_both_methods(tmp_path):
     result2 = cached.generate_historical_signals("AAPL", df)
     assert inner.calls == 1
     pd.testing.assert_frame_equal(result1, result2)
+
+
+def test_cached_analyzer_derives_signal_from_history(tmp_path):
+    class HistoryAwareAnalyzer(CountingAnalyzer):
+        def generate_signal_from_history(self, symbol, historical):
+            return {"signal": "bullish", "rows": len(historical)}
+
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    inner = HistoryAwareAnalyzer()
+    cached = CachedAnalyzer(
+        inner, csv_path=csv_path, cache_dir=tmp_path / "cache", model_name="lux"
+    )
+
+    historical = cached.generate_historical_signals("AAPL", _make_df())
+    sig = cached.generate_signal_from_history("AAPL", historical)
+
+    assert sig == {"signal": "bullish", "rows": 3}
+    assert inner.calls == 1
+
+
+def test_cache_survives_identical_rewrite_through_manifest(tmp_path):
+    from stock_data_manager.implementations.csv_writer import CSVWriter
+
+    csv_path = tmp_path / "AAPL.csv"
+    prices = pd.DataFrame(
+        {"Close": [100.0, 101.0]}, index=pd.to_datetime(["2024-01-01", "2024-01-02"])
+    )
+    writer = CSVWriter(manifest=True)
+    writer.write(prices, csv_path)
+    analyzer = CountingAnalyzer()
+    cache_dir = tmp_path / "cache"
+    kwargs = {
+        "analyzer": analyzer,
+        "symbol": "AAPL",
+        "df": _make_df(),
+        "csv_path": csv_path,
+        "cache_dir": cache_dir,
+        "model_name": "lux",
+    }
+    get_or_compute_historical(**kwargs)
+
+    # Full rewrite with the same content: new mtime, same manifest hash
+    new_mtime = csv_path.stat().st_mtime + 2.0
+    os.utime(csv_path, (new_mtime, new_mtime))
+    writer.write(prices, csv_path)
+    get_or_compute_historical(**kwargs)
+
+    assert analyzer.calls == 1
+
+
+def test_iter_symbol_data_exposes_manifest_fingerprint(tmp_path):
+    from market_scanner.pipeline import iter_symbol_data
+    from stock_data_manager.implementations.csv_writer import CSVWriter
+    from stock_data_manager.repositories.manifest import file_content_hash
+
+    prices = pd.DataFrame(
+        {"Close": [100.0]}, index=pd.DatetimeIndex(["2024-01-01"], name="Date")
+    )
+    CSVWriter(manifest=True).write(prices, tmp_path / "AAPL.csv")
+    prices.to_csv(tmp_path / "MSFT.csv")
+    universe = pd.DataFrame({"symbol": ["AAPL", "MSFT"], "market_cap": [1e9, 1e9]})
+
+    rows = {sd.symbol: sd for sd in iter_symbol_data(universe, tmp_path)}
+
+    assert rows["AAPL"].load_error is None
+    assert rows["AAPL"].fingerprint == file_content_hash(tmp_path / "AAPL.csv")
+    assert rows["MSFT"].fingerprint is None
+
+
+def test_compact_frames_use_separate_cache_entries(tmp_path):
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    cache_dir = tmp_path / "cache"
+    analyzer = CountingAnalyzer()
+    df = pd.DataFrame({"Close": [1.0, 2.0, 3.0]})
+
+    for frame in (df, df.astype("float32"), df):
+        get_or_compute_historical(
+            analyzer=analyzer,
+            symbol="AAPL",
+            df=frame,
+            csv_path=csv_path,
+            cache_dir=cache_dir,
+            model_name="lux",
+        )
+
+    assert analyzer.calls == 2
+    assert len(list((cache_dir / "lux_float32").glob("*.pkl"))) == 1
+
+
+def test_cache_keys_on_model_config():
+    from market_scanner.cache import _model_key
+    from stock_analyzer.analyzer import StockDataAnalyzer
+    from trading_indicators.indicators.lux import LuxConfig
+
+    default = StockDataAnalyzer(signal_model="lux")
+    tuned = StockDataAnalyzer(signal_model="lux")
+    tuned.signal_generator.config = LuxConfig(sensitivity=21)
+
+    assert _model_key(default) == _model_key(StockDataAnalyzer(signal_model="lux"))
+    assert _model_key(default) != _model_key(tuned)
+    assert _model_key(default) != _model_key(StockDataAnalyzer(signal_model="smc"))
+
+
+def test_cache_keys_on_code_version(tmp_path, monkeypatch):
+    from market_scanner import cache
+
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    analyzer = CountingAnalyzer()
+    kwargs = {
+        "analyzer": analyzer,
+        "symbol": "AAPL",
+        "df": _make_df(),
+        "csv_path": csv_path,
+        "cache_dir": tmp_path / "cache",
+        "model_name": "lux",
+    }
+
+    get_or_compute_historical(**kwargs)
+    monkeypatch.setattr(cache, "CACHE_FORMAT_VERSION", cache.CACHE_FORMAT_VERSION + 1)
+    get_or_compute_historical(**kwargs)
+
+    # Histories of other code versions are neither hit nor extended
+    assert analyzer.calls == 2
+    assert len(list((tmp_path / "cache" / "lux").glob("*.pkl"))) == 2
+
+
+def _write_entry(path, size, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def test_prune_evicts_least_recently_used_entries(tmp_path):
+    cache_dir = tmp_path / "cache"
+    _write_entry(cache_dir / "lux" / "old.pkl", 400_000, 1_000)
+    _write_entry(cache_dir / "smc" / "middle.pkl", 400_000, 2_000)
+    _write_entry(cache_dir / "lux" / "new.pkl", 400_000, 3_000)
+    (cache_dir / "lux" / "AAPL_x.latest").write_text("new.pkl")
+
+    result = prune_cache(cache_dir, max_mb=1.0)
+
+    assert (result.removed, result.freed_bytes, result.remaining_bytes) == (
+        1,
+        400_000,
+        800_000,
+    )
+    assert sorted(path.name for path in cache_dir.rglob("*.pkl")) == [
+        "middle.pkl",
+        "new.pkl",
+    ]
+    assert (cache_dir / "lux" / "AAPL_x.latest").exists()
+
+
+def test_cache_hit_marks_entry_as_recently_used(tmp_path):
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    cache_dir = tmp_path / "cache"
+    analyzer = CountingAnalyzer()
+    kwargs = {
+        "analyzer": analyzer,
+        "df": _make_df(),
+        "csv_path": csv_path,
+        "cache_dir": cache_dir,
+        "model_name": "lux",
+    }
+    get_or_compute_historical(symbol="AAPL", **kwargs)
+    get_or_compute_historical(symbol="MSFT", **kwargs)
+    entries = {
+        path.name.split("_")[0]: path for path in (cache_dir / "lux").glob("*.pkl")
+    }
+    for path in entries.values():
+        os.utime(path, (1_000, 1_000))
+
+    get_or_compute_historical(symbol="AAPL", **kwargs)
+    size = entries["AAPL"].stat().st_size
+    prune_cache(cache_dir, max_mb=size / (1024 * 1024))
+
+    assert entries["AAPL"].exists()
+    assert not entries["MSFT"].exists()
+
+
+def test_cache_stats_report_hit_rate_and_bytes(tmp_path):
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    cache_dir = tmp_path / "cache"
+    analyzer = CountingAnalyzer()
+    for _ in range(3):
+        get_or_compute_historical(
+            analyzer=analyzer,
+            symbol="AAPL",
+            df=_make_df(),
+            csv_path=csv_path,
+            cache_dir=cache_dir,
+            model_name="lux",
+        )
+
+    stats = cache_stats(cache_dir)
+
+    assert stats.entries == {"lux": 1}
+    assert stats.total_bytes == next((cache_dir / "lux").glob("*.pkl")).stat().st_size
+    assert stats.lookups["lux"] == {"computed": 1, "hit": 2}
+    assert stats.hit_rate() == 2 / 3
+
+    # Compaction keeps the counts
+    prune_cache(cache_dir, max_mb=100)
+    assert cache_stats(cache_dir).lookups == stats.lookups
+    assert len((cache_dir / "stats.log").read_text().splitlines()) == 2
+
+
+def test_cache_cli_stats_and_prune(tmp_path, capsys):
+    cache_dir = tmp_path / "cache"
+    _write_entry(cache_dir / "lux" / "old.pkl", 1000, 1_000)
+    _write_entry(cache_dir / "lux" / "new.pkl", 1000, 2_000)
+
+    assert main(["stats", "--cache-dir", str(cache_dir)]) == 0
+    assert "lux: 2 entries" in capsys.readouterr().out
+
+    assert main(["prune", "--cache-dir", str(cache_dir), "--max-mb", "0.001"]) == 0
+    assert "removed 1 entries" in capsys.readouterr().out
+    assert [path.name for path in (cache_dir / "lux").glob("*.pkl")] == ["new.pkl"]
+
+
+def test_window_and_full_history_keep_separate_entries(tmp_path):
+    csv_path = tmp_path / "AAPL.csv"
+    _write_fake_csv(csv_path)
+    analyzer = CountingAnalyzer()
+    prices = pd.DataFrame(
+        {"Close": [1.0, 2.0, 3.0, 4.0]},
+        index=pd.date_range("2024-01-01", periods=4, freq="D"),
+    )
+    kwargs = {
+        "analyzer": analyzer,
+        "symbol": "AAPL",
+        "csv_path": csv_path,
+        "cache_dir": tmp_path / "cache",
+        "model_name": "lux",
+    }
+
+    # Alternating scan (analysis-window tail) and backtest (full file) runs
+    for _ in range(3):
+        get_or_compute_historical(df=prices.tail(2), **kwargs)
+        get_or_compute_historical(df=prices, **kwargs)
+
+    assert analyzer.calls == 2
+    assert cache_stats(tmp_path / "cache").lookups["lux"] == {"computed": 2, "hit": 4}
@@ -1,9 +1,14 @@
+import numpy as np
 import pandas as pd
+import pytest
 
 from market_scanner.eligibility import (
     calculate_avg_dollar_volume_20,
     calculate_avg_volume_20,
+    compact_price_frame,
     evaluate_symbol_eligibility,
+    load_symbol_csv,
+    load_symbol_csv_tail,
 )
 
 
@@ -106,3 +111,133 @@ def test_evaluate_symbol_eligibility_accepts_valid_symbol():
     assert result.excluded_reason is None
     assert result.avg_volume_20 == 2_000_000.0
     assert result.avg_dollar_volume_20 == 21_000_000.0
+
+
+def write_price_csv(path, rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "Open": rng.uniform(10, 20, rows),
+            "High": rng.uniform(20, 30, rows),
+            "Low": rng.uniform(5, 10, rows),
+            "Close": rng.uniform(10, 20, rows),
+            "Volume": rng.integers(1_000, 1_000_000, rows),
+        },
+        index=pd.date_range(
+            "2015-01-01", periods=rows, freq="B", tz="America/New_York", name="Date"
+        ),
+    )
+    df.to_csv(path)
+    return df
+
+
+@pytest.mark.parametrize("rows", [1, 5, 200, 2000, 5000])
+def test_load_symbol_csv_tail_matches_full_load_tail(tmp_path, rows):
+    write_price_csv(tmp_path / "AAPL.csv", 2520)
+
+    tail = load_symbol_csv_tail(tmp_path, "AAPL", rows)
+
+    pd.testing.assert_frame_equal(tail, load_symbol_csv(tmp_path, "AAPL").tail(rows))
+
+
+def test_load_symbol_csv_tail_falls_back_for_unsorted_file(tmp_path):
+    df = write_price_csv(tmp_path / "AAPL.csv", 50)
+    df.iloc[::-1].to_csv(tmp_path / "AAPL.csv")
+
+    tail = load_symbol_csv_tail(tmp_path, "AAPL", 10)
+
+    pd.testing.assert_frame_equal(tail, load_symbol_csv(tmp_path, "AAPL").tail(10))
+    assert tail.index[-1] == df.index[-1]
+
+
+def test_load_symbol_csv_tail_falls_back_when_dates_do_not_parse(tmp_path):
+    write_price_csv(tmp_path / "AAPL.csv", 50)
+    with open(tmp_path / "AAPL.csv", "a") as f:
+        f.write("garbage,1,2,3,4,5\n")
+
+    tail = load_symbol_csv_tail(tmp_path, "AAPL", 10)
+
+    pd.testing.assert_frame_equal(tail, load_symbol_csv(tmp_path, "AAPL").tail(10))
+
+
+def test_load_symbol_csv_tail_rejects_non_positive_rows(tmp_path):
+    write_price_csv(tmp_path / "AAPL.csv", 5)
+
+    with pytest.raises(ValueError):
+        load_symbol_csv_tail(tmp_path, "AAPL", 0)
+
+
+def make_random_walk_df(rows: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+    open_ = close * (1 + rng.normal(0, 0.005, rows))
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, rows)),
+            "Low": np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, rows)),
+            "Close": close,
+            "Volume": rng.integers(100_000, 5_000_000, rows).astype(float),
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=pd.date_range(
+            "2020-01-01", periods=rows, freq="B", tz="UTC", name="Date"
+        ),
+    )
+
+
+def test_compact_price_frame_narrows_dtypes_and_drops_unused_actions():
+    df = make_random_walk_df(50)
+
+    compact = compact_price_frame(df)
+
+    assert list(compact.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert (compact[["Open", "High", "Low", "Close"]].dtypes == np.float32).all()
+    assert compact["Volume"].dtype == np.int64
+    assert compact.index.equals(df.index)
+    assert (
+        compact.memory_usage(index=False).sum() < df.memory_usage(index=False).sum() / 2
+    )
+
+
+def test_compact_price_frame_keeps_dividends_and_fractional_volume():
+    df = make_random_walk_df(5)
+    df.loc[df.index[2], "Dividends"] = 0.25
+    df.loc[df.index[3], "Volume"] = np.nan
+
+    compact = compact_price_frame(df)
+
+    assert compact["Dividends"].dtype == np.float32
+    assert compact["Dividends"].iloc[2] == pytest.approx(0.25)
+    assert "Stock Splits" not in compact.columns
+    assert compact["Volume"].dtype == np.float64
+
+
+@pytest.mark.parametrize("signal_model", ["lux", "smc"])
+def test_compact_price_frame_keeps_indicator_outputs_within_tolerance(signal_model):
+    from stock_analyzer.analyzer import StockDataAnalyzer
+
+    df = make_random_walk_df(600)
+    analyzer = StockDataAnalyzer(signal_model=signal_model)
+
+    expected = analyzer.generate_historical_signals("TEST", df)
+    actual = analyzer.generate_historical_signals("TEST", compact_price_frame(df))
+
+    assert list(actual.columns) == list(expected.columns)
+    assert actual.index.equals(expected.index)
+    for column in expected.columns:
+        if pd.api.types.is_numeric_dtype(
+            expected[column]
+        ) and not pd.api.types.is_bool_dtype(expected[column]):
+            np.testing.assert_allclose(
+                actual[column].to_numpy(dtype=float),
+                expected[column].to_numpy(dtype=float),
+                rtol=1e-4,
+                atol=1e-4,
+                err_msg=column,
+            )
+        else:
+            pd.testing.assert_series_equal(
+                actual[column], expected[column], check_dtype=False
+            )
@@ -0,0 +1,86 @@
+"""
+Tests for build_event_state_history, the per-bar latest/active event state
+the columnar scanner engine reads instead of rescanning each history prefix.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_scanner.event_state import (
+    LUX_ACTIVE_PRIORITY_CONTEXTS,
+    SMC_ACTIVE_PRIORITY_CONTEXTS,
+    active_lux_event,
+    active_smc_event,
+    build_event_state_history,
+    latest_model_event,
+)
+
+
+@pytest.mark.parametrize("seed", [8, 9])
+def test_event_state_history_matches_events_of_each_history_prefix(
+    fuzz_histories, seed
+):
+    lux, smc = fuzz_histories(rows=120, seed=seed)
+    # Repeated and out-of-order dates exercise the (date, priority) ordering
+    shuffled = np.random.default_rng(seed).permutation(lux["date"].to_numpy())
+    lux["date"] = np.sort(shuffled[: len(lux) // 2].repeat(2))
+    smc["date"] = shuffled
+
+    for historical, contexts, active_event in (
+        (lux, LUX_ACTIVE_PRIORITY_CONTEXTS, active_lux_event),
+        (smc, SMC_ACTIVE_PRIORITY_CONTEXTS, active_smc_event),
+    ):
+        states = build_event_state_history(
+            historical, active_priority_contexts=contexts
+        )
+        latest = states.events("latest")
+        active = states.events("active")
+        assert len(states) == len(historical)
+        for index in range(len(historical)):
+            prefix = historical.iloc[: index + 1]
+            assert states[index] == {
+                "latest": latest_model_event(prefix),
+                "active": active_event(prefix),
+            }
+            assert {field: values[index] for field, values in latest.items()} == (
+                states[index]["latest"]
+            )
+            assert {field: values[index] for field, values in active.items()} == (
+                states[index]["active"]
+            )
+
+
+def test_event_state_history_keeps_first_of_equal_active_events():
+    dates = pd.to_datetime(["2024-01-02", "2024-01-02", "2024-01-01", "2024-01-02"])
+    historical = pd.DataFrame(
+        {
+            "date": dates,
+            "combined_signal": [1, -1, 1, 1],
+            "options_hint": ["CALL", "PUT", "CALL", "CALL"],
+            "signal_context": [
+                "contrarian_reversal_buy",
+                "contrarian_reversal_sell",
+                "trend_confirmation_buy",
+                "trend_confirmation_buy",
+            ],
+        }
+    )
+
+    states = build_event_state_history(
+        historical, active_priority_contexts=LUX_ACTIVE_PRIORITY_CONTEXTS
+    )
+
+    assert states.active_index.tolist() == [0, 0, 0, 3]
+    assert states.latest_index.tolist() == [0, 1, 2, 3]
+    assert states[2]["active"]["days_since"] == -1
+    assert states[2]["latest"]["days_since"] == 0
+
+
+def test_event_state_history_of_empty_history():
+    states = build_event_state_history(
+        pd.DataFrame(), active_priority_contexts=SMC_ACTIVE_PRIORITY_CONTEXTS
+    )
+
+    assert len(states) == 0
+    assert states.events("active")["date"].tolist() == []
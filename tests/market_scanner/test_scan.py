@@ -8,8 +8,13 @@ from market_scanner.event_state import (
     build_event_state_history,
 )
 from market_scanner.scan import _smc_context, scan_universe
-from market_scanner.scanner_row import build_scanner_row_from_history
+from market_scanner.cache import CachedAnalyzer
+from market_scanner.scanner_row import (
+    build_scanner_row,
+    build_scanner_row_from_history,
+)
 from market_scanner.report_writer import render_top_n_summary
+from stock_analyzer.analyzer import StockDataAnalyzer
 from stock_analyzer.signals.smc import SMCSignalGenerator
 
 
@@ -129,6 +134,92 @@ def test_precomputed_event_state_matches_history_scanner_row():
     assert precomputed_row == slow_row
 
 
+class CountingStockAnalyzer(StockDataAnalyzer):
+    def __init__(self, signal_model):
+        super().__init__(signal_model=signal_model)
+        self.history_calls = 0
+        self.signal_calls = 0
+
+    def generate_signal(self, symbol, df):
+        self.signal_calls += 1
+        return super().generate_signal(symbol, df)
+
+    def generate_historical_signals(self, symbol, df):
+        self.history_calls += 1
+        return super().generate_historical_signals(symbol, df)
+
+
+def make_trending_frame(rows: int = 320) -> pd.DataFrame:
+    index = pd.date_range("2025-01-01", periods=rows, freq="D")
+    close = pd.Series(
+        [50 + i * 0.1 + ((i % 11) - 5) * 0.6 for i in range(rows)], index=index
+    )
+    return pd.DataFrame(
+        {
+            "Open": close - 0.2,
+            "High": close + 0.9,
+            "Low": close - 0.8,
+            "Close": close,
+            "Volume": [2_000_000] * rows,
+        },
+        index=index,
+    )
+
+
+def test_build_scanner_row_computes_each_model_history_once(tmp_path):
+    df = make_trending_frame()
+    expected = build_scanner_row(
+        "AAPL",
+        df,
+        ranking_mode="snapshot",
+        lux_analyzer=_TwoCallAnalyzer("lux"),
+        smc_analyzer=_TwoCallAnalyzer("smc"),
+    )
+
+    lux = CountingStockAnalyzer("lux")
+    smc = CountingStockAnalyzer("smc")
+    row = build_scanner_row(
+        "AAPL", df, ranking_mode="snapshot", lux_analyzer=lux, smc_analyzer=smc
+    )
+
+    assert row == expected
+    assert (lux.history_calls, lux.signal_calls) == (1, 0)
+    assert (smc.history_calls, smc.signal_calls) == (1, 0)
+
+    csv_path = tmp_path / "AAPL.csv"
+    csv_path.write_text("placeholder")
+    cached_lux = CachedAnalyzer(
+        lux, csv_path=csv_path, cache_dir=tmp_path / "cache", model_name="lux"
+    )
+    cached_smc = CachedAnalyzer(
+        smc, csv_path=csv_path, cache_dir=tmp_path / "cache", model_name="smc"
+    )
+    for _ in range(2):
+        cached_row = build_scanner_row(
+            "AAPL",
+            df,
+            ranking_mode="snapshot",
+            lux_analyzer=cached_lux,
+            smc_analyzer=cached_smc,
+        )
+        assert cached_row == expected
+    assert (lux.history_calls, lux.signal_calls) == (2, 0)
+    assert (smc.history_calls, smc.signal_calls) == (2, 0)
+
+
+class _TwoCallAnalyzer:
+    """Analyzer without generate_signal_from_history (legacy two-call path)."""
+
+    def __init__(self, signal_model):
+        self._analyzer = StockDataAnalyzer(signal_model=signal_model)
+
+    def generate_signal(self, symbol, df):
+        return self._analyzer.generate_signal(symbol, df)
+
+    def generate_historical_signals(self, symbol, df):
+        return self._analyzer.generate_historical_signals(symbol, df)
+
+
 def test_scan_universe_generates_csv_and_sorts_top_results(
     tmp_path, monkeypatch, capsys
 ):
@@ -708,12 +799,9 @@ def test_smc_context_matches_historical_adapter_context():
         },
     ]
 
-    for case in cases:
-        signal = SimpleNamespace(**case)
-        historical_row = pd.Series(case)
-        assert _smc_context(signal) == SMCSignalGenerator._signal_context(
-            historical_row
-        )
+    historical_contexts = SMCSignalGenerator._signal_contexts(pd.DataFrame(cases))
+    for case, historical_context in zip(cases, historical_contexts):
+        assert _smc_context(SimpleNamespace(**case)) == historical_context
 
 
 def test_recent_event_mode_falls_back_to_no_trade_without_active_directional_event(
@@ -928,3 +1016,242 @@ def test_render_top_n_summary_can_sort_by_recent_smc_event():
     assert "smc_active_event" in summary
     assert "NEW" in lines[2]
     assert "OLD" in lines[3]
+
+
+def test_scan_worker_reads_frame_from_shared_store(tmp_path):
+    from market_scanner.pipeline import iter_symbol_data, shared_price_store
+    from market_scanner.scan import _scan_symbol_worker, _ScanWorkerArgs
+
+    make_csv(tmp_path / "AAPL.csv", rows=50)
+    universe = pd.DataFrame({"symbol": ["AAPL", "MISSING"], "market_cap": [2e9, 2e9]})
+    symbol_rows = iter_symbol_data(universe, tmp_path)
+
+    with shared_price_store(symbol_rows) as shared_rows:
+        rows = [
+            _scan_symbol_worker(
+                _ScanWorkerArgs(
+                    symbol=sd.symbol,
+                    market_cap=sd.market_cap,
+                    store_dir=store_dir,
+                    load_error=sd.load_error,
+                    analysis_bars=None,
+                    ranking_mode="snapshot",
+                    min_market_cap=1e9,
+                    min_avg_volume_20=1e6,
+                    min_avg_dollar_volume_20=0,
+                    min_history_rows=200,
+                )
+            )
+            for store_dir, sd in shared_rows
+        ]
+
+    assert rows[0]["excluded_reason"] == "insufficient_history"
+    assert rows[0]["close"] == 10.5
+    assert rows[1]["excluded_reason"] == "missing_csv"
+
+
+def test_iter_symbol_data_tail_rows_parses_only_the_window(tmp_path, monkeypatch):
+    from market_scanner import pipeline
+
+    make_csv(tmp_path / "AAPL.csv", rows=300)
+    universe = pd.DataFrame({"symbol": ["AAPL"], "market_cap": [2e9]})
+
+    def fail_full_load(*args, **kwargs):
+        raise AssertionError("full CSV load")
+
+    monkeypatch.setattr(pipeline, "load_symbol_csv", fail_full_load)
+    [symbol_data] = pipeline.iter_symbol_data(universe, tmp_path, tail_rows=200)
+
+    assert symbol_data.load_error is None
+    assert len(symbol_data.df) == 200
+    assert symbol_data.df.index[-1] == pd.Timestamp("2026-10-27", tz="UTC")
+
+
+def test_iter_symbol_data_streams_with_bounded_prefetch(tmp_path, monkeypatch):
+    from market_scanner import pipeline
+
+    symbols = [f"S{i}" for i in range(10)]
+    for symbol in symbols:
+        make_csv(tmp_path / f"{symbol}.csv", rows=5)
+    universe = pd.DataFrame({"symbol": symbols, "market_cap": [2e9] * 10})
+    loaded = []
+    real_load = pipeline.load_symbol_csv
+
+    def counting_load(data_dir, symbol):
+        loaded.append(symbol)
+        return real_load(data_dir, symbol)
+
+    monkeypatch.setattr(pipeline, "load_symbol_csv", counting_load)
+    stream = pipeline.iter_symbol_data(universe, tmp_path, prefetch=2)
+
+    first = next(stream)
+    assert first.symbol == "S0"
+    assert len(loaded) <= 3
+    assert [sd.symbol for sd in stream] == symbols[1:]
+    assert loaded == symbols
+
+
+def _cached_scan_setup(tmp_path):
+    from stock_data_manager.implementations.csv_writer import CSVWriter
+
+    universe_file = tmp_path / "universe.csv"
+    pd.DataFrame(
+        {"symbol": ["AAPL", "MSFT", "PENNY"], "market_cap": [2e9, 3e9, 1e6]}
+    ).to_csv(universe_file, index=False)
+    data_dir = tmp_path / "data"
+    writer = CSVWriter(manifest=True)
+    for symbol in ("AAPL", "MSFT", "PENNY"):
+        prices = make_trending_frame().rename_axis("Date")
+        writer.write(prices, data_dir / f"{symbol}.csv")
+    return universe_file, data_dir
+
+
+def _cached_scan(tmp_path, universe_file, data_dir, **kwargs):
+    result, _ = scan_universe(
+        universe_file,
+        data_dir,
+        min_market_cap=1e9,
+        min_avg_volume_20=1e6,
+        top=3,
+        output=tmp_path / "scan.csv",
+        analysis_bars=250,
+        use_cache=True,
+        cache_dir=tmp_path / "cache",
+        **kwargs,
+    )
+    return result
+
+
+def _fail_loads(monkeypatch):
+    from market_scanner import pipeline
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("CSV opened")
+
+    monkeypatch.setattr(pipeline, "load_symbol_csv", fail_load)
+    monkeypatch.setattr(pipeline, "load_symbol_csv_tail", fail_load)
+
+
+def test_scan_skips_unchanged_files_through_the_cache(tmp_path, monkeypatch):
+    universe_file, data_dir = _cached_scan_setup(tmp_path)
+    cold = _cached_scan(tmp_path, universe_file, data_dir)
+
+    _fail_loads(monkeypatch)
+    warm = _cached_scan(tmp_path, universe_file, data_dir)
+
+    pd.testing.assert_frame_equal(warm, cold)
+    assert cold.set_index("symbol").loc["PENNY", "excluded_reason"] == (
+        "market_cap_below_threshold"
+    )
+
+
+def test_scan_reads_skipped_file_when_its_history_was_evicted(tmp_path):
+    universe_file, data_dir = _cached_scan_setup(tmp_path)
+    cold = _cached_scan(tmp_path, universe_file, data_dir)
+    for path in (tmp_path / "cache" / "smc").glob("AAPL_*.pkl"):
+        path.unlink()
+
+    warm = _cached_scan(tmp_path, universe_file, data_dir)
+
+    pd.testing.assert_frame_equal(warm, cold)
+    assert list((tmp_path / "cache" / "smc").glob("AAPL_*.pkl"))
+
+
+def test_scan_worker_serves_skipped_files_from_the_cache(tmp_path, monkeypatch):
+    from market_scanner.cache import cached_inputs
+    from market_scanner.pipeline import iter_symbol_data, shared_price_store
+    from market_scanner.scan import _scan_symbol_worker, _ScanWorkerArgs
+
+    universe_file, data_dir = _cached_scan_setup(tmp_path)
+    cold = _cached_scan(tmp_path, universe_file, data_dir)
+    cache_dir = tmp_path / "cache"
+    universe = pd.read_csv(universe_file)
+
+    _fail_loads(monkeypatch)
+    symbol_rows = iter_symbol_data(
+        universe,
+        data_dir,
+        tail_rows=250,
+        cached=lambda symbol, fingerprint: cached_inputs(
+            cache_dir, symbol, fingerprint, window=250
+        ),
+    )
+    with shared_price_store(symbol_rows) as shared_rows:
+        rows = [
+            _scan_symbol_worker(
+                _ScanWorkerArgs(
+                    symbol=sd.symbol,
+                    market_cap=sd.market_cap,
+                    store_dir=store_dir,
+                    load_error=sd.load_error,
+                    analysis_bars=250,
+                    ranking_mode="snapshot",
+                    min_market_cap=1e9,
+                    min_avg_volume_20=1e6,
+                    min_avg_dollar_volume_20=0,
+                    min_history_rows=200,
+                    csv_path=data_dir / f"{sd.symbol}.csv",
+                    cache_dir=cache_dir,
+                    use_cache=True,
+                    fingerprint=sd.fingerprint,
+                    inputs=sd.inputs,
+                )
+            )
+            for store_dir, sd in shared_rows
+        ]
+
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(rows).set_index("symbol").sort_index(),
+        cold.set_index("symbol").sort_index(),
+    )
+
+
+def test_shared_price_store_batches_rows_lazily(tmp_path):
+    from market_scanner.pipeline import (
+        SymbolData,
+        load_shared_frame,
+        shared_price_store,
+    )
+
+    frame = pd.DataFrame(
+        {"Close": [1.0, 2.0]},
+        index=pd.date_range("2026-01-01", periods=2, tz="UTC", name="Date"),
+    )
+    pulled = []
+
+    def rows():
+        for i in range(5):
+            pulled.append(i)
+            yield SymbolData(f"S{i}", None, frame.copy(), None)
+        yield SymbolData("MISSING", None, None, "missing_csv")
+
+    with shared_price_store(rows(), batch_symbols=2) as shared_rows:
+        store_dir, first = next(shared_rows)
+        assert pulled == [0, 1]
+        assert first.df is None
+        pd.testing.assert_frame_equal(
+            load_shared_frame(store_dir, "S0"), frame, check_freq=False
+        )
+        rest = list(shared_rows)
+
+    assert [sd.symbol for _, sd in rest] == ["S1", "S2", "S3", "S4", "MISSING"]
+    assert len({store_dir for store_dir, _ in [(store_dir, first), *rest]}) == 3
+
+
+def test_map_in_order_submits_lazily():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from market_scanner.pipeline import map_in_order
+
+    pulled = []
+
+    def items():
+        for i in range(10):
+            pulled.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = map_in_order(pool, lambda x: x * x, items(), max_pending=3)
+        assert next(results) == 0
+        assert len(pulled) == 4
+        assert list(results) == [i * i for i in range(1, 10)]
@@ -0,0 +1,203 @@
+"""
+Parity suite for the columnar scanner-decision engine.
+
+Every row of build_scanner_columns must equal the scalar
+build_scanner_row_from_history row for the same bar, value and type.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_scanner.event_state import (
+    LUX_ACTIVE_PRIORITY_CONTEXTS,
+    SMC_ACTIVE_PRIORITY_CONTEXTS,
+    build_event_state_history,
+)
+from market_scanner.market_state import (
+    EARLY_TREND,
+    EXHAUSTION,
+    EXTENDED,
+    PULLBACK,
+    RANGE,
+    UNKNOWN,
+    adjust_alignment_for_market_state,
+)
+from market_scanner.ranking import (
+    BEARISH_TREND,
+    BEARISH_TRIGGER,
+    BEARISH_WATCH,
+    BULLISH_TREND,
+    BULLISH_TRIGGER,
+    BULLISH_WATCH,
+    NEUTRAL_ROLE,
+)
+from market_scanner.scanner_columns import _adjusted_alignment, build_scanner_columns
+from market_scanner.scanner_row import build_scanner_row_from_history
+
+RANKING_MODES = ("snapshot", "recent-event")
+
+
+def analyzer_histories(rows: int, seed: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    from stock_analyzer.analyzer import StockDataAnalyzer
+
+    rng = np.random.default_rng(seed)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+    open_ = close * (1 + rng.normal(0, 0.005, rows))
+    df = pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) * (1 + rng.uniform(0, 0.01, rows)),
+            "Low": np.minimum(open_, close) * (1 - rng.uniform(0, 0.01, rows)),
+            "Close": close,
+            "Volume": rng.integers(100_000, 5_000_000, rows).astype(float),
+        },
+        index=pd.date_range(
+            "2020-01-01", periods=rows, freq="B", tz="UTC", name="Date"
+        ),
+    )
+    lux = StockDataAnalyzer(signal_model="lux").generate_historical_signals("TEST", df)
+    smc = StockDataAnalyzer(signal_model="smc").generate_historical_signals("TEST", df)
+    return lux, smc
+
+
+def assert_rows_identical(actual: dict, expected: dict) -> None:
+    assert list(actual) == list(expected)
+    for key, value in expected.items():
+        assert type(actual[key]) is type(value), key
+        if isinstance(value, float) and np.isnan(value):
+            assert np.isnan(actual[key]), key
+        else:
+            assert actual[key] == value, key
+
+
+def assert_matches_scalar(lux, smc, *, indexes=None, precomputed=True):
+    lux_states = build_event_state_history(
+        lux, active_priority_contexts=LUX_ACTIVE_PRIORITY_CONTEXTS
+    )
+    smc_states = build_event_state_history(
+        smc, active_priority_contexts=SMC_ACTIVE_PRIORITY_CONTEXTS
+    )
+    for ranking_mode in RANKING_MODES:
+        columns = build_scanner_columns(
+            "TEST", lux_historical=lux, smc_historical=smc, ranking_mode=ranking_mode
+        )
+        assert len(columns) == len(lux)
+        for index in indexes if indexes is not None else range(len(lux)):
+            expected = build_scanner_row_from_history(
+                "TEST",
+                close=12.5,
+                lux_historical=lux,
+                smc_historical=smc,
+                index=index,
+                ranking_mode=ranking_mode,
+                lux_event_state=lux_states[index] if precomputed else None,
+                smc_event_state=smc_states[index] if precomputed else None,
+            )
+            assert_rows_identical(columns.row(index, close=12.5), expected)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_columns_match_scalar_rows_on_fuzzed_histories(fuzz_histories, seed):
+    lux, smc = fuzz_histories(rows=250, seed=seed)
+
+    assert_matches_scalar(lux, smc)
+
+
+def test_columns_match_scalar_rows_without_precomputed_event_state(fuzz_histories):
+    lux, smc = fuzz_histories(rows=60, seed=4)
+
+    assert_matches_scalar(lux, smc, precomputed=False)
+
+
+def test_columns_match_scalar_rows_on_analyzer_histories():
+    lux, smc = analyzer_histories(rows=400, seed=5)
+
+    assert_matches_scalar(lux, smc)
+
+
+def test_columns_handle_missing_optional_columns(fuzz_histories):
+    lux, smc = fuzz_histories(rows=40, seed=6)
+    lux = lux.drop(columns=["adx", "confirmation_signal", "contrarian_signal"])
+    smc = smc.drop(columns=["signal_bias", "rsi", "in_premium", "long_signal"])
+
+    assert_matches_scalar(lux, smc)
+
+
+def test_columns_keep_close_from_history_when_not_overridden(fuzz_histories):
+    lux, smc = fuzz_histories(rows=5, seed=7)
+
+    columns = build_scanner_columns(
+        "TEST", lux_historical=lux, smc_historical=smc, ranking_mode="snapshot"
+    )
+
+    assert columns.row(2)["close"] == float(lux["close"].iloc[2])
+    assert columns.frame().shape == (5, len(columns.columns))
+
+
+def test_adjusted_alignment_matches_scalar_for_every_rule_combination():
+    # Every classify_alignment result ("mixed" is never produced)
+    alignments = [
+        "conflicted",
+        "bullish_aligned",
+        "bearish_aligned",
+        "early_bullish",
+        "bullish_watch",
+        "early_bearish",
+        "bearish_watch",
+        "bullish_trend",
+        "bearish_trend",
+        "no_trade",
+    ]
+    states = [EARLY_TREND, PULLBACK, EXTENDED, EXHAUSTION, RANGE, UNKNOWN]
+    roles = [
+        BULLISH_TRIGGER,
+        BEARISH_TRIGGER,
+        BULLISH_TREND,
+        BEARISH_TREND,
+        BULLISH_WATCH,
+        BEARISH_WATCH,
+        NEUTRAL_ROLE,
+    ]
+    combos = list(
+        itertools.product(
+            alignments,
+            states,
+            ["BULLISH", "BEARISH"],
+            ["STRONG", "NORMAL"],
+            ["BUY", "SELL", None],
+            roles,
+            roles,
+        )
+    )
+    column = dict(
+        zip(
+            ["alignment", "state", "trend", "strength", "last", "lux_role", "smc_role"],
+            (np.array(values, dtype=object) for values in zip(*combos)),
+        )
+    )
+
+    actual = _adjusted_alignment(
+        column["alignment"],
+        column["state"],
+        lux_role=column["lux_role"],
+        smc_role=column["smc_role"],
+    )
+
+    expected = [
+        adjust_alignment_for_market_state(
+            alignment=alignment,
+            row={
+                "lux_trend": trend,
+                "lux_strength": strength,
+                "lux_last_event": last,
+                "lux_role": lux_role,
+                "smc_role": smc_role,
+            },
+            market_state=state,
+        )
+        for alignment, state, trend, strength, last, lux_role, smc_role in combos
+    ]
+    assert actual.tolist() == expected
@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def random_walk():
+    """Factory of reproducible daily OHLC random walks: random_walk(rows, seed)."""
+
+    def make(rows: int = 3000, seed: int = 3) -> pd.DataFrame:
+        rng = np.random.default_rng(seed)
+        index = pd.date_range("2012-01-01", periods=rows, freq="D")
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+        spread = close * rng.uniform(0.002, 0.02, rows)
+        return pd.DataFrame(
+            {
+                "Open": close * (1 + rng.normal(0, 0.003, rows)),
+                "High": close + spread,
+                "Low": close - spread,
+                "Close": close,
+            },
+            index=index,
+        )
+
+    return make
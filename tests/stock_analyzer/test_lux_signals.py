@@ -1,8 +1,11 @@
+import numpy as np
 import pandas as pd
+import pytest
 
 from stock_analyzer.analyzer import StockDataAnalyzer
 from stock_analyzer.enums import Signal
 from stock_analyzer.signals import LuxSignalGenerator
+from stock_analyzer.signals.base import EXTENSION_CHECK_BARS
 
 
 def make_ohlc(rows: int = 220) -> pd.DataFrame:
@@ -53,6 +56,64 @@ def test_lux_signal_generator_returns_historical_columns():
     )
 
 
+def test_lux_extended_history_matches_full_history(monkeypatch, random_walk):
+    generator = LuxSignalGenerator()
+    df = random_walk(seed=7)
+    full = generator.generate_historical_signals("AAPL", df)
+    historical = generator.generate_historical_signals("AAPL", df.iloc[:-5])
+
+    computed_rows = []
+    generate = generator.generate_historical_signals
+
+    def spy(symbol, frame):
+        computed_rows.append(len(frame))
+        return generate(symbol, frame)
+
+    monkeypatch.setattr(generator, "generate_historical_signals", spy)
+    extended = generator.extend_historical_signals("AAPL", df, historical)
+
+    # Only the tail is recomputed
+    assert computed_rows == [
+        generator.indicator.tail_bars()
+        + EXTENSION_CHECK_BARS
+        + generator.indicator.lookahead_bars()
+        + 5
+    ]
+    floats = [column for column in full if full[column].dtype.kind == "f"]
+    pd.testing.assert_frame_equal(
+        extended.drop(columns=floats), full.drop(columns=floats)
+    )
+    pd.testing.assert_frame_equal(extended[floats], full[floats], rtol=1e-5)
+
+
+def test_lux_tail_only_current_signal_matches_full_history(random_walk):
+    full = LuxSignalGenerator()
+    tail = LuxSignalGenerator(tail_only=True)
+
+    for seed in range(5):
+        df = random_walk(seed=seed)
+        expected = full.generate_current_signal("AAPL", df)
+        result = tail.generate_current_signal("AAPL", df)
+
+        for field in ("supertrend", "adx", "rsi", "upper_zone", "lower_zone"):
+            assert getattr(result, field) == pytest.approx(
+                getattr(expected, field), rel=1e-5
+            )
+        assert result.date == expected.date
+        assert result.trend == expected.trend
+        assert result.strength == expected.strength
+        assert result.combined_signal == expected.combined_signal
+        assert result.options_hint == expected.options_hint
+
+
+def test_lux_tail_only_current_signal_with_short_history():
+    df = make_ohlc()
+
+    result = LuxSignalGenerator(tail_only=True).generate_current_signal("AAPL", df)
+
+    assert result == LuxSignalGenerator().generate_current_signal("AAPL", df)
+
+
 def test_lux_signal_generator_returns_current_signal():
     generator = LuxSignalGenerator()
 
@@ -87,3 +148,38 @@ def test_lux_signal_generator_assigns_signal_context_and_options_hint():
         }
     )
     assert set(result["options_hint"].unique()).issubset({"CALL", "PUT", "NO_TRADE"})
+
+
+def row_signal_context(row: pd.Series) -> str:
+    """Classificador linha a linha, referência para `_signal_contexts`."""
+    if row["confirmation_signal"] == int(Signal.BUY):
+        return "trend_confirmation_buy"
+    if row["confirmation_signal"] == int(Signal.SELL):
+        return "trend_confirmation_sell"
+    if row["contrarian_signal"] == int(Signal.BUY):
+        return "contrarian_reversal_buy"
+    if row["contrarian_signal"] == int(Signal.SELL):
+        return "contrarian_reversal_sell"
+    return "no_trade"
+
+
+def test_lux_vectorized_context_matches_row_classifier():
+    rng = np.random.default_rng(0)
+    history = pd.DataFrame(
+        {
+            "confirmation_signal": rng.choice([-1, 0, 1], 2000),
+            "contrarian_signal": rng.choice([-1, 0, 1], 2000),
+        }
+    )
+
+    contexts = LuxSignalGenerator._signal_contexts(history)
+
+    assert isinstance(contexts.dtype, pd.CategoricalDtype)
+    assert contexts.tolist() == history.apply(row_signal_context, axis=1).tolist()
+
+
+def test_lux_historical_labels_are_categorical():
+    result = LuxSignalGenerator().generate_historical_signals("AAPL", make_ohlc())
+
+    assert isinstance(result["options_hint"].dtype, pd.CategoricalDtype)
+    assert set(result["options_hint"].cat.categories) == {"CALL", "PUT", "NO_TRADE"}
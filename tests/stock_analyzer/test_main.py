@@ -133,7 +133,9 @@ def test_main_accepts_smc_model(monkeypatch):
     df = pd.DataFrame({"Close": [1.0]}, index=pd.to_datetime(["2026-04-20"]))
 
     class FakeAnalyzer:
-        def __init__(self, config=None, signal_model="rsi-sma"):
+        def __init__(
+            self, config=None, signal_model="rsi-sma", tail_only_current=False
+        ):
             calls.append(("init", signal_model))
             self.config = config
             self.signal_model = signal_model
@@ -202,7 +204,9 @@ def test_main_local_only_reads_local_csv(monkeypatch):
     df = pd.DataFrame({"Close": [1.0]}, index=pd.to_datetime(["2026-04-20"]))
 
     class FakeAnalyzer:
-        def __init__(self, config=None, signal_model="rsi-sma"):
+        def __init__(
+            self, config=None, signal_model="rsi-sma", tail_only_current=False
+        ):
             self.config = config
             self.signal_model = signal_model
             self.signal_generator = SignalGenerator()
@@ -261,7 +265,9 @@ def test_main_local_only_reads_local_csv(monkeypatch):
 
 def test_main_local_only_fails_without_csv(monkeypatch):
     class FakeAnalyzer:
-        def __init__(self, config=None, signal_model="rsi-sma"):
+        def __init__(
+            self, config=None, signal_model="rsi-sma", tail_only_current=False
+        ):
             self.config = config
             self.signal_model = signal_model
             self.signal_generator = SignalGenerator()
@@ -281,7 +287,9 @@ def test_main_default_mode_keeps_update_behavior(monkeypatch):
     df = pd.DataFrame({"Close": [1.0]}, index=pd.to_datetime(["2026-04-20"]))
 
     class FakeAnalyzer:
-        def __init__(self, config=None, signal_model="rsi-sma"):
+        def __init__(
+            self, config=None, signal_model="rsi-sma", tail_only_current=False
+        ):
             self.config = config
             self.signal_model = signal_model
             self.signal_generator = SignalGenerator()
@@ -1,11 +1,15 @@
+from dataclasses import replace
 from types import SimpleNamespace
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from stock_analyzer.analyzer import StockDataAnalyzer
 from stock_analyzer.enums import Signal
 from stock_analyzer.main import render_analysis_report
 from stock_analyzer.signals import SMCSignalGenerator
+from stock_analyzer.signals.base import EXTENSION_CHECK_BARS
 
 
 def make_ohlc(rows: int = 260) -> pd.DataFrame:
@@ -80,6 +84,53 @@ def test_smc_signal_generator_returns_current_signal():
     assert isinstance(result.swing_low_marker, bool)
 
 
+def test_smc_extended_history_matches_full_history(monkeypatch, random_walk):
+    generator = SMCSignalGenerator()
+    df = random_walk(seed=7)
+    full = generator.generate_historical_signals("AAPL", df)
+    historical = generator.generate_historical_signals("AAPL", df.iloc[:-5])
+
+    computed_rows = []
+    generate = generator.generate_historical_signals
+
+    def spy(symbol, frame):
+        computed_rows.append(len(frame))
+        return generate(symbol, frame)
+
+    monkeypatch.setattr(generator, "generate_historical_signals", spy)
+    extended = generator.extend_historical_signals("AAPL", df, historical)
+
+    # Only the tail is recomputed
+    assert computed_rows == [
+        generator.indicator.tail_bars()
+        + EXTENSION_CHECK_BARS
+        + generator.indicator.lookahead_bars()
+        + 5
+    ]
+    floats = [column for column in full if full[column].dtype.kind == "f"]
+    pd.testing.assert_frame_equal(
+        extended.drop(columns=floats), full.drop(columns=floats)
+    )
+    pd.testing.assert_frame_equal(extended[floats], full[floats], rtol=1e-5)
+
+
+def test_smc_tail_only_current_signal_matches_full_history(random_walk):
+    full = SMCSignalGenerator()
+    tail = SMCSignalGenerator(tail_only=True)
+
+    for seed in range(5):
+        df = random_walk(seed=seed)
+        expected = full.generate_current_signal("AAPL", df)
+        result = tail.generate_current_signal("AAPL", df)
+
+        assert result.rsi == pytest.approx(expected.rsi, rel=1e-5)
+        assert result.ema200 == pytest.approx(expected.ema200, rel=1e-5)
+        assert result.range_position_pct == expected.range_position_pct
+        assert replace(result, rsi=None, ema200=None) == replace(
+            expected, rsi=None, ema200=None
+        )
+
+
 def test_smc_signal_generator_uses_historical_rsi_series():
     generator = SMCSignalGenerator()
 
@@ -252,3 +303,58 @@ def test_render_analysis_report_for_smc_handles_missing_structure_markers():
 
     assert "Recent Structure Markers" in report
     assert "No swing markers found." in report
+
+
+def row_signal_context(row: pd.Series) -> str:
+    """Classificadores linha a linha, referência para as versões vetorizadas."""
+    if row["long_signal"]:
+        return "bullish_confluence"
+    if row["short_signal"]:
+        return "bearish_confluence"
+    if row["swing_low_marker"] and row["in_discount"]:
+        return "short_term_bullish_reversal"
+    if row["swing_high_marker"] and row["in_premium"]:
+        return "short_term_bearish_reversal"
+    if row["in_discount"] and row["bullish_rejection"]:
+        return "discount_watch"
+    if row["in_premium"] and row["bearish_rejection"]:
+        return "premium_watch"
+    if row["swing_low_marker"]:
+        return "swing_low_watch"
+    if row["swing_high_marker"]:
+        return "swing_high_watch"
+    return "no_trade"
+
+
+def row_options_hint(row: pd.Series) -> str:
+    if row["long_signal"]:
+        return "CALL"
+    if row["short_signal"]:
+        return "PUT"
+    if row["swing_low_marker"] or (row["in_discount"] and row["bullish_rejection"]):
+        return "CALL_WATCH"
+    if row["swing_high_marker"] or (row["in_premium"] and row["bearish_rejection"]):
+        return "PUT_WATCH"
+    return "NO_TRADE"
+
+
+def test_smc_vectorized_labels_match_row_classifiers():
+    rng = np.random.default_rng(0)
+    columns = [
+        "long_signal",
+        "short_signal",
+        "swing_low_marker",
+        "swing_high_marker",
+        "in_discount",
+        "in_premium",
+        "bullish_rejection",
+        "bearish_rejection",
+    ]
+    history = pd.DataFrame({column: rng.random(2000) < 0.3 for column in columns})
+
+    contexts = SMCSignalGenerator._signal_contexts(history)
+    hints = SMCSignalGenerator._options_hints(history)
+
+    assert isinstance(contexts.dtype, pd.CategoricalDtype)
+    assert contexts.tolist() == history.apply(row_signal_context, axis=1).tolist()
+    assert hints.tolist() == history.apply(row_options_hint, axis=1).tolist()
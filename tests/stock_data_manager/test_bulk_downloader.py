@@ -0,0 +1,220 @@
+"""
+Tests for BulkDownloader / TokenBucket and their use by
+StockDataManager.download_multiple.
+
+No network access: a fake IDataDownloader simulates latency and failures.
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from stock_data_manager.managers.bulk_downloader import BulkDownloader, TokenBucket
+from stock_data_manager.managers.stock_data_manager import StockDataManager
+from stock_data_manager.strategies.append_merge import AppendMergeStrategy
+
+
+def make_price_frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        {"Close": [10.0, 11.0]},
+        index=pd.to_datetime(["2024-01-01", "2024-01-02"]),
+    )
+
+
+class NullReader:
+    def read(self, filepath):
+        return None
+
+
+class RecordingWriter:
+    def __init__(self):
+        self.symbols = []
+        self._lock = threading.Lock()
+
+    def write(self, data, filepath):
+        with self._lock:
+            self.symbols.append(filepath.stem)
+
+
+class SlowFlakyDownloader:
+    """Sleeps `latency` per call and fails the first `failures[symbol]` calls."""
+
+    def __init__(self, latency=0.0, failures=None):
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def download(self, config):
+        with self._lock:
+            self.calls.append(config.symbol)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            remaining = self.failures.get(config.symbol, 0)
+            if remaining:
+                self.failures[config.symbol] = remaining - 1
+        try:
+            time.sleep(self.latency)
+            if remaining:
+                raise ConnectionError(f"transient error for {config.symbol}")
+            return make_price_frame()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_manager(downloader, tmp_path, bulk_downloader=None):
+    return StockDataManager(
+        reader=NullReader(),
+        writer=RecordingWriter(),
+        downloader=downloader,
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+        bulk_downloader=bulk_downloader,
+    )
+
+
+def test_token_bucket_allows_burst_then_throttles_to_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == [pytest.approx(0.5), pytest.approx(0.5)]
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_default_download_multiple_stays_sequential(tmp_path):
+    downloader = SlowFlakyDownloader(failures={"BAD": 1})
+    manager = make_manager(downloader, tmp_path)
+
+    results = manager.download_multiple(["AAPL", "BAD", "MSFT"])
+
+    assert list(results) == ["AAPL", "BAD", "MSFT"]
+    assert results["BAD"] is None
+    assert downloader.calls == ["AAPL", "BAD", "MSFT"]
+    assert manager.last_download_summary.failed == ["BAD"]
+    assert manager.last_download_summary.retries == 0
+
+
+def test_concurrent_download_overlaps_latency(tmp_path):
+    symbols = [f"SYM{i}" for i in range(8)]
+    downloader = SlowFlakyDownloader(latency=0.05)
+    manager = make_manager(
+        downloader, tmp_path, bulk_downloader=BulkDownloader(max_workers=8)
+    )
+
+    started = time.perf_counter()
+    results = manager.download_multiple(symbols)
+    elapsed = time.perf_counter() - started
+
+    assert list(results) == symbols
+    assert all(df is not None for df in results.values())
+    assert sorted(manager.writer.symbols) == sorted(symbols)
+    assert downloader.max_in_flight > 1
+    # Sequencial levaria ~0.4s
+    assert elapsed < 0.3
+    assert manager.last_download_summary.succeeded == len(symbols)
+
+
+def test_retries_recover_transient_failures_with_backoff(tmp_path):
+    delays = []
+    downloader = SlowFlakyDownloader(failures={"AAPL": 2})
+    bulk = BulkDownloader(
+        max_workers=2, max_retries=2, backoff_seconds=0.5, sleep=delays.append
+    )
+    manager = make_manager(downloader, tmp_path, bulk_downloader=bulk)
+
+    results = manager.download_multiple(["AAPL", "MSFT"])
+
+    assert results["AAPL"] is not None
+    assert downloader.calls.count("AAPL") == 3
+    assert delays == [0.5, 1.0]
+    assert manager.last_download_summary.retries == 2
+    assert manager.last_download_summary.failed == []
+
+
+def test_exhausted_retries_return_none(tmp_path):
+    downloader = SlowFlakyDownloader(failures={"BAD": 5})
+    bulk = BulkDownloader(max_workers=2, max_retries=1, sleep=lambda _: None)
+    manager = make_manager(downloader, tmp_path, bulk_downloader=bulk)
+
+    results = manager.download_multiple(["BAD", "MSFT"])
+
+    assert results["BAD"] is None
+    assert results["MSFT"] is not None
+    assert downloader.calls.count("BAD") == 2
+    summary = manager.last_download_summary
+    assert (summary.total, summary.succeeded, summary.failed) == (2, 1, ["BAD"])
+
+
+def test_rate_limiter_is_acquired_for_every_attempt():
+    class CountingLimiter:
+        def __init__(self):
+            self.count = 0
+
+        def acquire(self):
+            self.count += 1
+            return 0.0
+
+    attempts = {"BAD": 0}
+
+    def task(symbol):
+        if symbol == "BAD":
+            attempts["BAD"] += 1
+            raise ConnectionError("boom")
+        return symbol
+
+    limiter = CountingLimiter()
+    bulk = BulkDownloader(rate_limiter=limiter, max_retries=2, sleep=lambda _: None)
+
+    results, summary = bulk.run(["A", "BAD", "B"], task)
+
+    assert results == {"A": "A", "BAD": None, "B": "B"}
+    assert limiter.count == 2 + attempts["BAD"]
+    assert "2/3 ok" in summary.render()
+
+
+def test_duplicate_symbols_run_once():
+    calls = []
+
+    def task(symbol):
+        calls.append(symbol)
+        return symbol
+
+    results, summary = BulkDownloader().run(["A", "B", "A"], task)
+
+    assert calls == ["A", "B"]
+    assert results == {"A": "A", "B": "B"}
+    assert (summary.total, summary.succeeded) == (2, 2)
+
+
+def test_unexpected_errors_are_not_swallowed():
+    def task(symbol):
+        raise TypeError("bug")
+
+    with pytest.raises(TypeError):
+        BulkDownloader(max_retries=2, sleep=lambda _: None).run(["A"], task)
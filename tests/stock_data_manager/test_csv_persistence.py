@@ -23,3 +23,88 @@ def test_csv_writer_and_reader_round_trip_dataframe(tmp_path):
 
     assert filepath.exists()
     assert_frame_equal(result, data)
+
+
+def make_daily_frame(n: int, tz: str | None = None) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=n, freq="D", tz=tz)
+    return pd.DataFrame(
+        {
+            "Close": [10.0 + i for i in range(n)],
+            "Volume": [100 * (i + 1) for i in range(n)],
+        },
+        index=index,
+    )
+
+
+def test_csv_writer_append_writes_only_new_rows(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    full = make_daily_frame(12)
+    writer = CSVWriter(append=True)
+    writer.write(full.iloc[:10], filepath)
+    size_before = filepath.stat().st_size
+
+    writer.write(full, filepath)
+
+    assert (writer.stats.rewrites, writer.stats.appends) == (1, 1)
+    assert writer.stats.rows_written == 12
+    assert writer.stats.bytes_written == filepath.stat().st_size
+    assert filepath.stat().st_size - size_before < size_before / 4
+    assert_frame_equal(CSVReader().read(filepath), full, check_freq=False)
+
+
+def test_csv_writer_append_rewrites_when_history_was_revised(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    writer = CSVWriter(append=True)
+    writer.write(make_daily_frame(10), filepath)
+    revised = make_daily_frame(11)
+    revised.iloc[8, 0] = 99.0
+
+    writer.write(revised, filepath)
+
+    assert (writer.stats.rewrites, writer.stats.appends) == (2, 0)
+    assert_frame_equal(CSVReader().read(filepath), revised, check_freq=False)
+
+
+def test_csv_writer_append_skips_unchanged_data(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    writer = CSVWriter(append=True)
+    data = make_daily_frame(10)
+    writer.write(data, filepath)
+
+    writer.write(data, filepath)
+
+    assert writer.stats.skipped == 1
+    assert writer.stats.rewrites == 1
+
+
+def test_csv_writer_append_across_dst_matches_full_rewrite(tmp_path):
+    index = pd.DatetimeIndex(
+        ["2025-10-29", "2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04"]
+    ).tz_localize("America/New_York")
+    data = pd.DataFrame(
+        {"Close": [10.0, 11.0, 12.0, 13.0, 14.0], "Volume": [100] * 5}, index=index
+    )
+    rewritten = tmp_path / "rewrite" / "AAPL.csv"
+    CSVWriter().write(data, rewritten)
+    appended = tmp_path / "append" / "AAPL.csv"
+    writer = CSVWriter(append=True)
+    writer.write(data.iloc[:3], appended)
+
+    writer.write(data, appended)
+
+    assert writer.stats.appends == 1
+    assert appended.read_bytes() == rewritten.read_bytes()
+    assert appended.read_text().splitlines()[-2].startswith("2025-11-03 00:00:00-05:00")
+
+
+def test_csv_writer_append_rewrites_utc_rows_after_local_offsets(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    writer = CSVWriter(append=True)
+    data = make_daily_frame(3, tz="America/New_York")
+    writer.write(data.iloc[:2], filepath)
+
+    writer.write(data.tz_convert("UTC"), filepath)
+
+    lines = filepath.read_text().splitlines()
+    assert (writer.stats.rewrites, writer.stats.appends) == (2, 0)
+    assert lines[-1].startswith("2024-01-03 05:00:00+00:00")
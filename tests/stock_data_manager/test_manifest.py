@@ -0,0 +1,246 @@
+"""
+Tests for PriceStoreManifest and its maintenance by the writers and use by
+StockDataManager.
+
+No network access.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from stock_data_manager.implementations.append_support import TAIL_OVERLAP_ROWS
+from stock_data_manager.implementations.csv_reader import CSVReader
+from stock_data_manager.implementations.csv_writer import CSVWriter
+from stock_data_manager.managers.stock_data_manager import StockDataManager
+from stock_data_manager.repositories import manifest as manifest_module
+from stock_data_manager.repositories.manifest import (
+    MANIFEST_FILENAME,
+    PriceStoreManifest,
+    appended_content_hash,
+    file_content_hash,
+)
+from stock_data_manager.strategies.append_merge import AppendMergeStrategy
+
+
+def make_frame(n: int, end: datetime | None = None) -> pd.DataFrame:
+    end = end or datetime(2024, 1, 31)
+    index = pd.date_range(end=end.strftime("%Y-%m-%d"), periods=n, freq="D")
+    return pd.DataFrame({"Close": [10.0 + i for i in range(n)]}, index=index)
+
+
+class RecordingReader:
+    def __init__(self):
+        self.paths = []
+
+    def read(self, filepath):
+        self.paths.append(filepath)
+        return None
+
+
+class NoDownloads:
+    def download(self, config):
+        raise ConnectionError(f"offline: {config.symbol}")
+
+
+def test_csv_writer_records_manifest_entry(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    data = make_frame(10)
+
+    CSVWriter(manifest=True).write(data, filepath)
+
+    entry = PriceStoreManifest(tmp_path).fresh_entry("AAPL")
+    assert (tmp_path / MANIFEST_FILENAME).exists()
+    assert entry.filename == "AAPL.csv"
+    assert entry.rows == 10
+    assert entry.last_date.startswith("2024-01-31")
+    assert entry.size == filepath.stat().st_size
+    assert entry.content_hash == file_content_hash(filepath)
+
+
+def test_manifest_entry_is_updated_by_appends(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    writer = CSVWriter(append=True, manifest=True)
+    writer.write(make_frame(10), filepath)
+    first = PriceStoreManifest(tmp_path).fresh_entry("AAPL")
+
+    writer.write(make_frame(11, end=datetime(2024, 2, 1)), filepath)
+
+    entry = PriceStoreManifest(tmp_path).fresh_entry("AAPL")
+    assert writer.stats.appends == 1
+    assert entry.rows == 11
+    assert entry.last_date.startswith("2024-02-01")
+    assert entry.size == filepath.stat().st_size
+    assert entry.content_hash != first.content_hash
+
+
+def test_append_chains_the_hash_without_rereading_the_file(tmp_path, monkeypatch):
+    filepath = tmp_path / "AAPL.csv"
+    writer = CSVWriter(append=True, manifest=True)
+    writer.write(make_frame(10), filepath)
+    first = PriceStoreManifest(tmp_path).fresh_entry("AAPL")
+    size = filepath.stat().st_size
+
+    def no_full_hash(path):
+        raise AssertionError(f"full hash of {path}")
+
+    monkeypatch.setattr(manifest_module, "file_content_hash", no_full_hash)
+    writer.write(make_frame(11, end=datetime(2024, 2, 1)), filepath)
+
+    appended = filepath.read_bytes()[size:]
+    entry = PriceStoreManifest(tmp_path).fresh_entry("AAPL")
+    assert entry.content_hash == appended_content_hash(first.content_hash, appended)
+
+
+def test_manifest_entry_invalid_after_external_change(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    CSVWriter(manifest=True).write(make_frame(10), filepath)
+
+    mtime = filepath.stat().st_mtime + 2.0
+    os.utime(filepath, (mtime, mtime))
+
+    manifest = PriceStoreManifest(tmp_path)
+    assert manifest.get("AAPL") is not None
+    assert manifest.fresh_entry("AAPL") is None
+    assert manifest.fresh_entries() == {}
+
+
+def test_writer_without_manifest_leaves_no_index(tmp_path):
+    CSVWriter().write(make_frame(3), tmp_path / "AAPL.csv")
+
+    assert not (tmp_path / MANIFEST_FILENAME).exists()
+    assert PriceStoreManifest(tmp_path).fresh_entry("AAPL") is None
+
+
+def test_download_multiple_skips_current_symbols_without_reading(tmp_path):
+    today = datetime.now()
+    writer = CSVWriter(manifest=True)
+    writer.write(make_frame(5, end=today), tmp_path / "AAPL.csv")
+    writer.write(make_frame(5, end=today - timedelta(days=3)), tmp_path / "MSFT.csv")
+    reader = RecordingReader()
+    manager = StockDataManager(
+        reader=reader,
+        writer=writer,
+        downloader=NoDownloads(),
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+    )
+
+    assert manager.current_symbols(["AAPL", "MSFT", "GOOG"]) == ["AAPL"]
+
+    results = manager.download_multiple(["AAPL", "MSFT"], skip_current=True)
+
+    assert list(results) == ["MSFT"]
+    assert [path.stem for path in reader.paths] == ["MSFT"]
+    assert manager.last_download_summary.up_to_date == ["AAPL"]
+    assert "1 já atualizados" in manager.last_download_summary.render()
+
+
+class TailOnlyReader(CSVReader):
+    """CSVReader that counts full reads."""
+
+    def __init__(self):
+        super().__init__()
+        self.full_reads = 0
+
+    def read(self, filepath):
+        self.full_reads += 1
+        return super().read(filepath)
+
+
+class StaticDownloader:
+    def __init__(self, data):
+        self.data = data
+        self.configs = []
+
+    def download(self, config):
+        self.configs.append(config)
+        return self.data
+
+
+def _tail_manager(tmp_path, history, new):
+    writer = CSVWriter(append=True, manifest=True)
+    writer.write(history, tmp_path / "AAPL.csv")
+    reader = TailOnlyReader()
+    downloader = StaticDownloader(new)
+    manager = StockDataManager(
+        reader=reader,
+        writer=writer,
+        downloader=downloader,
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+    )
+    return manager, reader, downloader
+
+
+def test_download_and_save_updates_from_manifest_and_tail(tmp_path):
+    full = make_frame(40, end=datetime(2024, 2, 9))
+    manager, reader, downloader = _tail_manager(tmp_path, full.iloc[:38], full[38:])
+
+    result = manager.download_and_save("AAPL", full_history=False)
+
+    assert reader.full_reads == 0
+    assert downloader.configs[0].start_date == "2024-02-08"
+    assert len(result) == TAIL_OVERLAP_ROWS + 2
+    assert result.index[-1] == pd.Timestamp("2024-02-09")
+    rewritten = tmp_path / "rewrite" / "AAPL.csv"
+    CSVWriter().write(full, rewritten)
+    assert (tmp_path / "AAPL.csv").read_bytes() == rewritten.read_bytes()
+    assert manager.writer.stats.appends == 1
+
+
+def test_download_and_save_rereads_history_when_tail_is_revised(tmp_path):
+    full = make_frame(40, end=datetime(2024, 2, 9))
+    new = full.iloc[37:].copy()
+    new.iloc[0, 0] = 99.0
+    manager, reader, _ = _tail_manager(tmp_path, full.iloc[:38], new)
+
+    result = manager.download_and_save("AAPL", full_history=False)
+
+    assert reader.full_reads == 1
+    assert len(result) == 40
+    assert CSVReader().read(tmp_path / "AAPL.csv")["Close"].iloc[37] == 99.0
+
+
+def test_download_and_save_skips_current_symbol_from_manifest(tmp_path):
+    history = make_frame(30, end=datetime.now())
+    manager, reader, downloader = _tail_manager(tmp_path, history, history.iloc[:0])
+
+    result = manager.download_and_save("AAPL", full_history=False)
+
+    assert (reader.full_reads, downloader.configs) == (0, [])
+    assert len(result) == TAIL_OVERLAP_ROWS
+
+
+class BatchDownloader(StaticDownloader):
+    def download_batch(self, configs):
+        self.configs.extend(configs)
+        return {config.symbol: self.data for config in configs}
+
+
+def test_batched_update_prefetches_from_manifest_and_tails(tmp_path):
+    full = make_frame(40, end=datetime(2024, 2, 9))
+    writer = CSVWriter(append=True, manifest=True)
+    for symbol in ("AAPL", "MSFT"):
+        writer.write(full.iloc[:38], tmp_path / f"{symbol}.csv")
+    reader = TailOnlyReader()
+    downloader = BatchDownloader(full[38:])
+    manager = StockDataManager(
+        reader=reader,
+        writer=writer,
+        downloader=downloader,
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+    )
+    manager.BATCH_THRESHOLD = 2
+
+    results = manager.download_multiple(["AAPL", "MSFT"])
+
+    assert reader.full_reads == 0
+    assert [config.start_date for config in downloader.configs] == ["2024-02-08"] * 2
+    assert all(
+        result.index[-1] == pd.Timestamp("2024-02-09") for result in results.values()
+    )
+    assert writer.stats.appends == 2
+    assert len(CSVReader().read(tmp_path / "MSFT.csv")) == 40
@@ -0,0 +1,95 @@
+"""
+Tests for MmapPriceStore (memory-mapped, read-only columnar price store).
+
+No network access. No real CSV files from the project required.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_data_manager.repositories.mmap_store import MmapPriceStore, open_mmap_store
+
+
+def make_ohlcv_df(n: int = 30, tz: str | None = "UTC") -> pd.DataFrame:
+    dates = pd.date_range("2024-01-01", periods=n, freq="D", tz=tz, name="Date")
+    return pd.DataFrame(
+        {
+            "Open": np.arange(n, dtype=float) + 100,
+            "High": np.arange(n, dtype=float) + 101,
+            "Low": np.arange(n, dtype=float) + 99,
+            "Close": np.arange(n, dtype=float) + 100.5,
+            "Volume": np.arange(n, dtype=np.int64) * 1000 + 1_000_000,
+        },
+        index=dates,
+    )
+
+
+def test_build_and_load_roundtrip_preserves_frames(tmp_path):
+    frames = {
+        "AAPL": make_ohlcv_df(30),
+        "MSFT": make_ohlcv_df(12, tz="America/New_York"),
+        "NAIVE": make_ohlcv_df(5, tz=None),
+    }
+
+    store = MmapPriceStore.build(tmp_path / "store", frames.items())
+
+    assert store.list_symbols() == ["AAPL", "MSFT", "NAIVE"]
+    for symbol, df in frames.items():
+        pd.testing.assert_frame_equal(store.load_symbol(symbol), df, check_freq=False)
+
+
+def test_columns_and_dtypes_may_differ_between_symbols(tmp_path):
+    with_dividends = make_ohlcv_df(4).assign(Dividends=0.25)
+    float_volume = make_ohlcv_df(3).astype({"Volume": float})
+
+    store = MmapPriceStore.build(
+        tmp_path, [("A", with_dividends), ("B", float_volume), ("C", make_ohlcv_df(2))]
+    )
+
+    pd.testing.assert_frame_equal(
+        store.load_symbol("A"), with_dividends, check_freq=False
+    )
+    pd.testing.assert_frame_equal(
+        store.load_symbol("B"), float_volume, check_freq=False
+    )
+    assert "Dividends" not in store.load_symbol("C").columns
+
+
+def test_loaded_frames_are_read_only_views_of_the_mapping(tmp_path):
+    store = MmapPriceStore.build(
+        tmp_path, [("A", make_ohlcv_df()), ("B", make_ohlcv_df())]
+    )
+
+    close = store.load_symbol("B")["Close"].to_numpy()
+
+    assert not close.flags.writeable
+    assert np.shares_memory(close, store._array(store._symbols["B"]["columns"][3][1]))
+
+
+def test_missing_symbol_raises_file_not_found(tmp_path):
+    store = MmapPriceStore.build(tmp_path, [("A", make_ohlcv_df())])
+
+    assert "A" in store and "B" not in store
+    with pytest.raises(FileNotFoundError):
+        store.load_symbol("B")
+
+
+def test_non_numeric_columns_are_rejected(tmp_path):
+    df = make_ohlcv_df().assign(Note="x")
+
+    with pytest.raises(ValueError, match="Note"):
+        MmapPriceStore.build(tmp_path, [("A", df)])
+
+
+def test_open_mmap_store_reopens_rebuilt_store(tmp_path):
+    MmapPriceStore.build(tmp_path, [("A", make_ohlcv_df(3))])
+    assert open_mmap_store(str(tmp_path)) is open_mmap_store(str(tmp_path))
+
+    import os
+
+    MmapPriceStore.build(tmp_path, [("A", make_ohlcv_df(5))])
+    index = tmp_path / "index.json"
+    os.utime(index, ns=(index.stat().st_atime_ns, index.stat().st_mtime_ns + 1))
+
+    assert len(open_mmap_store(str(tmp_path)).load_symbol("A")) == 5
@@ -0,0 +1,158 @@
+"""
+Tests for ParquetPriceDataRepository, ParquetReader/ParquetWriter and the
+CSV -> Parquet importer.
+
+No network access. No real CSV files from the project required.
+"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from stock_data_manager.factories.manager_factory import StockDataManagerFactory
+from stock_data_manager.implementations.parquet_reader import ParquetReader
+from stock_data_manager.implementations.parquet_writer import ParquetWriter
+from stock_data_manager.importers.csv_to_parquet import import_csv_to_parquet
+from stock_data_manager.repositories.csv_repository import CsvPriceDataRepository
+from stock_data_manager.repositories.parquet_repository import (
+    ParquetPriceDataRepository,
+)
+
+
+def make_ohlcv_df(n: int = 30, tz: str = "UTC") -> pd.DataFrame:
+    dates = pd.date_range("2024-01-01", periods=n, freq="D", tz=tz)
+    dates.name = "Date"
+    return pd.DataFrame(
+        {
+            "Open": [float(100 + i) for i in range(n)],
+            "High": [float(101 + i) for i in range(n)],
+            "Low": [float(99 + i) for i in range(n)],
+            "Close": [float(100 + i) for i in range(n)],
+            "Volume": [1_000_000 + i * 1000 for i in range(n)],
+            "Dividends": [0.0] * n,
+            "Stock Splits": [0.0] * n,
+        },
+        index=dates,
+    )
+
+
+def test_save_and_load_symbol_roundtrip(tmp_path):
+    repo = ParquetPriceDataRepository(str(tmp_path))
+    df = make_ohlcv_df()
+
+    repo.save_symbol("AAPL", df.iloc[::-1])
+    loaded = repo.load_symbol("AAPL")
+
+    pd.testing.assert_frame_equal(loaded, df, check_freq=False)
+    assert str(loaded.index.tz) == "UTC"
+
+
+def test_save_normalizes_timezone_to_utc(tmp_path):
+    repo = ParquetPriceDataRepository(str(tmp_path))
+    df = make_ohlcv_df(tz="America/New_York")
+
+    repo.save_symbol("AAPL", df)
+    loaded = repo.load_symbol("AAPL")
+
+    assert str(loaded.index.tz) == "UTC"
+    assert list(loaded.index) == list(df.index.tz_convert("UTC"))
+
+
+def test_load_supports_column_projection_and_date_range(tmp_path):
+    repo = ParquetPriceDataRepository(str(tmp_path))
+    df = make_ohlcv_df()
+    repo.save_symbol("AAPL", df)
+
+    loaded = repo.load_symbol(
+        "AAPL", columns=["Close", "Volume"], start="2024-01-10", end="2024-01-14"
+    )
+
+    assert list(loaded.columns) == ["Close", "Volume"]
+    assert list(loaded.index) == list(df.loc["2024-01-10":"2024-01-14"].index)
+    assert list(loaded["Close"]) == [109.0, 110.0, 111.0, 112.0, 113.0]
+
+
+def test_missing_symbol_raises_and_reader_returns_none(tmp_path):
+    repo = ParquetPriceDataRepository(str(tmp_path))
+
+    with pytest.raises(FileNotFoundError):
+        repo.load_symbol("MISSING")
+    assert ParquetReader().read(tmp_path / "MISSING.csv") is None
+
+
+def test_list_symbols_returns_all_saved(tmp_path):
+    repo = ParquetPriceDataRepository(str(tmp_path))
+    for symbol in ("MSFT", "AAPL", "GOOG"):
+        repo.save_symbol(symbol, make_ohlcv_df())
+
+    assert repo.list_symbols() == ["AAPL", "GOOG", "MSFT"]
+
+
+def test_parquet_reader_and_writer_use_symbol_from_filepath(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    df = make_ohlcv_df()
+
+    ParquetWriter().write(df, filepath)
+    loaded = ParquetReader().read(filepath)
+
+    assert (tmp_path / "AAPL.parquet").exists()
+    assert not filepath.exists()
+    assert loaded is not None
+    assert list(loaded["Close"]) == pytest.approx(list(df["Close"]))
+
+
+def test_factory_selects_parquet_storage(tmp_path):
+    manager = StockDataManagerFactory.create_default(
+        data_dir=str(tmp_path), storage="parquet"
+    )
+
+    assert isinstance(manager.reader, ParquetReader)
+    assert isinstance(manager.writer, ParquetWriter)
+
+
+def test_import_csv_to_parquet_matches_csv_load(tmp_path):
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    make_ohlcv_df().to_csv(csv_dir / "TSLA.csv")
+    parquet_dir = tmp_path / "parquet"
+
+    import_csv_to_parquet(str(csv_dir), str(parquet_dir))
+
+    from_csv = CsvPriceDataRepository(str(csv_dir)).load_symbol("TSLA")
+    from_parquet = ParquetPriceDataRepository(str(parquet_dir)).load_symbol("TSLA")
+    pd.testing.assert_frame_equal(from_parquet, from_csv)
+
+
+def test_load_tail_reads_last_rows(tmp_path):
+    repo = ParquetPriceDataRepository(str(tmp_path))
+    df = make_ohlcv_df(n=1200)
+    repo.save_symbol("AAPL", df)
+
+    tail = repo.load_tail("AAPL", 5)
+
+    pd.testing.assert_frame_equal(tail, df.iloc[-5:], check_freq=False)
+
+
+def test_parquet_writer_append_skips_unchanged_data(tmp_path):
+    filepath = tmp_path / "AAPL.csv"
+    writer = ParquetWriter(append=True)
+    df = make_ohlcv_df()
+    writer.write(df, filepath)
+
+    writer.write(df, filepath)
+    writer.write(make_ohlcv_df(n=31), filepath)
+
+    assert writer.stats.skipped == 1
+    assert writer.stats.rewrites == 2
+    assert len(ParquetReader().read(filepath)) == 31
+
+
+def test_parquet_writer_maintains_manifest(tmp_path):
+    from stock_data_manager.repositories.manifest import PriceStoreManifest
+
+    ParquetWriter(manifest=True).write(make_ohlcv_df(), tmp_path / "AAPL.csv")
+
+    entry = PriceStoreManifest(tmp_path).fresh_entry("AAPL")
+    assert entry.filename == "AAPL.parquet"
+    assert entry.rows == 30
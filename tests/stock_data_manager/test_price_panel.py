@@ -0,0 +1,169 @@
+"""
+Tests for PricePanel and the load_panel implementations of the CSV, SQLite
+and Parquet repositories.
+
+No network access. No real CSV files from the project required.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_data_manager.models import PricePanel
+from stock_data_manager.repositories.csv_repository import CsvPriceDataRepository
+from stock_data_manager.repositories.sqlite_repository import SqlitePriceDataRepository
+
+
+def make_ohlcv_df(start: str, n: int, tz: str = "America/New_York") -> pd.DataFrame:
+    dates = pd.date_range(start, periods=n, freq="D", tz=tz)
+    dates.name = "Date"
+    base = np.arange(n, dtype=float)
+    return pd.DataFrame(
+        {
+            "Open": 100 + base,
+            "High": 101 + base,
+            "Low": 99 + base,
+            "Close": 100.5 + base,
+            "Volume": 1_000_000 + 1000 * base,
+            "Dividends": 0.0,
+            "Stock Splits": 0.0,
+        },
+        index=dates,
+    )
+
+
+FRAMES = {
+    "AAPL": make_ohlcv_df("2024-01-01", 10),
+    "MSFT": make_ohlcv_df("2024-01-05", 10),
+}
+
+
+def make_sqlite_repo(tmp_path):
+    repo = SqlitePriceDataRepository(str(tmp_path / "prices.db"))
+    for symbol, df in FRAMES.items():
+        repo.save_symbol(symbol, df)
+    return repo
+
+
+def make_csv_repo(tmp_path):
+    for symbol, df in FRAMES.items():
+        df.to_csv(tmp_path / f"{symbol}.csv")
+    return CsvPriceDataRepository(str(tmp_path))
+
+
+def make_parquet_repo(tmp_path):
+    pytest.importorskip("pyarrow")
+    from stock_data_manager.repositories.parquet_repository import (
+        ParquetPriceDataRepository,
+    )
+
+    repo = ParquetPriceDataRepository(str(tmp_path))
+    for symbol, df in FRAMES.items():
+        repo.save_symbol(symbol, df)
+    return repo
+
+
+REPOSITORIES = [make_sqlite_repo, make_csv_repo, make_parquet_repo]
+
+
+@pytest.mark.parametrize("make_repo", REPOSITORIES)
+def test_load_panel_aligns_symbols_on_union_of_dates(tmp_path, make_repo):
+    repo = make_repo(tmp_path)
+
+    panel = repo.load_panel(["MSFT", "AAPL"], fields=["Close", "Volume"])
+
+    assert panel.symbols == ["MSFT", "AAPL"]
+    assert panel.fields == ["Close", "Volume"]
+    assert len(panel.dates) == 14
+    assert panel.dates.tz is None
+    assert panel["Close"].shape == panel.valid.shape == (14, 2)
+    assert panel.valid[:, 1].tolist() == [True] * 10 + [False] * 4
+    assert panel.valid[:, 0].tolist() == [False] * 4 + [True] * 10
+    assert np.isnan(panel["Close"][~panel.valid]).all()
+    np.testing.assert_array_equal(panel["Close"][:10, 1], FRAMES["AAPL"]["Close"])
+    np.testing.assert_array_equal(panel["Volume"][4:, 0], FRAMES["MSFT"]["Volume"])
+
+
+@pytest.mark.parametrize("make_repo", REPOSITORIES)
+def test_load_panel_filters_dates_inclusively(tmp_path, make_repo):
+    repo = make_repo(tmp_path)
+    start = FRAMES["AAPL"].index[2]
+    end = FRAMES["AAPL"].index[6]
+
+    panel = repo.load_panel(["AAPL", "MSFT"], fields=["Close"], start=start, end=end)
+
+    assert list(panel.dates) == list(FRAMES["AAPL"].index[2:7].tz_localize(None))
+    assert panel.valid[:, 0].all()
+    assert panel.valid[:, 1].tolist() == [False, False, True, True, True]
+
+
+@pytest.mark.parametrize("make_repo", REPOSITORIES)
+def test_load_panel_aligns_exchanges_on_session_dates(tmp_path, make_repo):
+    repo = make_repo(tmp_path)
+    repo.save_symbol("PETR4.SA", make_ohlcv_df("2024-01-02", 3, "America/Sao_Paulo"))
+
+    panel = repo.load_panel(
+        ["AAPL", "PETR4.SA"], fields=["Close"], start="2024-01-02", end="2024-01-04"
+    )
+
+    assert list(panel.dates) == list(pd.date_range("2024-01-02", periods=3))
+    assert panel.valid.all()
+
+
+@pytest.mark.parametrize("make_repo", REPOSITORIES)
+def test_load_panel_marks_missing_symbol_invalid(tmp_path, make_repo):
+    repo = make_repo(tmp_path)
+
+    panel = repo.load_panel(["AAPL", "MISSING"], fields=["Close"])
+
+    assert panel.symbols == ["AAPL", "MISSING"]
+    assert not panel.valid[:, 1].any()
+    assert np.isnan(panel["Close"][:, 1]).all()
+
+
+def test_sqlite_load_panel_matches_frames(tmp_path):
+    repo = make_sqlite_repo(tmp_path)
+    symbols = list(FRAMES)
+
+    from_sql = repo.load_panel(symbols)
+    from_frames = PricePanel.from_frames({s: repo.load_symbol(s) for s in symbols})
+
+    pd.testing.assert_index_equal(from_sql.dates, from_frames.dates)
+    np.testing.assert_array_equal(from_sql.valid, from_frames.valid)
+    for field in from_sql.fields:
+        np.testing.assert_array_equal(from_sql[field], from_frames[field])
+
+
+def test_sqlite_load_panel_chunks_large_universes(tmp_path, monkeypatch):
+    import stock_data_manager.repositories.sqlite_repository as sqlite_repository
+
+    monkeypatch.setattr(sqlite_repository, "_PANEL_QUERY_SYMBOLS", 1)
+    repo = make_sqlite_repo(tmp_path)
+
+    panel = repo.load_panel(["AAPL", "MSFT"], fields=["Close"])
+
+    assert panel.valid.sum() == 20
+
+
+def test_sqlite_load_panel_rejects_unknown_field(tmp_path):
+    repo = make_sqlite_repo(tmp_path)
+
+    with pytest.raises(ValueError):
+        repo.load_panel(["AAPL"], fields=["Adj Close"])
+
+
+def test_frame_returns_dates_by_symbols_view():
+    panel = PricePanel.from_frames({"AAPL": FRAMES["AAPL"], "EMPTY": None}, ["Close"])
+
+    frame = panel.frame("Close")
+
+    assert list(frame.columns) == ["AAPL", "EMPTY"]
+    assert frame["AAPL"].tolist() == FRAMES["AAPL"]["Close"].tolist()
+    assert np.shares_memory(frame.to_numpy(), panel["Close"])
+
+
+def test_from_frames_with_no_data_is_empty():
+    panel = PricePanel.from_frames({"AAPL": None}, ["Close"])
+
+    assert len(panel.dates) == 0
+    assert panel["Close"].shape == (0, 1)
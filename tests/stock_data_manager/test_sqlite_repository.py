@@ -4,6 +4,8 @@ Tests for SqlitePriceDataRepository and CsvPriceDataRepository.
 No network access. No real CSV files from the project required.
 """
 
+from pathlib import Path
+
 import pandas as pd
 import pytest
 
@@ -178,3 +180,107 @@ def test_sqlite_reader_and_writer_use_symbol_from_filepath(tmp_path):
     assert loaded is not None
     assert len(loaded) == len(df)
     assert list(loaded["Close"]) == pytest.approx(list(df["Close"]))
+
+
+def test_sqlite_writer_append_inserts_only_new_rows(tmp_path):
+    db_path = _db_path(tmp_path)
+    writer = SQLiteWriter(db_path, append=True)
+    filepath = Path("data/1D/AAPL.csv")
+    full = make_ohlcv_df(8)
+    writer.write(full.iloc[:5], filepath)
+
+    writer.write(full, filepath)
+
+    assert (writer.stats.rewrites, writer.stats.appends) == (1, 1)
+    assert writer.stats.rows_written == 8
+    assert len(SqlitePriceDataRepository(db_path).load_symbol("AAPL")) == 8
+
+    revised = full.copy()
+    revised.iloc[-1, revised.columns.get_loc("Close")] = 1.0
+    writer.write(revised, filepath)
+
+    assert writer.stats.rewrites == 2
+    loaded = SqlitePriceDataRepository(db_path).load_symbol("AAPL")
+    assert loaded["Close"].iloc[-1] == 1.0
+
+
+@pytest.mark.parametrize("tz", ["UTC", "America/New_York", "Asia/Kolkata", None])
+def test_stored_dates_match_timestamp_isoformat(tmp_path, tz):
+    """The vectorized date text must match the per-row format of older DBs."""
+    import sqlite3
+
+    db_path = _db_path(tmp_path)
+    df = make_ohlcv_df(400, tz=tz)
+    SqlitePriceDataRepository(db_path).save_symbol("AAPL", df)
+
+    with sqlite3.connect(db_path) as conn:
+        stored = [
+            row[0] for row in conn.execute("SELECT date FROM ohlcv_daily ORDER BY date")
+        ]
+
+    assert stored == sorted(ts.isoformat() for ts in df.index)
+
+
+def test_missing_values_are_stored_as_null_and_loaded_as_nan(tmp_path):
+    repo = SqlitePriceDataRepository(_db_path(tmp_path))
+    df = make_ohlcv_df(3).drop(columns=["Dividends", "Stock Splits"])
+    df.iloc[1, df.columns.get_loc("Close")] = float("nan")
+
+    repo.save_symbol("AAPL", df)
+    loaded = repo.load_symbol("AAPL")
+
+    assert pd.isna(loaded["Close"].iloc[1])
+    assert loaded["Dividends"].isna().all()
+    assert loaded["Close"].dtype == "float64"
+
+
+def test_transaction_commits_all_symbols_once(tmp_path):
+    db_path = _db_path(tmp_path)
+    repo = SqlitePriceDataRepository(db_path)
+
+    with repo.transaction():
+        repo.save_symbol("AAPL", make_ohlcv_df())
+        repo.save_symbol("MSFT", make_ohlcv_df())
+        # Other connections do not see the batch before the commit
+        assert SqlitePriceDataRepository(db_path).list_symbols() == []
+
+    assert SqlitePriceDataRepository(db_path).list_symbols() == ["AAPL", "MSFT"]
+
+
+def test_transaction_rolls_back_on_error(tmp_path):
+    repo = SqlitePriceDataRepository(_db_path(tmp_path))
+
+    with pytest.raises(RuntimeError), repo.transaction():
+        repo.save_symbol("AAPL", make_ohlcv_df())
+        raise RuntimeError("boom")
+
+    assert repo.list_symbols() == []
+
+
+def test_failed_write_inside_transaction_leaves_no_partial_rows(tmp_path):
+    repo = SqlitePriceDataRepository(_db_path(tmp_path))
+    bad = make_ohlcv_df(3).astype({"Close": object})
+    bad.iloc[2, bad.columns.get_loc("Close")] = "not a number"
+
+    with repo.transaction():
+        repo.save_symbol("AAPL", make_ohlcv_df())
+        with pytest.raises(ValueError):
+            repo.save_symbol("BAD", bad)
+
+    assert repo.list_symbols() == ["AAPL"]
+
+
+def test_connection_is_reused_per_thread(tmp_path):
+    import threading
+
+    repo = SqlitePriceDataRepository(_db_path(tmp_path))
+    assert repo._connect() is repo._connect()
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(repo._connect()))
+    thread.start()
+    thread.join()
+    assert other[0] is not repo._connect()
+
+    repo.close()
+    assert repo.list_symbols() == []
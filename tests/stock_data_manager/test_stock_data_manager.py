@@ -37,7 +37,7 @@ class FakeDownloader:
 
 class FailingDownloader:
     def download(self, config):
-        raise RuntimeError(f"download failed for {config.symbol}")
+        raise ConnectionError(f"download failed for {config.symbol}")
 
 
 def test_download_and_save_downloads_incremental_data_merges_and_writes(tmp_path):
@@ -109,3 +109,171 @@ def test_download_multiple_returns_none_for_failed_symbol(tmp_path):
     result = manager.download_multiple(["AAPL"])
 
     assert result == {"AAPL": None}
+
+
+class MappingReader:
+    def __init__(self, frames):
+        self.frames = frames
+
+    def read(self, filepath):
+        return self.frames.get(filepath.stem)
+
+
+class FakeBatchDownloader(FakeDownloader):
+    def __init__(self, data, missing=()):
+        super().__init__(data)
+        self.missing = set(missing)
+        self.batches = []
+
+    def download(self, config):
+        # Ticker.history devolve índice com timezone; o lote, sem
+        self.configs.append(config)
+        return self.data.tz_localize("America/New_York")
+
+    def download_batch(self, configs):
+        self.batches.append(configs)
+        return {
+            config.symbol: self.data
+            for config in configs
+            if config.symbol not in self.missing
+        }
+
+
+def test_download_multiple_uses_batch_for_many_incremental_symbols(tmp_path):
+    existing_index = pd.DatetimeIndex(["2024-01-01"]).tz_localize("America/New_York")
+    existing = pd.DataFrame({"Close": [10.0]}, index=existing_index)
+    new = pd.DataFrame({"Close": [11.0]}, index=pd.to_datetime(["2024-01-02"]))
+    symbols = [f"SYM{i}" for i in range(StockDataManager.BATCH_THRESHOLD)]
+    writer = FakeWriter()
+    downloader = FakeBatchDownloader(new, missing={"SYM0"})
+    manager = StockDataManager(
+        reader=MappingReader({symbol: existing for symbol in symbols}),
+        writer=writer,
+        downloader=downloader,
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+    )
+
+    results = manager.download_multiple(symbols)
+
+    assert len(downloader.batches) == 1
+    assert [c.symbol for c in downloader.batches[0]] == symbols
+    assert {c.start_date for c in downloader.batches[0]} == {"2024-01-02"}
+    # Ausente do lote: baixado individualmente
+    assert [c.symbol for c in downloader.configs] == ["SYM0"]
+    assert len(writer.calls) == len(symbols)
+    expected_index = pd.DatetimeIndex(["2024-01-01", "2024-01-02"]).tz_localize(
+        "America/New_York"
+    )
+    assert list(results["SYM1"].index) == list(expected_index)
+    assert manager.last_download_summary.succeeded == len(symbols)
+
+
+def _batch_update(existing, new, tmp_path):
+    symbols = [f"SYM{i}" for i in range(StockDataManager.BATCH_THRESHOLD)]
+    downloader = FakeBatchDownloader(new)
+    manager = StockDataManager(
+        reader=MappingReader({symbol: existing for symbol in symbols}),
+        writer=FakeWriter(),
+        downloader=downloader,
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+    )
+    return manager.download_multiple(symbols), downloader
+
+
+def test_download_multiple_batch_localizes_new_bars_across_dst(tmp_path):
+    existing_index = pd.DatetimeIndex(["2025-10-31"]).tz_localize("America/New_York")
+    existing = pd.DataFrame({"Close": [10.0]}, index=existing_index)
+    new = pd.DataFrame({"Close": [11.0]}, index=pd.to_datetime(["2025-11-03"]))
+
+    results, downloader = _batch_update(existing, new, tmp_path)
+
+    assert [str(date) for date in results["SYM1"].index] == [
+        "2025-10-31 00:00:00-04:00",
+        "2025-11-03 00:00:00-05:00",
+    ]
+    assert downloader.configs == []
+
+
+def test_download_multiple_batch_never_copies_a_fixed_offset(tmp_path):
+    # Como lido de um CSV: offset fixo, sem o nome do timezone
+    existing_index = pd.DatetimeIndex(["2025-10-31 00:00:00-04:00"])
+    existing = pd.DataFrame({"Close": [10.0]}, index=existing_index)
+    new = pd.DataFrame({"Close": [11.0]}, index=pd.to_datetime(["2025-11-03"]))
+
+    results, downloader = _batch_update(existing, new, tmp_path)
+
+    # Baixados individualmente, com o timezone da bolsa
+    assert len(downloader.configs) == StockDataManager.BATCH_THRESHOLD
+    assert str(results["SYM1"].index[-1]) == "2025-11-03 00:00:00-05:00"
+
+
+def test_download_multiple_skips_batch_for_full_downloads(tmp_path):
+    symbols = [f"SYM{i}" for i in range(StockDataManager.BATCH_THRESHOLD)]
+    new = pd.DataFrame({"Close": [11.0]}, index=pd.to_datetime(["2024-01-02"]))
+    downloader = FakeBatchDownloader(new)
+    manager = StockDataManager(
+        reader=FakeReader(None),
+        writer=FakeWriter(),
+        downloader=downloader,
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+    )
+
+    manager.download_multiple(symbols)
+    manager.download_multiple(symbols, force_full=True)
+
+    assert downloader.batches == []
+    assert len(downloader.configs) == 2 * len(symbols)
+
+
+def test_download_multiple_reports_write_stats_for_append_writes(tmp_path):
+    from stock_data_manager.implementations.csv_reader import CSVReader
+    from stock_data_manager.implementations.csv_writer import CSVWriter
+
+    index = pd.date_range("2024-01-01", periods=4, freq="D", tz="America/New_York")
+    history = pd.DataFrame({"Close": [10.0, 11.0, 12.0, 13.0]}, index=index)
+    writer = CSVWriter(append=True)
+    writer.write(history.iloc[:3], tmp_path / "AAPL.csv")
+    manager = StockDataManager(
+        reader=CSVReader(),
+        writer=writer,
+        downloader=FakeDownloader(history.iloc[3:]),
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+    )
+
+    result = manager.download_multiple(["AAPL"])
+
+    stats = manager.last_download_summary.write_stats
+    assert (stats.appends, stats.rewrites, stats.rows_written) == (1, 0, 1)
+    assert 0 < stats.bytes_written < (tmp_path / "AAPL.csv").stat().st_size
+    assert "1 appends" in manager.last_download_summary.render()
+    assert list(result["AAPL"]["Close"]) == [10.0, 11.0, 12.0, 13.0]
+
+
+def test_download_and_save_appends_new_bars_with_their_own_offset(tmp_path):
+    from stock_data_manager.implementations.csv_reader import CSVReader
+    from stock_data_manager.implementations.csv_writer import CSVWriter
+
+    index = pd.DatetimeIndex(
+        ["2025-10-30", "2025-10-31", "2025-11-03", "2025-11-04"]
+    ).tz_localize("America/New_York")
+    history = pd.DataFrame({"Close": [10.0, 11.0, 12.0, 13.0]}, index=index)
+    writer = CSVWriter(append=True)
+    writer.write(history.iloc[:2], tmp_path / "AAPL.csv")
+    manager = StockDataManager(
+        reader=CSVReader(),
+        writer=writer,
+        downloader=FakeDownloader(history.iloc[2:]),
+        merge_strategy=AppendMergeStrategy(),
+        data_dir=str(tmp_path),
+    )
+
+    manager.download_and_save("AAPL")
+
+    rewritten = tmp_path / "rewrite.csv"
+    CSVWriter().write(history, rewritten)
+    assert writer.stats.appends == 1
+    assert (tmp_path / "AAPL.csv").read_bytes() == rewritten.read_bytes()
@@ -0,0 +1,117 @@
+"""
+Tests for YFinanceDownloader.download_batch / split_batch.
+
+No network access: yf.download is replaced by a fake returning a
+multi-ticker frame.
+"""
+
+import numpy as np
+import pandas as pd
+
+from stock_data_manager.implementations import yfinance_downloader
+from stock_data_manager.implementations.yfinance_downloader import YFinanceDownloader
+from stock_data_manager.models.stock_config import StockConfig
+
+FIELDS = ["Close", "Dividends", "High", "Low", "Open", "Stock Splits", "Volume"]
+
+
+def make_batch_frame(symbols, dates):
+    index = pd.DatetimeIndex(pd.to_datetime(dates), name="Date")
+    frames = {}
+    for n, symbol in enumerate(symbols):
+        frames[symbol] = pd.DataFrame(
+            {field: np.arange(len(dates), dtype=float) + n for field in FIELDS},
+            index=index,
+        )
+    return pd.concat(frames, axis=1)
+
+
+def test_split_batch_returns_history_shaped_frames_per_symbol():
+    data = make_batch_frame(["AAPL", "7203.T"], ["2024-01-02", "2024-01-03"])
+    # Feriado local: sem barra para 7203.T no segundo dia
+    data.loc["2024-01-03", "7203.T"] = np.nan
+
+    frames = YFinanceDownloader.split_batch(data, ["AAPL", "7203.T", "MISSING"])
+
+    assert set(frames) == {"AAPL", "7203.T"}
+    assert list(frames["AAPL"].columns) == YFinanceDownloader.HISTORY_COLUMNS
+    assert len(frames["AAPL"]) == 2
+    assert frames["AAPL"]["Volume"].dtype == "int64"
+    assert list(frames["7203.T"].index) == [pd.Timestamp("2024-01-02")]
+
+
+def test_split_batch_accepts_flat_single_ticker_frame():
+    data = make_batch_frame(["AAPL"], ["2024-01-02"])["AAPL"]
+
+    frames = YFinanceDownloader.split_batch(data, ["AAPL"])
+
+    assert list(frames) == ["AAPL"]
+    assert YFinanceDownloader.split_batch(data, ["AAPL", "MSFT"]) == {}
+    assert YFinanceDownloader.split_batch(None, ["AAPL"]) == {}
+
+
+def test_download_batch_groups_by_start_date_and_chunks(monkeypatch):
+    calls = []
+
+    def fake_download(tickers, start=None, end=None, interval=None, **kwargs):
+        calls.append((list(tickers), start, interval))
+        return make_batch_frame(tickers, [start])
+
+    monkeypatch.setattr(yfinance_downloader.yf, "download", fake_download)
+    monkeypatch.setattr(YFinanceDownloader, "BATCH_SIZE", 2)
+    configs = [
+        StockConfig("A", start_date="2024-01-02", end_date="2024-01-05"),
+        StockConfig("B", start_date="2024-01-02", end_date="2024-01-05"),
+        StockConfig("C", start_date="2024-01-02", end_date="2024-01-05"),
+        StockConfig("D", start_date="2024-01-03", end_date="2024-01-05"),
+    ]
+
+    frames = YFinanceDownloader().download_batch(configs)
+
+    assert calls == [
+        (["A", "B"], "2024-01-02", "1D"),
+        (["C"], "2024-01-02", "1D"),
+        (["D"], "2024-01-03", "1D"),
+    ]
+    assert sorted(frames) == ["A", "B", "C", "D"]
+    assert frames["D"].index[0] == pd.Timestamp("2024-01-03")
+
+
+def test_download_batch_keeps_each_exchange_timezone_across_dst(monkeypatch):
+    # Lote com bolsas diferentes: o yfinance converte tudo para UTC
+    new_york = pd.DatetimeIndex(["2025-10-31", "2025-11-03"]).tz_localize(
+        "America/New_York"
+    )
+    tokyo = pd.DatetimeIndex(["2025-10-31", "2025-11-04"]).tz_localize("Asia/Tokyo")
+
+    def fake_download(tickers, **kwargs):
+        assert kwargs["ignore_tz"] is False
+        frames = {
+            "AAPL": pd.DataFrame(
+                {"Close": [1.0, 2.0]}, index=new_york.tz_convert("UTC")
+            ),
+            "7203.T": pd.DataFrame(
+                {"Close": [3.0, 4.0]}, index=tokyo.tz_convert("UTC")
+            ),
+            "NOTZ": pd.DataFrame(
+                {"Close": [5.0, 6.0]}, index=new_york.tz_convert("UTC")
+            ),
+        }
+        return pd.concat(frames, axis=1)
+
+    timezones = {"AAPL": "America/New_York", "7203.T": "Asia/Tokyo", "NOTZ": None}
+    monkeypatch.setattr(yfinance_downloader.yf, "download", fake_download)
+    monkeypatch.setattr(
+        YFinanceDownloader, "exchange_timezone", lambda self, s: timezones[s]
+    )
+    configs = [StockConfig(symbol, start_date="2025-10-31") for symbol in timezones]
+
+    frames = YFinanceDownloader().download_batch(configs)
+
+    assert [str(date) for date in frames["AAPL"].index] == [
+        "2025-10-31 00:00:00-04:00",
+        "2025-11-03 00:00:00-05:00",
+    ]
+    assert list(frames["7203.T"].index) == list(tokyo)
+    # Sem timezone da bolsa: fica fora, e o chamador baixa individualmente
+    assert "NOTZ" not in frames
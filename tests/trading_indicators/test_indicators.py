@@ -9,6 +9,8 @@ Execução:
 
 from __future__ import annotations
 
+import dataclasses
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -21,6 +23,11 @@ from trading_indicators.signals.aggregator import (
     LuxSignalStrategy,
     SMCSignalStrategy,
 )
+from trading_indicators.utils.features import (
+    FeatureGraph,
+    resolve_features,
+    shared_features,
+)
 from trading_indicators.utils.types import SignalType, Trend
 
 
@@ -193,6 +200,98 @@ class TestAggregator:
         assert len(signals) == len(df)
         assert signals.dtype == object  # SignalType enum
 
+    def test_as_codes_returns_int8_codes(self, df, smc_result, lux_result):
+        from trading_indicators.signals.aggregator import SIGNAL_CODES, decode_signals
+
+        agg = CompositeSignalAggregator(
+            AggregationRule(require_agreement=False, min_strategies=1)
+        )
+        agg.add(SMCSignalStrategy(smc_result)).add(LuxSignalStrategy(lux_result))
+
+        codes = agg.aggregate(df, as_codes=True)
+        assert codes.dtype == np.int8
+        assert set(codes.unique()) <= {
+            SIGNAL_CODES[SignalType.BUY],
+            SIGNAL_CODES[SignalType.SELL],
+            SIGNAL_CODES[SignalType.NONE],
+        }
+        pd.testing.assert_series_equal(
+            decode_signals(codes.to_numpy(), df.index), agg.aggregate(df)
+        )
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            AggregationRule(require_agreement=True),
+            AggregationRule(require_agreement=False, min_strategies=1),
+            AggregationRule(require_agreement=False, min_strategies=2),
+        ],
+    )
+    def test_matches_row_loop_reference(self, df, smc_result, lux_result, rule):
+        class _PlainStrategy:
+            """Estratégia sem generate_codes (caminho de codificação genérico)."""
+
+            def __init__(self, signals):
+                self._signals = signals
+
+            def generate(self, df):
+                return self._signals
+
+        contra = pd.Series(SignalType.NONE, index=df.index)
+        contra.iloc[::7] = SignalType.CONTRA_BUY
+        contra.iloc[3::11] = SignalType.STRONG_SELL
+
+        strategies = [
+            SMCSignalStrategy(smc_result),
+            LuxSignalStrategy(lux_result),
+            _PlainStrategy(contra),
+        ]
+        agg = CompositeSignalAggregator(rule)
+        for strategy in strategies:
+            agg.add(strategy)
+
+        expected = _aggregate_reference(df, strategies, rule)
+        pd.testing.assert_series_equal(agg.aggregate(df), expected)
+
+    def test_strategy_signals_match_overwrite_order(self, df, lux_result, smc_result):
+        lux = pd.Series(SignalType.NONE, index=df.index)
+        lux[lux_result.valid_buy] = SignalType.BUY
+        lux[lux_result.valid_sell] = SignalType.SELL
+        lux[lux_result.valid_buy & lux_result.is_strong] = SignalType.STRONG_BUY
+        lux[lux_result.valid_sell & lux_result.is_strong] = SignalType.STRONG_SELL
+        lux[lux_result.contra_buy] = SignalType.CONTRA_BUY
+        lux[lux_result.contra_sell] = SignalType.CONTRA_SELL
+
+        smc = pd.Series(SignalType.NONE, index=df.index)
+        smc[smc_result.long_signal] = SignalType.BUY
+        smc[smc_result.short_signal] = SignalType.SELL
+
+        pd.testing.assert_series_equal(LuxSignalStrategy(lux_result).generate(df), lux)
+        pd.testing.assert_series_equal(SMCSignalStrategy(smc_result).generate(df), smc)
+
+
+def _aggregate_reference(df, strategies, rule):
+    """Implementação original (loop por candle) usada como oráculo."""
+    all_signals = pd.DataFrame({i: s.generate(df) for i, s in enumerate(strategies)})
+    buy_types = {SignalType.BUY, SignalType.STRONG_BUY, SignalType.CONTRA_BUY}
+    sell_types = {SignalType.SELL, SignalType.STRONG_SELL, SignalType.CONTRA_SELL}
+    result = pd.Series(SignalType.NONE, index=df.index)
+    for idx in df.index:
+        row = all_signals.loc[idx]
+        buy_count = sum(1 for v in row if v in buy_types)
+        sell_count = sum(1 for v in row if v in sell_types)
+        if rule.require_agreement:
+            if buy_count == len(strategies):
+                result[idx] = SignalType.BUY
+            elif sell_count == len(strategies):
+                result[idx] = SignalType.SELL
+        else:
+            if buy_count >= rule.min_strategies:
+                result[idx] = SignalType.BUY
+            elif sell_count >= rule.min_strategies:
+                result[idx] = SignalType.SELL
+    return result
+
 
 # ─── Testes de Primitivas TA ───────────────────────────────────────────────────
 
@@ -218,3 +317,307 @@ class TestTAPrimitives:
         df = make_df(300)
         _, direction = supertrend(df["high"], df["low"], df["close"])
         assert set(direction.dropna().unique()).issubset({-1, 1})
+
+
+# ─── Equivalência de kernels vetorizados ───────────────────────────────────────
+
+
+def _supertrend_reference(high, low, close, multiplier=3.0, length=10):
+    """Implementação original (loop com Series.iloc) usada como oráculo."""
+    from trading_indicators.utils.ta_primitives import _true_range
+
+    hl2 = (high + low) / 2
+    atr = _true_range(high, low, close).ewm(span=length, adjust=False).mean()
+    upper_band = hl2 + multiplier * atr
+    lower_band = hl2 - multiplier * atr
+
+    st = pd.Series(np.nan, index=close.index)
+    direction = pd.Series(1, index=close.index)
+    for i in range(1, len(close)):
+        prev_dir = direction.iloc[i - 1]
+        prev_close = close.iloc[i - 1]
+        curr_upper = upper_band.iloc[i]
+        curr_lower = lower_band.iloc[i]
+        final_upper = (
+            curr_upper
+            if curr_upper < upper_band.iloc[i - 1]
+            or prev_close > upper_band.iloc[i - 1]
+            else upper_band.iloc[i - 1]
+        )
+        final_lower = (
+            curr_lower
+            if curr_lower > lower_band.iloc[i - 1]
+            or prev_close < lower_band.iloc[i - 1]
+            else lower_band.iloc[i - 1]
+        )
+        upper_band.iloc[i] = final_upper
+        lower_band.iloc[i] = final_lower
+        if prev_dir == 1 and close.iloc[i] > final_upper:
+            direction.iloc[i] = -1
+        elif prev_dir == -1 and close.iloc[i] < final_lower:
+            direction.iloc[i] = 1
+        else:
+            direction.iloc[i] = prev_dir
+        st.iloc[i] = final_lower if direction.iloc[i] == -1 else final_upper
+    return st, direction
+
+
+def _pivot_reference(series, left_bars, right_bars, use_max):
+    """Implementação original (janela via Series.iloc por barra)."""
+    result = pd.Series(np.nan, index=series.index)
+    for i in range(left_bars, len(series) - right_bars):
+        window = series.iloc[i - left_bars : i + right_bars + 1]
+        extreme = window.max() if use_max else window.min()
+        if series.iloc[i] == extreme:
+            result.iloc[i] = series.iloc[i]
+    return result
+
+
+class TestVectorizedKernels:
+    @pytest.mark.parametrize("seed", [0, 1, 42])
+    @pytest.mark.parametrize("multiplier,length", [(3.0, 10), (1.5, 14)])
+    def test_supertrend_matches_reference(self, seed, multiplier, length):
+        from trading_indicators.utils.ta_primitives import supertrend
+
+        df = make_df(600, seed=seed)
+        expected = _supertrend_reference(
+            df["high"], df["low"], df["close"], multiplier, length
+        )
+        actual = supertrend(df["high"], df["low"], df["close"], multiplier, length)
+
+        pd.testing.assert_series_equal(actual[0], expected[0])
+        pd.testing.assert_series_equal(actual[1], expected[1])
+
+    def test_supertrend_matches_reference_with_gaps_and_flat_bars(self):
+        from trading_indicators.utils.ta_primitives import supertrend
+
+        df = make_df(300, seed=3)
+        df.iloc[50:55] = np.nan
+        df.iloc[100:140, df.columns.get_indexer(["high", "low", "close"])] = 100.0
+
+        expected = _supertrend_reference(df["high"], df["low"], df["close"])
+        actual = supertrend(df["high"], df["low"], df["close"])
+
+        pd.testing.assert_series_equal(actual[0], expected[0])
+        pd.testing.assert_series_equal(actual[1], expected[1])
+
+    def test_supertrend_empty_and_single_bar(self):
+        from trading_indicators.utils.ta_primitives import supertrend
+
+        for n in (0, 1):
+            s = pd.Series([100.0] * n, dtype=float)
+            st, direction = supertrend(s, s, s)
+            assert len(st) == n and len(direction) == n
+
+    @pytest.mark.parametrize("left,right", [(10, 10), (3, 5), (0, 2), (4, 0)])
+    def test_pivots_match_reference(self, left, right):
+        from trading_indicators.utils.ta_primitives import pivot_high, pivot_low
+
+        df = make_df(400, seed=5)
+        # Arredondar força empates dentro das janelas
+        high = df["high"].round(0)
+        low = df["low"].round(0)
+        high.iloc[[20, 21, 150]] = np.nan
+        low.iloc[[30, 200]] = np.nan
+
+        pd.testing.assert_series_equal(
+            pivot_high(high, left, right), _pivot_reference(high, left, right, True)
+        )
+        pd.testing.assert_series_equal(
+            pivot_low(low, left, right), _pivot_reference(low, left, right, False)
+        )
+
+    def test_pivots_ties_and_short_series(self):
+        from trading_indicators.utils.ta_primitives import pivot_high, pivot_low
+
+        flat = pd.Series([1.0, 2.0, 2.0, 1.0, 1.0])
+        assert pivot_high(flat, 1, 1).tolist()[1:3] == [2.0, 2.0]
+        assert pivot_low(flat, 1, 1).iloc[3] == 1.0
+        assert pivot_high(flat, 3, 3).isna().all()
+
+
+# ─── Atualização incremental ───────────────────────────────────────────────────
+
+
+def _assert_stream_matches(indicator, df, start, skip=()):
+    """Alimenta `update()` a partir de `start` e compara com `compute(df)`."""
+    full = indicator.compute(df)
+    state = indicator.init_state(df.iloc[:start])
+    outputs = [indicator.update(state, df.iloc[k]) for k in range(start, len(df))]
+
+    for key in outputs[0]:
+        if key in skip or not isinstance(getattr(full, key, None), pd.Series):
+            continue
+        expected = getattr(full, key).iloc[start:]
+        actual = pd.Series([out[key] for out in outputs], index=expected.index)
+        if expected.dtype == bool or expected.dtype == object:
+            assert actual.tolist() == expected.tolist(), key
+        else:
+            np.testing.assert_allclose(
+                actual.astype(float), expected, rtol=1e-9, atol=1e-9, err_msg=key
+            )
+    return full, outputs
+
+
+class TestIncrementalState:
+    @pytest.mark.parametrize("use_trend_filter", [False, True])
+    def test_lux_update_matches_full_recompute(self, use_trend_filter):
+        df = make_df(600, seed=11)
+        lux = LuxSignalsOverlays(LuxConfig(use_trend_filter=use_trend_filter))
+        _assert_stream_matches(lux, df, start=400)
+
+    @pytest.mark.parametrize("use_ema_filter", [False, True])
+    def test_smc_update_matches_full_recompute(self, use_ema_filter):
+        df = make_df(600, seed=11)
+        cfg = SMCConfig(use_ema_filter=use_ema_filter)
+        smc = SmartMoneyConfluence(cfg)
+        full, outputs = _assert_stream_matches(
+            smc, df, start=400, skip={"swing_highs", "swing_lows"}
+        )
+
+        # Pivô do candle `swing_lookback` barras atrás é confirmado na barra nova
+        lag = cfg.swing_lookback
+        confirmed_high = [out["confirmed_swing_high"] for out in outputs]
+        confirmed_low = [out["confirmed_swing_low"] for out in outputs]
+        np.testing.assert_array_equal(
+            confirmed_high, full.swing_highs.iloc[400 - lag : len(df) - lag]
+        )
+        np.testing.assert_array_equal(
+            confirmed_low, full.swing_lows.iloc[400 - lag : len(df) - lag]
+        )
+        assert all(np.isnan(out["swing_highs"]) for out in outputs)
+
+        last = smc.compute(df)
+        assert outputs[-1]["range_position_pct"] == pytest.approx(
+            last.range_position_pct
+        )
+
+    def test_update_handles_nan_bars(self):
+        df = make_df(500, seed=4)
+        df.iloc[420:423] = np.nan
+        _assert_stream_matches(LuxSignalsOverlays(), df, start=410)
+        _assert_stream_matches(
+            SmartMoneyConfluence(), df, start=410, skip={"swing_highs", "swing_lows"}
+        )
+
+    def test_state_survives_json_round_trip(self):
+        import json
+
+        from trading_indicators.indicators.lux import LuxState
+        from trading_indicators.indicators.smc import SMCState
+
+        df = make_df(450, seed=8)
+        for indicator, state_cls in (
+            (LuxSignalsOverlays(), LuxState),
+            (SmartMoneyConfluence(), SMCState),
+        ):
+            state = indicator.init_state(df.iloc[:400])
+            restored = state_cls.from_dict(json.loads(json.dumps(state.to_dict())))
+            assert isinstance(restored, state_cls)
+
+            for k in range(400, 450):
+                bar = df.iloc[k].to_dict()
+                original_out = indicator.update(state, bar)
+                restored_out = indicator.update(restored, bar)
+                assert restored_out.keys() == original_out.keys()
+                for key, value in original_out.items():
+                    other = restored_out[key]
+                    assert value == other or (value != value and other != other)
+
+    def test_update_accepts_uppercase_bar_and_validates_columns(self):
+        df = make_df(300)
+        lux = LuxSignalsOverlays()
+        state = lux.init_state(df)
+        out = lux.update(state, {"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5})
+        assert out["trend"] in {Trend.BULLISH, Trend.BEARISH}
+        with pytest.raises(ValueError, match="faltando colunas"):
+            lux.update(state, {"open": 1.0, "high": 2.0, "low": 0.5})
+
+    def test_init_state_requires_min_bars(self):
+        with pytest.raises(ValueError, match="requer ao menos"):
+            SmartMoneyConfluence().init_state(make_df(10))
+
+
+# ─── Grafo de features compartilhado ───────────────────────────────────────────
+
+
+def _assert_results_equal(left, right):
+    for f in dataclasses.fields(left):
+        a, b = getattr(left, f.name), getattr(right, f.name)
+        if isinstance(a, pd.Series):
+            pd.testing.assert_series_equal(a, b, check_names=False)
+        else:
+            assert a == b or (a != a and b != b), f.name
+
+
+class TestFeatureGraph:
+    def test_shared_graph_matches_independent_compute(self, df):
+        features = FeatureGraph(df)
+        lux = LuxSignalsOverlays().compute(df, features=features)
+        smc = SmartMoneyConfluence().compute(df, features=features)
+
+        _assert_results_equal(lux, LuxSignalsOverlays().compute(df))
+        _assert_results_equal(smc, SmartMoneyConfluence().compute(df))
+        # RSI(14) e true range são reaproveitados entre/dentro dos indicadores
+        assert features.hits >= 2
+
+    def test_scope_reuses_graph_for_equal_frames(self, df):
+        with shared_features():
+            first = resolve_features(df)
+            assert resolve_features(df.copy()) is first
+
+            shifted = df.copy()
+            shifted["close"] = shifted["close"] + 1
+            assert resolve_features(shifted) is not first
+
+        assert resolve_features(df) is not first
+
+    def test_scope_shares_rsi_between_indicators(self, df):
+        with shared_features() as scope:
+            LuxSignalsOverlays().compute(df)
+            features = resolve_features(df)
+            misses = features.misses
+            SmartMoneyConfluence().compute(df)
+        assert features.hits > 0
+        assert features.misses > misses
+        assert scope.graphs == [features]
+        assert scope.hits == features.hits
+        assert scope.saved_seconds == features.saved_seconds > 0
+
+    def test_mismatched_graph_raises(self, df):
+        features = FeatureGraph(df.iloc[:-1])
+        with pytest.raises(ValueError):
+            LuxSignalsOverlays().compute(df, features=features)
+
+    def test_graph_of_other_prices_on_same_dates_raises(self, df):
+        shifted = df.copy()
+        shifted["close"] = shifted["close"] + 1
+        features = FeatureGraph(shifted)
+        with pytest.raises(ValueError):
+            SmartMoneyConfluence().compute(df, features=features)
+
+
+class TestTailCompute:
+    def test_ewm_warmup_bars_bounds_discarded_weight(self):
+        from trading_indicators.utils.ta_primitives import ewm_warmup_bars
+
+        bars = ewm_warmup_bars(1 / 14, 1e-6)
+        assert (13 / 14) ** bars <= 1e-6 < (13 / 14) ** (bars - 1)
+        with pytest.raises(ValueError):
+            ewm_warmup_bars(1 / 14, 0)
+
+    def test_compute_tail_matches_last_bar(self):
+        df = make_df(3000, seed=5)
+        for indicator in (LuxSignalsOverlays(), SmartMoneyConfluence()):
+            assert indicator.tail_bars() < len(df)
+            full = indicator.compute(df)
+            tail = indicator.compute_tail(df)
+            assert len(tail.rsi) == indicator.tail_bars()
+            for f in dataclasses.fields(full):
+                a, b = getattr(full, f.name), getattr(tail, f.name)
+                if isinstance(a, pd.Series):
+                    a, b = a.iloc[-1], b.iloc[-1]
+                if isinstance(a, float):
+                    assert b == pytest.approx(a, rel=1e-5, nan_ok=True), f.name
+                else:
+                    assert a == b, f.name